@@ -196,10 +196,12 @@ run_backend_server(){
   #
   # 1. See https://docs.gunicorn.org/en/stable/faq.html#blocking-os-fchmod for
   #    why we set worker-tmp-dir to /dev/shm by default.
-  # 2. Log to stdout
-  # 3. Log requests to stdout
+  # 2. Use the server hooks that warm up the table models of every worker.
+  # 3. Log to stdout
+  # 4. Log requests to stdout
   exec gunicorn --workers="$BASEROW_AMOUNT_OF_GUNICORN_WORKERS" \
     --worker-tmp-dir "${TMPDIR:-/dev/shm}" \
+    --config python:baserow.config.gunicorn \
     --log-file=- \
     --access-logfile=- \
     --capture-output \
@@ -1,8 +1,58 @@
+import binascii
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, List, Optional
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.paginator import Paginator as DjangoPaginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import BooleanField, F, Func, Q, QuerySet, Value
+from django.db.models.expressions import OrderBy
+from django.utils.functional import cached_property
+
 from rest_framework.exceptions import NotFound, APIException
-from rest_framework.status import HTTP_400_BAD_REQUEST
 from rest_framework.pagination import (
+    BasePagination,
     PageNumberPagination as RestFrameworkPageNumberPagination,
 )
+from rest_framework.response import Response
+from rest_framework.status import HTTP_400_BAD_REQUEST
+from rest_framework.utils.urls import replace_query_param
+
+
+class CountFunctionPaginator(DjangoPaginator):
+    """
+    A Django paginator that uses the provided count function to count the total
+    number of objects instead of `object_list.count()`.
+    """
+
+    def __init__(
+        self,
+        *args,
+        count_function: Optional[Callable[[QuerySet], int]] = None,
+        **kwargs,
+    ):
+        self.count_function = count_function
+        super().__init__(*args, **kwargs)
+
+    @cached_property
+    def count(self):
+        if self.count_function is None:
+            return super().count
+        return self.count_function(self.object_list)
+
+    def page(self, number):
+        """
+        Unlike the Django paginator, the page is not cut off at the counted number
+        of objects because a cached count can be lower than the actual count.
+        """
+
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        return self._get_page(self.object_list[bottom:top], number, self)
 
 
 class PageNumberPagination(RestFrameworkPageNumberPagination):
@@ -11,8 +61,19 @@ class PageNumberPagination(RestFrameworkPageNumberPagination):
     page_size = 100
     page_size_query_param = "size"
 
-    def __init__(self, limit_page_size=None, *args, **kwargs):
+    def __init__(self, limit_page_size=None, count_function=None, *args, **kwargs):
+        """
+        :param limit_page_size: The maximum page size that can be requested.
+        :param count_function: An optional function that is called with the
+            queryset to count the total number of objects. This can for example be
+            used to return a cached count.
+        """
+
         self.limit_page_size = limit_page_size
+        if count_function is not None:
+            self.django_paginator_class = partial(
+                CountFunctionPaginator, count_function=count_function
+            )
         super().__init__(*args, **kwargs)
 
     def get_page_size(self, request):
@@ -39,3 +100,316 @@ class PageNumberPagination(RestFrameworkPageNumberPagination):
             exception = APIException({"error": "ERROR_INVALID_PAGE", "detail": str(e)})
             exception.status_code = HTTP_400_BAD_REQUEST
             raise exception
+
+
+@dataclass
+class KeysetKey:
+    """
+    One of the expressions that a queryset is ordered by, annotated as `alias` so
+    that its value can be read from the last row of a page and filtered on when
+    selecting the next one.
+    """
+
+    alias: str
+    expression: Any
+    descending: bool
+    nulls_first: bool
+    nullable: bool
+
+    @property
+    def is_column(self) -> bool:
+        return isinstance(self.expression, F)
+
+
+class RowValueComparison(Func):
+    """
+    Compares two row values, `(a, b) > (x, y)`, which PostgreSQL can answer using
+    a multi column index on `(a, b)` whereas the equivalent
+    `a > x OR (a = x AND b > y)` generally can't.
+    """
+
+    output_field = BooleanField()
+
+    def __init__(self, lhs, rhs, operator):
+        self.operator = operator
+        self.size = len(lhs)
+        super().__init__(*lhs, *rhs)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        sql_parts, params = [], []
+        for expression in self.source_expressions:
+            sql, expression_params = compiler.compile(expression)
+            sql_parts.append(sql)
+            params.extend(expression_params)
+        lhs = ", ".join(sql_parts[: self.size])
+        rhs = ", ".join(sql_parts[self.size :])
+        return f"({lhs}) {self.operator} ({rhs})", params
+
+
+def get_keyset_keys(queryset: QuerySet) -> List[KeysetKey]:
+    """
+    Figures out by which expressions the queryset is ordered. The explicit order
+    of the queryset is used if it has one, otherwise the default ordering of the
+    model.
+
+    :param queryset: The ordered queryset.
+    :return: The keys in the order in which they are sorted on.
+    """
+
+    query = queryset.query
+    if query.order_by:
+        order_by = query.order_by
+    elif query.default_ordering:
+        order_by = queryset.model._meta.ordering
+    else:
+        order_by = []
+
+    keys = []
+    for index, order in enumerate(order_by):
+        descending, nulls_first = False, None
+        if isinstance(order, str):
+            descending = order.startswith("-")
+            expression = F(order.lstrip("-"))
+        elif isinstance(order, OrderBy):
+            expression = order.expression
+            descending = order.descending
+            if order.nulls_first:
+                nulls_first = True
+            elif order.nulls_last:
+                nulls_first = False
+        else:
+            expression = order
+
+        # PostgreSQL sorts NULL values as if they were larger than any other value
+        # when no explicit NULLS FIRST or NULLS LAST is given.
+        if nulls_first is None:
+            nulls_first = descending
+
+        nullable = True
+        if isinstance(expression, F):
+            try:
+                field = queryset.model._meta.get_field(expression.name)
+                nullable = field.null or not field.concrete
+            except FieldDoesNotExist:
+                pass
+
+        keys.append(
+            KeysetKey(
+                alias=f"keyset_{index}",
+                expression=expression,
+                descending=descending,
+                nulls_first=nulls_first,
+                nullable=nullable,
+            )
+        )
+
+    return keys
+
+
+def get_keyset_after_condition(keys: List[KeysetKey], values: List[Any]) -> Q:
+    """
+    Builds the condition that only matches the rows that are sorted after the row
+    having the provided key values.
+
+    :param keys: The keys returned by `get_keyset_keys`, they must have been
+        annotated on the queryset.
+    :param values: The key values of the last row of the previous page.
+    :return: The condition to filter the queryset on. It's empty if no row can be
+        sorted after the provided values.
+    """
+
+    # The trailing keys that can't be NULL and are sorted in the same direction,
+    # like the `order` and `id` that every table is finally sorted on, are compared
+    # as one row value so that the index on those columns can be used.
+    row_value_start = len(keys)
+    while (
+        row_value_start > 0
+        and keys[row_value_start - 1].is_column
+        and not keys[row_value_start - 1].nullable
+        and keys[row_value_start - 1].descending == keys[-1].descending
+    ):
+        row_value_start -= 1
+    if len(keys) - row_value_start < 2:
+        row_value_start = len(keys)
+
+    condition = Q()
+    equal = Q()
+    for index, (key, value) in enumerate(zip(keys, values)):
+        if index == row_value_start:
+            row_value_keys = keys[index:]
+            condition |= equal & Q(
+                RowValueComparison(
+                    [row_value_key.expression for row_value_key in row_value_keys],
+                    [Value(value) for value in values[index:]],
+                    "<" if key.descending else ">",
+                )
+            )
+            break
+
+        after = None
+        if value is None:
+            if key.nulls_first:
+                after = Q(**{f"{key.alias}__isnull": False})
+        else:
+            lookup = "lt" if key.descending else "gt"
+            after = Q(**{f"{key.alias}__{lookup}": value})
+            if not key.nulls_first:
+                after |= Q(**{f"{key.alias}__isnull": True})
+
+        if after is not None:
+            condition |= equal & after
+
+        if value is None:
+            equal &= Q(**{f"{key.alias}__isnull": True})
+        else:
+            equal &= Q(**{key.alias: value})
+
+    return condition
+
+
+class KeysetPagination(BasePagination):
+    """
+    Paginates an ordered queryset by remembering the sort key values of the last
+    row of the page in an opaque cursor. The next page is then selected by only
+    including the rows that come after those values instead of using an `OFFSET`,
+    and the total amount of rows is never counted. This means that fetching a page
+    deep into a big table is as fast as fetching the first one. Only the next page
+    can be requested.
+
+    The queryset must be ordered in such a way that every row has a unique position,
+    for example by ending with the `id`.
+
+    If a `cursor_version` is provided, it's included in the cursor and a cursor with
+    another version is rejected. It must change whenever the sort key values of the
+    existing rows change without the rows being moved, because the rows after the
+    cursor values can't be determined anymore.
+    """
+
+    page_size = 100
+    page_size_query_param = "size"
+    cursor_query_param = "cursor"
+
+    def __init__(self, limit_page_size=None, cursor_version=None):
+        self.limit_page_size = limit_page_size
+        self.cursor_version = cursor_version
+        self.next_cursor = None
+        self.request = None
+
+    def get_page_size(self, request):
+        page_size = self.page_size
+
+        if self.page_size_query_param in request.query_params:
+            try:
+                page_size = int(request.query_params[self.page_size_query_param])
+            except ValueError:
+                page_size = 0
+            if page_size <= 0:
+                page_size = self.page_size
+
+        if self.limit_page_size and page_size > self.limit_page_size:
+            exception = APIException(
+                {
+                    "error": "ERROR_PAGE_SIZE_LIMIT",
+                    "detail": f"The page size is limited to {self.limit_page_size}.",
+                }
+            )
+            exception.status_code = HTTP_400_BAD_REQUEST
+            raise exception
+
+        return page_size
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        page_size = self.get_page_size(request)
+        keys = get_keyset_keys(queryset)
+
+        queryset = queryset.annotate(**{key.alias: key.expression for key in keys})
+
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            values = self.decode_cursor(cursor, queryset, keys)
+            condition = get_keyset_after_condition(keys, values)
+            queryset = queryset.filter(condition) if condition else queryset.none()
+
+        rows = list(queryset[: page_size + 1])
+        page = rows[:page_size]
+
+        if len(rows) > page_size:
+            self.next_cursor = self.encode_cursor(
+                [getattr(page[-1], key.alias) for key in keys]
+            )
+        else:
+            self.next_cursor = None
+
+        return page
+
+    def encode_cursor(self, values: List[Any]) -> str:
+        data = json.dumps(
+            {"version": self.cursor_version, "values": values},
+            cls=DjangoJSONEncoder,
+            separators=(",", ":"),
+        )
+        return urlsafe_b64encode(data.encode()).decode()
+
+    def decode_cursor(
+        self, cursor: str, queryset: QuerySet, keys: List[KeysetKey]
+    ) -> List[Any]:
+        """
+        Decodes the key values of the cursor and converts them back to the Python
+        values of the annotated keys.
+
+        :param cursor: The cursor provided by the client.
+        :param queryset: The queryset on which the keys are annotated.
+        :param keys: The keys that the queryset is ordered on.
+        :raises APIException: When the cursor is invalid, doesn't match the keys or
+            has another version.
+        :return: The key values of the last row of the previous page.
+        """
+
+        try:
+            data = json.loads(urlsafe_b64decode(cursor.encode()).decode())
+            values = data["values"]
+            version = data["version"]
+            if not isinstance(values, list) or len(values) != len(keys):
+                raise ValueError("The cursor doesn't match the keys.")
+            annotations = queryset.query.annotations
+            values = [
+                value
+                if value is None
+                else annotations[key.alias].output_field.to_python(value)
+                for key, value in zip(keys, values)
+            ]
+        except (TypeError, ValueError, KeyError, ValidationError, binascii.Error):
+            exception = APIException(
+                {
+                    "error": "ERROR_INVALID_CURSOR",
+                    "detail": "The provided cursor is invalid or doesn't match the "
+                    "ordering of the rows.",
+                }
+            )
+            exception.status_code = HTTP_400_BAD_REQUEST
+            raise exception
+
+        if version != self.cursor_version:
+            exception = APIException(
+                {
+                    "error": "ERROR_CURSOR_EXPIRED",
+                    "detail": "The order of the rows has been changed since the "
+                    "cursor was created, the rows must be fetched again from the "
+                    "first page.",
+                }
+            )
+            exception.status_code = HTTP_400_BAD_REQUEST
+            raise exception
+
+        return values
+
+    def get_next_link(self):
+        if self.next_cursor is None:
+            return None
+
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
@@ -1,7 +1,7 @@
 from django.conf import settings
 from drf_spectacular.plumbing import build_object_type
 from drf_spectacular.types import OpenApiTypes
-from drf_spectacular.utils import OpenApiParameter
+from drf_spectacular.utils import OpenApiParameter, OpenApiResponse
 
 
 def get_error_schema(errors=None):
@@ -40,3 +40,19 @@ CLIENT_SESSION_ID_SCHEMA_PARAMETER = OpenApiParameter(
     f"endpoints with the same {settings.CLIENT_SESSION_ID_HEADER} header this action "
     "can be undone/redone.",
 )
+
+
+IF_NONE_MATCH_SCHEMA_PARAMETER = OpenApiParameter(
+    name="If-None-Match",
+    location=OpenApiParameter.HEADER,
+    type=OpenApiTypes.STR,
+    required=False,
+    description="An optional header containing the `ETag` of a previous response. If "
+    "the response hasn't changed since, an empty response with status 304 is "
+    "returned.",
+)
+
+NOT_MODIFIED_RESPONSE_SCHEMA = OpenApiResponse(
+    description="The response hasn't changed since the version of which the `ETag` "
+    "was provided in the `If-None-Match` header."
+)
@@ -2,6 +2,7 @@ from contextlib import contextmanager
 from typing import Dict, Union, Tuple, Callable, Optional, Type
 
 from django.utils.encoding import force_str
+from django.utils.http import parse_etags
 from rest_framework import status
 from rest_framework import serializers
 from rest_framework.exceptions import APIException
@@ -239,6 +240,32 @@ def get_request(args):
     return args[1]
 
 
+def is_not_modified(request: Request, etag: Optional[str]) -> bool:
+    """
+    Checks whether the client already has the response with the provided ETag
+    according to the `If-None-Match` header of the request. The tags are compared
+    using the weak comparison, like described in RFC 7232.
+
+    :param request: The request that might contain an `If-None-Match` header.
+    :param etag: The ETag of the current version of the response or None if the
+        response doesn't have an ETag.
+    :return: Whether a `304 Not Modified` response can be returned.
+    """
+
+    if_none_match = request.headers.get("If-None-Match")
+    if etag is None or not if_none_match:
+        return False
+
+    etags = parse_etags(if_none_match)
+    if "*" in etags:
+        return True
+
+    def strip_weak(tag):
+        return tag[2:] if tag.startswith("W/") else tag
+
+    return strip_weak(etag) in [strip_weak(tag) for tag in etags]
+
+
 def type_from_data_or_registry(
     data, registry, model_instance, type_attribute_name="type"
 ):
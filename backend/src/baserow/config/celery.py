@@ -1,6 +1,22 @@
 from celery import Celery
+from celery.signals import worker_init, worker_process_init
 
 
 app = Celery("baserow")
 app.config_from_object("django.conf:settings", namespace="CELERY")
 app.autodiscover_tasks()
+
+
+def warm_up_table_models_in_worker_process(**kwargs):
+    from baserow.contrib.database.table.cache import warm_up_table_models_on_startup
+
+    # The worker process is killed if initializing takes longer than the alive
+    # timeout, so only a part of it can be used to warm up.
+    warm_up_table_models_on_startup(max_seconds=app.conf.worker_proc_alive_timeout / 2)
+
+
+@worker_init.connect
+def connect_warm_up_table_models(**kwargs):
+    # Only connected when the worker starts, so that it runs after Celery's Django
+    # fixup has closed the database connections inherited from the parent process.
+    worker_process_init.connect(warm_up_table_models_in_worker_process, weak=False)
@@ -0,0 +1,24 @@
+"""
+Gunicorn server hooks, used by starting gunicorn with
+`--config python:baserow.config.gunicorn`.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def post_worker_init(worker):
+    # Called in every worker process after it has loaded the application and
+    # before it accepts any requests, so Django is ready and the database
+    # connections are not shared with the parent process.
+    try:
+        from baserow.contrib.database.table.cache import (
+            warm_up_table_models_on_startup,
+        )
+
+        # The worker is killed if it doesn't notify the arbiter within the
+        # timeout, so only a part of it can be used to warm up.
+        warm_up_table_models_on_startup(max_seconds=worker.timeout / 2)
+    except Exception:
+        logger.exception("Failed to warm up the table models.")
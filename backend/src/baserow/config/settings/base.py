@@ -172,6 +172,22 @@ CACHES = {
         "VERSION": None,
     },
 }
+# The maximum amount of fully generated table model classes that every process keeps in
+# memory. Setting this to 0 disables the in memory model cache.
+BASEROW_GENERATED_MODEL_LRU_CACHE_SIZE = int(
+    os.getenv("BASEROW_GENERATED_MODEL_LRU_CACHE_SIZE", 256)
+)
+# When enabled, every process subscribes to a Redis channel on which the ids of
+# changed tables are published. As long as the subscription is active, the model
+# classes cached in memory can be used without checking the model versions in Redis.
+BASEROW_GENERATED_MODEL_CACHE_PUBSUB_ENABLED = (
+    os.getenv("BASEROW_GENERATED_MODEL_CACHE_PUBSUB_ENABLED", "true") == "true"
+)
+# The amount of most recently used tables of which the models are generated when a
+# backend or celery worker process starts. Setting this to 0 disables the warm up.
+BASEROW_GENERATED_MODEL_WARM_UP_SIZE = int(
+    os.getenv("BASEROW_GENERATED_MODEL_WARM_UP_SIZE", 20)
+)
 
 # Should contain the database connection name of the database where the user tables
 # are stored. This can be different than the default database because there are not
@@ -432,6 +448,102 @@ ROW_PAGE_SIZE_LIMIT = int(os.getenv("BASEROW_ROW_PAGE_SIZE_LIMIT", 200))
 BATCH_ROWS_SIZE_LIMIT = int(
     os.getenv("BATCH_ROWS_SIZE_LIMIT", 200)
 )  # How many rows can be modified at once.
+# The maximum amount of rows that can be created, updated or deleted by one rows
+# batch job, the amount of rows that are changed per transaction while running the
+# job, how long the task may run before it's restarted with the remaining chunks and
+# how often the jobs that stopped making progress are marked as failed.
+BASEROW_ROWS_BATCH_JOB_SIZE_LIMIT = int(
+    os.getenv("BASEROW_ROWS_BATCH_JOB_SIZE_LIMIT", 1000000)
+)
+BASEROW_ROWS_BATCH_JOB_CHUNK_SIZE = int(
+    os.getenv("BASEROW_ROWS_BATCH_JOB_CHUNK_SIZE", 1000)
+)
+BASEROW_ROWS_BATCH_JOB_SOFT_TIME_LIMIT = int(
+    os.getenv("BASEROW_ROWS_BATCH_JOB_SOFT_TIME_LIMIT", 60 * 60)  # 1 hour
+)
+BASEROW_ROWS_BATCH_JOB_CLEANUP_INTERVAL_MINUTES = int(
+    os.getenv("BASEROW_ROWS_BATCH_JOB_CLEANUP_INTERVAL_MINUTES", 5)
+)
+# Updating or deleting the rows matching a filter can only be undone if at most this
+# many rows match, because the original values or the ids of the rows must be stored
+# in the action.
+BASEROW_ROWS_BY_FILTER_UNDO_LIMIT = int(
+    os.getenv("BASEROW_ROWS_BY_FILTER_UNDO_LIMIT", 10000)
+)
+# When the gap between the orders of two rows becomes smaller than this threshold
+# because rows are repeatedly inserted or moved before the same row, the row orders
+# of the table are renormalized in the background in transactions of at least
+# this many rows. The renormalization is scheduled at most once per table within
+# the lock timeout in seconds.
+BASEROW_ROW_ORDER_RENORMALIZATION_THRESHOLD = Decimal(
+    os.getenv("BASEROW_ROW_ORDER_RENORMALIZATION_THRESHOLD", "0.0000000001")
+)
+BASEROW_ROW_ORDER_RENORMALIZATION_CHUNK_SIZE = int(
+    os.getenv("BASEROW_ROW_ORDER_RENORMALIZATION_CHUNK_SIZE", 1000)
+)
+BASEROW_ROW_ORDER_RENORMALIZATION_LOCK_TIMEOUT = int(
+    os.getenv("BASEROW_ROW_ORDER_RENORMALIZATION_LOCK_TIMEOUT", 60 * 60)  # 1 hour
+)
+# When enabled, a pg_trgm index is created in the background for the text fields that
+# are used by a contains filter or a search in tables with at least the minimum number
+# of rows. The index is dropped again when the field hasn't been used for the number
+# of unused days. The indexes are managed every interval minutes.
+BASEROW_TRIGRAM_INDEXES_ENABLED = (
+    os.getenv("BASEROW_TRIGRAM_INDEXES_ENABLED", "false") == "true"
+)
+BASEROW_TRIGRAM_INDEX_MIN_ROWS = int(os.getenv("BASEROW_TRIGRAM_INDEX_MIN_ROWS", 10000))
+BASEROW_TRIGRAM_INDEX_UNUSED_DAYS = int(
+    os.getenv("BASEROW_TRIGRAM_INDEX_UNUSED_DAYS", 7)
+)
+BASEROW_TRIGRAM_INDEX_MANAGE_INTERVAL_MINUTES = int(
+    os.getenv("BASEROW_TRIGRAM_INDEX_MANAGE_INTERVAL_MINUTES", 10)
+)
+# When enabled, every table that is searched gets a full-text search column that
+# contains the words of all the field values of the row. It's updated in the
+# background in chunks of this many rows and allows a search to use an index.
+BASEROW_FULL_TEXT_SEARCH_ENABLED = (
+    os.getenv("BASEROW_FULL_TEXT_SEARCH_ENABLED", "false") == "true"
+)
+BASEROW_FULL_TEXT_SEARCH_CHUNK_SIZE = int(
+    os.getenv("BASEROW_FULL_TEXT_SEARCH_CHUNK_SIZE", 1000)
+)
+# When enabled, a B-tree index is created in the background for the fields that views
+# sort on first or filter on with an equality or range filter in tables with at least
+# the minimum number of rows. The indexes are managed every interval minutes.
+BASEROW_VIEW_INDEX_ADVISOR_ENABLED = (
+    os.getenv("BASEROW_VIEW_INDEX_ADVISOR_ENABLED", "false") == "true"
+)
+BASEROW_VIEW_INDEX_MIN_ROWS = int(os.getenv("BASEROW_VIEW_INDEX_MIN_ROWS", 10000))
+BASEROW_VIEW_INDEX_MANAGE_INTERVAL_MINUTES = int(
+    os.getenv("BASEROW_VIEW_INDEX_MANAGE_INTERVAL_MINUTES", 10)
+)
+# The maximum amount of compiled view filters and sorts that every process keeps in
+# memory. Setting this to 0 disables the compiled view filters and sorts cache.
+BASEROW_VIEW_PLAN_CACHE_SIZE = int(os.getenv("BASEROW_VIEW_PLAN_CACHE_SIZE", 1024))
+# How long an exact row count of a table, view or filter is cached. The cached counts
+# are invalidated when the rows change, this only limits how long a count can be
+# stale if the rows are changed without going through Baserow.
+BASEROW_ROW_COUNT_CACHE_TIMEOUT = int(
+    os.getenv("BASEROW_ROW_COUNT_CACHE_TIMEOUT", 60 * 10)
+)
+# An unfiltered table is only counted using the planner estimate if it is estimated
+# to have at least this many rows, because smaller tables are quickly counted exactly.
+BASEROW_ROW_COUNT_ESTIMATE_THRESHOLD = int(
+    os.getenv("BASEROW_ROW_COUNT_ESTIMATE_THRESHOLD", 100000)
+)
+# Rows are inserted using the PostgreSQL `COPY` command instead of an `INSERT`
+# statement when at least this many rows are created at once.
+BASEROW_BULK_INSERT_COPY_THRESHOLD = int(
+    os.getenv("BASEROW_BULK_INSERT_COPY_THRESHOLD", 1000)
+)
+# How long the row changes are kept in the change log. Changes from before this
+# period can't be requested via the row changes endpoint anymore.
+BASEROW_ROW_CHANGE_LOG_RETENTION_DAYS = int(
+    os.getenv("BASEROW_ROW_CHANGE_LOG_RETENTION_DAYS", 7)
+)
+BASEROW_ROW_CHANGE_LOG_COMPACTION_INTERVAL_MINUTES = int(
+    os.getenv("BASEROW_ROW_CHANGE_LOG_COMPACTION_INTERVAL_MINUTES", 60)
+)
 
 TRASH_PAGE_SIZE_LIMIT = 200  # How many trash entries can be requested at once.
 ROW_COMMENT_PAGE_SIZE_LIMIT = 200  # How many row comments can be requested at once.
@@ -78,6 +78,19 @@ class SelectOptionSerializer(serializers.Serializer):
     color = serializers.CharField(max_length=255, required=True)
 
 
+def serialize_select_option(select_option):
+    """
+    Returns the same data as the `SelectOptionSerializer` would for the provided
+    select option, but without the overhead of the serializer.
+    """
+
+    return {
+        "id": select_option.id,
+        "value": select_option.value,
+        "color": select_option.color,
+    }
+
+
 class CreateFieldSerializer(serializers.ModelSerializer):
     type = serializers.ChoiceField(
         choices=lazy(field_type_registry.get_types, list)(), required=True
@@ -1,3 +1,4 @@
+from django.conf import settings
 from rest_framework.status import HTTP_404_NOT_FOUND, HTTP_400_BAD_REQUEST
 
 ERROR_ROW_DOES_NOT_EXIST = (
@@ -11,3 +12,47 @@ ERROR_ROW_IDS_NOT_UNIQUE = (
     HTTP_400_BAD_REQUEST,
     "The provided row ids {e.ids} are not unique.",
 )
+
+ERROR_INCOMPATIBLE_UPSERT_KEY_FIELD = (
+    "ERROR_INCOMPATIBLE_UPSERT_KEY_FIELD",
+    HTTP_400_BAD_REQUEST,
+    "The values of the provided key field can't be used to match rows.",
+)
+
+ERROR_UPSERT_KEY_VALUES_NOT_UNIQUE = (
+    "ERROR_UPSERT_KEY_VALUES_NOT_UNIQUE",
+    HTTP_400_BAD_REQUEST,
+    "The provided key values {e.values} are not unique.",
+)
+
+ERROR_UPSERT_KEY_MATCHES_MULTIPLE_ROWS = (
+    "ERROR_UPSERT_KEY_MATCHES_MULTIPLE_ROWS",
+    HTTP_400_BAD_REQUEST,
+    "The provided key values {e.values} match multiple existing rows.",
+)
+
+ERROR_ROW_CHANGE_CURSOR_INVALID = (
+    "ERROR_ROW_CHANGE_CURSOR_INVALID",
+    HTTP_400_BAD_REQUEST,
+    "The provided cursor is invalid.",
+)
+
+ERROR_ROW_CHANGE_CURSOR_EXPIRED = (
+    "ERROR_ROW_CHANGE_CURSOR_EXPIRED",
+    HTTP_400_BAD_REQUEST,
+    "The changes before the retention period of "
+    f"{settings.BASEROW_ROW_CHANGE_LOG_RETENTION_DAYS} days are not available "
+    "anymore. All the rows must be fetched again.",
+)
+
+ERROR_ROWS_BATCH_JOB_DOES_NOT_EXIST = (
+    "ERROR_ROWS_BATCH_JOB_DOES_NOT_EXIST",
+    HTTP_404_NOT_FOUND,
+    "The requested rows batch job does not exist.",
+)
+
+ERROR_ROWS_BATCH_JOB_ALREADY_RUNNING = (
+    "ERROR_ROWS_BATCH_JOB_ALREADY_RUNNING",
+    HTTP_400_BAD_REQUEST,
+    "Another rows batch job is already running for you.",
+)
@@ -1,5 +1,9 @@
+from drf_spectacular.openapi import OpenApiParameter, OpenApiTypes
 from drf_spectacular.plumbing import build_object_type
 
+from baserow.contrib.database.table.models import SEARCH_MODES
+from baserow.contrib.database.views.registries import view_filter_type_registry
+
 
 row_names_response_schema = build_object_type(
     {
@@ -18,3 +22,117 @@ row_names_response_schema = build_object_type(
         },
     },
 )
+
+
+# The query parameters that select, search, filter and order the rows of a table.
+list_rows_query_parameters = [
+    OpenApiParameter(
+        name="search",
+        location=OpenApiParameter.QUERY,
+        type=OpenApiTypes.STR,
+        description="If provided only rows with data that matches the search "
+        "query are going to be returned.",
+    ),
+    OpenApiParameter(
+        name="search_mode",
+        location=OpenApiParameter.QUERY,
+        type=OpenApiTypes.STR,
+        enum=SEARCH_MODES,
+        description="If `full-text` is provided and full-text search is enabled, "
+        "the rows that contain a word starting with every word of the search "
+        "query are returned using an index instead of the rows of which a field "
+        "contains the search query. Defaults to `contains`.",
+    ),
+    OpenApiParameter(
+        name="order_by",
+        location=OpenApiParameter.QUERY,
+        type=OpenApiTypes.STR,
+        description="Optionally the rows can be ordered by provided field ids "
+        "separated by comma. By default a field is ordered in ascending (A-Z) "
+        "order, but by prepending the field with a '-' it can be ordered "
+        "descending (Z-A). "
+        "If the `user_field_names` parameter is provided then "
+        "instead order_by should be a comma separated list of the actual "
+        "field names. For field names with commas you should surround the "
+        'name with quotes like so: `order_by=My Field,"Field With , "`. '
+        "A backslash can be used to escape field names which contain "
+        'double quotes like so: `order_by=My Field,Field with \\"`.',
+    ),
+    OpenApiParameter(
+        name="filter__{field}__{filter}",
+        location=OpenApiParameter.QUERY,
+        type=OpenApiTypes.STR,
+        description=(
+            f"The rows can optionally be filtered by the same view filters "
+            f"available for the views. Multiple filters can be provided if "
+            f"they follow the same format. The field and filter variable "
+            f"indicate how to filter and the value indicates where to filter "
+            f"on.\n\n"
+            f"For example if you provide the following GET parameter "
+            f"`filter__field_1__equal=test` then only rows where the value of "
+            f"field_1 is equal to test are going to be returned.\n\n"
+            f"The following filters are available: "
+            f'{", ".join(view_filter_type_registry.get_types())}.'
+        ),
+    ),
+    OpenApiParameter(
+        name="filter_type",
+        location=OpenApiParameter.QUERY,
+        type=OpenApiTypes.STR,
+        description=(
+            "`AND`: Indicates that the rows must match all the provided "
+            "filters.\n"
+            "`OR`: Indicates that the rows only have to match one of the "
+            "filters.\n\n"
+            "This works only if two or more filters are provided."
+        ),
+    ),
+    OpenApiParameter(
+        name="include",
+        location=OpenApiParameter.QUERY,
+        type=OpenApiTypes.STR,
+        description=(
+            "All the fields are included in the response by default. You can "
+            "select a subset of fields by providing the include query "
+            "parameter. If you for example provide the following GET "
+            "parameter `include=field_1,field_2` then only the fields with"
+            "id `1` and id `2` are going to be selected and included in the "
+            "response. "
+            "If the `user_field_names` parameter is provided then "
+            "instead include should be a comma separated list of the actual "
+            "field names. For field names with commas you should surround the "
+            'name with quotes like so: `include=My Field,"Field With , "`. '
+            "A backslash can be used to escape field names which contain "
+            'double quotes like so: `include=My Field,Field with \\"`.'
+        ),
+    ),
+    OpenApiParameter(
+        name="exclude",
+        location=OpenApiParameter.QUERY,
+        type=OpenApiTypes.STR,
+        description=(
+            "All the fields are included in the response by default. You can "
+            "select a subset of fields by providing the exclude query "
+            "parameter. If you for example provide the following GET "
+            "parameter `exclude=field_1,field_2` then the fields with id `1` "
+            "and id `2` are going to be excluded from the selection and "
+            "response. "
+            "If the `user_field_names` parameter is provided then "
+            "instead exclude should be a comma separated list of the actual "
+            "field names. For field names with commas you should surround the "
+            'name with quotes like so: `exclude=My Field,"Field With , "`. '
+            "A backslash can be used to escape field names which contain "
+            'double quotes like so: `exclude=My Field,Field with \\"`.'
+        ),
+    ),
+    OpenApiParameter(
+        name="user_field_names",
+        location=OpenApiParameter.QUERY,
+        type=OpenApiTypes.BOOL,
+        description=(
+            "A flag query parameter which if provided the returned json "
+            "will use the user specified field names instead of internal "
+            "Baserow field names (field_123 etc). "
+        ),
+    ),
+]
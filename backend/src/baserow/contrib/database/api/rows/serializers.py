@@ -1,18 +1,50 @@
 import logging
+import threading
+from collections import OrderedDict
 from copy import deepcopy
-from typing import Dict
+from operator import attrgetter
+from typing import Any, Callable, Dict
 
 from django.conf import settings
 from rest_framework import serializers
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
 from django.db.models.base import ModelBase
 
 from baserow.api.serializers import get_example_pagination_serializer_class
 from baserow.api.utils import get_serializer_class
+from baserow.contrib.database.fields.field_filters import (
+    FILTER_TYPE_AND,
+    FILTER_TYPE_OR,
+)
 from baserow.contrib.database.fields.registries import field_type_registry
+from baserow.contrib.database.rows.models import (
+    RowChange,
+    RowsBatchJob,
+    RowsBatchJobTypes,
+)
 from baserow.contrib.database.rows.registries import row_metadata_registry
+from baserow.contrib.database.table.models import (
+    SEARCH_MODE_CONTAINS,
+    SEARCH_MODES,
+    deconstruct_filter_key_regex,
+)
 
 logger = logging.getLogger(__name__)
 
+# The maximum amount of generated row serializer classes that are kept in memory.
+ROW_SERIALIZER_CLASS_CACHE_SIZE = 256
+row_serializer_class_cache: "OrderedDict[Any, Any]" = OrderedDict()
+row_serializer_class_cache_lock = threading.Lock()
+
+# The Django REST framework serializer fields of which the `to_representation` returns
+# values of the related type unchanged.
+PASSTHROUGH_REPRESENTATION_TYPES = {
+    serializers.BooleanField.to_representation: bool,
+    serializers.CharField.to_representation: str,
+    serializers.IntegerField.to_representation: int,
+}
+
 
 class RowSerializer(serializers.ModelSerializer):
     class Meta:
@@ -71,6 +103,27 @@ def get_row_serializer_class(
     :rtype: ModelSerializer
     """
 
+    # Generating the serializer fields of every table field is relatively slow, so
+    # the generated classes are memoized by the table, the model version and the
+    # fields of the model. The model version changes whenever the schema of the
+    # table changes, so that the model classes generated for the same version,
+    # like the projected models of a request, share their serializers.
+    cache_key = _get_row_serializer_class_cache_key(
+        model,
+        base_class,
+        is_response,
+        field_ids,
+        field_names_to_include,
+        user_field_names,
+        field_kwargs,
+        include_id,
+        required_fields,
+    )
+    if cache_key is not None:
+        serializer_class = _get_cached_row_serializer_class(cache_key)
+        if serializer_class is not None:
+            return serializer_class
+
     if not field_kwargs:
         field_kwargs = {}
 
@@ -111,7 +164,7 @@ def get_row_serializer_class(
         field_names.append("id")
         field_overrides["id"] = serializers.IntegerField()
 
-    return get_serializer_class(
+    serializer_class = get_serializer_class(
         model,
         field_names,
         field_overrides,
@@ -119,6 +172,206 @@ def get_row_serializer_class(
         required_fields=required_fields,
     )
 
+    if cache_key is not None:
+        _set_cached_row_serializer_class(cache_key, serializer_class)
+
+    return serializer_class
+
+
+def _get_row_serializer_class_cache_key(
+    model,
+    base_class,
+    is_response,
+    field_ids,
+    field_names_to_include,
+    user_field_names,
+    field_kwargs,
+    include_id,
+    required_fields,
+):
+    """
+    Returns a hashable key of the table, model version, fields of the model and the
+    arguments that the generated row serializer class depends on. None is returned
+    if the model hasn't been generated from a known version of the table's fields or
+    if the arguments can't be hashed.
+    """
+
+    table_id = getattr(model, "_table_id", None)
+    model_version = getattr(model, "_table_fields_version", None)
+    if table_id is None or model_version is None:
+        return None
+
+    cache_key = (
+        table_id,
+        model_version,
+        tuple(
+            sorted(
+                (field_id, field_object["name"])
+                for field_id, field_object in model._field_objects.items()
+            )
+        ),
+        base_class,
+        bool(is_response),
+        None if field_ids is None else frozenset(field_ids),
+        None if field_names_to_include is None else frozenset(field_names_to_include),
+        bool(user_field_names),
+        tuple(
+            sorted(
+                (name, tuple(sorted(kwargs.items())))
+                for name, kwargs in (field_kwargs or {}).items()
+            )
+        ),
+        bool(include_id),
+        None if required_fields is None else tuple(required_fields),
+    )
+
+    try:
+        hash(cache_key)
+    except TypeError:
+        return None
+
+    return cache_key
+
+
+def _get_cached_row_serializer_class(cache_key):
+    with row_serializer_class_cache_lock:
+        serializer_class = row_serializer_class_cache.get(cache_key)
+        if serializer_class is not None:
+            row_serializer_class_cache.move_to_end(cache_key)
+        return serializer_class
+
+
+def _set_cached_row_serializer_class(cache_key, serializer_class):
+    with row_serializer_class_cache_lock:
+        row_serializer_class_cache[cache_key] = serializer_class
+        row_serializer_class_cache.move_to_end(cache_key)
+        while len(row_serializer_class_cache) > ROW_SERIALIZER_CLASS_CACHE_SIZE:
+            row_serializer_class_cache.popitem(last=False)
+
+
+def clear_row_serializer_class_cache():
+    """
+    Removes all the generated row serializer classes kept in memory.
+    """
+
+    with row_serializer_class_cache_lock:
+        row_serializer_class_cache.clear()
+
+
+def get_compiled_row_serializer(
+    model, base_class=None, field_ids=None, user_field_names=False
+) -> Callable[[Any], Dict[str, Any]]:
+    """
+    Returns a function that serializes a row into exactly the same data as the
+    response serializer generated by `get_row_serializer_class` with
+    `is_response=True`, but much faster. The fields of the serializer are
+    inspected once and turned into a list of attribute getters and converters,
+    so that serializing a row doesn't go through the Django REST framework
+    serializer machinery. Field types can provide a faster converter using
+    `get_response_value_converter`, otherwise the `to_representation` of the
+    serializer field is called directly.
+
+    The compiled function is memoized on the generated serializer class and is
+    therefore shared by the models generated for the same version of the table.
+
+    :param model: The model for which to compile the serializer.
+    :type model: Model
+    :param base_class: The base serializer class of the response serializer.
+    :type base_class: ModelSerializer
+    :param field_ids: If provided only the field ids in the list will be included.
+    :type field_ids: Optional[Iterable[int]]
+    :param user_field_names: Whether the names of the fields must be used as keys.
+    :type user_field_names: bool
+    :return: The function that serializes one row.
+    """
+
+    serializer_class = get_row_serializer_class(
+        model,
+        base_class,
+        is_response=True,
+        field_ids=field_ids,
+        user_field_names=user_field_names,
+    )
+    serialize_row = serializer_class.__dict__.get("_compiled_row_serializer")
+
+    if serialize_row is None:
+        serialize_row = _compile_row_serializer(
+            serializer_class(), model, user_field_names
+        )
+        serializer_class._compiled_row_serializer = serialize_row
+
+    return serialize_row
+
+
+def _compile_row_serializer(serializer, model, user_field_names):
+    field_objects_by_name = {
+        (
+            field_object["field"].name if user_field_names else field_object["name"]
+        ): field_object
+        for field_object in model._field_objects.values()
+    }
+
+    readers = []
+    for serializer_field in serializer._readable_fields:
+        field_object = field_objects_by_name.get(serializer_field.field_name)
+        convert = None
+
+        if field_object is not None:
+            convert = field_object["type"].get_response_value_converter(
+                field_object["field"]
+            )
+
+        if convert is None:
+            convert = _get_representation_converter(serializer_field)
+
+        get_value = serializer_field.get_attribute
+        if (
+            type(serializer_field).get_attribute is serializers.Field.get_attribute
+            and serializer_field.source != "*"
+        ):
+            get_value = attrgetter(".".join(serializer_field.source_attrs))
+
+        readers.append((serializer_field, get_value, convert))
+
+    def serialize_row(row):
+        data = {}
+        for serializer_field, get_value, convert in readers:
+            try:
+                value = get_value(row)
+            except (KeyError, AttributeError):
+                # Let the serializer field decide how to handle missing values.
+                try:
+                    value = serializer_field.get_attribute(row)
+                except SkipField:
+                    continue
+            except SkipField:
+                continue
+
+            if value is None or (isinstance(value, PKOnlyObject) and value.pk is None):
+                data[serializer_field.field_name] = None
+            else:
+                data[serializer_field.field_name] = convert(value)
+        return data
+
+    return serialize_row
+
+
+def _get_representation_converter(serializer_field):
+    to_representation = serializer_field.to_representation
+    passthrough_type = PASSTHROUGH_REPRESENTATION_TYPES.get(
+        type(serializer_field).to_representation
+    )
+
+    if passthrough_type is None:
+        return to_representation
+
+    def convert(value):
+        if type(value) is passthrough_type:
+            return value
+        return to_representation(value)
+
+    return convert
+
 
 def get_batch_row_serializer_class(row_serializer_class):
     class_name = "BatchRowSerializer"
@@ -149,6 +402,69 @@ class BatchDeleteRowsSerializer(serializers.Serializer):
     )
 
 
+class RowsByFilterSerializer(serializers.Serializer):
+    view_id = serializers.IntegerField(
+        required=False,
+        help_text="If provided, only the rows that match the filters of this view "
+        "are affected.",
+    )
+    filters = serializers.DictField(
+        child=serializers.ListField(child=serializers.CharField(allow_blank=True)),
+        required=False,
+        help_text="If provided, only the rows that match these filters are "
+        "affected. The keys must be in the `filter__{field}__{filter}` format and "
+        "the values are lists of filter values, like the filter GET parameters of "
+        "the list rows endpoint.",
+    )
+    filter_type = serializers.ChoiceField(
+        choices=[FILTER_TYPE_AND, FILTER_TYPE_OR],
+        default=FILTER_TYPE_AND,
+        help_text="Indicates whether the `filters` are combined with an AND or an OR.",
+    )
+
+    def validate_filters(self, filters):
+        for key in filters.keys():
+            if not deconstruct_filter_key_regex.match(key):
+                raise serializers.ValidationError(
+                    f"The key {key} is not in the `filter__{{field}}__{{filter}}` "
+                    f"format."
+                )
+        return filters
+
+    def validate(self, data):
+        if "view_id" not in data and not data.get("filters"):
+            raise serializers.ValidationError(
+                "Either the `view_id` or the `filters` must be provided."
+            )
+        return data
+
+
+def get_update_rows_by_filter_serializer_class(row_serializer_class):
+    class_name = "UpdateRowsByFilterSerializer"
+
+    def validate(self, data):
+        # The data is validated partially, so the values must be required here.
+        if "values" not in data:
+            raise serializers.ValidationError({"values": "This field is required."})
+        return RowsByFilterSerializer.validate(self, data)
+
+    fields = {
+        "values": row_serializer_class(
+            help_text="The values that must be set for all the matching rows."
+        ),
+        "validate": validate,
+    }
+
+    class_object = type(class_name, (RowsByFilterSerializer,), fields)
+    return class_object
+
+
+class RowsByFilterResponseSerializer(serializers.Serializer):
+    count = serializers.IntegerField(
+        help_text="The number of rows that have been updated or deleted."
+    )
+
+
 def get_example_row_serializer_class(example_type="get", user_field_names=False):
     """
     Generates a serializer containing a field for each field type. It is only used for
@@ -325,15 +641,76 @@ class BatchCreateRowsQueryParamsSerializer(serializers.Serializer):
     before = serializers.IntegerField(required=False)
 
 
+class BatchUpsertRowsQueryParamsSerializer(serializers.Serializer):
+    key_field_id = serializers.IntegerField()
+
+
 class ListRowsQueryParamsSerializer(serializers.Serializer):
     user_field_names = serializers.BooleanField(required=False, default=False)
     search = serializers.CharField(required=False)
+    search_mode = serializers.ChoiceField(
+        required=False, choices=SEARCH_MODES, default=SEARCH_MODE_CONTAINS
+    )
     order_by = serializers.CharField(required=False)
     include = serializers.CharField(required=False)
     exclude = serializers.CharField(required=False)
     filter_type = serializers.CharField(required=False, default="")
 
 
+class ListRowChangesQueryParamsSerializer(serializers.Serializer):
+    user_field_names = serializers.BooleanField(required=False, default=False)
+    cursor = serializers.CharField(required=False)
+    since = serializers.DateTimeField(required=False)
+    size = serializers.IntegerField(
+        required=False,
+        default=100,
+        min_value=1,
+        max_value=settings.ROW_PAGE_SIZE_LIMIT,
+    )
+
+
+class RowChangeSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = RowChange
+        fields = ("row_id", "action", "timestamp")
+
+
+def get_example_row_changes_serializer_class(user_field_names=False):
+    row_change_serializer_class = type(
+        "ExampleRowChangeSerializer",
+        (RowChangeSerializer,),
+        {
+            "row": get_example_row_serializer_class(
+                example_type="get", user_field_names=user_field_names
+            )(
+                allow_null=True,
+                help_text="The current values of the row. This is `null` if the "
+                "change is a deletion, a change of the whole table or if the row has "
+                "been deleted since.",
+            ),
+            "Meta": type(
+                "Meta",
+                (RowChangeSerializer.Meta,),
+                {"fields": ("row_id", "action", "timestamp", "row")},
+            ),
+        },
+    )
+    return type(
+        "ExampleRowChangesResponseSerializer",
+        (serializers.Serializer,),
+        {
+            "next_cursor": serializers.CharField(
+                help_text="Can be provided as the `cursor` query parameter to fetch "
+                "the changes made after these."
+            ),
+            "has_more": serializers.BooleanField(
+                help_text="Indicates whether more changes can be fetched right away."
+            ),
+            "results": row_change_serializer_class(many=True),
+        },
+    )
+
+
 class BatchUpdateRowsSerializer(serializers.Serializer):
     items = serializers.ListField(
         child=RowSerializer(),
@@ -364,3 +741,49 @@ def get_example_batch_rows_serializer_class(example_type="get", user_field_names
     }
     class_object = type(class_name, (serializers.Serializer,), fields)
     return class_object
+
+
+class RowsBatchJobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = RowsBatchJob
+        fields = (
+            "id",
+            "table_id",
+            "type",
+            "state",
+            "progress_percentage",
+            "processed_count",
+            "total_count",
+            "human_readable_error",
+            "created_on",
+        )
+
+
+class CreateRowsBatchJobSerializer(serializers.Serializer):
+    type = serializers.ChoiceField(
+        choices=RowsBatchJobTypes.choices,
+        help_text="Indicates whether the rows must be created, updated or deleted.",
+    )
+    items = serializers.ListField(
+        child=serializers.JSONField(),
+        min_length=1,
+        max_length=settings.BASEROW_ROWS_BATCH_JOB_SIZE_LIMIT,
+        help_text="The values of the rows that must be created, the values "
+        "including the `id` of the rows that must be updated or the ids of the rows "
+        "that must be deleted.",
+    )
+
+    def validate(self, data):
+        if data["type"] == RowsBatchJobTypes.DELETE:
+            valid = all(
+                isinstance(item, int) and not isinstance(item, bool)
+                for item in data["items"]
+            )
+            message = "The items must be row ids when deleting rows."
+        else:
+            valid = all(isinstance(item, dict) for item in data["items"])
+            message = "The items must be objects containing the row values."
+
+        if not valid:
+            raise serializers.ValidationError({"items": message})
+        return data
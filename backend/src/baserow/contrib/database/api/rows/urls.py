@@ -3,11 +3,17 @@ from django.urls import re_path
 
 from .views import (
     RowsView,
+    StreamRowsView,
     RowView,
     RowMoveView,
     RowNamesView,
+    RowChangesView,
     BatchRowsView,
     BatchDeleteRowsView,
+    UpdateRowsByFilterView,
+    DeleteRowsByFilterView,
+    RowsBatchJobsView,
+    RowsBatchJobView,
 )
 
 
@@ -15,6 +21,16 @@ app_name = "baserow.contrib.database.api.rows"
 
 urlpatterns = [
     re_path(r"table/(?P<table_id>[0-9]+)/$", RowsView.as_view(), name="list"),
+    re_path(
+        r"table/(?P<table_id>[0-9]+)/stream/$",
+        StreamRowsView.as_view(),
+        name="stream",
+    ),
+    re_path(
+        r"table/(?P<table_id>[0-9]+)/changes/$",
+        RowChangesView.as_view(),
+        name="changes",
+    ),
     re_path(
         r"table/(?P<table_id>[0-9]+)/(?P<row_id>[0-9]+)/$",
         RowView.as_view(),
@@ -30,6 +46,26 @@ urlpatterns = [
         BatchDeleteRowsView.as_view(),
         name="batch-delete",
     ),
+    re_path(
+        r"table/(?P<table_id>[0-9]+)/update-by-filter/$",
+        UpdateRowsByFilterView.as_view(),
+        name="update-by-filter",
+    ),
+    re_path(
+        r"table/(?P<table_id>[0-9]+)/delete-by-filter/$",
+        DeleteRowsByFilterView.as_view(),
+        name="delete-by-filter",
+    ),
+    re_path(
+        r"table/(?P<table_id>[0-9]+)/batch-job/$",
+        RowsBatchJobsView.as_view(),
+        name="batch-job",
+    ),
+    re_path(
+        r"batch-job/(?P<job_id>[0-9]+)/$",
+        RowsBatchJobView.as_view(),
+        name="batch-job-item",
+    ),
     re_path(
         r"table/(?P<table_id>[0-9]+)/(?P<row_id>[0-9]+)/move/$",
         RowMoveView.as_view(),
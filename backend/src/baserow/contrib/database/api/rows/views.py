@@ -1,13 +1,19 @@
-from typing import Dict, Any
+import json
+from typing import Dict, Any, Tuple, Type
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import transaction
+from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
+from django.utils.dateparse import parse_datetime
 from drf_spectacular.openapi import OpenApiParameter, OpenApiTypes
-from drf_spectacular.utils import extend_schema
+from drf_spectacular.utils import extend_schema, OpenApiResponse
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
+from rest_framework.status import HTTP_304_NOT_MODIFIED
+from rest_framework.utils.encoders import JSONEncoder
 from rest_framework.views import APIView
 
 from baserow.api.decorators import (
@@ -20,12 +26,21 @@ from baserow.api.exceptions import (
     RequestBodyValidationException,
     QueryParameterValidationException,
 )
-from baserow.api.pagination import PageNumberPagination
-from baserow.api.schemas import get_error_schema, CLIENT_SESSION_ID_SCHEMA_PARAMETER
+from baserow.api.pagination import KeysetPagination, PageNumberPagination
+from baserow.api.schemas import (
+    get_error_schema,
+    CLIENT_SESSION_ID_SCHEMA_PARAMETER,
+    IF_NONE_MATCH_SCHEMA_PARAMETER,
+    NOT_MODIFIED_RESPONSE_SCHEMA,
+)
 from baserow.api.trash.errors import ERROR_CANNOT_DELETE_ALREADY_DELETED_ITEM
 from baserow.api.user_files.errors import ERROR_USER_FILE_DOES_NOT_EXIST
-from baserow.api.utils import validate_data
-from baserow.contrib.database.api.utils import get_include_exclude_fields
+from baserow.api.utils import is_not_modified, validate_data
+from baserow.contrib.database.api.utils import (
+    get_include_exclude_fields,
+    get_query_params_filter_types,
+    get_table_etag,
+)
 from baserow.contrib.database.api.fields.errors import (
     ERROR_ORDER_BY_FIELD_NOT_POSSIBLE,
     ERROR_ORDER_BY_FIELD_NOT_FOUND,
@@ -34,8 +49,15 @@ from baserow.contrib.database.api.fields.errors import (
     ERROR_INVALID_SELECT_OPTION_VALUES,
 )
 from baserow.contrib.database.api.rows.errors import (
+    ERROR_INCOMPATIBLE_UPSERT_KEY_FIELD,
+    ERROR_ROW_CHANGE_CURSOR_EXPIRED,
+    ERROR_ROW_CHANGE_CURSOR_INVALID,
     ERROR_ROW_DOES_NOT_EXIST,
     ERROR_ROW_IDS_NOT_UNIQUE,
+    ERROR_ROWS_BATCH_JOB_ALREADY_RUNNING,
+    ERROR_ROWS_BATCH_JOB_DOES_NOT_EXIST,
+    ERROR_UPSERT_KEY_MATCHES_MULTIPLE_ROWS,
+    ERROR_UPSERT_KEY_VALUES_NOT_UNIQUE,
 )
 from baserow.contrib.database.api.rows.serializers import (
     example_pagination_row_serializer_class,
@@ -44,8 +66,10 @@ from baserow.contrib.database.api.tables.errors import ERROR_TABLE_DOES_NOT_EXIS
 from baserow.contrib.database.api.tokens.authentications import TokenAuthentication
 from baserow.contrib.database.api.tokens.errors import ERROR_NO_PERMISSION_TO_TABLE
 from baserow.contrib.database.api.views.errors import (
+    ERROR_VIEW_DOES_NOT_EXIST,
     ERROR_VIEW_FILTER_TYPE_DOES_NOT_EXIST,
     ERROR_VIEW_FILTER_TYPE_UNSUPPORTED_FIELD,
+    ERROR_VIEW_NOT_IN_TABLE,
 )
 from baserow.contrib.database.fields.exceptions import (
     OrderByFieldNotFound,
@@ -59,43 +83,122 @@ from baserow.contrib.database.rows.actions import (
     CreateRowsActionType,
     DeleteRowActionType,
     DeleteRowsActionType,
+    DeleteRowsByFilterActionType,
     MoveRowActionType,
     UpdateRowActionType,
     UpdateRowsActionType,
+    UpdateRowsByFilterActionType,
+    UpsertRowsActionType,
 )
 from baserow.core.action.registries import action_type_registry
-from baserow.contrib.database.rows.exceptions import RowDoesNotExist, RowIdsNotUnique
+from baserow.core.db import chunked_queryset_iterator, iterate_outside_event_loop
+from baserow.contrib.database.rows.batch_jobs import RowsBatchJobHandler
+from baserow.contrib.database.rows.count import get_cached_row_count
+from baserow.contrib.database.rows.change_log import RowChangeLogHandler
+from baserow.contrib.database.rows.exceptions import (
+    IncompatibleUpsertKeyField,
+    RowChangeCursorExpired,
+    RowChangeCursorInvalid,
+    RowDoesNotExist,
+    RowIdsNotUnique,
+    RowsBatchJobAlreadyRunning,
+    RowsBatchJobDoesNotExist,
+    UpsertKeyMatchesMultipleRows,
+    UpsertKeyValuesNotUnique,
+)
+from baserow.contrib.database.rows.models import RowChangeActions
 from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.rows.order import get_table_row_order_version
 from baserow.contrib.database.table.exceptions import TableDoesNotExist
 from baserow.contrib.database.table.handler import TableHandler
-from baserow.contrib.database.table.models import Table
+from baserow.contrib.database.table.models import GeneratedTableModel, Table
 from baserow.contrib.database.tokens.exceptions import NoPermissionToTable
 from baserow.contrib.database.tokens.handler import TokenHandler
 from baserow.contrib.database.views.exceptions import (
+    ViewDoesNotExist,
     ViewFilterTypeNotAllowedForField,
     ViewFilterTypeDoesNotExist,
+    ViewNotInTable,
 )
-from baserow.contrib.database.views.registries import view_filter_type_registry
+from baserow.contrib.database.views.handler import ViewHandler
 from baserow.core.exceptions import UserNotInGroup
 from baserow.core.trash.exceptions import CannotDeleteAlreadyDeletedItem
 from baserow.core.user_files.exceptions import UserFileDoesNotExist
 from .serializers import (
     ListRowsQueryParamsSerializer,
+    ListRowChangesQueryParamsSerializer,
     MoveRowQueryParamsSerializer,
     CreateRowQueryParamsSerializer,
     RowSerializer,
     BatchCreateRowsQueryParamsSerializer,
+    BatchUpsertRowsQueryParamsSerializer,
     BatchDeleteRowsSerializer,
+    RowsByFilterSerializer,
+    RowsByFilterResponseSerializer,
     get_batch_row_serializer_class,
+    get_update_rows_by_filter_serializer_class,
     get_example_row_serializer_class,
+    get_example_row_changes_serializer_class,
+    get_compiled_row_serializer,
+    RowChangeSerializer,
     get_row_serializer_class,
     get_example_batch_rows_serializer_class,
+    CreateRowsBatchJobSerializer,
+    RowsBatchJobSerializer,
 )
 from baserow.contrib.database.fields.field_filters import (
     FILTER_TYPE_AND,
     FILTER_TYPE_OR,
 )
-from .schemas import row_names_response_schema
+from .schemas import list_rows_query_parameters, row_names_response_schema
+
+
+def get_rows_queryset(
+    request: Request, table: Table, query_params: Dict[str, Any]
+) -> Tuple[Type[GeneratedTableModel], QuerySet]:
+    """
+    Generates the model of the table and returns the queryset of the rows that must
+    be listed according to the `ListRowsQueryParamsSerializer` query parameters and
+    the `filter__{field}__{filter}` GET parameters.
+
+    :param request: The request containing the filter GET parameters.
+    :param table: The table of which the rows must be listed.
+    :param query_params: The validated query parameters.
+    :return: The generated model and the searched, ordered and filtered queryset.
+    """
+
+    search = query_params.get("search")
+    order_by = query_params.get("order_by")
+    include = query_params.get("include")
+    exclude = query_params.get("exclude")
+    user_field_names = query_params.get("user_field_names")
+    fields = get_include_exclude_fields(
+        table, include, exclude, user_field_names=user_field_names
+    )
+
+    # Only the ids of the requested fields are fetched because the fields
+    # themselves can be selected from the cached fields of the table. If none of
+    # the requested fields exist, then all fields are included.
+    field_ids = list(fields.values_list("id", flat=True)) if fields is not None else []
+    model = table.get_model(field_ids=field_ids or None)
+    queryset = model.objects.all().enhance_by_fields()
+
+    if search:
+        queryset = queryset.search_all_fields(
+            search, search_mode=query_params.get("search_mode")
+        )
+
+    if order_by:
+        queryset = queryset.order_by_fields_string(order_by, user_field_names)
+
+    filter_type_query_param = query_params.get("filter_type")
+    filter_type = (
+        FILTER_TYPE_OR if filter_type_query_param.upper() == "OR" else FILTER_TYPE_AND
+    )
+    filter_object = {key: request.GET.getlist(key) for key in request.GET.keys()}
+    queryset = queryset.filter_by_fields_object(filter_object, filter_type)
+
+    return model, queryset
 
 
 class RowsView(APIView):
@@ -124,129 +227,51 @@ class RowsView(APIView):
                 description="Defines how many rows should be returned per page.",
             ),
             OpenApiParameter(
-                name="search",
-                location=OpenApiParameter.QUERY,
-                type=OpenApiTypes.STR,
-                description="If provided only rows with data that matches the search "
-                "query are going to be returned.",
-            ),
-            OpenApiParameter(
-                name="order_by",
-                location=OpenApiParameter.QUERY,
-                type=OpenApiTypes.STR,
-                description="Optionally the rows can be ordered by provided field ids "
-                "separated by comma. By default a field is ordered in ascending (A-Z) "
-                "order, but by prepending the field with a '-' it can be ordered "
-                "descending (Z-A). "
-                "If the `user_field_names` parameter is provided then "
-                "instead order_by should be a comma separated list of the actual "
-                "field names. For field names with commas you should surround the "
-                'name with quotes like so: `order_by=My Field,"Field With , "`. '
-                "A backslash can be used to escape field names which contain "
-                'double quotes like so: `order_by=My Field,Field with \\"`.',
-            ),
-            OpenApiParameter(
-                name="filter__{field}__{filter}",
-                location=OpenApiParameter.QUERY,
-                type=OpenApiTypes.STR,
-                description=(
-                    f"The rows can optionally be filtered by the same view filters "
-                    f"available for the views. Multiple filters can be provided if "
-                    f"they follow the same format. The field and filter variable "
-                    f"indicate how to filter and the value indicates where to filter "
-                    f"on.\n\n"
-                    f"For example if you provide the following GET parameter "
-                    f"`filter__field_1__equal=test` then only rows where the value of "
-                    f"field_1 is equal to test are going to be returned.\n\n"
-                    f"The following filters are available: "
-                    f'{", ".join(view_filter_type_registry.get_types())}.'
-                ),
-            ),
-            OpenApiParameter(
-                name="filter_type",
+                name="cursor",
                 location=OpenApiParameter.QUERY,
                 type=OpenApiTypes.STR,
-                description=(
-                    "`AND`: Indicates that the rows must match all the provided "
-                    "filters.\n"
-                    "`OR`: Indicates that the rows only have to match one of the "
-                    "filters.\n\n"
-                    "This works only if two or more filters are provided."
-                ),
-            ),
-            OpenApiParameter(
-                name="include",
-                location=OpenApiParameter.QUERY,
-                type=OpenApiTypes.STR,
-                description=(
-                    "All the fields are included in the response by default. You can "
-                    "select a subset of fields by providing the include query "
-                    "parameter. If you for example provide the following GET "
-                    "parameter `include=field_1,field_2` then only the fields with"
-                    "id `1` and id `2` are going to be selected and included in the "
-                    "response. "
-                    "If the `user_field_names` parameter is provided then "
-                    "instead include should be a comma separated list of the actual "
-                    "field names. For field names with commas you should surround the "
-                    'name with quotes like so: `include=My Field,"Field With , "`. '
-                    "A backslash can be used to escape field names which contain "
-                    'double quotes like so: `include=My Field,Field with \\"`.'
-                ),
-            ),
-            OpenApiParameter(
-                name="exclude",
-                location=OpenApiParameter.QUERY,
-                type=OpenApiTypes.STR,
-                description=(
-                    "All the fields are included in the response by default. You can "
-                    "select a subset of fields by providing the exclude query "
-                    "parameter. If you for example provide the following GET "
-                    "parameter `exclude=field_1,field_2` then the fields with id `1` "
-                    "and id `2` are going to be excluded from the selection and "
-                    "response. "
-                    "If the `user_field_names` parameter is provided then "
-                    "instead exclude should be a comma separated list of the actual "
-                    "field names. For field names with commas you should surround the "
-                    'name with quotes like so: `exclude=My Field,"Field With , "`. '
-                    "A backslash can be used to escape field names which contain "
-                    'double quotes like so: `exclude=My Field,Field with \\"`.'
-                ),
-            ),
-            OpenApiParameter(
-                name="user_field_names",
-                location=OpenApiParameter.QUERY,
-                type=OpenApiTypes.BOOL,
-                description=(
-                    "A flag query parameter which if provided the returned json "
-                    "will use the user specified field names instead of internal "
-                    "Baserow field names (field_123 etc). "
-                ),
+                description="If provided, the rows are paginated by a cursor instead "
+                "of by page. An empty value returns the first page and the `next` "
+                "url of the response contains the cursor of the following page. "
+                "The response doesn't contain the `count` and `previous` keys, but "
+                "fetching a page is equally fast regardless of its position, which "
+                "makes it better suited for iterating over big tables. A cursor "
+                "expires when the orders of the rows are renormalized, after which "
+                "the rows must be fetched again from the first page.",
             ),
+            *list_rows_query_parameters,
+            IF_NONE_MATCH_SCHEMA_PARAMETER,
         ],
         tags=["Database table rows"],
         operation_id="list_database_table_rows",
         description=(
             "Lists all the rows of the table related to the provided parameter if the "
             "user has access to the related database's group. The response is "
-            "paginated by a page/size style. It is also possible to provide an "
-            "optional search query, only rows where the data matches the search query "
-            "are going to be returned then. The properties of the returned rows "
+            "paginated by a page/size or cursor/size style. It is also possible to "
+            "provide an optional search query, only rows where the data matches the "
+            "search query are going to be returned then. The properties of the returned rows "
             "depends on which fields the table has. For a complete overview of fields "
             "use the **list_database_table_fields** endpoint to list them all. In the "
             "example all field types are listed, but normally the number in "
             "field_{id} key is going to be the id of the field. Or if the GET "
             "parameter `user_field_names` is provided then the keys will be the name "
             "of the field. The value is what the user has provided and the format of "
-            "it depends on the fields type."
+            "it depends on the fields type.\n\nThe response contains an `ETag` "
+            "header that changes when the rows, fields or views of the table change. "
+            "If it is provided in the `If-None-Match` header of a next request, an "
+            "empty `304` response is returned if nothing has changed."
         ),
         responses={
             200: example_pagination_row_serializer_class,
+            304: NOT_MODIFIED_RESPONSE_SCHEMA,
             400: get_error_schema(
                 [
                     "ERROR_USER_NOT_IN_GROUP",
                     "ERROR_REQUEST_BODY_VALIDATION",
                     "ERROR_PAGE_SIZE_LIMIT",
                     "ERROR_INVALID_PAGE",
+                    "ERROR_INVALID_CURSOR",
+                    "ERROR_CURSOR_EXPIRED",
                     "ERROR_ORDER_BY_FIELD_NOT_FOUND",
                     "ERROR_ORDER_BY_FIELD_NOT_POSSIBLE",
                     "ERROR_FILTER_FIELD_NOT_FOUND",
@@ -284,44 +309,36 @@ class RowsView(APIView):
         table.database.group.has_user(request.user, raise_error=True)
 
         TokenHandler().check_table_permissions(request, "read", table, False)
-        search = query_params.get("search")
-        order_by = query_params.get("order_by")
-        include = query_params.get("include")
-        exclude = query_params.get("exclude")
-        user_field_names = query_params.get("user_field_names")
-        fields = get_include_exclude_fields(
-            table, include, exclude, user_field_names=user_field_names
-        )
-
-        model = table.get_model(
-            fields=fields,
-            field_ids=[] if fields else None,
-        )
-        queryset = model.objects.all().enhance_by_fields()
 
-        if search:
-            queryset = queryset.search_all_fields(search)
+        etag = get_table_etag(table.id, get_query_params_filter_types(request.GET))
+        if is_not_modified(request, etag):
+            return Response(status=HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
 
-        if order_by:
-            queryset = queryset.order_by_fields_string(order_by, user_field_names)
+        model, queryset = get_rows_queryset(request, table, query_params)
+        user_field_names = query_params.get("user_field_names")
 
-        filter_type_query_param = query_params.get("filter_type")
-        filter_type = (
-            FILTER_TYPE_OR
-            if filter_type_query_param.upper() == "OR"
-            else FILTER_TYPE_AND
-        )
-        filter_object = {key: request.GET.getlist(key) for key in request.GET.keys()}
-        queryset = queryset.filter_by_fields_object(filter_object, filter_type)
+        if KeysetPagination.cursor_query_param in request.GET:
+            paginator = KeysetPagination(
+                limit_page_size=settings.ROW_PAGE_SIZE_LIMIT,
+                cursor_version=get_table_row_order_version(table.id),
+            )
+        else:
+            paginator = PageNumberPagination(
+                limit_page_size=settings.ROW_PAGE_SIZE_LIMIT,
+                count_function=get_cached_row_count,
+            )
 
-        paginator = PageNumberPagination(limit_page_size=settings.ROW_PAGE_SIZE_LIMIT)
         page = paginator.paginate_queryset(queryset, request, self)
-        serializer_class = get_row_serializer_class(
-            model, RowSerializer, is_response=True, user_field_names=user_field_names
+        serialize_row = get_compiled_row_serializer(
+            model, RowSerializer, user_field_names=user_field_names
         )
-        serializer = serializer_class(page, many=True)
 
-        return paginator.get_paginated_response(serializer.data)
+        response = paginator.get_paginated_response(
+            [serialize_row(row) for row in page]
+        )
+        if etag:
+            response["ETag"] = etag
+        return response
 
     @extend_schema(
         parameters=[
@@ -444,6 +461,250 @@ class RowsView(APIView):
         return Response(serializer.data)
 
 
+class StreamRowsView(APIView):
+    authentication_classes = APIView.authentication_classes + [TokenAuthentication]
+    permission_classes = (IsAuthenticated,)
+    chunk_size = 2000
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="table_id",
+                location=OpenApiParameter.PATH,
+                type=OpenApiTypes.INT,
+                description="Streams the rows of the table related to the provided "
+                "value.",
+            ),
+            *list_rows_query_parameters,
+        ],
+        tags=["Database table rows"],
+        operation_id="stream_database_table_rows",
+        description=(
+            "Streams all the rows of the table related to the provided parameter as "
+            "newline delimited JSON if the user has access to the related "
+            "database's group. Every line contains one row in the same format as the "
+            "**list_database_table_rows** endpoint. The same search, order, filter "
+            "and field parameters are supported, but the rows are not paginated. "
+            "This makes it possible to read a whole table using one request."
+        ),
+        responses={
+            200: OpenApiResponse(
+                response=get_example_row_serializer_class(
+                    example_type="get", user_field_names=True
+                ),
+                description="One JSON object per row, separated by newlines.",
+            ),
+            400: get_error_schema(
+                [
+                    "ERROR_USER_NOT_IN_GROUP",
+                    "ERROR_REQUEST_BODY_VALIDATION",
+                    "ERROR_ORDER_BY_FIELD_NOT_FOUND",
+                    "ERROR_ORDER_BY_FIELD_NOT_POSSIBLE",
+                    "ERROR_FILTER_FIELD_NOT_FOUND",
+                    "ERROR_VIEW_FILTER_TYPE_DOES_NOT_EXIST",
+                    "ERROR_VIEW_FILTER_TYPE_UNSUPPORTED_FIELD",
+                ]
+            ),
+            401: get_error_schema(["ERROR_NO_PERMISSION_TO_TABLE"]),
+            404: get_error_schema(
+                ["ERROR_TABLE_DOES_NOT_EXIST", "ERROR_FIELD_DOES_NOT_EXIST"]
+            ),
+        },
+    )
+    @map_exceptions(
+        {
+            UserNotInGroup: ERROR_USER_NOT_IN_GROUP,
+            TableDoesNotExist: ERROR_TABLE_DOES_NOT_EXIST,
+            NoPermissionToTable: ERROR_NO_PERMISSION_TO_TABLE,
+            OrderByFieldNotFound: ERROR_ORDER_BY_FIELD_NOT_FOUND,
+            OrderByFieldNotPossible: ERROR_ORDER_BY_FIELD_NOT_POSSIBLE,
+            FilterFieldNotFound: ERROR_FILTER_FIELD_NOT_FOUND,
+            FieldDoesNotExist: ERROR_FIELD_DOES_NOT_EXIST,
+            ViewFilterTypeDoesNotExist: ERROR_VIEW_FILTER_TYPE_DOES_NOT_EXIST,
+            ViewFilterTypeNotAllowedForField: ERROR_VIEW_FILTER_TYPE_UNSUPPORTED_FIELD,
+        }
+    )
+    @validate_query_parameters(ListRowsQueryParamsSerializer)
+    def get(self, request, table_id, query_params):
+        """
+        Streams all the rows of the given table id as newline delimited JSON. The
+        rows are fetched in chunks using a server side cursor, so that the memory
+        usage doesn't depend on the size of the table. When served via ASGI, the
+        chunks are fetched in a separate thread because the response is streamed
+        inside the event loop.
+        """
+
+        table = TableHandler().get_table(table_id)
+        table.database.group.has_user(request.user, raise_error=True)
+
+        TokenHandler().check_table_permissions(request, "read", table, False)
+        model, queryset = get_rows_queryset(request, table, query_params)
+        serialize_row = get_compiled_row_serializer(
+            model,
+            RowSerializer,
+            user_field_names=query_params.get("user_field_names"),
+        )
+
+        # The queryset is only evaluated while the response is being streamed, so
+        # any error that happens before this point results in a normal error
+        # response.
+        def stream_rows():
+            for chunk in chunked_queryset_iterator(queryset, self.chunk_size):
+                yield "".join(
+                    json.dumps(
+                        row,
+                        cls=JSONEncoder,
+                        ensure_ascii=False,
+                        separators=(",", ":"),
+                    )
+                    + "\n"
+                    for row in map(serialize_row, chunk)
+                )
+
+        return StreamingHttpResponse(
+            iterate_outside_event_loop(stream_rows()),
+            content_type="application/x-ndjson",
+        )
+
+
+class RowChangesView(APIView):
+    authentication_classes = APIView.authentication_classes + [TokenAuthentication]
+    permission_classes = (IsAuthenticated,)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="table_id",
+                location=OpenApiParameter.PATH,
+                type=OpenApiTypes.INT,
+                description="Lists the row changes of the table related to the "
+                "provided value.",
+            ),
+            OpenApiParameter(
+                name="cursor",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.STR,
+                description="The `next_cursor` of an earlier response. Only the "
+                "changes made after the changes of that response are returned.",
+            ),
+            OpenApiParameter(
+                name="since",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.DATETIME,
+                description="If provided and the `cursor` isn't, only the changes "
+                "made at or after this ISO 8601 timestamp are returned.",
+            ),
+            OpenApiParameter(
+                name="size",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.INT,
+                description="The maximum amount of changes that must be returned. "
+                "Defaults to 100.",
+            ),
+            OpenApiParameter(
+                name="user_field_names",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.BOOL,
+                description=(
+                    "A flag query parameter which if provided the returned json "
+                    "will use the user specified field names instead of internal "
+                    "Baserow field names (field_123 etc)."
+                ),
+            ),
+        ],
+        tags=["Database table rows"],
+        operation_id="list_database_table_row_changes",
+        description=(
+            "Lists the rows of the table that have been created, updated or deleted, "
+            "in the order in which the changes were made, if the user has access to "
+            "the related database's group. Every change contains the current values "
+            "of the row, so a copy of the table can be kept up to date by "
+            "repeatedly fetching the changes using the `next_cursor` of the "
+            "previous response. Changes are kept for "
+            f"{settings.BASEROW_ROW_CHANGE_LOG_RETENTION_DAYS} days and only the "
+            "latest change of a row is guaranteed to be kept. Values that are "
+            "recalculated because another row or table changed, like lookups and "
+            "formulas, are included as updates of the recalculated rows. If any row "
+            "of the table could have changed, for example because the values of a "
+            "field have been converted or recalculated, a change with the "
+            "`table_updated` action and without a `row_id` is returned and all "
+            "the rows must be fetched again."
+        ),
+        responses={
+            200: get_example_row_changes_serializer_class(user_field_names=True),
+            400: get_error_schema(
+                [
+                    "ERROR_USER_NOT_IN_GROUP",
+                    "ERROR_QUERY_PARAMETER_VALIDATION",
+                    "ERROR_ROW_CHANGE_CURSOR_INVALID",
+                    "ERROR_ROW_CHANGE_CURSOR_EXPIRED",
+                ]
+            ),
+            401: get_error_schema(["ERROR_NO_PERMISSION_TO_TABLE"]),
+            404: get_error_schema(["ERROR_TABLE_DOES_NOT_EXIST"]),
+        },
+    )
+    @map_exceptions(
+        {
+            UserNotInGroup: ERROR_USER_NOT_IN_GROUP,
+            TableDoesNotExist: ERROR_TABLE_DOES_NOT_EXIST,
+            NoPermissionToTable: ERROR_NO_PERMISSION_TO_TABLE,
+            RowChangeCursorInvalid: ERROR_ROW_CHANGE_CURSOR_INVALID,
+            RowChangeCursorExpired: ERROR_ROW_CHANGE_CURSOR_EXPIRED,
+        }
+    )
+    @validate_query_parameters(ListRowChangesQueryParamsSerializer)
+    def get(self, request, table_id, query_params):
+        """
+        Lists the changes of the rows of the given table id, including the current
+        values of the rows that still exist.
+        """
+
+        table = TableHandler().get_table(table_id)
+        table.database.group.has_user(request.user, raise_error=True)
+
+        TokenHandler().check_table_permissions(request, "read", table, False)
+
+        since = query_params.get("since")
+        changes, next_cursor, has_more = RowChangeLogHandler().get_row_changes(
+            table,
+            cursor=query_params.get("cursor"),
+            since=parse_datetime(since) if since else None,
+            limit=query_params["size"],
+        )
+
+        model = table.get_model()
+        serialize_row = get_compiled_row_serializer(
+            model,
+            RowSerializer,
+            user_field_names=query_params["user_field_names"],
+        )
+        rows = (
+            model.objects.all()
+            .enhance_by_fields()
+            .in_bulk(
+                {
+                    change.row_id
+                    for change in changes
+                    if change.action != RowChangeActions.DELETED
+                    and change.row_id is not None
+                }
+            )
+        )
+
+        results = RowChangeSerializer(changes, many=True).data
+        for change, result in zip(changes, results):
+            row = rows.get(change.row_id)
+            if change.action == RowChangeActions.DELETED or row is None:
+                result["row"] = None
+            else:
+                result["row"] = serialize_row(row)
+
+        return Response(
+            {"next_cursor": next_cursor, "has_more": has_more, "results": results}
+        )
+
+
 class RowNamesView(APIView):
     authentication_classes = APIView.authentication_classes + [TokenAuthentication]
     permission_classes = (IsAuthenticated,)
@@ -1149,6 +1410,132 @@ class BatchRowsView(APIView):
         response_serializer = response_serializer_class({"items": rows})
         return Response(response_serializer.data)
 
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="table_id",
+                location=OpenApiParameter.PATH,
+                type=OpenApiTypes.INT,
+                description="Creates or updates the rows in the table.",
+            ),
+            OpenApiParameter(
+                name="key_field_id",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.INT,
+                description="The id of the field of which the value is used to "
+                "find the existing row that must be updated.",
+            ),
+            OpenApiParameter(
+                name="user_field_names",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.BOOL,
+                description=(
+                    "A flag query parameter which if provided this endpoint will "
+                    "expect and return the user specified field names instead of "
+                    "internal Baserow field names (field_123 etc)."
+                ),
+            ),
+            CLIENT_SESSION_ID_SCHEMA_PARAMETER,
+        ],
+        tags=["Database table rows"],
+        operation_id="batch_upsert_database_table_rows",
+        description=(
+            "Updates the existing rows that have the same value for the field "
+            "provided as `key_field_id` as the provided items, and creates new rows "
+            "for the other items, if the user has access to the related table's "
+            "group. The items are provided in the same format as for the "
+            "**batch_create_database_table_rows** endpoint. Items without a value "
+            "for the key field always create a new row. The created and updated "
+            "rows are returned in the same order as the items. Upserts with the "
+            "same key field are processed one after the other, so that concurrent "
+            "requests don't create duplicate rows for the same new key. The key "
+            "field doesn't get an index for this, so matching the rows can require "
+            "a scan of the whole table."
+            "\n\n **WARNING:** This endpoint doesn't yet work with row created and "
+            "row updated webhooks."
+        ),
+        request=get_example_batch_rows_serializer_class(
+            example_type="post", user_field_names=True
+        ),
+        responses={
+            200: get_example_batch_rows_serializer_class(
+                example_type="get", user_field_names=True
+            ),
+            400: get_error_schema(
+                [
+                    "ERROR_USER_NOT_IN_GROUP",
+                    "ERROR_REQUEST_BODY_VALIDATION",
+                    "ERROR_QUERY_PARAMETER_VALIDATION",
+                    "ERROR_INCOMPATIBLE_UPSERT_KEY_FIELD",
+                    "ERROR_UPSERT_KEY_VALUES_NOT_UNIQUE",
+                    "ERROR_UPSERT_KEY_MATCHES_MULTIPLE_ROWS",
+                    "ERROR_INVALID_SELECT_OPTION_VALUES",
+                ]
+            ),
+            401: get_error_schema(["ERROR_NO_PERMISSION_TO_TABLE"]),
+            404: get_error_schema(
+                ["ERROR_TABLE_DOES_NOT_EXIST", "ERROR_FIELD_DOES_NOT_EXIST"]
+            ),
+        },
+    )
+    @transaction.atomic
+    @map_exceptions(
+        {
+            UserNotInGroup: ERROR_USER_NOT_IN_GROUP,
+            TableDoesNotExist: ERROR_TABLE_DOES_NOT_EXIST,
+            FieldDoesNotExist: ERROR_FIELD_DOES_NOT_EXIST,
+            IncompatibleUpsertKeyField: ERROR_INCOMPATIBLE_UPSERT_KEY_FIELD,
+            UpsertKeyValuesNotUnique: ERROR_UPSERT_KEY_VALUES_NOT_UNIQUE,
+            UpsertKeyMatchesMultipleRows: ERROR_UPSERT_KEY_MATCHES_MULTIPLE_ROWS,
+            AllProvidedMultipleSelectValuesMustBeSelectOption: ERROR_INVALID_SELECT_OPTION_VALUES,
+            NoPermissionToTable: ERROR_NO_PERMISSION_TO_TABLE,
+            UserFileDoesNotExist: ERROR_USER_FILE_DOES_NOT_EXIST,
+        }
+    )
+    @validate_query_parameters(BatchUpsertRowsQueryParamsSerializer)
+    def put(self, request: Request, table_id: int, query_params) -> Response:
+        """
+        Creates or updates the provided rows for the given table_id, matching the
+        existing rows by the value of the key field.
+        """
+
+        table = TableHandler().get_table(table_id)
+        TokenHandler().check_table_permissions(request, "create", table, False)
+        TokenHandler().check_table_permissions(request, "update", table, False)
+        model = table.get_model()
+
+        user_field_names = "user_field_names" in request.GET
+
+        row_validation_serializer = get_row_serializer_class(
+            model, user_field_names=user_field_names
+        )
+        validation_serializer = get_batch_row_serializer_class(
+            row_validation_serializer
+        )
+        data = validate_data(
+            validation_serializer, request.data, partial=True, return_validated=True
+        )
+
+        try:
+            rows = action_type_registry.get_by_type(UpsertRowsActionType).do(
+                request.user,
+                table,
+                data["items"],
+                query_params["key_field_id"],
+                model,
+            )
+        except ValidationError as exc:
+            raise RequestBodyValidationException(detail=exc.message)
+
+        response_row_serializer_class = get_row_serializer_class(
+            model, RowSerializer, is_response=True, user_field_names=user_field_names
+        )
+        response_serializer_class = get_batch_row_serializer_class(
+            response_row_serializer_class
+        )
+        response_serializer = response_serializer_class({"items": rows})
+        return Response(response_serializer.data)
+
 
 class BatchDeleteRowsView(APIView):
     authentication_classes = APIView.authentication_classes + [TokenAuthentication]
@@ -1214,3 +1601,318 @@ class BatchDeleteRowsView(APIView):
         )
 
         return Response(status=204)
+
+
+class UpdateRowsByFilterView(APIView):
+    authentication_classes = APIView.authentication_classes + [TokenAuthentication]
+    permission_classes = (IsAuthenticated,)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="table_id",
+                location=OpenApiParameter.PATH,
+                type=OpenApiTypes.INT,
+                description="Updates the rows in the table related to the value.",
+            ),
+            OpenApiParameter(
+                name="user_field_names",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.BOOL,
+                description=(
+                    "A flag query parameter which if provided this endpoint will "
+                    "expect the user specified field names instead of internal "
+                    "Baserow field names (field_123 etc)."
+                ),
+            ),
+            CLIENT_SESSION_ID_SCHEMA_PARAMETER,
+        ],
+        tags=["Database table rows"],
+        operation_id="update_database_table_rows_by_filter",
+        description=(
+            "Sets the provided `values` for all the rows in the table that match the "
+            "filters of the provided view and the provided `filters`, if the user "
+            "has access to the table's group. The values are provided in the same "
+            "format as for the **update_database_table_row** endpoint. The rows are "
+            "updated at once without having to list the matching row ids first. "
+            "The change can only be undone if at most "
+            f"{settings.BASEROW_ROWS_BY_FILTER_UNDO_LIMIT} rows match. If more rows "
+            "match, the change can't be undone and the undo history of the table is "
+            "cleared."
+            "\n\n **WARNING:** This endpoint doesn't yet work with row updated "
+            "webhooks."
+        ),
+        request=get_update_rows_by_filter_serializer_class(
+            get_example_row_serializer_class(
+                example_type="patch", user_field_names=True
+            )
+        ),
+        responses={
+            200: RowsByFilterResponseSerializer,
+            400: get_error_schema(
+                [
+                    "ERROR_USER_NOT_IN_GROUP",
+                    "ERROR_REQUEST_BODY_VALIDATION",
+                    "ERROR_VIEW_NOT_IN_TABLE",
+                    "ERROR_FILTER_FIELD_NOT_FOUND",
+                    "ERROR_VIEW_FILTER_TYPE_DOES_NOT_EXIST",
+                    "ERROR_VIEW_FILTER_TYPE_UNSUPPORTED_FIELD",
+                    "ERROR_INVALID_SELECT_OPTION_VALUES",
+                ]
+            ),
+            401: get_error_schema(["ERROR_NO_PERMISSION_TO_TABLE"]),
+            404: get_error_schema(
+                ["ERROR_TABLE_DOES_NOT_EXIST", "ERROR_VIEW_DOES_NOT_EXIST"]
+            ),
+        },
+    )
+    @transaction.atomic
+    @map_exceptions(
+        {
+            UserNotInGroup: ERROR_USER_NOT_IN_GROUP,
+            TableDoesNotExist: ERROR_TABLE_DOES_NOT_EXIST,
+            ViewDoesNotExist: ERROR_VIEW_DOES_NOT_EXIST,
+            ViewNotInTable: ERROR_VIEW_NOT_IN_TABLE,
+            FilterFieldNotFound: ERROR_FILTER_FIELD_NOT_FOUND,
+            ViewFilterTypeDoesNotExist: ERROR_VIEW_FILTER_TYPE_DOES_NOT_EXIST,
+            ViewFilterTypeNotAllowedForField: ERROR_VIEW_FILTER_TYPE_UNSUPPORTED_FIELD,
+            AllProvidedMultipleSelectValuesMustBeSelectOption: ERROR_INVALID_SELECT_OPTION_VALUES,
+            NoPermissionToTable: ERROR_NO_PERMISSION_TO_TABLE,
+            UserFileDoesNotExist: ERROR_USER_FILE_DOES_NOT_EXIST,
+        }
+    )
+    def patch(self, request: Request, table_id: int) -> Response:
+        """
+        Updates all the rows that match the provided filters of the table with the
+        given table_id.
+        """
+
+        table = TableHandler().get_table(table_id)
+        TokenHandler().check_table_permissions(request, "update", table, False)
+        model = table.get_model()
+
+        row_validation_serializer = get_row_serializer_class(
+            model, user_field_names="user_field_names" in request.GET
+        )
+        validation_serializer = get_update_rows_by_filter_serializer_class(
+            row_validation_serializer
+        )
+        data = validate_data(
+            validation_serializer, request.data, partial=True, return_validated=True
+        )
+        view = ViewHandler().get_view(data["view_id"]) if "view_id" in data else None
+
+        try:
+            count = action_type_registry.get_by_type(UpdateRowsByFilterActionType).do(
+                request.user,
+                table,
+                data["values"],
+                view=view,
+                filter_object=data.get("filters"),
+                # The default isn't set because the data is partially validated.
+                filter_type=data.get("filter_type", FILTER_TYPE_AND),
+                model=model,
+            )
+        except ValidationError as exc:
+            raise RequestBodyValidationException(detail=exc.message)
+
+        return Response(RowsByFilterResponseSerializer({"count": count}).data)
+
+
+class DeleteRowsByFilterView(APIView):
+    authentication_classes = APIView.authentication_classes + [TokenAuthentication]
+    permission_classes = (IsAuthenticated,)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="table_id",
+                location=OpenApiParameter.PATH,
+                type=OpenApiTypes.INT,
+                description="Deletes the rows in the table related to the value.",
+            ),
+            CLIENT_SESSION_ID_SCHEMA_PARAMETER,
+        ],
+        tags=["Database table rows"],
+        operation_id="delete_database_table_rows_by_filter",
+        description=(
+            "Deletes all the rows in the table that match the filters of the "
+            "provided view and the provided `filters`, if the user has access to the "
+            "table's group. The rows are moved to the trash at once without having "
+            "to list the matching row ids first. They end up in a single trash "
+            "entry. The change can only be undone if at most "
+            f"{settings.BASEROW_ROWS_BY_FILTER_UNDO_LIMIT} rows match. If more rows "
+            "match, the change can't be undone and the undo history of the table is "
+            "cleared, but the rows can always be restored from the trash."
+            "\n\n **WARNING:** This endpoint doesn't yet work with row deleted "
+            "webhooks."
+        ),
+        request=RowsByFilterSerializer,
+        responses={
+            200: RowsByFilterResponseSerializer,
+            400: get_error_schema(
+                [
+                    "ERROR_USER_NOT_IN_GROUP",
+                    "ERROR_REQUEST_BODY_VALIDATION",
+                    "ERROR_VIEW_NOT_IN_TABLE",
+                    "ERROR_FILTER_FIELD_NOT_FOUND",
+                    "ERROR_VIEW_FILTER_TYPE_DOES_NOT_EXIST",
+                    "ERROR_VIEW_FILTER_TYPE_UNSUPPORTED_FIELD",
+                ]
+            ),
+            401: get_error_schema(["ERROR_NO_PERMISSION_TO_TABLE"]),
+            404: get_error_schema(
+                ["ERROR_TABLE_DOES_NOT_EXIST", "ERROR_VIEW_DOES_NOT_EXIST"]
+            ),
+        },
+    )
+    @transaction.atomic
+    @validate_body(RowsByFilterSerializer)
+    @map_exceptions(
+        {
+            UserNotInGroup: ERROR_USER_NOT_IN_GROUP,
+            TableDoesNotExist: ERROR_TABLE_DOES_NOT_EXIST,
+            ViewDoesNotExist: ERROR_VIEW_DOES_NOT_EXIST,
+            ViewNotInTable: ERROR_VIEW_NOT_IN_TABLE,
+            FilterFieldNotFound: ERROR_FILTER_FIELD_NOT_FOUND,
+            ViewFilterTypeDoesNotExist: ERROR_VIEW_FILTER_TYPE_DOES_NOT_EXIST,
+            ViewFilterTypeNotAllowedForField: ERROR_VIEW_FILTER_TYPE_UNSUPPORTED_FIELD,
+            NoPermissionToTable: ERROR_NO_PERMISSION_TO_TABLE,
+        }
+    )
+    def post(self, request: Request, table_id: int, data: Dict[str, Any]) -> Response:
+        """
+        Deletes all the rows that match the provided filters of the table with the
+        given table_id.
+        """
+
+        table = TableHandler().get_table(table_id)
+        TokenHandler().check_table_permissions(request, "delete", table, False)
+        view = ViewHandler().get_view(data["view_id"]) if "view_id" in data else None
+
+        count = action_type_registry.get_by_type(DeleteRowsByFilterActionType).do(
+            request.user,
+            table,
+            view=view,
+            filter_object=data.get("filters"),
+            filter_type=data["filter_type"],
+        )
+
+        return Response(RowsByFilterResponseSerializer({"count": count}).data)
+
+
+class RowsBatchJobsView(APIView):
+    authentication_classes = APIView.authentication_classes + [TokenAuthentication]
+    permission_classes = (IsAuthenticated,)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="table_id",
+                location=OpenApiParameter.PATH,
+                type=OpenApiTypes.INT,
+                description="Changes the rows in the table.",
+            ),
+            OpenApiParameter(
+                name="user_field_names",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.BOOL,
+                description=(
+                    "A flag query parameter which if provided this endpoint will "
+                    "expect the user specified field names instead of internal "
+                    "Baserow field names (field_123 etc)."
+                ),
+            ),
+        ],
+        tags=["Database table rows"],
+        operation_id="create_database_table_rows_batch_job",
+        description=(
+            "Creates a job that creates, updates or deletes more rows than the "
+            "batch endpoints accept at once. The job runs asynchronously in the "
+            "background and changes the rows in chunks, where every chunk is "
+            "committed separately. The items are provided in the same format as "
+            "for the **batch_create_database_table_rows**, "
+            "**batch_update_database_table_rows** and "
+            "**batch_delete_database_table_rows** endpoints, and are only "
+            "validated while the job is running. If a chunk fails, the job stops, "
+            "but the rows of the chunks before it stay changed. The "
+            "`get_database_table_rows_batch_job` endpoint can be used to get the "
+            "state of the job. Instead of the row webhook events, one "
+            "`rows.batch_job_chunk_processed` event is sent per chunk. These "
+            "changes can't be undone."
+        ),
+        request=CreateRowsBatchJobSerializer,
+        responses={
+            200: RowsBatchJobSerializer,
+            400: get_error_schema(
+                [
+                    "ERROR_USER_NOT_IN_GROUP",
+                    "ERROR_REQUEST_BODY_VALIDATION",
+                    "ERROR_ROWS_BATCH_JOB_ALREADY_RUNNING",
+                ]
+            ),
+            401: get_error_schema(["ERROR_NO_PERMISSION_TO_TABLE"]),
+            404: get_error_schema(["ERROR_TABLE_DOES_NOT_EXIST"]),
+        },
+    )
+    @transaction.atomic
+    @map_exceptions(
+        {
+            UserNotInGroup: ERROR_USER_NOT_IN_GROUP,
+            TableDoesNotExist: ERROR_TABLE_DOES_NOT_EXIST,
+            NoPermissionToTable: ERROR_NO_PERMISSION_TO_TABLE,
+            RowsBatchJobAlreadyRunning: ERROR_ROWS_BATCH_JOB_ALREADY_RUNNING,
+        }
+    )
+    @validate_body(CreateRowsBatchJobSerializer)
+    def post(self, request: Request, table_id: int, data: Dict[str, Any]) -> Response:
+        """
+        Creates and starts a job that changes the rows of the table with the given
+        table_id.
+        """
+
+        table = TableHandler().get_table(table_id)
+        TokenHandler().check_table_permissions(request, data["type"], table, False)
+
+        job = RowsBatchJobHandler().create_and_start_job(
+            request.user,
+            table,
+            data["type"],
+            data["items"],
+            user_field_names="user_field_names" in request.GET,
+        )
+        return Response(RowsBatchJobSerializer(job).data)
+
+
+class RowsBatchJobView(APIView):
+    authentication_classes = APIView.authentication_classes + [TokenAuthentication]
+    permission_classes = (IsAuthenticated,)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter(
+                name="job_id",
+                location=OpenApiParameter.PATH,
+                type=OpenApiTypes.INT,
+                description="The job id to lookup information about.",
+            )
+        ],
+        tags=["Database table rows"],
+        operation_id="get_database_table_rows_batch_job",
+        description=(
+            "Returns the information related to the provided rows batch job id. "
+            "This endpoint can for example be polled to get the state of the job."
+        ),
+        responses={
+            200: RowsBatchJobSerializer,
+            404: get_error_schema(["ERROR_ROWS_BATCH_JOB_DOES_NOT_EXIST"]),
+        },
+    )
+    @map_exceptions(
+        {
+            RowsBatchJobDoesNotExist: ERROR_ROWS_BATCH_JOB_DOES_NOT_EXIST,
+        }
+    )
+    def get(self, request: Request, job_id: int) -> Response:
+        job = RowsBatchJobHandler().get_job(request.user, job_id)
+        return Response(RowsBatchJobSerializer(job).data)
@@ -1,6 +1,16 @@
 import re
+from typing import Iterable, List, Optional
+
+from django.http import QueryDict
+
 from baserow.core.utils import split_comma_separated_string
 from baserow.contrib.database.fields.models import Field
+from baserow.contrib.database.table.change_sequence import get_table_change_sequence
+from baserow.contrib.database.table.models import deconstruct_filter_key_regex
+from baserow.contrib.database.views.exceptions import ViewFilterTypeDoesNotExist
+from baserow.contrib.database.views.models import View
+from baserow.contrib.database.views.registries import view_filter_type_registry
+from baserow.version import VERSION
 
 
 def get_include_exclude_field_ids(table, include=None, exclude=None):
@@ -118,3 +128,51 @@ def extract_field_ids_from_string(value):
         for v in value.split(",")
         if any(c.isdigit() for c in v)
     ]
+
+
+def get_table_etag(table_id: int, filter_types: Iterable[str] = ()) -> Optional[str]:
+    """
+    Returns an ETag for a response that only changes if the rows, fields or views of
+    the table change. It is based on the change sequence number of the table.
+
+    :param table_id: The id of the table that the response is about.
+    :param filter_types: The types of the filters that are applied to the rows in
+        the response.
+    :return: The ETag or None if one of the filters compares with the current time,
+        because then the response can change without a change to the table.
+    """
+
+    for filter_type in filter_types:
+        try:
+            if view_filter_type_registry.get(filter_type).depends_on_current_time:
+                return None
+        except ViewFilterTypeDoesNotExist:
+            pass
+
+    sequence = get_table_change_sequence(table_id)
+    return f'"{VERSION}-{table_id}-{sequence}"'
+
+
+def get_view_filter_types(view: View) -> List[str]:
+    """
+    Returns the types of the filters that are applied to the rows of the view.
+    """
+
+    if view.filters_disabled:
+        return []
+
+    return list(view.viewfilter_set.values_list("type", flat=True))
+
+
+def get_query_params_filter_types(query_params: QueryDict) -> List[str]:
+    """
+    Returns the types of the `filter__field_{id}__{view_filter_type}` query
+    parameters.
+    """
+
+    filter_types = []
+    for key in query_params.keys():
+        match = deconstruct_filter_key_regex.match(key)
+        if match:
+            filter_types.append(match.group(2))
+    return filter_types
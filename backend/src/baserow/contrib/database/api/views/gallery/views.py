@@ -20,6 +20,7 @@ from baserow.contrib.database.api.views.gallery.serializers import (
 )
 from baserow.contrib.database.api.views.serializers import FieldOptionsField
 from baserow.contrib.database.views.exceptions import ViewDoesNotExist
+from baserow.contrib.database.rows.count import count_rows
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.models import GalleryView
 from baserow.contrib.database.views.registries import view_type_registry
@@ -47,6 +48,18 @@ class GalleryViewView(APIView):
                 type=OpenApiTypes.BOOL,
                 description="If provided only the count will be returned.",
             ),
+            OpenApiParameter(
+                name="approximate",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.BOOL,
+                description=(
+                    "Can be provided together with `count`. If the view has no "
+                    "filters and no search and the table is big, the estimated "
+                    "row count of the database is returned instead of an exact "
+                    "count. The `count_is_exact` key of the response indicates "
+                    "whether that was the case."
+                ),
+            ),
             OpenApiParameter(
                 name="include",
                 location=OpenApiParameter.QUERY,
@@ -129,7 +142,10 @@ class GalleryViewView(APIView):
         queryset = view_handler.get_queryset(view, search, model)
 
         if "count" in request.GET:
-            return Response({"count": queryset.count()})
+            count, count_is_exact = count_rows(
+                queryset, approximate="approximate" in request.GET
+            )
+            return Response({"count": count, "count_is_exact": count_is_exact})
 
         paginator = GalleryLimitOffsetPagination()
         page = paginator.paginate_queryset(queryset, request, self)
@@ -5,12 +5,18 @@ from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.request import Request
 from rest_framework.response import Response
+from rest_framework.status import HTTP_304_NOT_MODIFIED
 from rest_framework.views import APIView
 
 from baserow.api.decorators import map_exceptions, allowed_includes, validate_body
+from baserow.api.utils import is_not_modified
 from baserow.api.errors import ERROR_USER_NOT_IN_GROUP
-from baserow.api.pagination import PageNumberPagination
-from baserow.api.schemas import get_error_schema
+from baserow.api.pagination import KeysetPagination, PageNumberPagination
+from baserow.api.schemas import (
+    get_error_schema,
+    IF_NONE_MATCH_SCHEMA_PARAMETER,
+    NOT_MODIFIED_RESPONSE_SCHEMA,
+)
 from baserow.api.serializers import get_example_pagination_serializer_class
 from baserow.core.db import specific_iterator
 from baserow.contrib.database.api.rows.serializers import (
@@ -18,10 +24,14 @@ from baserow.contrib.database.api.rows.serializers import (
     get_example_row_metadata_field_serializer,
 )
 from baserow.contrib.database.api.rows.serializers import (
-    get_row_serializer_class,
+    get_compiled_row_serializer,
     RowSerializer,
 )
-from baserow.contrib.database.api.utils import get_include_exclude_field_ids
+from baserow.contrib.database.api.utils import (
+    get_include_exclude_field_ids,
+    get_table_etag,
+    get_view_filter_types,
+)
 from baserow.contrib.database.api.views.errors import (
     ERROR_VIEW_DOES_NOT_EXIST,
 )
@@ -51,6 +61,9 @@ from baserow.contrib.database.views.exceptions import (
     NoAuthorizationToPubliclySharedView,
     ViewDoesNotExist,
 )
+from baserow.contrib.database.rows.count import count_rows, get_cached_row_count
+from baserow.contrib.database.rows.order import get_table_row_order_version
+from baserow.contrib.database.table.models import SEARCH_MODE_CONTAINS, SEARCH_MODES
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.models import GridView
 from baserow.contrib.database.views.registries import (
@@ -113,6 +126,18 @@ class GridViewView(APIView):
                 type=OpenApiTypes.BOOL,
                 description="If provided only the count will be returned.",
             ),
+            OpenApiParameter(
+                name="approximate",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.BOOL,
+                description=(
+                    "Can be provided together with `count`. If the view has no "
+                    "filters and no search and the table is big, the estimated "
+                    "row count of the database is returned instead of an exact "
+                    "count. The `count_is_exact` key of the response indicates "
+                    "whether that was the case."
+                ),
+            ),
             OpenApiParameter(
                 name="include",
                 location=OpenApiParameter.QUERY,
@@ -151,8 +176,21 @@ class GridViewView(APIView):
                 name="size",
                 location=OpenApiParameter.QUERY,
                 type=OpenApiTypes.INT,
-                description="Can only be used in combination with the `page` parameter "
-                "and defines how many rows should be returned.",
+                description="Can only be used in combination with the `page` or "
+                "`cursor` parameter and defines how many rows should be returned.",
+            ),
+            OpenApiParameter(
+                name="cursor",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.STR,
+                description="If provided, the rows are paginated by a cursor instead "
+                "of by page. An empty value returns the first page and the `next` "
+                "url of the response contains the cursor of the following page. "
+                "The response doesn't contain the `count` and `previous` keys, but "
+                "fetching a page is equally fast regardless of its position, which "
+                "makes it better suited for iterating over big views. A cursor "
+                "expires when the orders of the rows are renormalized, after which "
+                "the rows must be fetched again from the first page.",
             ),
             OpenApiParameter(
                 name="search",
@@ -161,6 +199,16 @@ class GridViewView(APIView):
                 description="If provided only rows with data that matches the search "
                 "query are going to be returned.",
             ),
+            OpenApiParameter(
+                name="search_mode",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.STR,
+                enum=SEARCH_MODES,
+                description="If `full-text` is provided and full-text search is "
+                "enabled, the rows that contain a word starting with every word of "
+                "the search query are returned using an index instead of the rows of "
+                "which a field contains the search query. Defaults to `contains`.",
+            ),
             OpenApiParameter(
                 name="include_fields",
                 location=OpenApiParameter.QUERY,
@@ -187,13 +235,15 @@ class GridViewView(APIView):
                     "response. "
                 ),
             ),
+            IF_NONE_MATCH_SCHEMA_PARAMETER,
         ],
         tags=["Database table grid view"],
         operation_id="list_database_table_grid_view_rows",
         description=(
             "Lists the requested rows of the view's table related to the provided "
             "`view_id` if the authorized user has access to the database's group. "
-            "The response is paginated either by a limit/offset or page/size style. "
+            "The response is paginated either by a limit/offset, page/size or "
+            "cursor/size style. "
             "The style depends on the provided GET parameters. The properties of the "
             "returned rows depends on which fields the table has. For a complete "
             "overview of fields use the **list_database_table_fields** endpoint to "
@@ -205,7 +255,13 @@ class GridViewView(APIView):
             "The filters and sortings are automatically applied. To get a full "
             "overview of the applied filters and sortings you can use the "
             "`list_database_table_view_filters` and "
-            "`list_database_table_view_sortings` endpoints."
+            "`list_database_table_view_sortings` endpoints.\n"
+            "\n"
+            "Unless the `row_metadata` is included or a filter compares with the "
+            "current date, the response contains an `ETag` header that changes when "
+            "the rows, fields or the view change. If it is provided in the "
+            "`If-None-Match` header of a next request, an empty `304` response is "
+            "returned if nothing has changed."
         ),
         responses={
             200: get_example_pagination_serializer_class(
@@ -220,7 +276,15 @@ class GridViewView(APIView):
                 },
                 serializer_name="PaginationSerializerWithGridViewFieldOptions",
             ),
-            400: get_error_schema(["ERROR_USER_NOT_IN_GROUP"]),
+            304: NOT_MODIFIED_RESPONSE_SCHEMA,
+            400: get_error_schema(
+                [
+                    "ERROR_USER_NOT_IN_GROUP",
+                    "ERROR_INVALID_PAGE",
+                    "ERROR_INVALID_CURSOR",
+                    "ERROR_CURSOR_EXPIRED",
+                ]
+            ),
             404: get_error_schema(
                 ["ERROR_GRID_DOES_NOT_EXIST", "ERROR_FIELD_DOES_NOT_EXIST"]
             ),
@@ -236,15 +300,17 @@ class GridViewView(APIView):
     @allowed_includes("field_options", "row_metadata")
     def get(self, request, view_id, field_options, row_metadata):
         """
-        Lists all the rows of a grid view, paginated either by a page or offset/limit.
-        If the limit get parameter is provided the limit/offset pagination will be used
-        else the page number pagination.
+        Lists all the rows of a grid view, paginated either by a page, offset/limit or
+        cursor. If the limit get parameter is provided the limit/offset pagination will
+        be used, if the cursor get parameter is provided the keyset pagination and else
+        the page number pagination.
 
         Optionally the field options can also be included in the response if the
         `field_options` are provided in the include GET parameter.
         """
 
         search = request.GET.get("search")
+        search_mode = request.GET.get("search_mode", SEARCH_MODE_CONTAINS)
         include_fields = request.GET.get("include_fields")
         exclude_fields = request.GET.get("exclude_fields")
 
@@ -255,31 +321,51 @@ class GridViewView(APIView):
         view.table.database.group.has_user(
             request.user, raise_error=True, allow_if_template=True
         )
+
+        # The row metadata can change without a change to the table.
+        etag = (
+            None
+            if row_metadata
+            else get_table_etag(view.table_id, get_view_filter_types(view))
+        )
+        if is_not_modified(request, etag):
+            return Response(status=HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
         field_ids = get_include_exclude_field_ids(
             view.table, include_fields, exclude_fields
         )
 
         model = view.table.get_model()
-        queryset = view_handler.get_queryset(view, search, model)
+        queryset = view_handler.get_queryset(
+            view, search, model, search_mode=search_mode
+        )
 
         if "count" in request.GET:
-            return Response({"count": queryset.count()})
+            count, count_is_exact = count_rows(
+                queryset, approximate="approximate" in request.GET
+            )
+            return Response(
+                {"count": count, "count_is_exact": count_is_exact},
+                headers={"ETag": etag} if etag else None,
+            )
 
         if LimitOffsetPagination.limit_query_param in request.GET:
             paginator = LimitOffsetPagination()
+        elif KeysetPagination.cursor_query_param in request.GET:
+            paginator = KeysetPagination(
+                cursor_version=get_table_row_order_version(view.table_id)
+            )
         else:
-            paginator = PageNumberPagination()
+            paginator = PageNumberPagination(count_function=get_cached_row_count)
 
         page = paginator.paginate_queryset(queryset, request, self)
-        serializer_class = get_row_serializer_class(
-            model,
-            RowSerializer,
-            is_response=True,
-            field_ids=field_ids,
+        serialize_row = get_compiled_row_serializer(
+            model, RowSerializer, field_ids=field_ids
         )
-        serializer = serializer_class(page, many=True)
 
-        response = paginator.get_paginated_response(serializer.data)
+        response = paginator.get_paginated_response(
+            [serialize_row(row) for row in page]
+        )
 
         if field_options:
             context = {"fields": [o["field"] for o in model._field_objects.values()]}
@@ -294,6 +380,8 @@ class GridViewView(APIView):
             )
             response.data.update(row_metadata=row_metadata)
 
+        if etag:
+            response["ETag"] = etag
         return response
 
     @extend_schema(
@@ -351,11 +439,8 @@ class GridViewView(APIView):
         model = view.table.get_model(field_ids=data["field_ids"])
         results = model.objects.filter(pk__in=data["row_ids"])
 
-        serializer_class = get_row_serializer_class(
-            model, RowSerializer, is_response=True
-        )
-        serializer = serializer_class(results, many=True)
-        return Response(serializer.data)
+        serialize_row = get_compiled_row_serializer(model, RowSerializer)
+        return Response([serialize_row(row) for row in results])
 
 
 class GridViewFieldAggregationsView(APIView):
@@ -393,17 +478,22 @@ class GridViewFieldAggregationsView(APIView):
                     "returned with the result."
                 ),
             ),
+            IF_NONE_MATCH_SCHEMA_PARAMETER,
         ],
         tags=["Database table grid view"],
         operation_id="get_database_table_grid_view_field_aggregations",
         description=(
             "Returns all field aggregations values previously defined for this grid "
             "view. If filters exist for this view, the aggregations are computed only "
-            "on filtered rows."
-            "You need to have read permissions on the view to request aggregations."
+            "on filtered rows. "
+            "You need to have read permissions on the view to request aggregations. "
+            "The response contains an `ETag` header that can be provided in the "
+            "`If-None-Match` header of a next request to get an empty `304` response "
+            "if nothing has changed."
         ),
         responses={
             200: field_aggregations_response_schema,
+            304: NOT_MODIFIED_RESPONSE_SCHEMA,
             400: get_error_schema(
                 [
                     "ERROR_USER_NOT_IN_GROUP",
@@ -440,6 +530,10 @@ class GridViewFieldAggregationsView(APIView):
             request.user, raise_error=True, allow_if_template=True
         )
 
+        etag = get_table_etag(view.table_id, get_view_filter_types(view))
+        if is_not_modified(request, etag):
+            return Response(status=HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
         # Compute aggregation
         # Note: we can't optimize model by giving a model with just
         # the aggregated field because we may need other fields for filtering
@@ -447,7 +541,7 @@ class GridViewFieldAggregationsView(APIView):
             view, with_total=total, search=search
         )
 
-        return Response(result)
+        return Response(result, headers={"ETag": etag} if etag else None)
 
 
 class GridViewFieldAggregationView(APIView):
@@ -491,6 +585,7 @@ class GridViewFieldAggregationView(APIView):
                     "returned with the result."
                 ),
             ),
+            IF_NONE_MATCH_SCHEMA_PARAMETER,
         ],
         tags=["Database table grid view"],
         operation_id="get_database_table_grid_view_field_aggregation",
@@ -499,10 +594,14 @@ class GridViewFieldAggregationView(APIView):
             "selected grid view. You must select the aggregation type by setting "
             "the `type` GET parameter. If filters are configured for the selected "
             "view, the aggregation is calculated only on filtered rows. "
-            "You need to have read permissions on the view to request an aggregation."
+            "You need to have read permissions on the view to request an aggregation. "
+            "The response contains an `ETag` header that can be provided in the "
+            "`If-None-Match` header of a next request to get an empty `304` response "
+            "if nothing has changed."
         ),
         responses={
             200: field_aggregation_response_schema,
+            304: NOT_MODIFIED_RESPONSE_SCHEMA,
             400: get_error_schema(
                 [
                     "ERROR_USER_NOT_IN_GROUP",
@@ -545,6 +644,10 @@ class GridViewFieldAggregationView(APIView):
         )
         field_instance = FieldHandler().get_field(field_id)
 
+        etag = get_table_etag(view.table_id, get_view_filter_types(view))
+        if is_not_modified(request, etag):
+            return Response(status=HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
         aggregation_type = request.GET.get("type")
 
         # Compute aggregation
@@ -561,7 +664,7 @@ class GridViewFieldAggregationView(APIView):
         if total:
             result["total"] = aggregations["total"]
 
-        return Response(result)
+        return Response(result, headers={"ETag": etag} if etag else None)
 
 
 class PublicGridViewRowsView(APIView):
@@ -581,6 +684,18 @@ class PublicGridViewRowsView(APIView):
                 type=OpenApiTypes.BOOL,
                 description="If provided only the count will be returned.",
             ),
+            OpenApiParameter(
+                name="approximate",
+                location=OpenApiParameter.QUERY,
+                type=OpenApiTypes.BOOL,
+                description=(
+                    "Can be provided together with `count`. If the view has no "
+                    "filters and no search and the table is big, the estimated "
+                    "row count of the database is returned instead of an exact "
+                    "count. The `count_is_exact` key of the response indicates "
+                    "whether that was the case."
+                ),
+            ),
             OpenApiParameter(
                 name="include",
                 location=OpenApiParameter.QUERY,
@@ -803,7 +918,10 @@ class PublicGridViewRowsView(APIView):
             queryset = queryset.search_all_fields(search, publicly_visible_field_ids)
 
         if "count" in request.GET:
-            return Response({"count": queryset.count()})
+            count, count_is_exact = count_rows(
+                queryset, approximate="approximate" in request.GET
+            )
+            return Response({"count": count, "count_is_exact": count_is_exact})
 
         if LimitOffsetPagination.limit_query_param in request.GET:
             paginator = LimitOffsetPagination()
@@ -817,11 +935,12 @@ class PublicGridViewRowsView(APIView):
         )
 
         page = paginator.paginate_queryset(queryset, request, self)
-        serializer_class = get_row_serializer_class(
-            model, RowSerializer, is_response=True, field_ids=field_ids
+        serialize_row = get_compiled_row_serializer(
+            model, RowSerializer, field_ids=field_ids
+        )
+        response = paginator.get_paginated_response(
+            [serialize_row(row) for row in page]
         )
-        serializer = serializer_class(page, many=True)
-        response = paginator.get_paginated_response(serializer.data)
 
         if field_options:
             context = {"field_options": publicly_visible_field_options}
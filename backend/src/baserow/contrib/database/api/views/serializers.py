@@ -17,6 +17,7 @@ from baserow.contrib.database.views.models import (
     ViewFilter,
     ViewSort,
     ViewDecoration,
+    ViewFieldIndex,
 )
 
 
@@ -365,3 +366,23 @@ class PublicViewAuthRequestSerializer(serializers.Serializer):
 
 class PublicViewAuthResponseSerializer(serializers.Serializer):
     access_token = serializers.CharField()
+
+
+class ViewFieldIndexSerializer(serializers.ModelSerializer):
+    table_id = serializers.IntegerField(
+        source="field.table_id",
+        read_only=True,
+        help_text="The table that the indexed field belongs to.",
+    )
+
+    class Meta:
+        model = ViewFieldIndex
+        fields = (
+            "id",
+            "field_id",
+            "table_id",
+            "state",
+            "error",
+            "created_on",
+            "updated_on",
+        )
@@ -16,6 +16,7 @@ from .views import (
     RotateViewSlugView,
     PublicViewAuthView,
     PublicViewLinkRowFieldLookupView,
+    ViewFieldIndexesView,
 )
 
 
@@ -26,6 +27,7 @@ urlpatterns = view_type_registry.api_urls + [
     re_path(
         r"table/(?P<table_id>[0-9]+)/order/$", OrderViewsView.as_view(), name="order"
     ),
+    re_path(r"indexes/$", ViewFieldIndexesView.as_view(), name="indexes"),
     re_path(
         r"(?P<slug>[-\w]+)/link-row-field-lookup/(?P<field_id>[0-9]+)/$",
         PublicViewLinkRowFieldLookupView.as_view(),
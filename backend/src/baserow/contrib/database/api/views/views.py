@@ -8,7 +8,7 @@ from rest_framework.exceptions import AuthenticationFailed
 from rest_framework.views import APIView
 from rest_framework.request import Request
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated, AllowAny
+from rest_framework.permissions import IsAuthenticated, AllowAny, IsAdminUser
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.views.actions import (
     CreateViewActionType,
@@ -75,6 +75,7 @@ from baserow.contrib.database.views.models import (
     ViewFilter,
     ViewSort,
     ViewDecoration,
+    ViewFieldIndex,
 )
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.exceptions import (
@@ -112,6 +113,7 @@ from .serializers import (
     UpdateViewDecorationSerializer,
     PublicViewAuthRequestSerializer,
     PublicViewAuthResponseSerializer,
+    ViewFieldIndexSerializer,
 )
 from .errors import (
     ERROR_NO_AUTHORIZATION_TO_PUBLICLY_SHARED_VIEW,
@@ -1364,6 +1366,27 @@ class ViewSortView(APIView):
         return Response(status=204)
 
 
+class ViewFieldIndexesView(APIView):
+    permission_classes = (IsAdminUser,)
+
+    @extend_schema(
+        tags=["Database table views"],
+        operation_id="list_database_table_view_field_indexes",
+        description=(
+            "Lists the indexes that the view index advisor has created for the fields "
+            "that views of large tables sort or filter on, including the indexes that "
+            "could not be created. Only a user with staff permissions can list them."
+        ),
+        responses={200: ViewFieldIndexSerializer(many=True)},
+    )
+    def get(self, request):
+        """Lists all the indexes created by the view index advisor."""
+
+        indexes = ViewFieldIndex.objects.select_related("field").order_by("id")
+        serializer = ViewFieldIndexSerializer(indexes, many=True)
+        return Response(serializer.data)
+
+
 class ViewFieldOptionsView(APIView):
     permission_classes = (IsAuthenticated,)
 
@@ -15,9 +15,9 @@ from baserow.contrib.database.fields.field_cache import FieldCache
 from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.models import Database, Table
 from baserow.contrib.database.views.registries import view_type_registry
+from baserow.core.db import copy_bulk_create
 from baserow.core.registries import ApplicationType
 from baserow.core.trash.handler import TrashHandler
-from baserow.core.utils import grouper
 
 from .constants import IMPORT_SERIALIZED_IMPORTING, IMPORT_SERIALIZED_IMPORTING_TABLE
 from .export_serialized import DatabaseExportSerializedStructure
@@ -292,15 +292,14 @@ class DatabaseApplicationType(ApplicationType):
                     state=f"{IMPORT_SERIALIZED_IMPORTING_TABLE}{table['id']}"
                 )
 
-            # We want to insert the rows in bulk because there could potentially be
-            # hundreds of thousands of rows in there and this will result in better
-            # performance.
-            for chunk in grouper(512, rows_to_be_inserted):
-                model.objects.bulk_create(chunk, batch_size=512)
-                progress.increment(
-                    len(chunk),
-                    state=f"{IMPORT_SERIALIZED_IMPORTING_TABLE}{table['id']}",
-                )
+            # We want to insert the rows in bulk using `COPY` because there could
+            # potentially be hundreds of thousands of rows in there and this will
+            # result in better performance.
+            copy_bulk_create(model, rows_to_be_inserted)
+            progress.increment(
+                len(rows_to_be_inserted),
+                state=f"{IMPORT_SERIALIZED_IMPORTING_TABLE}{table['id']}",
+            )
 
             # When the rows are inserted we keep the provide the old ids and because of
             # that the auto increment is still set at `1`. This needs to be set to the
@@ -315,6 +314,9 @@ class DatabaseApplicationType(ApplicationType):
             update_collector = CachingFieldUpdateCollector(
                 field.table, existing_field_lookup_cache=field_cache
             )
+            # The rows have been inserted using `COPY`, which doesn't calculate the
+            # values of for example formula fields.
+            field_type.after_rows_copied(field, update_collector)
             field_type.after_rows_imported(field, [], update_collector)
             update_collector.apply_updates_and_get_updated_fields()
             progress.increment(state=IMPORT_SERIALIZED_IMPORTING)
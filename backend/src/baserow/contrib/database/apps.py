@@ -79,9 +79,12 @@ class DatabaseConfig(AppConfig):
             CreateRowsActionType,
             DeleteRowActionType,
             DeleteRowsActionType,
+            DeleteRowsByFilterActionType,
             MoveRowActionType,
             UpdateRowActionType,
             UpdateRowsActionType,
+            UpdateRowsByFilterActionType,
+            UpsertRowsActionType,
         )
 
         action_type_registry.register(CreateRowActionType())
@@ -91,6 +94,9 @@ class DatabaseConfig(AppConfig):
         action_type_registry.register(MoveRowActionType())
         action_type_registry.register(UpdateRowActionType())
         action_type_registry.register(UpdateRowsActionType())
+        action_type_registry.register(UpsertRowsActionType())
+        action_type_registry.register(UpdateRowsByFilterActionType())
+        action_type_registry.register(DeleteRowsByFilterActionType())
 
         from baserow.contrib.database.views.actions import (
             CreateViewActionType,
@@ -338,11 +344,13 @@ class DatabaseConfig(AppConfig):
             RowCreatedEventType,
             RowUpdatedEventType,
             RowDeletedEventType,
+            RowsBatchJobChunkProcessedEventType,
         )
 
         webhook_event_type_registry.register(RowCreatedEventType())
         webhook_event_type_registry.register(RowUpdatedEventType())
         webhook_event_type_registry.register(RowDeletedEventType())
+        webhook_event_type_registry.register(RowsBatchJobChunkProcessedEventType())
 
         from .airtable.airtable_column_types import (
             TextAirtableColumnType,
@@ -269,3 +269,21 @@ def safe_django_schema_editor(atomic=True, **kwargs):
     with optional_atomic(atomic=atomic):
         with connection.schema_editor(atomic=False, **kwargs) as schema_editor:
             yield schema_editor
+
+
+def execute_concurrently_if_possible(sql: str):
+    """
+    Executes a statement that can't run inside a transaction block when it's
+    prefixed with `CONCURRENTLY`. The statement is only executed concurrently if
+    there is no transaction, otherwise it runs in a savepoint so that a failure
+    doesn't break the transaction.
+
+    :param sql: The statement to execute with a `{concurrently}` placeholder.
+    """
+
+    if connection.in_atomic_block:
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(sql.format(concurrently=""))
+    else:
+        with connection.cursor() as cursor:
+            cursor.execute(sql.format(concurrently="CONCURRENTLY"))
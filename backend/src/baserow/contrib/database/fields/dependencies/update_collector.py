@@ -1,12 +1,14 @@
 from collections import defaultdict
-from typing import Optional, Dict, List, Tuple
+from typing import Optional, Dict, List, Tuple, Union
 
-from django.db.models import Expression
+from django.db.models import Expression, QuerySet
 
 from baserow.contrib.database.fields.dependencies.exceptions import InvalidViaPath
 from baserow.contrib.database.fields.field_cache import FieldCache
 from baserow.contrib.database.fields.models import Field, LinkRowField
 from baserow.contrib.database.fields.signals import field_updated
+from baserow.contrib.database.rows.change_log import RowChangeLogHandler
+from baserow.contrib.database.rows.models import RowChangeActions
 from baserow.contrib.database.table.models import GeneratedTableModel, Table
 
 
@@ -66,9 +68,21 @@ class PathBasedUpdateStatementCollector:
                 path_to_starting_table_id_column = (
                     "__".join(path_to_starting_table) + "__id"
                 )
-            if isinstance(starting_row_id, list):
+            if isinstance(starting_row_id, (list, QuerySet)):
                 path_to_starting_table_id_column += "__in"
             qs = qs.filter(**{path_to_starting_table_id_column: starting_row_id})
+
+        # The rows updated here are not updated via the RowHandler, so they must be
+        # added to the change log here. The starting rows themselves are logged by
+        # the RowHandler. Without starting rows every row of the table can change.
+        if self.update_statements:
+            if starting_row_id is None:
+                RowChangeLogHandler().log_table_change(self.table)
+            elif len(path_to_starting_table) > 0:
+                RowChangeLogHandler().log_row_changes_by_queryset(
+                    self.table, RowChangeActions.UPDATED, qs
+                )
+
         qs.update(**self.update_statements)
 
 
@@ -84,7 +98,7 @@ class CachingFieldUpdateCollector(FieldCache):
         starting_table: Table,
         existing_field_lookup_cache: Optional[FieldCache] = None,
         existing_model: Optional[GeneratedTableModel] = None,
-        starting_row_id: Optional[int] = None,
+        starting_row_id: Optional[Union[int, List[int], QuerySet]] = None,
     ):
         """
 
@@ -95,7 +109,9 @@ class CachingFieldUpdateCollector(FieldCache):
             internal field cache with.
         :param starting_row_id: If the update starts from a single row in the
             starting table set this and all update statements executed by this collector
-            will only update rows which join back to this starting row.
+            will only update rows which join back to this starting row. A list of
+            ids or a queryset selecting the ids can be provided if the update starts
+            from multiple rows.
         """
 
         super().__init__(existing_field_lookup_cache, existing_model)
@@ -92,6 +92,17 @@ class FilterBuilder:
 
         return queryset.annotate(**self._annotation).filter(self._q_filters)
 
+    def get_annotated_q(self) -> AnnotatedQ:
+        """
+        Combines all of the Q and AnnotatedQ filters previously given to this
+        FilterBuilder into a single AnnotatedQ, so that it can be combined with other
+        filters.
+
+        :return: An AnnotatedQ with the merged annotations and combined filters.
+        """
+
+        return AnnotatedQ(annotation=self._annotation, q=self._q_filters)
+
     def _annotate(self, annotation_dict: Dict[str, Any]) -> "FilterBuilder":
         self._annotation = {**self._annotation, **annotation_dict}
 
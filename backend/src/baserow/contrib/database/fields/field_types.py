@@ -13,7 +13,7 @@ from django.contrib.postgres.aggregates import StringAgg
 from django.contrib.postgres.fields import JSONField
 from django.core.exceptions import ValidationError
 from django.core.files.storage import default_storage
-from django.db import models, OperationalError
+from django.db import connection, models, OperationalError
 from django.db.models import Case, When, Q, F, Func, Value, CharField
 from django.db.models.expressions import RawSQL
 from django.db.models.functions import Coalesce
@@ -37,6 +37,7 @@ from baserow.contrib.database.api.fields.serializers import (
     SelectOptionSerializer,
     FileFieldResponseSerializer,
     MustBeEmptyField,
+    serialize_select_option,
 )
 from baserow.contrib.database.formula import (
     BaserowExpression,
@@ -80,6 +81,8 @@ from .fields import (
     BaserowExpressionField,
     MultipleSelectManyToManyField,
     BaserowLastModifiedField,
+    add_reverse_index_to_through_model,
+    create_through_table_reverse_index,
 )
 from .handler import FieldHandler
 from .constants import UPSERT_OPTION_DICT_KEY
@@ -204,6 +207,8 @@ class CharFieldMatchingRegexFieldType(TextFieldMatchingRegexFieldType):
           altering a column to being an email type.
     """
 
+    can_have_view_index = True
+
     @property
     @abstractmethod
     def max_length(self):
@@ -230,6 +235,7 @@ class CharFieldMatchingRegexFieldType(TextFieldMatchingRegexFieldType):
 class TextFieldType(FieldType):
     type = "text"
     model_class = TextField
+    can_have_trigram_index = True
     allowed_fields = ["text_default"]
     serializer_field_names = ["text_default"]
 
@@ -268,6 +274,7 @@ class TextFieldType(FieldType):
 class LongTextFieldType(FieldType):
     type = "long_text"
     model_class = LongTextField
+    can_have_trigram_index = True
 
     def get_serializer_field(self, instance, **kwargs):
         required = kwargs.get("required", False)
@@ -301,6 +308,7 @@ class LongTextFieldType(FieldType):
 class URLFieldType(TextFieldMatchingRegexFieldType):
     type = "url"
     model_class = URLField
+    can_have_trigram_index = True
 
     @property
     def regex(self):
@@ -318,6 +326,7 @@ class NumberFieldType(FieldType):
 
     type = "number"
     model_class = NumberField
+    can_have_view_index = True
     allowed_fields = ["number_decimal_places", "number_negative"]
     serializer_field_names = ["number_decimal_places", "number_negative", "number_type"]
     serializer_field_overrides = {
@@ -452,6 +461,7 @@ class NumberFieldType(FieldType):
 class RatingFieldType(FieldType):
     type = "rating"
     model_class = RatingField
+    can_have_view_index = True
     allowed_fields = ["max_value", "color", "style"]
     serializer_field_names = ["max_value", "color", "style"]
 
@@ -563,6 +573,7 @@ class RatingFieldType(FieldType):
 class BooleanFieldType(FieldType):
     type = "boolean"
     model_class = BooleanField
+    can_have_view_index = True
 
     # lowercase serializers.BooleanField.TRUE_VALUES + "checked" keyword
     # WARNING: these values are prone to SQL injection
@@ -616,6 +627,7 @@ class BooleanFieldType(FieldType):
 class DateFieldType(FieldType):
     type = "date"
     model_class = DateField
+    can_have_view_index = True
     allowed_fields = ["date_format", "date_include_time", "date_time_format"]
     serializer_field_names = ["date_format", "date_include_time", "date_time_format"]
 
@@ -1123,6 +1135,69 @@ class LinkRowFieldType(FieldType):
         else:
             return primary_field_value is None
 
+    def _check_related_row_ids_exist(self, instance, row_ids, existing_ids):
+        """
+        Checks if the provided related row ids exist in the related table, using a
+        single query for the ids that aren't in `existing_ids` yet. Trashed rows are
+        considered as existing so that their relations can be restored.
+
+        :param instance: The link row field instance.
+        :param row_ids: The related row ids that must exist.
+        :param existing_ids: The ids that are known to exist. The ids found by the
+            query are added to it.
+        :raises ValidationError: When one of the ids doesn't exist.
+        """
+
+        from baserow.contrib.database.table.models import Table
+
+        missing_ids = row_ids - existing_ids
+        if len(missing_ids) > 0:
+            table_name = connection.ops.quote_name(
+                f"{Table.USER_TABLE_DATABASE_NAME_PREFIX}{instance.link_row_table_id}"
+            )
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f'SELECT "id" FROM {table_name} WHERE "id" = ANY(%s)',  # nosec
+                    [list(missing_ids)],
+                )
+                existing_ids.update(row_id for row_id, in cursor.fetchall())
+
+        invalid_ids = sorted(row_ids - existing_ids)
+        if len(invalid_ids) > 0:
+            raise ValidationError(
+                f"The provided row ids {invalid_ids} do not exist in the related table."
+            )
+
+    def prepare_value_for_db(self, instance, value):
+        if value:
+            self._check_related_row_ids_exist(
+                instance, {x for x in value if isinstance(x, int)}, set()
+            )
+        return value
+
+    def prepare_value_for_db_in_bulk(self, instance, values_by_row, lookup_cache=None):
+        """
+        Checks if all the provided related row ids of all the rows exist in the
+        related table using a single query. The ids that are found are kept in the
+        lookup cache, so that they're not checked again by the next batches.
+        """
+
+        unique_ids = set()
+        for value in values_by_row.values():
+            if value is not None:
+                unique_ids.update(x for x in value if isinstance(x, int))
+
+        if len(unique_ids) == 0:
+            return values_by_row
+
+        existing_ids = (
+            set()
+            if lookup_cache is None
+            else lookup_cache.setdefault(f"field_{instance.id}_existing_row_ids", set())
+        )
+        self._check_related_row_ids_exist(instance, unique_ids, existing_ids)
+        return values_by_row
+
     def get_serializer_field(self, instance, **kwargs):
         """
         If the value is going to be updated we want to accept a list of integers
@@ -1215,6 +1290,7 @@ class LinkRowFieldType(FieldType):
         apps.do_pending_operations(related_model)
         apps.do_pending_operations(model_field.remote_field.through)
         apps.clear_cache()
+        add_reverse_index_to_through_model(model_field)
 
     def prepare_values(self, values, user):
         """
@@ -1294,6 +1370,8 @@ class LinkRowFieldType(FieldType):
         if field.link_row_related_field:
             return
 
+        create_through_table_reverse_index(model._meta.get_field(field.db_column))
+
         related_field_name = self.find_next_unused_related_field_name(field)
         field.link_row_related_field = FieldHandler().create_field(
             user=user,
@@ -1365,6 +1443,14 @@ class LinkRowFieldType(FieldType):
         field into the related table.
         """
 
+        if isinstance(to_field, self.model_class) and (
+            not isinstance(from_field, self.model_class)
+            or from_field.link_row_table_id != to_field.link_row_table_id
+        ):
+            create_through_table_reverse_index(
+                to_model._meta.get_field(to_field.db_column)
+            )
+
         if not isinstance(from_field, self.model_class) and isinstance(
             to_field, self.model_class
         ):
@@ -1536,6 +1622,7 @@ class LinkRowFieldType(FieldType):
 class EmailFieldType(CharFieldMatchingRegexFieldType):
     type = "email"
     model_class = EmailField
+    can_have_trigram_index = True
 
     @property
     def regex(self):
@@ -1620,25 +1707,37 @@ class FileFieldType(FieldType):
 
         return user_files
 
-    def prepare_value_for_db_in_bulk(self, instance, values_by_row):
+    def prepare_value_for_db_in_bulk(self, instance, values_by_row, lookup_cache=None):
         provided_names_by_row = defaultdict(list)
         unique_names = set()
 
         for row_index, value in values_by_row.items():
+            if value is None:
+                value = []
+            elif not isinstance(value, list):
+                raise ValidationError("The provided value must be a list.")
             provided_names_by_row[row_index] = self._extract_file_names(value)
             unique_names.update(pn["name"] for pn in provided_names_by_row[row_index])
 
         if len(unique_names) == 0:
+            for row_index in values_by_row.keys():
+                values_by_row[row_index] = []
             return values_by_row
 
-        files = UserFile.objects.all().name(*unique_names)
-        if len(files) != len(unique_names):
-            invalid_names = sorted(
-                list(unique_names - set((file.name) for file in files))
-            )
+        # The user files are not related to a field, so they can be shared by all the
+        # file fields.
+        user_files_by_name = (
+            {} if lookup_cache is None else lookup_cache.setdefault("user_files", {})
+        )
+        missing_names = unique_names - user_files_by_name.keys()
+        if len(missing_names) > 0:
+            for file in UserFile.objects.all().name(*missing_names):
+                user_files_by_name[file.name] = file
+
+        if not unique_names.issubset(user_files_by_name.keys()):
+            invalid_names = sorted(list(unique_names - user_files_by_name.keys()))
             raise UserFileDoesNotExist(invalid_names)
 
-        user_files_by_name = dict((file.name, file) for file in files)
         for row_index, value in values_by_row.items():
             serialized_files = []
             for file_names in provided_names_by_row[row_index]:
@@ -1825,6 +1924,40 @@ class SelectOptionBaseFieldType(FieldType):
         # If there are any deleted options we need to backup
         return old_field.select_options.exclude(id__in=updated_ids).exists()
 
+    def get_select_options_by_id(
+        self, instance, option_ids, lookup_cache=None
+    ) -> Dict[int, SelectOption]:
+        """
+        Fetches the select options of the field with the provided ids using a single
+        query. The options that have already been fetched before are taken from the
+        lookup cache if provided.
+
+        :param instance: The field instance of which the select options are fetched.
+        :param option_ids: The ids of the select options that must be fetched.
+        :param lookup_cache: An optional dict in which the fetched select options are
+            stored for later calls.
+        :return: The select options by id. Ids that don't belong to a select option of
+            the field are not included.
+        """
+
+        options_by_id = (
+            {}
+            if lookup_cache is None
+            else lookup_cache.setdefault(f"field_{instance.id}_select_options", {})
+        )
+        missing_ids = set(option_ids) - options_by_id.keys()
+        if len(missing_ids) > 0:
+            for option in SelectOption.objects.filter(
+                field=instance, id__in=missing_ids
+            ):
+                options_by_id[option.id] = option
+
+        return {
+            option_id: options_by_id[option_id]
+            for option_id in option_ids
+            if option_id in options_by_id
+        }
+
 
 class SingleSelectFieldType(SelectOptionBaseFieldType):
     type = "single_select"
@@ -1852,6 +1985,9 @@ class SingleSelectFieldType(SelectOptionBaseFieldType):
             }
         )
 
+    def get_response_value_converter(self, instance):
+        return serialize_select_option
+
     def enhance_queryset(self, queryset, field, name):
         return queryset.prefetch_related(
             models.Prefetch(name, queryset=SelectOption.objects.using("default").all())
@@ -1879,21 +2015,15 @@ class SingleSelectFieldType(SelectOptionBaseFieldType):
         # then the provided value is invalid and a validation error can be raised.
         raise ValidationError(f"The provided value is not a valid option.")
 
-    def prepare_value_for_db_in_bulk(self, instance, values_by_row):
+    def prepare_value_for_db_in_bulk(self, instance, values_by_row, lookup_cache=None):
         unique_values = {value for value in values_by_row.values() if value is not None}
 
-        select_options = SelectOption.objects.filter(
-            field=instance, id__in=unique_values
+        options_by_id = self.get_select_options_by_id(
+            instance, unique_values, lookup_cache
         )
 
-        options_by_id = {}
-        selected_ids = []
-        for option in select_options:
-            options_by_id[option.id] = option
-            selected_ids.append(option.id)
-
-        if len(selected_ids) != len(unique_values):
-            invalid_ids = sorted(list(unique_values - set(selected_ids)))
+        if len(options_by_id) != len(unique_values):
+            invalid_ids = sorted(list(unique_values - options_by_id.keys()))
             raise AllProvidedMultipleSelectValuesMustBeSelectOption(invalid_ids)
 
         for row_index, value in values_by_row.items():
@@ -2142,6 +2272,15 @@ class MultipleSelectFieldType(SelectOptionBaseFieldType):
             }
         )
 
+    def get_response_value_converter(self, instance):
+        def convert(select_options):
+            return [
+                serialize_select_option(select_option)
+                for select_option in select_options.all()
+            ]
+
+        return convert
+
     def enhance_queryset(self, queryset, field, name):
         remote_field = queryset.model._meta.get_field(name).remote_field
         remote_model = remote_field.model
@@ -2167,17 +2306,18 @@ class MultipleSelectFieldType(SelectOptionBaseFieldType):
 
         return value
 
-    def prepare_value_for_db_in_bulk(self, instance, values_by_row):
+    def prepare_value_for_db_in_bulk(self, instance, values_by_row, lookup_cache=None):
         unique_values = set()
         for row_index, value in values_by_row.items():
-            unique_values.update(value)
+            if value is not None:
+                unique_values.update(value)
 
-        selected_ids = SelectOption.objects.filter(
-            field=instance, id__in=unique_values
-        ).values_list("id", flat=True)
+        options_by_id = self.get_select_options_by_id(
+            instance, unique_values, lookup_cache
+        )
 
-        if len(selected_ids) != len(unique_values):
-            invalid_ids = sorted(list(unique_values - set(selected_ids)))
+        if len(options_by_id) != len(unique_values):
+            invalid_ids = sorted(list(unique_values - options_by_id.keys()))
             raise AllProvidedMultipleSelectValuesMustBeSelectOption(invalid_ids)
 
         return values_by_row
@@ -2279,6 +2419,27 @@ class MultipleSelectFieldType(SelectOptionBaseFieldType):
         apps.do_pending_operations(model)
         apps.do_pending_operations(select_option_field.remote_field.through)
         apps.clear_cache()
+        add_reverse_index_to_through_model(model_field)
+
+    def after_create(self, field, model, user, connection, before):
+        create_through_table_reverse_index(model._meta.get_field(field.db_column))
+        super().after_create(field, model, user, connection, before)
+
+    def after_update(
+        self,
+        from_field,
+        to_field,
+        from_model,
+        to_model,
+        user,
+        connection,
+        altered_column,
+        before,
+    ):
+        if not isinstance(from_field, self.model_class):
+            create_through_table_reverse_index(
+                to_model._meta.get_field(to_field.db_column)
+            )
 
     def get_export_serialized_value(self, row, field_name, cache, files_zip, storage):
         cache_entry = f"{field_name}_relations"
@@ -2709,6 +2870,9 @@ class FormulaFieldType(ReadOnlyFieldType):
         if field.requires_refresh_after_insert:
             self._refresh_row_values(field, update_collector, [])
 
+    def after_rows_copied(self, field: FormulaField, update_collector):
+        self._refresh_row_values(field, update_collector, [])
+
     def after_update(
         self,
         from_field,
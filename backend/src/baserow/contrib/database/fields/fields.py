@@ -1,6 +1,6 @@
 from typing import Optional
 
-from django.db import models
+from django.db import connection, models
 from django.db.models import Field, Value
 from django.db.models.fields.related_descriptors import (
     ForwardManyToOneDescriptor,
@@ -77,6 +77,66 @@ class MultipleSelectManyToManyDescriptor(ManyToManyDescriptor):
         return CustomManager
 
 
+def get_through_table_reverse_index(
+    model_field: models.ManyToManyField,
+) -> models.Index:
+    """
+    The automatically created through table of a many to many field only has a unique
+    index starting with the column of the row that has the field. This returns an index
+    starting with the column of the related row or select option instead. It allows
+    finding the rows that have a relation to a specific row or select option, like the
+    `has` view filters do, without scanning the whole through table.
+
+    :param model_field: The many to many field of which the through table has been
+        generated.
+    :return: The index of the through table.
+    """
+
+    through_model = model_field.remote_field.through
+    return models.Index(
+        fields=[model_field.m2m_reverse_field_name(), model_field.m2m_field_name()],
+        name=f"{through_model._meta.db_table}_reverse",
+    )
+
+
+def add_reverse_index_to_through_model(model_field: models.ManyToManyField):
+    """
+    Adds the reverse index to the through model, so that it's created together with
+    the through table when the schema editor creates a managed table model.
+
+    :param model_field: The many to many field of which the through table has been
+        generated.
+    """
+
+    through_model = model_field.remote_field.through
+    index = get_through_table_reverse_index(model_field)
+    if all(existing.name != index.name for existing in through_model._meta.indexes):
+        through_model._meta.indexes = [*through_model._meta.indexes, index]
+
+
+def create_through_table_reverse_index(model_field: models.ManyToManyField):
+    """
+    Creates the reverse index of the through table if it doesn't exist yet. This is
+    needed when the through table is created by adding the field to an unmanaged
+    table model, because then the indexes of the through model are not created.
+
+    :param model_field: The many to many field of which the through table has been
+        created.
+    """
+
+    through_model = model_field.remote_field.through
+    index = get_through_table_reverse_index(model_field)
+    columns = ", ".join(
+        connection.ops.quote_name(through_model._meta.get_field(name).column)
+        for name in index.fields
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE INDEX IF NOT EXISTS {connection.ops.quote_name(index.name)} "
+            f"ON {connection.ops.quote_name(through_model._meta.db_table)} ({columns})"
+        )
+
+
 class MultipleSelectManyToManyField(models.ManyToManyField):
     """
     This is a slight modification of Djangos default ManyToManyField to be used with
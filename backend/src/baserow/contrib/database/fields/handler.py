@@ -33,8 +33,11 @@ from baserow.contrib.database.fields.models import TextField
 from baserow.contrib.database.fields.field_converters import (
     MultipleSelectConversionConfig,
 )
+from baserow.contrib.database.rows.change_log import RowChangeLogHandler
 from baserow.contrib.database.table.models import Table
+from baserow.contrib.database.table.search import SearchDataHandler
 from baserow.contrib.database.views.handler import ViewHandler
+from baserow.contrib.database.views.index_advisor import ViewIndexAdvisor
 from baserow.contrib.database.db.sql_queries import (
     sql_drop_try_cast,
     sql_create_try_cast,
@@ -69,6 +72,7 @@ from .signals import (
     field_restored,
     before_field_deleted,
 )
+from .trigram_indexes import TrigramIndexHandler
 
 logger = logging.getLogger(__name__)
 
@@ -292,6 +296,9 @@ class FieldHandler:
             type_name=type_name,
         )
         update_collector.send_additional_field_updated_signals()
+        SearchDataHandler().fields_changed(
+            [instance.table_id] + [f.table_id for f in updated_fields]
+        )
 
         if return_updated_fields:
             return instance, updated_fields
@@ -395,6 +402,17 @@ class FieldHandler:
         from_model_field = from_model._meta.get_field(field.db_column)
         to_model_field = to_model._meta.get_field(field.db_column)
 
+        # The trigram index only supports text columns and the view index only
+        # supports some of the types, so they must be dropped before the type of the
+        # column changes.
+        if baserow_field_type_changed:
+            TrigramIndexHandler().drop_field_index(old_field)
+            ViewIndexAdvisor().drop_field_index(old_field)
+
+        # The search data trigger depends on the type of the column, so it's dropped
+        # until it's recreated when the fields have changed.
+        SearchDataHandler().drop_search_data_trigger(field.table)
+
         # Before a field is updated we are going to call the before_schema_change
         # method of the old field because some cleanup of related instances might
         # need to happen.
@@ -412,6 +430,7 @@ class FieldHandler:
         converter = field_converter_registry.find_applicable_converter(
             from_model, old_field, field
         )
+        force_alter_column = False
 
         if converter:
             # If a field data converter is found we are going to use that one to alter
@@ -469,6 +488,11 @@ class FieldHandler:
         to_model_field_type = to_model_field.db_parameters(connection)["type"]
         altered_column = from_model_field_type != to_model_field_type
 
+        # Converting the values of the column changes the rows without going through
+        # the RowHandler, so every row of the table is marked as changed.
+        if converter or force_alter_column or altered_column:
+            RowChangeLogHandler().log_table_change(field.table)
+
         # If the new field doesn't support select options we can delete those
         # relations.
         if (
@@ -517,6 +541,9 @@ class FieldHandler:
             user=user,
         )
         update_collector.send_additional_field_updated_signals()
+        SearchDataHandler().fields_changed(
+            [field.table_id] + [f.table_id for f in updated_fields]
+        )
 
         if return_updated_fields:
             return field, updated_fields
@@ -612,6 +639,9 @@ class FieldHandler:
                 before_return=before_return,
             )
             update_collector.send_additional_field_updated_signals()
+            SearchDataHandler().fields_changed(
+                [field.table_id] + [f.table_id for f in updated_fields]
+            )
             return updated_fields
         else:
             return []
@@ -847,6 +877,9 @@ class FieldHandler:
                     self, field=field, user=None, related_fields=updated_fields
                 )
                 update_collector.send_additional_field_updated_signals()
+                SearchDataHandler().fields_changed(
+                    [field.table_id] + [f.table_id for f in updated_fields]
+                )
 
             for other_required_field in other_fields_that_must_restore_at_same_time:
                 if other_required_field.trashed:
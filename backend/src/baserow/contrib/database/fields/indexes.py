@@ -0,0 +1,110 @@
+import logging
+from typing import Optional, Type
+
+from django.db import connection
+from django.db.utils import DatabaseError
+
+from baserow.contrib.database.db.schema import execute_concurrently_if_possible
+from baserow.contrib.database.table.models import Table
+
+from .models import Field, ManagedFieldIndex
+
+logger = logging.getLogger(__name__)
+
+
+class FieldIndexHandler:
+    """
+    Creates and drops the indexes on the columns of fields of which the state is
+    tracked by a `ManagedFieldIndex` model, without locking the table for writes.
+    """
+
+    index_model: Type[ManagedFieldIndex] = None
+    created_state: str = "created"
+    failed_state: str = "failed"
+
+    def get_index_definition(self, column_name: str) -> str:
+        """
+        Returns the part of the `CREATE INDEX` statement that follows the table name.
+
+        :param column_name: The quoted name of the column of the field.
+        :return: The definition of the index.
+        """
+
+        raise NotImplementedError(
+            "Each field index handler must have its own get_index_definition method."
+        )
+
+    def create_index(self, index: ManagedFieldIndex) -> ManagedFieldIndex:
+        """
+        Creates the index of the field and saves its state. If the index can't be
+        created, it's marked as failed together with the error.
+
+        :param index: The index that must be created.
+        :return: The created or failed index.
+        """
+
+        table_name = connection.ops.quote_name(
+            f"{Table.USER_TABLE_DATABASE_NAME_PREFIX}{index.field.table_id}"
+        )
+        index_name = connection.ops.quote_name(index.index_name)
+        column_name = connection.ops.quote_name(index.field.db_column)
+
+        # An earlier attempt that was interrupted can have left an invalid index.
+        execute_concurrently_if_possible(
+            f"DROP INDEX {{concurrently}} IF EXISTS {index_name}"
+        )
+        try:
+            execute_concurrently_if_possible(
+                f"CREATE INDEX {{concurrently}} {index_name} ON {table_name} "
+                f"{self.get_index_definition(column_name)}"
+            )
+        except DatabaseError as e:
+            # A failed concurrent index creation leaves an invalid index behind.
+            execute_concurrently_if_possible(
+                f"DROP INDEX {{concurrently}} IF EXISTS {index_name}"
+            )
+            logger.warning(
+                f"The index {index.index_name} of field {index.field_id} could not "
+                f"be created: {e}"
+            )
+            index.state = self.failed_state
+            index.error = str(e)
+        else:
+            index.state = self.created_state
+            index.error = ""
+
+        index.save()
+        return index
+
+    def drop_index(self, index: ManagedFieldIndex):
+        """
+        Drops the index of the field and deletes its state.
+
+        :param index: The index that must be dropped.
+        """
+
+        index_name = connection.ops.quote_name(index.index_name)
+        execute_concurrently_if_possible(
+            f"DROP INDEX {{concurrently}} IF EXISTS {index_name}"
+        )
+        index.delete()
+
+    def get_field_index(self, field: Field) -> Optional[ManagedFieldIndex]:
+        return (
+            self.index_model.objects.select_related("field")
+            .filter(field_id=field.id)
+            .first()
+        )
+
+    def drop_field_index(self, field: Field):
+        """
+        Drops the index of the provided field if it has one. This must be called
+        before the type of the column changes, because the new type might not support
+        the index.
+
+        :param field: The field of which the index must be dropped.
+        """
+
+        index = self.get_field_index(field)
+        if index is not None:
+            self.drop_index(index)
@@ -483,4 +483,59 @@ class LookupField(FormulaField):
         )
 
 
+class ManagedFieldIndex(CreatedAndUpdatedOnMixin, models.Model):
+    """
+    Keeps track of an index on the column of a field that is created and dropped in
+    the background, see the `FieldIndexHandler`. The concrete models must have a
+    one to one `field` relation and a `state` field.
+    """
+
+    # Distinguishes the names of the different kinds of indexes of the same field.
+    index_name_suffix = None
+
+    error = models.TextField(
+        blank=True, help_text="The error that occurred while creating the index."
+    )
+
+    @property
+    def index_name(self):
+        from baserow.contrib.database.table.models import Table
+
+        return (
+            f"{Table.USER_TABLE_DATABASE_NAME_PREFIX}{self.field.table_id}_field_"
+            f"{self.field_id}_{self.index_name_suffix}"
+        )
+
+    class Meta:
+        abstract = True
+
+
+class FieldTrigramIndexStates(models.TextChoices):
+    PENDING = "pending"
+    CREATED = "created"
+    FAILED = "failed"
+
+
+class FieldTrigramIndex(ManagedFieldIndex):
+    """
+    Keeps track of the `pg_trgm` GIN index of a text field that is used by a
+    contains filter or search. The index is created in the background when the field
+    is used for the first time and dropped again when it hasn't been used for a while.
+    """
+
+    index_name_suffix = "trgm"
+
+    field = models.OneToOneField(
+        Field, on_delete=models.CASCADE, related_name="trigram_index"
+    )
+    state = models.CharField(
+        max_length=16,
+        choices=FieldTrigramIndexStates.choices,
+        default=FieldTrigramIndexStates.PENDING,
+    )
+    last_used_on = models.DateTimeField(
+        help_text="The last time the field was used by a contains filter or search."
+    )
+
+
 SpecificFieldForUpdate = NewType("SpecificFieldForUpdate", Field)
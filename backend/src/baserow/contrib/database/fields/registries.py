@@ -91,6 +91,20 @@ class FieldType(
     `FieldHandler::get_unique_row_values` method.
     """
 
+    can_have_trigram_index = False
+    """
+    Indicates whether a `pg_trgm` GIN index can be created for the column of this
+    field type to speed up the contains filter and search. The column must contain
+    text.
+    """
+
+    can_have_view_index = False
+    """
+    Indicates whether the view index advisor can create a B-tree index for the column
+    of this field type when views sort or filter on it. The column must be sorted by
+    its own value and its values must be small enough to fit in an index entry.
+    """
+
     read_only = False
     """Indicates whether the field allows inserting/updating row values or if it is
     read only."""
@@ -136,15 +150,22 @@ class FieldType(
 
         return getattr(row, field_name)
 
-    def prepare_value_for_db_in_bulk(self, instance, values_by_row):
+    def prepare_value_for_db_in_bulk(self, instance, values_by_row, lookup_cache=None):
         """
         This method will work for every `prepare_value_for_db` that doesn't
-        execute a query. Fields that do should override this method.
+        execute a query. Fields that do, and every field type of which the values
+        reference other objects like select options, files or related rows, must
+        override this method and resolve the references of all the rows with a single
+        query.
 
         :param instance: The field instance.
         :type instance: Field
         :param values_by_row: The values that needs to be inserted or updated,
             indexed by row id as dict(index, values).
+        :param lookup_cache: An optional dict in which the resolved references can be
+            stored, so that they don't have to be fetched again when multiple batches
+            of rows are prepared for the same request.
+        :type lookup_cache: Optional[dict]
         :return: The modified values in the same structure as it was passed in.
         """
 
@@ -272,6 +293,24 @@ class FieldType(
 
         return self.get_serializer_field(instance, **kwargs)
 
+    def get_response_value_converter(self, instance):
+        """
+        Can optionally return a function that directly converts the value of the
+        field in a row to the value that the `get_response_serializer_field` would
+        return, without going through the Django REST framework serializer field. It
+        is used by the compiled row serializer to speed up serializing many rows. The
+        function is not called for `None` values and its output must be identical to
+        the serializer field's output.
+
+        :param instance: The field instance for which to get the converter.
+        :type instance: Field
+        :return: The function that converts the value or None if the response
+            serializer field must be used.
+        :rtype: Optional[Callable[[Any], Any]]
+        """
+
+        return None
+
     def get_serializer_help_text(self, instance):
         """
         If some additional information in the documentation related to the field's type
@@ -758,6 +797,20 @@ class FieldType(
 
         pass
 
+    def after_rows_copied(self, field, update_collector):
+        """
+        Called after rows have been inserted using the PostgreSQL `COPY` command.
+        Values that are calculated by an expression while inserting, are not set by
+        the `COPY` command, so fields with such values must register an update
+        statement with the update_collector to set them.
+
+        :param field: A field instance of this field type.
+        :param update_collector: Any row update statements should be registered into
+            this collector.
+        """
+
+        pass
+
     def get_export_serialized_value(
         self,
         row: "GeneratedTableModel",
@@ -2,6 +2,7 @@ from django.db.models.signals import post_delete
 from django.dispatch import Signal, receiver
 
 from baserow.contrib.database.fields.models import Field
+from baserow.contrib.database.table.change_sequence import bump_table_change_sequences
 
 field_created = Signal()
 field_restored = Signal()
@@ -13,3 +14,15 @@ before_field_deleted = Signal()
 @receiver(post_delete, sender=Field)
 def invalidate_model_cache_when_field_deleted(sender, instance, **kwargs):
     instance.invalidate_table_model_cache()
+
+
+@receiver(field_created)
+@receiver(field_restored)
+@receiver(field_updated)
+@receiver(field_deleted)
+def bump_table_change_sequences_when_field_changed(
+    sender, field, related_fields, **kwargs
+):
+    bump_table_change_sequences(
+        [field.table_id] + [related_field.table_id for related_field in related_fields]
+    )
@@ -0,0 +1,27 @@
+from datetime import timedelta
+
+from django.conf import settings
+
+from baserow.config.celery import app
+
+
+@app.task(bind=True, queue="export")
+def manage_trigram_indexes(self):
+    """
+    Creates the trigram indexes of the text fields that are used by contains filters
+    or searches and drops the indexes that aren't used anymore.
+    """
+
+    from baserow.contrib.database.fields.trigram_indexes import TrigramIndexHandler
+
+    TrigramIndexHandler().manage_indexes()
+
+
+# noinspection PyUnusedLocal
+@app.on_after_finalize.connect
+def setup_periodic_trigram_index_tasks(sender, **kwargs):
+    if settings.BASEROW_TRIGRAM_INDEXES_ENABLED:
+        sender.add_periodic_task(
+            timedelta(minutes=settings.BASEROW_TRIGRAM_INDEX_MANAGE_INTERVAL_MINUTES),
+            manage_trigram_indexes.s(),
+        )
@@ -0,0 +1,150 @@
+"""
+The contains filter and the search compile to a `LIKE` on the uppercased column, which
+requires a sequential scan of the whole table. A `pg_trgm` GIN index on that
+expression allows PostgreSQL to find the matching rows using the index instead.
+
+Because these indexes are big and slow down writes, they're only created for the
+text fields that are actually filtered or searched on in tables with enough rows.
+Using a field only records its usage, the indexes are created and dropped in the
+background by the `manage_trigram_indexes` task. An index is dropped again when the
+field hasn't been used for `BASEROW_TRIGRAM_INDEX_UNUSED_DAYS` days or when the field
+is trashed. When the column is dropped or its type changes, the index is dropped as
+well.
+"""
+
+import logging
+from datetime import timedelta
+from typing import Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Q
+from django.db.utils import DatabaseError
+from django.utils import timezone
+
+from baserow.contrib.database.db.schema import execute_concurrently_if_possible
+from baserow.contrib.database.rows.count import get_estimated_row_count
+
+from .indexes import FieldIndexHandler
+from .models import Field, FieldTrigramIndex, FieldTrigramIndexStates
+from .registries import field_type_registry
+
+logger = logging.getLogger(__name__)
+
+# The usage of a field is recorded at most once per this many seconds, so that
+# filtering or searching doesn't write to the database on every request.
+USAGE_RECORD_INTERVAL = 60 * 60
+
+
+def get_trigram_index_usage_cache_key(field_id: int) -> str:
+    return f"trigram_index_usage__{field_id}"
+
+
+class TrigramIndexHandler(FieldIndexHandler):
+    index_model = FieldTrigramIndex
+    created_state = FieldTrigramIndexStates.CREATED
+    failed_state = FieldTrigramIndexStates.FAILED
+
+    def record_usage(self, fields: Iterable[Field]):
+        """
+        Records that the provided fields have been used by a contains filter or
+        search, so that a trigram index is created for them in the background. Fields
+        of which the type can't have a trigram index are ignored.
+
+        :param fields: The fields that have been used.
+        """
+
+        if not settings.BASEROW_TRIGRAM_INDEXES_ENABLED:
+            return
+
+        field_ids_by_cache_key = {
+            get_trigram_index_usage_cache_key(field.id): field.id
+            for field in fields
+            if field_type_registry.get_by_model(field).can_have_trigram_index
+        }
+        recently_recorded = cache.get_many(field_ids_by_cache_key.keys())
+        field_ids = [
+            field_id
+            for cache_key, field_id in field_ids_by_cache_key.items()
+            if cache_key not in recently_recorded
+            and cache.add(cache_key, True, timeout=USAGE_RECORD_INTERVAL)
+        ]
+        if len(field_ids) == 0:
+            return
+
+        now = timezone.now()
+        FieldTrigramIndex.objects.filter(field_id__in=field_ids).update(
+            last_used_on=now
+        )
+        FieldTrigramIndex.objects.bulk_create(
+            [
+                FieldTrigramIndex(field_id=field_id, last_used_on=now)
+                for field_id in field_ids
+            ],
+            ignore_conflicts=True,
+        )
+
+    def is_extension_available(self) -> bool:
+        """
+        Checks whether the `pg_trgm` extension is installed and tries to install it
+        if it isn't. Installing an extension might require more privileges than the
+        database user has.
+
+        :return: Whether the `pg_trgm` extension is installed.
+        """
+
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+            if cursor.fetchone() is not None:
+                return True
+
+        try:
+            execute_concurrently_if_possible("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        except DatabaseError as e:
+            logger.warning(f"The pg_trgm extension could not be installed: {e}")
+            return False
+
+        return True
+
+    def get_index_definition(self, column_name: str) -> str:
+        return f"USING gin (UPPER({column_name}::text) gin_trgm_ops)"
+
+    def manage_indexes(self):
+        """
+        Drops the indexes of the fields that haven't been used for a while or that
+        have been trashed and creates the pending indexes of the fields in tables that
+        have at least `BASEROW_TRIGRAM_INDEX_MIN_ROWS` rows. The indexes of smaller
+        tables stay pending until the table is big enough.
+        """
+
+        if not settings.BASEROW_TRIGRAM_INDEXES_ENABLED:
+            return
+
+        unused_since = timezone.now() - timedelta(
+            days=settings.BASEROW_TRIGRAM_INDEX_UNUSED_DAYS
+        )
+        unused_indexes = FieldTrigramIndex.objects.select_related("field").filter(
+            Q(last_used_on__lt=unused_since)
+            | Q(field__trashed=True)
+            | Q(field__table__trashed=True)
+        )
+        for index in unused_indexes:
+            self.drop_index(index)
+
+        pending_indexes = FieldTrigramIndex.objects.select_related(
+            "field__table"
+        ).filter(state=FieldTrigramIndexStates.PENDING)
+        if not pending_indexes.exists() or not self.is_extension_available():
+            return
+
+        for index in pending_indexes:
+            field_type = field_type_registry.get_by_model(index.field.specific_class)
+            if not field_type.can_have_trigram_index:
+                index.delete()
+                continue
+
+            model = index.field.table.get_model(field_ids=[])
+            row_count = get_estimated_row_count(model.objects.all()) or 0
+            if row_count >= settings.BASEROW_TRIGRAM_INDEX_MIN_ROWS:
+                self.create_index(index)
@@ -0,0 +1,62 @@
+import time
+
+from django.core.management import BaseCommand
+from django.db import connection
+
+from baserow.contrib.database.views.handler import ViewHandler
+from baserow.contrib.database.views.models import View
+
+
+class Command(BaseCommand):
+    help = (
+        "Shows the query plan of the filtered and sorted rows of a view and measures "
+        "how long it takes to count them and to fetch the first page. This can be "
+        "used to compare the performance of the view filters, for example of views "
+        "with multiple link row or multiple select filters."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "view_id", type=int, help="The id of the view that must be benchmarked."
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=10,
+            help="The amount of times the queries are executed.",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=100,
+            help="The amount of rows in the first page.",
+        )
+
+    def handle(self, *args, **options):
+        view = View.objects.select_related("table").get(id=options["view_id"]).specific
+        model = view.table.get_model()
+        queryset = ViewHandler().get_queryset(view, model=model)
+        page_queryset = queryset[: options["limit"]]
+
+        sql, params = page_queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS) {sql}", params)
+            plan = "\n".join(row[0] for row in cursor.fetchall())
+        self.stdout.write(plan)
+
+        for name, run in [
+            ("count", lambda: queryset.count()),
+            ("first page", lambda: list(page_queryset.all())),
+        ]:
+            timings = []
+            for _ in range(options["repeat"]):
+                start = time.perf_counter()
+                run()
+                timings.append((time.perf_counter() - start) * 1000)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{name}: min {min(timings):.2f}ms, "
+                    f"avg {sum(timings) / len(timings):.2f}ms, "
+                    f"max {max(timings):.2f}ms"
+                )
+            )
@@ -8,8 +8,12 @@ from django.db.models import Max
 from django.db.models.fields.related import ForeignKey
 from faker import Faker
 
+from baserow.contrib.database.fields.dependencies.update_collector import (
+    CachingFieldUpdateCollector,
+)
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.table.models import Table
+from baserow.core.db import copy_bulk_create
 
 
 class Command(BaseCommand):
@@ -74,7 +78,7 @@ def fill_table_rows(limit, table):
 
     # First create the rows in bulk because that's more efficient than creating them
     # one by one.
-    model.objects.bulk_create([row for (row, relations) in rows])
+    copy_bulk_create(model, [row for (row, relations) in rows])
 
     # Construct an object where the key is the field name of the many to many field
     # that must be populated. The value contains the objects that must be inserted in
@@ -110,4 +114,15 @@ def fill_table_rows(limit, table):
 
     for field_name, values in many_to_many.items():
         through = getattr(model, field_name).through
-        through.objects.bulk_create(values)
+        copy_bulk_create(through, values, assign_ids=False)
+
+    # The `COPY` command doesn't calculate the values of for example the formula
+    # fields, so they're updated after the rows and relations have been inserted.
+    update_collector = CachingFieldUpdateCollector(
+        table,
+        starting_row_id=[row.id for (row, relations) in rows],
+        existing_model=model,
+    )
+    for field_object in model._field_objects.values():
+        field_object["type"].after_rows_copied(field_object["field"], update_collector)
+    update_collector.apply_updates_and_get_updated_fields()
@@ -0,0 +1,41 @@
+from django.core.management import BaseCommand
+
+from baserow.contrib.database.views.index_advisor import ViewIndexAdvisor
+
+
+class Command(BaseCommand):
+    help = (
+        "Creates an index for the fields that views of large tables sort on first or "
+        "filter on with an equality or range filter, and drops the indexes of the "
+        "fields that aren't sorted or filtered on anymore."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only shows which indexes would be created and dropped.",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+        created, dropped = ViewIndexAdvisor().manage_indexes(dry_run=dry_run)
+
+        create_verb = "Would create" if dry_run else "Created"
+        drop_verb = "Would drop" if dry_run else "Dropped"
+        for field in created:
+            self.stdout.write(
+                f"{create_verb} the index of field {field.id} in table "
+                f"{field.table_id}."
+            )
+        for index in dropped:
+            self.stdout.write(
+                f"{drop_verb} the index of field {index.field_id} in table "
+                f"{index.field.table_id}."
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{create_verb} {len(created)} and {drop_verb.lower()} "
+                f"{len(dropped)} indexes."
+            )
+        )
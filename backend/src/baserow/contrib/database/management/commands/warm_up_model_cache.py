@@ -0,0 +1,26 @@
+from django.core.management import BaseCommand
+
+from baserow.contrib.database.table.cache import warm_up_table_models
+
+
+class Command(BaseCommand):
+    help = (
+        "Generates the models of the most recently used tables so that their "
+        "schemas are cached in Redis again, for example after clearing the "
+        "generated model cache."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=None,
+            help="The maximum amount of tables to warm up. Defaults to the "
+            "BASEROW_GENERATED_MODEL_WARM_UP_SIZE setting.",
+        )
+
+    def handle(self, *args, **options):
+        warmed_up = warm_up_table_models(limit=options["limit"])
+        self.stdout.write(
+            self.style.SUCCESS(f"Warmed up the models of {warmed_up} tables.")
+        )
@@ -0,0 +1,72 @@
+# Generated by Django 3.2.13 on 2026-10-17 01:14
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("database", "0074_auto_20220530_0919"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RowChange",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("row_id", models.PositiveIntegerField()),
+                (
+                    "action",
+                    models.CharField(
+                        choices=[
+                            ("created", "Created"),
+                            ("updated", "Updated"),
+                            ("deleted", "Deleted"),
+                        ],
+                        max_length=8,
+                    ),
+                ),
+                (
+                    "timestamp",
+                    models.DateTimeField(
+                        help_text="The start time of the transaction that changed the row."
+                    ),
+                ),
+                (
+                    "transaction_id",
+                    models.BigIntegerField(
+                        help_text="The id of the transaction that changed the row."
+                    ),
+                ),
+                (
+                    "table",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to="database.table"
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("transaction_id", "id"),
+            },
+        ),
+        migrations.AddIndex(
+            model_name="rowchange",
+            index=models.Index(
+                fields=["table", "transaction_id", "id"],
+                name="database_ro_table_i_6bc5b7_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="rowchange",
+            index=models.Index(
+                fields=["timestamp"], name="database_ro_timesta_110542_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="rowchange",
+            index=models.Index(
+                fields=["table", "row_id"], name="database_ro_table_i_b76ec6_idx"
+            ),
+        ),
+    ]
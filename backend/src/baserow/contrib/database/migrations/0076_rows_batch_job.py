@@ -0,0 +1,127 @@
+# Generated by Django 3.2.13 on 2026-10-17 02:08
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("database", "0075_row_change"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RowsBatchJob",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_on", models.DateTimeField(auto_now_add=True)),
+                ("updated_on", models.DateTimeField(auto_now=True)),
+                (
+                    "type",
+                    models.CharField(
+                        choices=[
+                            ("create", "Create"),
+                            ("update", "Update"),
+                            ("delete", "Delete"),
+                        ],
+                        help_text="Indicates whether the rows must be created, updated or deleted.",
+                        max_length=16,
+                    ),
+                ),
+                (
+                    "user_field_names",
+                    models.BooleanField(
+                        default=False,
+                        help_text="Indicates whether the items contain the names of the fields instead of the internal `field_{id}` names.",
+                    ),
+                ),
+                (
+                    "items",
+                    models.JSONField(
+                        default=list,
+                        help_text="The row values or ids that must be processed. They're removed when the job has finished or failed.",
+                    ),
+                ),
+                (
+                    "total_count",
+                    models.PositiveIntegerField(
+                        help_text="The total amount of items that must be processed."
+                    ),
+                ),
+                (
+                    "processed_count",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="The amount of items that have been processed.",
+                    ),
+                ),
+                (
+                    "progress_percentage",
+                    models.IntegerField(
+                        default=0,
+                        help_text="A percentage indicating how far along the job is. 100 means that it's finished.",
+                    ),
+                ),
+                (
+                    "state",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("processing", "Processing"),
+                            ("finished", "Finished"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        help_text="Indicates the state of the job.",
+                        max_length=16,
+                    ),
+                ),
+                (
+                    "error",
+                    models.TextField(
+                        blank=True,
+                        default="",
+                        help_text="An error message if something went wrong.",
+                    ),
+                ),
+                (
+                    "human_readable_error",
+                    models.TextField(
+                        blank=True,
+                        default="",
+                        help_text="A human readable error message indicating what went wrong.",
+                    ),
+                ),
+                (
+                    "table",
+                    models.ForeignKey(
+                        help_text="The table in which the rows must be changed.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="database.table",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        help_text="The user that has created the job.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 3.2.13 on 2026-10-17 03:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("database", "0077_field_trigram_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="table",
+            name="search_data_column_added",
+            field=models.BooleanField(
+                default=False,
+                help_text="Indicates whether the full-text search data column, its indexes and its trigger have been added to the table.",
+            ),
+        ),
+        migrations.AddField(
+            model_name="table",
+            name="search_data_outdated_since",
+            field=models.DateTimeField(
+                help_text="Set when a field change has outdated the search data of all rows. The search uses the contains search until the search data is rebuilt.",
+                null=True,
+            ),
+        ),
+        migrations.RunSQL(
+            """
+            CREATE OR REPLACE FUNCTION database_table_search_data_outdated()
+            RETURNS trigger AS $$
+            BEGIN
+                IF NEW.search_data IS NOT DISTINCT FROM OLD.search_data THEN
+                    NEW.search_data := NULL;
+                END IF;
+                RETURN NEW;
+            END;
+            $$ LANGUAGE plpgsql;
+            """,
+            "DROP FUNCTION IF EXISTS database_table_search_data_outdated() CASCADE;",
+        ),
+    ]
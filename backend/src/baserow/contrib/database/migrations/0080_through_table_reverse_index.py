@@ -0,0 +1,65 @@
+from tqdm import tqdm
+
+from django.db import migrations
+
+
+# Matches the through tables of the link row and multiple select fields.
+THROUGH_TABLE_NAME_REGEX = r"^database_(relation|multipleselect)_[0-9]+$"
+
+
+def _get_through_tables(schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT
+                c.table_name::text,
+                array_agg(c.column_name::text ORDER BY c.ordinal_position)
+            FROM information_schema.columns c
+            WHERE c.table_schema = current_schema()
+            AND c.table_name ~ %s
+            AND c.column_name != 'id'
+            GROUP BY c.table_name
+            ORDER BY c.table_name
+            """,
+            [THROUGH_TABLE_NAME_REGEX],
+        )
+        return cursor.fetchall()
+
+
+# noinspection PyPep8Naming
+def forward(apps, schema_editor):
+    for table_name, column_names in tqdm(
+        _get_through_tables(schema_editor),
+        desc="Adding reverse index to all through tables",
+    ):
+        if len(column_names) != 2:
+            continue
+
+        # The through table has the column of the row with the field first, the
+        # existing unique index starts with that column and the new index with the
+        # column of the related row or select option.
+        from_column, to_column = column_names
+        schema_editor.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+            f'"{table_name}_reverse" ON "{table_name}"("{to_column}", "{from_column}")'
+        )
+
+
+# noinspection PyPep8Naming
+def reverse(apps, schema_editor):
+    for table_name, _ in _get_through_tables(schema_editor):
+        schema_editor.execute(
+            f'DROP INDEX CONCURRENTLY IF EXISTS "{table_name}_reverse"'
+        )
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("database", "0079_view_field_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(forward, reverse),
+    ]
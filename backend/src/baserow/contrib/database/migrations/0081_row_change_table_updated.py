@@ -0,0 +1,31 @@
+# Generated by Django 3.2.13 on 2026-10-17 05:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("database", "0080_through_table_reverse_index"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="rowchange",
+            name="action",
+            field=models.CharField(
+                choices=[
+                    ("created", "Created"),
+                    ("updated", "Updated"),
+                    ("deleted", "Deleted"),
+                    ("table_updated", "Table Updated"),
+                ],
+                max_length=16,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="rowchange",
+            name="row_id",
+            field=models.PositiveIntegerField(null=True),
+        ),
+    ]
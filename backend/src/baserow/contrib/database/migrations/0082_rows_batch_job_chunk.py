@@ -0,0 +1,56 @@
+# Generated by Django 3.2.13 on 2026-10-17 05:34
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("database", "0081_row_change_table_updated"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="rowsbatchjob",
+            name="items",
+        ),
+        migrations.CreateModel(
+            name="RowsBatchJobChunk",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "offset",
+                    models.PositiveIntegerField(
+                        help_text="The index of the first item of the chunk in all the items of the job."
+                    ),
+                ),
+                (
+                    "items",
+                    models.JSONField(
+                        help_text="The row values or ids that must be processed."
+                    ),
+                ),
+                (
+                    "job",
+                    models.ForeignKey(
+                        help_text="The job that the chunk belongs to.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="chunks",
+                        to="database.rowsbatchjob",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("offset",),
+            },
+        ),
+    ]
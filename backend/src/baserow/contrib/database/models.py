@@ -32,6 +32,7 @@ from .webhooks.models import (
     TableWebhookHeader,
 )
 from .airtable.models import AirtableImportJob
+from .rows.models import RowChange, RowsBatchJob, RowsBatchJobChunk
 
 from baserow.contrib.database.fields.dependencies.models import FieldDependency
 
@@ -65,6 +66,9 @@ __all__ = [
     "TableWebhookHeader",
     "TableWebhookCall",
     "AirtableImportJob",
+    "RowChange",
+    "RowsBatchJob",
+    "RowsBatchJobChunk",
     "FieldDependency",
 ]
 
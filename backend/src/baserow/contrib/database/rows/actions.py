@@ -4,9 +4,13 @@ from copy import deepcopy
 from decimal import Decimal
 from typing import Any, Dict, Optional, Type, List
 
+from django.conf import settings
 from django.contrib.auth.models import AbstractUser
+from django.db import transaction
+from baserow.contrib.database.fields.field_filters import FILTER_TYPE_AND
 from baserow.contrib.database.table.handler import TableHandler
 
+from baserow.core.action.handler import ActionHandler
 from baserow.core.action.models import Action
 from baserow.core.action.registries import ActionType, ActionScopeStr
 from baserow.contrib.database.action.scopes import TableActionScopeType
@@ -18,7 +22,9 @@ from baserow.contrib.database.table.models import (
     GeneratedTableModel,
     Table,
 )
+from baserow.contrib.database.views.models import View
 from baserow.core.trash.handler import TrashHandler
+from baserow.core.utils import grouper
 
 
 class CreateRowActionType(ActionType):
@@ -595,3 +601,321 @@ class UpdateRowsActionType(ActionType):
     def redo(cls, user: AbstractUser, params: Params, action_being_redone: Action):
         table = TableHandler().get_table(params.table_id)
         RowHandler().update_rows(user, table, params.new_rows)
+
+
+class UpsertRowsActionType(ActionType):
+    type = "upsert_rows"
+
+    @dataclasses.dataclass
+    class Params:
+        table_id: int
+        created_row_ids: List[int]
+        original_rows_values: List
+        new_rows: List
+        trashed_rows_entry_id: Optional[int] = None
+
+    @classmethod
+    def do(
+        cls,
+        user: AbstractUser,
+        table: Table,
+        rows_values: List[Dict[str, Any]],
+        key_field_id: int,
+        model: Optional[Type[GeneratedTableModel]] = None,
+    ) -> List[GeneratedTableModel]:
+        """
+        Updates the rows that have the same value for the key field and creates the
+        others. See the baserow.contrib.database.rows.handler.RowHandler.upsert_rows
+        for more information.
+        Undoing this action trashes the created rows and restores the original values
+        of the updated rows. Redoing restores the created rows and sets the new
+        values again.
+
+        :param user: The user of whose behalf the rows are upserted.
+        :param table: The table for which the rows must be upserted.
+        :param rows_values: The values of the rows that must be upserted.
+        :param key_field_id: The id of the field that is used to match the rows.
+        :param model: If the correct model has already been generated it can be
+            provided so that it does not have to be generated for a second time.
+        :return: The created or updated rows in the same order as the rows values.
+        """
+
+        row_handler = RowHandler()
+
+        if model is None:
+            model = table.get_model()
+
+        # The key field stays locked until the new rows have been created.
+        with transaction.atomic():
+            matched_row_ids = row_handler.match_rows_by_key(
+                model, key_field_id, rows_values
+            )
+            rows_keys_map = {
+                row_id: values.keys()
+                for values, row_id in zip(rows_values, matched_row_ids)
+                if row_id is not None
+            }
+            original_rows = row_handler.get_rows_for_update(model, rows_keys_map.keys())
+
+            original_rows_values = []
+            for row in original_rows:
+                original_row_values = row_handler.get_internal_values_for_fields(
+                    row, rows_keys_map[row.id]
+                )
+                original_row_values["id"] = row.id
+                original_rows_values.append(original_row_values)
+
+            new_rows = [
+                {**deepcopy(values), "id": row_id}
+                for values, row_id in zip(rows_values, matched_row_ids)
+                if row_id is not None
+            ]
+
+            rows = row_handler.upsert_rows(
+                user,
+                table,
+                rows_values,
+                key_field_id,
+                model=model,
+                matched_row_ids=matched_row_ids,
+                rows_to_update=original_rows,
+            )
+
+        created_row_ids = [
+            row.id for row, row_id in zip(rows, matched_row_ids) if row_id is None
+        ]
+        params = cls.Params(table.id, created_row_ids, original_rows_values, new_rows)
+        cls.register_action(user, params, cls.scope(table.id))
+
+        return rows
+
+    @classmethod
+    def scope(cls, table_id) -> ActionScopeStr:
+        return TableActionScopeType.value(table_id)
+
+    @classmethod
+    def undo(cls, user: AbstractUser, params: Params, action_being_undone: Action):
+        table = TableHandler().get_table(params.table_id)
+        row_handler = RowHandler()
+        if params.original_rows_values:
+            row_handler.update_rows(user, table, params.original_rows_values)
+        if params.created_row_ids:
+            trashed_rows_trash_entry = row_handler.delete_rows(
+                user, table, params.created_row_ids
+            )
+            params.trashed_rows_entry_id = trashed_rows_trash_entry.id
+            action_being_undone.params = params
+
+    @classmethod
+    def redo(cls, user: AbstractUser, params: Params, action_being_redone: Action):
+        if params.trashed_rows_entry_id is not None:
+            TrashHandler.restore_item(
+                user,
+                "rows",
+                params.trashed_rows_entry_id,
+                parent_trash_item_id=params.table_id,
+            )
+        if params.new_rows:
+            table = TableHandler().get_table(params.table_id)
+            RowHandler().update_rows(user, table, params.new_rows)
+
+
+class UpdateRowsByFilterActionType(ActionType):
+    type = "update_rows_by_filter"
+
+    @dataclasses.dataclass
+    class Params:
+        table_id: int
+        row_ids: List[int]
+        original_rows_values: List
+        new_values: Dict[str, Any]
+
+    @classmethod
+    def do(
+        cls,
+        user: AbstractUser,
+        table: Table,
+        values: Dict[str, Any],
+        view: Optional[View] = None,
+        filter_object: Optional[Dict[str, Any]] = None,
+        filter_type: str = FILTER_TYPE_AND,
+        model: Optional[Type[GeneratedTableModel]] = None,
+    ) -> int:
+        """
+        Sets the same values for all the rows that match the filters of the provided
+        view and the provided filter object using set-based statements. See the
+        baserow.contrib.database.rows.handler.RowHandler
+        .get_row_ids_queryset_by_filter and
+        baserow.contrib.database.rows.handler.RowHandler.update_rows_values for more
+        information.
+        The original values of the rows must be stored to undo this action, so it's
+        only registered if at most `BASEROW_ROWS_BY_FILTER_UNDO_LIMIT` rows match.
+        Otherwise the undo stack of the table is cleared, so that undo doesn't skip
+        past this change.
+        Undoing this action restores the original values of the matched rows.
+        Redoing sets the new values again for the same rows.
+
+        :param user: The user of whose behalf the change is made.
+        :param table: The table for which the rows must be updated.
+        :param values: The values that must be set for all the matching rows.
+        :param view: If provided, only the rows matching the view filters are updated.
+        :param filter_object: If provided, only the rows matching these filters are
+            updated.
+        :param filter_type: Indicates whether the filters of the filter object are
+            combined with an AND or an OR.
+        :param model: If the correct model has already been generated it can be
+            provided so that it does not have to be generated for a second time.
+        :return: The amount of updated rows.
+        """
+
+        row_handler = RowHandler()
+
+        if model is None:
+            model = table.get_model()
+
+        with transaction.atomic():
+            queryset, count = row_handler.get_row_ids_queryset_by_filter(
+                table, model, view, filter_object, filter_type
+            )
+
+            undoable = count <= settings.BASEROW_ROWS_BY_FILTER_UNDO_LIMIT
+            original_rows_values = []
+            if undoable:
+                original_rows_values = row_handler.get_internal_values_for_queryset(
+                    queryset, values.keys()
+                )
+
+            row_handler.update_rows_values(user, table, queryset, values, model=model)
+
+        if undoable:
+            params = cls.Params(
+                table.id,
+                [row["id"] for row in original_rows_values],
+                original_rows_values,
+                deepcopy(values),
+            )
+            cls.register_action(user, params, cls.scope(table.id))
+        else:
+            ActionHandler.clear_undo_stack(user, cls.scope(table.id))
+
+        return count
+
+    @classmethod
+    def scope(cls, table_id) -> ActionScopeStr:
+        return TableActionScopeType.value(table_id)
+
+    @classmethod
+    def undo(cls, user: AbstractUser, params: Params, action_being_undone: Action):
+        table = TableHandler().get_table(params.table_id)
+        model = table.get_model()
+        row_handler = RowHandler()
+        lookup_cache = {}
+        for chunk in grouper(
+            settings.BATCH_ROWS_SIZE_LIMIT, params.original_rows_values
+        ):
+            row_handler.update_rows(
+                user, table, list(chunk), model=model, lookup_cache=lookup_cache
+            )
+
+    @classmethod
+    def redo(cls, user: AbstractUser, params: Params, action_being_redone: Action):
+        table = TableHandler().get_table(params.table_id)
+        model = table.get_model()
+        RowHandler().update_rows_values(
+            user,
+            table,
+            model.objects.filter(id__in=params.row_ids),
+            params.new_values,
+            model=model,
+        )
+
+
+class DeleteRowsByFilterActionType(ActionType):
+    type = "delete_rows_by_filter"
+
+    @dataclasses.dataclass
+    class Params:
+        table_id: int
+        row_ids: List[int]
+        trashed_rows_entry_id: int
+
+    @classmethod
+    def do(
+        cls,
+        user: AbstractUser,
+        table: Table,
+        view: Optional[View] = None,
+        filter_object: Optional[Dict[str, Any]] = None,
+        filter_type: str = FILTER_TYPE_AND,
+        model: Optional[Type[GeneratedTableModel]] = None,
+    ) -> int:
+        """
+        Trashes all the rows that match the filters of the provided view and the
+        provided filter object using set-based statements. All the rows end up in a
+        single entry in the trash. See the
+        baserow.contrib.database.rows.handler.RowHandler
+        .get_row_ids_queryset_by_filter and
+        baserow.contrib.database.rows.handler.RowHandler.delete_rows_by_queryset for
+        more information.
+        The ids of the rows must be stored to redo this action, so it's only
+        registered if at most `BASEROW_ROWS_BY_FILTER_UNDO_LIMIT` rows match.
+        Otherwise the undo stack of the table is cleared, so that undo doesn't skip
+        past this change. The trashed rows can always be restored from the trash.
+        Undoing this action restores the trashed rows and redoing trashes them again.
+
+        :param user: The user of whose behalf the change is made.
+        :param table: The table for which the rows must be deleted.
+        :param view: If provided, only the rows matching the view filters are deleted.
+        :param filter_object: If provided, only the rows matching these filters are
+            deleted.
+        :param filter_type: Indicates whether the filters of the filter object are
+            combined with an AND or an OR.
+        :param model: If the correct model has already been generated it can be
+            provided so that it does not have to be generated for a second time.
+        :return: The amount of deleted rows.
+        """
+
+        row_handler = RowHandler()
+
+        if model is None:
+            model = table.get_model()
+
+        with transaction.atomic():
+            queryset, count = row_handler.get_row_ids_queryset_by_filter(
+                table, model, view, filter_object, filter_type
+            )
+            trashed_rows = row_handler.delete_rows_by_queryset(
+                user, table, queryset, model=model
+            )
+
+        if count <= settings.BASEROW_ROWS_BY_FILTER_UNDO_LIMIT:
+            trashed_rows.refresh_from_db(fields=["row_ids"])
+            params = cls.Params(table.id, trashed_rows.row_ids, trashed_rows.id)
+            cls.register_action(user, params, cls.scope(table.id))
+        else:
+            ActionHandler.clear_undo_stack(user, cls.scope(table.id))
+
+        return count
+
+    @classmethod
+    def scope(cls, table_id) -> ActionScopeStr:
+        return TableActionScopeType.value(table_id)
+
+    @classmethod
+    def undo(cls, user: AbstractUser, params: Params, action_being_undone: Action):
+        TrashHandler.restore_item(
+            user,
+            "rows",
+            params.trashed_rows_entry_id,
+            parent_trash_item_id=params.table_id,
+        )
+
+    @classmethod
+    def redo(cls, user: AbstractUser, params: Params, action_being_redone: Action):
+        table = TableHandler().get_table(params.table_id)
+        model = table.get_model()
+        trashed_rows = RowHandler().delete_rows(
+            user, table, params.row_ids, model=model
+        )
+        params.trashed_rows_entry_id = trashed_rows.id
+        action_being_redone.params = params
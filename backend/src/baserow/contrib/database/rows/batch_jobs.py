@@ -0,0 +1,326 @@
+from math import floor
+from typing import Any, Dict, List, Optional, Union
+
+from celery.exceptions import SoftTimeLimitExceeded
+from django.conf import settings
+from django.contrib.auth.models import AbstractUser
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils import timezone
+
+from baserow.contrib.database.table.models import GeneratedTableModel, Table
+
+from .exceptions import (
+    RowDoesNotExist,
+    RowIdsNotUnique,
+    RowsBatchJobAlreadyRunning,
+    RowsBatchJobDoesNotExist,
+    RowsBatchJobInvalidItems,
+)
+from .handler import RowHandler
+from .models import (
+    RowsBatchJob,
+    RowsBatchJobChunk,
+    RowsBatchJobStates,
+    RowsBatchJobTypes,
+)
+from .signals import rows_batch_job_chunk_processed
+from .tasks import run_rows_batch_job
+
+
+class RowsBatchJobHandler:
+    def get_job(self, user: AbstractUser, job_id: int) -> RowsBatchJob:
+        """
+        Fetches a rows batch job from the database if the user has created it.
+
+        :param user: The user on whose behalf the job is requested.
+        :param job_id: The id of the job that must be fetched.
+        :raises RowsBatchJobDoesNotExist: If the job doesn't exist.
+        :return: The fetched rows batch job.
+        """
+
+        try:
+            return RowsBatchJob.objects.select_related("table").get(
+                id=job_id, user_id=user.id
+            )
+        except RowsBatchJob.DoesNotExist:
+            raise RowsBatchJobDoesNotExist(f"The job with id {job_id} does not exist.")
+
+    def create_and_start_job(
+        self,
+        user: AbstractUser,
+        table: Table,
+        type_name: str,
+        items: List[Union[Dict[str, Any], int]],
+        user_field_names: bool = False,
+    ) -> RowsBatchJob:
+        """
+        Creates a new rows batch job and starts the asynchronous task that processes
+        the items. The items are only validated while the job is running, chunk by
+        chunk.
+
+        :param user: The user on whose behalf the rows are changed.
+        :param table: The table in which the rows must be changed.
+        :param type_name: One of the `RowsBatchJobTypes`.
+        :param items: The values of the rows that must be created, the values
+            including the `id` of the rows that must be updated or the ids of the
+            rows that must be deleted.
+        :param user_field_names: Indicates whether the items contain the names of
+            the fields instead of the internal `field_{id}` names.
+        :raises RowsBatchJobAlreadyRunning: If another rows batch job of the user is
+            still running. A user can only have one job running simultaneously.
+        :return: The newly created rows batch job.
+        """
+
+        table.database.group.has_user(user, raise_error=True)
+
+        running_jobs = RowsBatchJob.objects.filter(user_id=user.id).is_running()
+        running_job_id = running_jobs.values_list("id", flat=True).first()
+        if running_job_id is not None:
+            raise RowsBatchJobAlreadyRunning(
+                f"Another job is already running with id {running_job_id}."
+            )
+
+        job = RowsBatchJob.objects.create(
+            user=user,
+            table=table,
+            type=type_name,
+            user_field_names=user_field_names,
+            total_count=len(items),
+        )
+        self.create_chunks(job, items)
+        transaction.on_commit(lambda: run_rows_batch_job.delay(job.id))
+        return job
+
+    def create_chunks(
+        self, job: RowsBatchJob, items: List[Union[Dict[str, Any], int]]
+    ) -> List[RowsBatchJobChunk]:
+        """
+        Stores the items of the job in chunks of `BASEROW_ROWS_BATCH_JOB_CHUNK_SIZE`,
+        so that the job doesn't have to load all the items at once.
+
+        :param job: The job of which the items must be stored.
+        :param items: The items that must be processed by the job.
+        :return: The created chunks.
+        """
+
+        chunk_size = settings.BASEROW_ROWS_BATCH_JOB_CHUNK_SIZE
+        return RowsBatchJobChunk.objects.bulk_create(
+            [
+                RowsBatchJobChunk(
+                    job=job, offset=offset, items=items[offset : offset + chunk_size]
+                )
+                for offset in range(0, len(items), chunk_size)
+            ]
+        )
+
+    def run_job(self, job: RowsBatchJob):
+        """
+        Processes the stored chunks of the provided job. Every chunk is processed in
+        its own transaction using the batch methods of the `RowHandler`, without the
+        realtime events of the rows. Instead the `rows_batch_job_chunk_processed`
+        signal is sent once per chunk, which makes the clients refresh the rows. A
+        chunk is deleted when it has been processed, so when the soft time limit of
+        the task is exceeded, the task is started again and continues with the first
+        remaining chunk. If not a single chunk could be processed within the time
+        limit, the job fails instead.
+
+        When a chunk fails, the job is marked as failed, but the chunks before it
+        stay committed. A job that stops making progress because its worker has
+        stopped is marked as failed by `clean_up_stale_jobs`.
+
+        :param job: The job that must be run.
+        """
+
+        if job.state not in (RowsBatchJobStates.PENDING, RowsBatchJobStates.PROCESSING):
+            return
+
+        job.state = RowsBatchJobStates.PROCESSING
+        job.save(update_fields=("state", "updated_on"))
+
+        lookup_cache = {}
+        processed_chunk_count = 0
+        try:
+            for chunk_id in job.chunks.values_list("id", flat=True):
+                with transaction.atomic():
+                    chunk = RowsBatchJobChunk.objects.get(id=chunk_id)
+                    row_ids = self.process_chunk(
+                        job, chunk.items, chunk.offset, lookup_cache
+                    )
+                    chunk.delete()
+                    job.processed_count = chunk.offset + len(chunk.items)
+                    job.progress_percentage = floor(
+                        job.processed_count / job.total_count * 100
+                    )
+                    job.save(
+                        update_fields=(
+                            "processed_count",
+                            "progress_percentage",
+                            "updated_on",
+                        )
+                    )
+                    rows_batch_job_chunk_processed.send(
+                        self,
+                        job=job,
+                        row_ids=row_ids,
+                        processed_count=job.processed_count,
+                        user=job.user,
+                        table=job.table,
+                    )
+                processed_chunk_count += 1
+        except SoftTimeLimitExceeded as e:
+            if processed_chunk_count == 0:
+                self._fail_job(job, e)
+                raise e
+            transaction.on_commit(lambda: run_rows_batch_job.delay(job.id))
+            return
+        except Exception as e:
+            self._fail_job(job, e)
+            raise e
+
+        job.state = RowsBatchJobStates.FINISHED
+        job.progress_percentage = 100
+        job.save(update_fields=("state", "progress_percentage", "updated_on"))
+
+    def _fail_job(self, job: RowsBatchJob, exception: Exception):
+        job.state = RowsBatchJobStates.FAILED
+        job.error = str(getattr(exception, "detail", exception))
+        job.human_readable_error = self.get_human_readable_error(exception)
+        job.save(update_fields=("state", "error", "human_readable_error", "updated_on"))
+        job.chunks.all().delete()
+
+    def clean_up_stale_jobs(self) -> int:
+        """
+        Marks the pending and processing jobs that haven't made progress for longer
+        than the soft time limit as failed and deletes their remaining chunks. This
+        happens when the worker running the job has stopped, in which case the job
+        would otherwise stay processing forever.
+
+        :return: The number of jobs that have been marked as failed.
+        """
+
+        with transaction.atomic():
+            stale_job_ids = list(
+                RowsBatchJob.objects.is_stale()
+                .select_for_update(skip_locked=True)
+                .values_list("id", flat=True)
+            )
+            RowsBatchJobChunk.objects.filter(job_id__in=stale_job_ids).delete()
+            return RowsBatchJob.objects.filter(id__in=stale_job_ids).update(
+                state=RowsBatchJobStates.FAILED,
+                error="The job stopped making progress.",
+                human_readable_error="The job was interrupted.",
+                updated_on=timezone.now(),
+            )
+
+    def process_chunk(
+        self,
+        job: RowsBatchJob,
+        chunk: List[Union[Dict[str, Any], int]],
+        offset: int,
+        lookup_cache: Optional[Dict[str, Any]] = None,
+    ) -> List[int]:
+        """
+        Creates, updates or deletes the rows of one chunk of the job.
+
+        :param job: The job of which the chunk must be processed.
+        :param chunk: The items of the chunk.
+        :param offset: The index of the first item of the chunk in all the items of
+            the job, used to point to the invalid item in the error message.
+        :param lookup_cache: An optional dict that is shared by all the chunks of
+            the job, so that the select options, files and related rows are only
+            resolved once.
+        :raises RowsBatchJobInvalidItems: When the row values are invalid.
+        :return: The ids of the rows that have been changed.
+        """
+
+        user = job.user
+        table = job.table
+        model = table.get_model()
+        handler = RowHandler()
+
+        # The realtime events of the rows are not sent because serializing all the
+        # rows would be expensive. The `rows_batch_job_chunk_processed` signal makes
+        # the clients refresh the rows instead.
+        if job.type == RowsBatchJobTypes.DELETE:
+            handler.delete_rows(
+                user, table, chunk, model=model, send_realtime_update=False
+            )
+            return chunk
+
+        values = self.validate_chunk(job, model, chunk, offset)
+        kwargs = {
+            "model": model,
+            "lookup_cache": lookup_cache,
+            "send_realtime_update": False,
+        }
+        if job.type == RowsBatchJobTypes.CREATE:
+            rows = handler.create_rows(user, table, values, **kwargs)
+        else:
+            rows = handler.update_rows(user, table, values, **kwargs)
+        return [row.id for row in rows]
+
+    def validate_chunk(
+        self,
+        job: RowsBatchJob,
+        model: GeneratedTableModel,
+        chunk: List[Dict[str, Any]],
+        offset: int,
+    ) -> List[Dict[str, Any]]:
+        """
+        Validates the row values of one chunk with the same serializer that is used
+        by the batch rows endpoints.
+
+        :param job: The job of which the chunk must be validated.
+        :param model: The generated model of the table.
+        :param chunk: The row values of the chunk.
+        :param offset: The index of the first item of the chunk in all the items of
+            the job.
+        :raises RowsBatchJobInvalidItems: When one of the items is invalid.
+        :return: The validated row values.
+        """
+
+        from baserow.contrib.database.api.rows.serializers import (
+            get_row_serializer_class,
+        )
+
+        kwargs = {}
+        if job.type == RowsBatchJobTypes.UPDATE:
+            kwargs = {"include_id": True, "required_fields": ["id"]}
+
+        row_serializer_class = get_row_serializer_class(
+            model, user_field_names=job.user_field_names, **kwargs
+        )
+        serializer = row_serializer_class(data=chunk, many=True, partial=True)
+        if not serializer.is_valid():
+            index, errors = next(
+                (index, errors)
+                for index, errors in enumerate(serializer.errors)
+                if errors
+            )
+            raise RowsBatchJobInvalidItems(
+                {offset + index: errors},
+                f"The item at index {offset + index} is invalid.",
+            )
+        return serializer.validated_data
+
+    def get_human_readable_error(self, exception: Exception) -> str:
+        """
+        Returns an error message that can be shown to the user for the exception
+        that made the job fail.
+
+        :param exception: The exception that was raised while running the job.
+        :return: The human readable error message.
+        """
+
+        exception_mapping = {
+            RowsBatchJobInvalidItems: str(exception),
+            SoftTimeLimitExceeded: "The job took too long and was timed out.",
+            ValidationError: "One of the items contains an invalid value.",
+            RowDoesNotExist: "One of the rows does not exist.",
+            RowIdsNotUnique: "The same row id is provided multiple times.",
+        }
+        for exception_class, error_message in exception_mapping.items():
+            if isinstance(exception, exception_class):
+                return error_message
+        return "Something went wrong while changing the rows."
@@ -0,0 +1,243 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, transaction
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from baserow.contrib.database.table.models import Table
+
+from .exceptions import RowChangeCursorExpired, RowChangeCursorInvalid
+from .models import RowChange, RowChangeActions
+
+
+class RowChangeLogHandler:
+    """
+    Keeps an append only log of the rows that have been created, updated and deleted
+    per table, so that a client can incrementally fetch the changes that have been
+    made since the last time it checked.
+
+    The changes are ordered by the id of the transaction that made them. Because
+    transactions can commit in a different order than they started, only the changes
+    made by transactions that are older than every transaction still running are
+    returned. Those can't change anymore and no new changes can be added before them,
+    so a client that remembers the position of the last change it has seen never
+    misses a change.
+    """
+
+    def log_row_changes(self, table: Table, action: str, row_ids: Iterable[int]):
+        """
+        Adds an entry to the change log for every provided row id in one query.
+
+        :param table: The table of the changed rows.
+        :param action: One of the `RowChangeActions`.
+        :param row_ids: The ids of the rows that have changed.
+        """
+
+        row_ids = list(row_ids)
+        if not row_ids:
+            return
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {RowChange._meta.db_table}
+                    (table_id, row_id, action, timestamp, transaction_id)
+                SELECT %s, unnest(%s::integer[]), %s, now(), txid_current()
+                """,
+                [table.id, row_ids, action],
+            )
+
+    def log_row_changes_by_queryset(
+        self, table: Table, action: str, queryset: QuerySet
+    ):
+        """
+        Adds an entry to the change log for every row matching the provided queryset
+        in one query, without fetching the row ids.
+
+        :param table: The table of the changed rows.
+        :param action: One of the `RowChangeActions`.
+        :param queryset: A queryset of the table's model matching the changed rows.
+        """
+
+        sql, params = queryset.values("id").query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {RowChange._meta.db_table}
+                    (table_id, row_id, action, timestamp, transaction_id)
+                SELECT %s, changed.id, %s, now(), txid_current()
+                FROM ({sql}) AS changed
+                """,
+                [table.id, action, *params],
+            )
+
+    def log_table_change(self, table: Table):
+        """
+        Adds a single entry to the change log indicating that any row of the table
+        could have changed, for example because the values of a field have been
+        converted or recalculated. A client must fetch all the rows again.
+
+        :param table: The table of which the rows have changed.
+        """
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {RowChange._meta.db_table}
+                    (table_id, row_id, action, timestamp, transaction_id)
+                VALUES (%s, NULL, %s, now(), txid_current())
+                """,
+                [table.id, RowChangeActions.TABLE_UPDATED],
+            )
+
+    def get_visible_transaction_id_limit(self) -> int:
+        """
+        Returns the id of the oldest transaction that is still running. All the
+        changes made by transactions with a lower id are final.
+        """
+
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT txid_snapshot_xmin(txid_current_snapshot())")
+            return cursor.fetchone()[0]
+
+    def get_retention_start(self) -> datetime:
+        """
+        Returns the moment from which the changes are guaranteed to still be in the
+        change log.
+        """
+
+        return timezone.now() - timezone.timedelta(
+            days=settings.BASEROW_ROW_CHANGE_LOG_RETENTION_DAYS
+        )
+
+    def encode_cursor(
+        self, transaction_id: int, change_id: int, timestamp: datetime
+    ) -> str:
+        data = json.dumps(
+            [transaction_id, change_id, timestamp],
+            cls=DjangoJSONEncoder,
+            separators=(",", ":"),
+        )
+        return urlsafe_b64encode(data.encode()).decode()
+
+    def decode_cursor(self, cursor: str) -> Tuple[int, int, datetime]:
+        """
+        Decodes a cursor that was created by the `encode_cursor` method.
+
+        :param cursor: The cursor that must be decoded.
+        :raises RowChangeCursorInvalid: When the cursor could not be decoded.
+        :return: The transaction id, change id and timestamp of the cursor.
+        """
+
+        try:
+            transaction_id, change_id, timestamp = json.loads(
+                urlsafe_b64decode(cursor.encode())
+            )
+            timestamp = parse_datetime(timestamp)
+            if timestamp is None:
+                raise ValueError
+            return int(transaction_id), int(change_id), timestamp
+        except (BinasciiError, TypeError, ValueError) as exc:
+            raise RowChangeCursorInvalid("The cursor is invalid.") from exc
+
+    def get_row_changes(
+        self,
+        table: Table,
+        cursor: Optional[str] = None,
+        since: Optional[datetime] = None,
+        limit: int = 100,
+    ) -> Tuple[List[RowChange], str, bool]:
+        """
+        Returns the changes of the provided table that have been made after the
+        provided cursor or since the provided timestamp. If neither is provided, all
+        the changes in the change log are returned.
+
+        :param table: The table for which the changes must be returned.
+        :param cursor: The `next_cursor` returned by an earlier call.
+        :param since: Only changes made at or after this moment are returned.
+        :param limit: The maximum amount of changes that are returned.
+        :raises RowChangeCursorInvalid: When the cursor could not be decoded.
+        :raises RowChangeCursorExpired: When the changes after the cursor or
+            timestamp could already have been removed from the change log.
+        :return: The changes, the cursor that must be used to fetch the changes after
+            these and whether there are more changes available right now.
+        """
+
+        retention_start = self.get_retention_start()
+        visible_transaction_id_limit = self.get_visible_transaction_id_limit()
+
+        queryset = RowChange.objects.filter(
+            table=table, transaction_id__lt=visible_transaction_id_limit
+        ).order_by("transaction_id", "id")
+
+        if cursor:
+            transaction_id, change_id, timestamp = self.decode_cursor(cursor)
+            if timestamp < retention_start:
+                raise RowChangeCursorExpired("The cursor has expired.")
+            queryset = queryset.filter(
+                Q(transaction_id__gt=transaction_id)
+                | Q(transaction_id=transaction_id, id__gt=change_id)
+            )
+        elif since:
+            if since < retention_start:
+                raise RowChangeCursorExpired("The since timestamp has expired.")
+            queryset = queryset.filter(timestamp__gte=since)
+
+        changes = list(queryset[: limit + 1])
+        has_more = len(changes) > limit
+        changes = changes[:limit]
+
+        if has_more:
+            last_change = changes[-1]
+            next_cursor = self.encode_cursor(
+                last_change.transaction_id, last_change.id, last_change.timestamp
+            )
+        else:
+            # All the changes made by transactions before the limit have been
+            # returned, so the next call can continue from the limit. This makes sure
+            # that the cursor also moves forward when there are no changes.
+            next_cursor = self.encode_cursor(
+                visible_transaction_id_limit, 0, timezone.now()
+            )
+
+        return changes, next_cursor, has_more
+
+    def compact_row_changes(self) -> Tuple[int, int]:
+        """
+        Removes the changes that are older than the retention period and the changes
+        for which a newer change of the same row, or a newer change of the whole
+        table, exists. A client that has not seen the older change yet, will also see
+        the newer one, which is enough to get the current state of the row.
+
+        :return: The amount of expired and superseded changes that were deleted.
+        """
+
+        with transaction.atomic():
+            expired_count, _ = RowChange.objects.filter(
+                timestamp__lt=self.get_retention_start()
+            ).delete()
+
+        visible_transaction_id_limit = self.get_visible_transaction_id_limit()
+        table_name = RowChange._meta.db_table
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                DELETE FROM {table_name} AS old
+                USING {table_name} AS new
+                WHERE old.table_id = new.table_id
+                    AND (old.row_id = new.row_id OR new.row_id IS NULL)
+                    AND (new.transaction_id, new.id) > (old.transaction_id, old.id)
+                    AND new.transaction_id < %s
+                """,
+                [visible_transaction_id_limit],
+            )
+            superseded_count = cursor.rowcount
+
+        return expired_count, superseded_count
@@ -0,0 +1,106 @@
+"""
+Counting the rows of a table with millions of rows using an exact `COUNT(*)` query
+can take seconds. The exact counts are therefore cached per table and counted query,
+under the change sequence number of the table. Whenever the rows of a table change,
+the sequence number increases, which invalidates all the cached counts of that table.
+
+Unfiltered tables can also be counted using the row estimate of the PostgreSQL
+planner, which is instant, but not exact.
+"""
+
+import hashlib
+from typing import Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.db.models import QuerySet
+
+from baserow.contrib.database.table.change_sequence import get_table_change_sequence
+
+
+def get_row_count_cache_key(table_id: int, sequence: int, queryset: QuerySet) -> str:
+    sql, params = queryset.order_by().query.sql_with_params()
+    digest = hashlib.sha1(f"{sql}{params!r}".encode()).hexdigest()
+    return f"row_count__{table_id}_{sequence}_{digest}"
+
+
+def get_cached_row_count(queryset: QuerySet) -> int:
+    """
+    Returns the exact count of the provided queryset of a generated table model. The
+    count is cached until the rows of the table change.
+
+    :param queryset: The filtered queryset of the generated table model.
+    :return: The number of rows in the queryset.
+    """
+
+    table_id = queryset.model._table_id
+    sequence = get_table_change_sequence(table_id)
+    cache_key = get_row_count_cache_key(table_id, sequence, queryset)
+
+    count = cache.get(cache_key)
+    if count is None:
+        count = queryset.count()
+        cache.set(cache_key, count, timeout=settings.BASEROW_ROW_COUNT_CACHE_TIMEOUT)
+
+    return count
+
+
+def get_estimated_row_count(queryset: QuerySet) -> Optional[int]:
+    """
+    Returns the number of rows that the PostgreSQL planner estimates the table of the
+    queryset to have. The estimate is updated when the table is vacuumed or analyzed
+    and also includes the trashed rows.
+
+    :param queryset: The queryset of the generated table model.
+    :return: The estimated number of rows or None if the table has never been
+        analyzed.
+    """
+
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)",
+            [queryset.model._meta.db_table],
+        )
+        row = cursor.fetchone()
+
+    if row is None or row[0] < 0:
+        return None
+
+    return row[0]
+
+
+def is_unfiltered_queryset(queryset: QuerySet) -> bool:
+    """
+    Checks whether the queryset selects all the rows of the generated table model,
+    so without any search or filters applied.
+    """
+
+    def compile_where(query):
+        compiler = query.get_compiler(queryset.db)
+        return compiler.compile(query.where)
+
+    return compile_where(queryset.query) == compile_where(
+        queryset.model.objects.all().query
+    )
+
+
+def count_rows(queryset: QuerySet, approximate: bool = False) -> Tuple[int, bool]:
+    """
+    Counts the rows of the provided queryset of a generated table model.
+
+    :param queryset: The filtered queryset of the generated table model.
+    :param approximate: Indicates whether the planner estimate may be used if the
+        queryset is unfiltered and the table is big.
+    :return: The number of rows and whether that number is exact.
+    """
+
+    if approximate and is_unfiltered_queryset(queryset):
+        estimate = get_estimated_row_count(queryset)
+        if (
+            estimate is not None
+            and estimate >= settings.BASEROW_ROW_COUNT_ESTIMATE_THRESHOLD
+        ):
+            return estimate, False
+
+    return get_cached_row_count(queryset), True
@@ -14,3 +14,55 @@ class RowIdsNotUnique(Exception):
     def __init__(self, ids, *args, **kwargs):
         self.ids = ids
         super().__init__(*args, **kwargs)
+
+
+class RowChangeCursorInvalid(Exception):
+    """Raised when the provided row change cursor could not be decoded."""
+
+
+class RowChangeCursorExpired(Exception):
+    """
+    Raised when changes are requested from a point that is older than the retention
+    period of the row change log, because some of the changes could be missing.
+    """
+
+
+class IncompatibleUpsertKeyField(Exception):
+    """
+    Raised when a field is used to match rows while upserting, but the values of the
+    field type can't be compared.
+    """
+
+
+class UpsertKeyValuesNotUnique(Exception):
+    """Raised when the same key value is provided multiple times while upserting."""
+
+    def __init__(self, values, *args, **kwargs):
+        self.values = values
+        super().__init__(*args, **kwargs)
+
+
+class UpsertKeyMatchesMultipleRows(Exception):
+    """
+    Raised when a key value provided while upserting matches multiple existing rows.
+    """
+
+    def __init__(self, values, *args, **kwargs):
+        self.values = values
+        super().__init__(*args, **kwargs)
+
+
+class RowsBatchJobDoesNotExist(Exception):
+    """Raised when the rows batch job does not exist."""
+
+
+class RowsBatchJobAlreadyRunning(Exception):
+    """Raised when a user starts a rows batch job while one is already running."""
+
+
+class RowsBatchJobInvalidItems(Exception):
+    """Raised when the items of a rows batch job don't match the fields of the table."""
+
+    def __init__(self, detail, *args, **kwargs):
+        self.detail = detail
+        super().__init__(*args, **kwargs)
@@ -1,18 +1,43 @@
 import re
 from collections import defaultdict
-from decimal import Decimal
+from decimal import Decimal, ROUND_DOWN, localcontext
 from math import floor, ceil
-from typing import cast, Any, Dict, List, NewType, Optional, Type
+from typing import cast, Any, Dict, List, NewType, Optional, Tuple, Type
+from uuid import uuid4
 
+from django.conf import settings
 from django.contrib.auth.models import AbstractUser
-from django.db import transaction
-from django.db.models import Max, F, QuerySet
+from django.db import connection, transaction
+from django.db.models import Max, F, Q, QuerySet, JSONField, Value
+from django.db.models.expressions import RawSQL
 from django.db.models.fields.related import ManyToManyField, ForeignKey
+from django.utils import timezone
 
+from baserow.contrib.database.fields.exceptions import FieldDoesNotExist
+from baserow.contrib.database.fields.field_filters import FILTER_TYPE_AND
+from baserow.contrib.database.fields.fields import BaserowExpressionField
+from baserow.contrib.database.formula import FormulaHandler
 from baserow.contrib.database.table.models import Table, GeneratedTableModel
+from baserow.contrib.database.table.search import SearchDataHandler
 from baserow.core.trash.handler import TrashHandler
 from baserow.contrib.database.trash.models import TrashedRows
-from .exceptions import RowDoesNotExist, RowIdsNotUnique
+from .change_log import RowChangeLogHandler
+from .exceptions import (
+    IncompatibleUpsertKeyField,
+    RowDoesNotExist,
+    RowIdsNotUnique,
+    UpsertKeyMatchesMultipleRows,
+    UpsertKeyValuesNotUnique,
+)
+from .models import RowChangeActions
+from .order import (
+    ROW_ORDER_PRECISION,
+    bump_table_row_order_version,
+    lock_table_row_orders,
+    schedule_row_order_renormalization,
+)
+from baserow.contrib.database.views.exceptions import ViewNotInTable
+from baserow.contrib.database.views.models import View
 from .signals import (
     before_row_update,
     before_row_delete,
@@ -24,11 +49,14 @@ from .signals import (
     rows_updated,
     row_deleted,
     rows_deleted,
+    rows_updated_by_filter,
+    rows_deleted_by_filter,
 )
 from baserow.contrib.database.fields.dependencies.update_collector import (
     CachingFieldUpdateCollector,
 )
 from baserow.contrib.database.fields.dependencies.handler import FieldDependencyHandler
+from baserow.core.db import bulk_insert, bulk_insert_uses_copy
 from baserow.core.utils import get_non_unique_values
 
 
@@ -38,6 +66,10 @@ GeneratedTableModelForUpdate = NewType(
 
 RowsForUpdate = NewType("RowsForUpdate", QuerySet)
 
+# The first key of the advisory lock that serializes the upserts that match the rows
+# by the same key field. The second key is the id of the key field.
+UPSERT_ADVISORY_LOCK_KEY = 41772
+
 
 class RowHandler:
     def prepare_values(self, fields, values):
@@ -64,7 +96,7 @@ class RowHandler:
             if field_id in values or field["name"] in values
         }
 
-    def prepare_rows_in_bulk(self, fields, rows):
+    def prepare_rows_in_bulk(self, fields, rows, lookup_cache=None):
         """
         Prepares a set of values in bulk for all rows so that they can be created or
         updated in the database. It will check if the values can actually be set and
@@ -74,6 +106,11 @@ class RowHandler:
         :type fields: dict
         :param values: The rows and their values that need to be prepared.
         :type values: dict
+        :param lookup_cache: An optional dict in which the field types can store the
+            select options, files or related rows that they have resolved. Passing
+            the same dict when preparing multiple batches of the same request
+            prevents resolving the same references again.
+        :type lookup_cache: dict
         :return: The prepared values for all rows in the same structure as it was
             passed in.
         :rtype: dict
@@ -99,6 +136,7 @@ class RowHandler:
             ] = field_type.prepare_value_for_db_in_bulk(
                 field["field"],
                 batch_values,
+                lookup_cache,
             )
 
         # replace original values to keep ordering
@@ -165,6 +203,52 @@ class RowHandler:
             values[field_name] = field_value
         return values
 
+    def get_internal_values_for_queryset(
+        self,
+        queryset: QuerySet,
+        fields_keys: List[str],
+    ) -> List[Dict[str, Any]]:
+        """
+        Gets the current values of the provided fields for all the rows of the
+        queryset in the same format as `get_internal_values_for_fields`. Only the
+        columns of the provided fields are fetched, so the rows don't have to be
+        loaded entirely.
+
+        :param queryset: The queryset of the rows of which the values are needed.
+        :param fields_keys: The fields keys that need to be exported.
+        :return: The current values of the rows, ordered by id, including the id.
+        """
+
+        model = queryset.model
+        field_names = []
+        many_to_many_field_names = []
+        for field_id in self.extract_field_ids_from_keys(fields_keys):
+            field = model._field_objects[field_id]
+            if field["type"].read_only:
+                continue
+            if model._meta.get_field(field["name"]).many_to_many:
+                many_to_many_field_names.append(field["name"])
+            else:
+                field_names.append(field["name"])
+
+        rows_values = {
+            row_values["id"]: row_values
+            for row_values in queryset.order_by("id").values("id", *field_names)
+        }
+
+        for field_name in many_to_many_field_names:
+            for row_values in rows_values.values():
+                row_values[field_name] = []
+            related_ids = (
+                queryset.filter(**{f"{field_name}__isnull": False})
+                .order_by("id", field_name)
+                .values_list("id", field_name)
+            )
+            for row_id, related_id in related_ids:
+                rows_values[row_id][field_name].append(related_id)
+
+        return list(rows_values.values())
+
     def extract_manytomany_values(self, values, model):
         """
         Extracts the ManyToMany values out of the values because they need to be
@@ -198,8 +282,11 @@ class RowHandler:
         Calculates a new unique order lower than the provided before row
         order and a step representing the change needed between multiple rows if
         multiple rows are being placed at once.
-        This order can be used by existing or new rows. Several other rows
-        could be updated as their order might need to change.
+        This order can be used by existing or new rows. Other rows only need to be
+        updated if there is no room left before the before row, in which case the
+        renormalization of the row orders of the table is also scheduled. When a before
+        row is provided, the row orders lock of the table is held until the current
+        transaction ends.
 
         :param before: The row instance where the before order must be calculated for.
         :type before: Table
@@ -213,17 +300,57 @@ class RowHandler:
         """
 
         if before:
-            # When the rows are being inserted before an existing row, the order
-            # of the last new row is calculated by subtracting a fraction of
-            # the "before" row order.
-            # The same fraction is also going to be subtracted from the other
-            # rows that have been placed before. By using these fractions we don't
-            # have to re-order every row in the table.
-            step = Decimal("0.00000000000000000001")
-            order_last_row = before.order - step
-            model.objects.filter(
-                order__gt=floor(order_last_row), order__lte=order_last_row
-            ).update(order=F("order") - (step * amount))
+            # When the rows are being inserted before an existing row, they're spread
+            # evenly over the gap between the "before" row and the row before it,
+            # which must be in the same bucket. This way no other rows have to be
+            # updated. See the `order` module for more information.
+            lock_table_row_orders(model._table_id)
+            # The order of the before row could have been changed by a
+            # renormalization that committed after the row was fetched.
+            current_before_order = (
+                model.objects_and_trash.filter(id=before.id)
+                .values_list("order", flat=True)
+                .first()
+            )
+            if current_before_order is not None:
+                before.order = current_before_order
+
+            with localcontext() as context:
+                context.prec = 50
+                bucket_lower_bound = Decimal(ceil(before.order) - 1)
+                previous_order = (
+                    model.objects_and_trash.filter(order__gt=bucket_lower_bound)
+                    .filter(
+                        Q(order__lt=before.order)
+                        | Q(order=before.order, id__lt=before.id)
+                    )
+                    .aggregate(max=Max("order"))
+                    .get("max")
+                )
+                lower_bound = (
+                    bucket_lower_bound if previous_order is None else previous_order
+                )
+                step = ((before.order - lower_bound) / (amount + 1)).quantize(
+                    ROW_ORDER_PRECISION, rounding=ROUND_DOWN
+                )
+
+                if step < settings.BASEROW_ROW_ORDER_RENORMALIZATION_THRESHOLD:
+                    schedule_row_order_renormalization(model._table_id)
+
+                if step > 0:
+                    return before.order - step, step
+
+                # If there is no room left, the order of the last row is calculated
+                # by subtracting the smallest possible fraction of the "before" row
+                # order. The same fraction is also going to be subtracted from the
+                # other rows that have been placed before it, until the orders are
+                # renormalized.
+                step = ROW_ORDER_PRECISION
+                order_last_row = before.order - step
+                model.objects.filter(
+                    order__gt=floor(order_last_row), order__lte=order_last_row
+                ).update(order=F("order") - (step * amount))
+                bump_table_row_order_version(model._table_id)
         else:
             # Because the rows are by default added as last, we have to figure out
             # what the highest order in the table is currently and increase that by
@@ -497,6 +624,11 @@ class RowHandler:
                 fields=model.fields_requiring_refresh_after_insert()
             )
 
+        RowChangeLogHandler().log_row_changes(
+            table, RowChangeActions.CREATED, [instance.id]
+        )
+        SearchDataHandler().rows_changed(table)
+
         from baserow.contrib.database.views.handler import ViewHandler
 
         ViewHandler().field_value_updated(fields)
@@ -637,6 +769,9 @@ class RowHandler:
         # query for the rows updated values instead.
         row.refresh_from_db(fields=model.fields_requiring_refresh_after_update())
 
+        RowChangeLogHandler().log_row_changes(table, RowChangeActions.UPDATED, [row.id])
+        SearchDataHandler().rows_changed(table)
+
         from baserow.contrib.database.views.handler import ViewHandler
 
         ViewHandler().field_value_updated(updated_fields)
@@ -660,6 +795,8 @@ class RowHandler:
         rows_values: List[Dict[str, Any]],
         before_row: Optional[GeneratedTableModel] = None,
         model: Optional[Type[GeneratedTableModel]] = None,
+        lookup_cache: Optional[Dict[str, Any]] = None,
+        send_realtime_update: bool = True,
     ) -> List[GeneratedTableModel]:
         """
         Creates new rows for a given table if the user
@@ -672,6 +809,12 @@ class RowHandler:
             the before_row.
         :param model: If the correct model has already been generated it can be
             provided so that it does not have to be generated for a second time.
+        :param lookup_cache: An optional dict that is shared by all the calls of
+            the same request, so that the select options, files and related rows
+            are only resolved once.
+        :param send_realtime_update: Indicates whether the realtime events must be
+            sent. The rows are not serialized for them if `False`, which is for
+            example used by the rows batch jobs that send a single refresh event.
         :return: The created row instances.
         """
 
@@ -685,7 +828,9 @@ class RowHandler:
             before_row, model, amount=len(rows_values)
         )
 
-        rows = self.prepare_rows_in_bulk(model._field_objects, rows_values)
+        rows = self.prepare_rows_in_bulk(
+            model._field_objects, rows_values, lookup_cache
+        )
 
         rows_relationships = []
         for index, row in enumerate(rows, start=-len(rows)):
@@ -699,9 +844,9 @@ class RowHandler:
             }
             rows_relationships.append((instance, relations))
 
-        inserted_rows = model.objects.bulk_create(
-            [row for (row, relations) in rows_relationships]
-        )
+        rows_to_insert = [row for (row, relations) in rows_relationships]
+        inserted_using_copy = bulk_insert_uses_copy(rows_to_insert)
+        inserted_rows = bulk_insert(model, rows_to_insert)
 
         many_to_many = defaultdict(list)
         for index, row in enumerate(inserted_rows):
@@ -735,7 +880,7 @@ class RowHandler:
 
         for field_name, values in many_to_many.items():
             through = getattr(model, field_name).through
-            through.objects.bulk_create(values)
+            bulk_insert(through, values, assign_ids=False)
 
         update_collector = CachingFieldUpdateCollector(
             table,
@@ -753,6 +898,8 @@ class RowHandler:
                 inserted_rows,
                 update_collector,
             )
+            if inserted_using_copy:
+                field_type.after_rows_copied(field, update_collector)
 
         for (
             dependant_field,
@@ -769,6 +916,11 @@ class RowHandler:
             )
         update_collector.apply_updates_and_get_updated_fields()
 
+        RowChangeLogHandler().log_row_changes(
+            table, RowChangeActions.CREATED, [row.id for row in inserted_rows]
+        )
+        SearchDataHandler().rows_changed(table)
+
         from baserow.contrib.database.views.handler import ViewHandler
 
         updated_fields = [o["field"] for o in model._field_objects.values()]
@@ -787,6 +939,7 @@ class RowHandler:
             user=user,
             table=table,
             model=model,
+            send_realtime_update=send_realtime_update,
         )
 
         return rows_to_return
@@ -798,6 +951,8 @@ class RowHandler:
         rows: List,
         model: Optional[Type[GeneratedTableModel]] = None,
         rows_to_update: Optional[RowsForUpdate] = None,
+        lookup_cache: Optional[Dict[str, Any]] = None,
+        send_realtime_update: bool = True,
     ) -> List[GeneratedTableModelForUpdate]:
         """
         Updates field values in batch based on provided rows with the new values.
@@ -810,6 +965,12 @@ class RowHandler:
         :param rows_to_update: If the rows to update have already been generated
             it can be provided so that it does not have to be generated for a
             second time.
+        :param lookup_cache: An optional dict that is shared by all the calls of
+            the same request, so that the select options, files and related rows
+            are only resolved once.
+        :param send_realtime_update: Indicates whether the realtime events must be
+            sent. The rows are not serialized for them if `False`, which is for
+            example used by the rows batch jobs that send a single refresh event.
         :raises RowIdsNotUnique: When trying to update the same row multiple times.
         :raises RowDoesNotExist: When any of the rows don't exist.
         :return: The updated row instances.
@@ -821,7 +982,7 @@ class RowHandler:
         if model is None:
             model = table.get_model()
 
-        rows = self.prepare_rows_in_bulk(model._field_objects, rows)
+        rows = self.prepare_rows_in_bulk(model._field_objects, rows, lookup_cache)
         row_ids = [row["id"] for row in rows]
 
         non_unique_ids = get_non_unique_values(row_ids)
@@ -854,6 +1015,7 @@ class RowHandler:
             table=table,
             model=model,
             updated_field_ids=updated_field_ids,
+            send_realtime_update=send_realtime_update,
         )
 
         rows_relationships = []
@@ -966,6 +1128,9 @@ class RowHandler:
             )
         update_collector.apply_updates_and_get_updated_fields()
 
+        RowChangeLogHandler().log_row_changes(table, RowChangeActions.UPDATED, row_ids)
+        SearchDataHandler().rows_changed(table)
+
         from baserow.contrib.database.views.handler import ViewHandler
 
         updated_fields = [o["field"] for o in model._field_objects.values()]
@@ -982,6 +1147,7 @@ class RowHandler:
             model=model,
             before_return=before_return,
             updated_field_ids=updated_field_ids,
+            send_realtime_update=send_realtime_update,
         )
 
         return rows_to_return
@@ -1000,6 +1166,458 @@ class RowHandler:
             .filter(id__in=row_ids),
         )
 
+    def match_rows_by_key(
+        self,
+        model: Type[GeneratedTableModel],
+        key_field_id: int,
+        rows_values: List[Dict[str, Any]],
+    ) -> List[Optional[int]]:
+        """
+        Finds the existing rows that have the same value for the key field as the
+        provided rows values using a single query. Rows values without a value for
+        the key field never match an existing row.
+
+        A transaction level advisory lock on the key field is acquired before the
+        rows are matched, so that concurrent upserts with the same new key don't
+        both create a row. This must therefore be called in the transaction that
+        also creates the rows that didn't match.
+
+        :param model: The model of the table that contains the rows.
+        :param key_field_id: The id of the field that is used to match the rows.
+        :param rows_values: The values of the rows that must be matched. The keys
+            must be the field names.
+        :raises FieldDoesNotExist: When the key field is not a field of the table.
+        :raises IncompatibleUpsertKeyField: When the values of the key field can't be
+            compared.
+        :raises UpsertKeyValuesNotUnique: When multiple rows values have the same key.
+        :raises UpsertKeyMatchesMultipleRows: When a key matches multiple rows.
+        :return: The id of the matching row or `None` for every rows values.
+        """
+
+        if key_field_id not in model._field_objects:
+            raise FieldDoesNotExist(f"The field {key_field_id} does not exist.")
+
+        field_object = model._field_objects[key_field_id]
+        field_type = field_object["type"]
+        field_name = field_object["name"]
+        model_field = model._meta.get_field(field_name)
+        if (
+            field_type.read_only
+            or model_field.is_relation
+            or isinstance(model_field, JSONField)
+        ):
+            raise IncompatibleUpsertKeyField(
+                f"The {field_type.type} field type can't be used as key."
+            )
+
+        key_values = field_type.prepare_value_for_db_in_bulk(
+            field_object["field"],
+            {
+                index: values[field_name]
+                for index, values in enumerate(rows_values)
+                if values.get(field_name) not in (None, "")
+            },
+        )
+
+        non_unique_values = get_non_unique_values(list(key_values.values()))
+        if len(non_unique_values) > 0:
+            raise UpsertKeyValuesNotUnique(
+                sorted(str(value) for value in non_unique_values)
+            )
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_advisory_xact_lock(%s, %s)",
+                [UPSERT_ADVISORY_LOCK_KEY, key_field_id],
+            )
+
+        row_ids_by_key = {}
+        multiple_matches = set()
+        for row_id, key_value in model.objects.filter(
+            **{f"{field_name}__in": set(key_values.values())}
+        ).values_list("id", field_name):
+            if key_value in row_ids_by_key:
+                multiple_matches.add(key_value)
+            row_ids_by_key[key_value] = row_id
+
+        if len(multiple_matches) > 0:
+            raise UpsertKeyMatchesMultipleRows(
+                sorted(str(value) for value in multiple_matches)
+            )
+
+        return [
+            row_ids_by_key.get(key_values[index]) if index in key_values else None
+            for index in range(len(rows_values))
+        ]
+
+    def upsert_rows(
+        self,
+        user: AbstractUser,
+        table: Table,
+        rows_values: List[Dict[str, Any]],
+        key_field_id: int,
+        model: Optional[Type[GeneratedTableModel]] = None,
+        matched_row_ids: Optional[List[Optional[int]]] = None,
+        rows_to_update: Optional[RowsForUpdate] = None,
+    ) -> List[GeneratedTableModel]:
+        """
+        Updates the existing rows that have the same value for the key field as the
+        provided rows values and creates new rows for the others. The new and updated
+        rows are both handled in bulk, which means that the rows_created and the
+        rows_updated signals are both sent at most once.
+
+        :param user: The user of whose behalf the rows are upserted.
+        :param table: The table for which the rows must be upserted.
+        :param rows_values: The values of the rows that must be upserted.
+        :param key_field_id: The id of the field that is used to match the rows.
+        :param model: If the correct model has already been generated it can be
+            provided so that it does not have to be generated for a second time.
+        :param matched_row_ids: If the rows have already been matched using the
+            `match_rows_by_key` method in the current transaction, the result can be
+            provided here.
+        :param rows_to_update: If the matched rows have already been fetched for
+            update, they can be provided so that they're not fetched again.
+        :return: The created or updated row instances in the same order as the rows
+            values.
+        """
+
+        group = table.database.group
+        group.has_user(user, raise_error=True)
+
+        if model is None:
+            model = table.get_model()
+
+        # The rows that didn't match must be created in the transaction in which the
+        # key field is locked.
+        with transaction.atomic():
+            if matched_row_ids is None:
+                matched_row_ids = self.match_rows_by_key(
+                    model, key_field_id, rows_values
+                )
+
+            rows_values_to_create = []
+            rows_values_to_update = []
+            for values, row_id in zip(rows_values, matched_row_ids):
+                if row_id is None:
+                    rows_values_to_create.append(values)
+                else:
+                    rows_values_to_update.append({**values, "id": row_id})
+
+            # The new and the updated rows often reference the same select options and
+            # related rows, so they only have to be resolved once.
+            lookup_cache = {}
+            created_rows = (
+                self.create_rows(
+                    user,
+                    table,
+                    rows_values_to_create,
+                    model=model,
+                    lookup_cache=lookup_cache,
+                )
+                if rows_values_to_create
+                else []
+            )
+            updated_rows = (
+                self.update_rows(
+                    user,
+                    table,
+                    rows_values_to_update,
+                    model=model,
+                    rows_to_update=rows_to_update,
+                    lookup_cache=lookup_cache,
+                )
+                if rows_values_to_update
+                else []
+            )
+
+            created_rows = iter(created_rows)
+            updated_rows_by_id = {row.id: row for row in updated_rows}
+            return [
+                next(created_rows) if row_id is None else updated_rows_by_id[row_id]
+                for row_id in matched_row_ids
+            ]
+
+    def get_row_ids_queryset_by_filter(
+        self,
+        table: Table,
+        model: Optional[Type[GeneratedTableModel]] = None,
+        view: Optional[View] = None,
+        filter_object: Optional[Dict[str, Any]] = None,
+        filter_type: str = FILTER_TYPE_AND,
+    ) -> Tuple[QuerySet, int]:
+        """
+        Selects the ids of the rows that match the filters of the provided view and
+        the provided filter object into a temporary table using a single query. If
+        neither are provided, the ids of all the rows of the table are selected. The
+        ids never leave the database and the temporary table is dropped at the end
+        of the transaction, so this method must be called within a transaction.
+
+        The returned queryset selects the rows by the stored ids, so it keeps
+        selecting the same rows after they have been updated and perhaps don't match
+        the filters anymore, or after they have been trashed.
+
+        :param table: The table of which the rows must be filtered.
+        :param model: If the correct model has already been generated it can be
+            provided so that it does not have to be generated for a second time.
+        :param view: If provided, only the rows that match the filters of this view
+            are selected.
+        :param filter_object: If provided, only the rows that match these filters are
+            selected. The format is the same as the `filter_by_fields_object` method
+            of the table model queryset expects.
+        :param filter_type: Indicates whether the filters of the filter object are
+            combined with an AND or an OR.
+        :raises ViewNotInTable: When the view doesn't belong to the table.
+        :return: A queryset of the matching rows and the amount of matching rows.
+        """
+
+        from baserow.contrib.database.views.handler import ViewHandler
+
+        if model is None:
+            model = table.get_model()
+
+        queryset = model.objects.all()
+
+        if view is not None:
+            if view.table_id != table.id:
+                raise ViewNotInTable(view.id)
+            queryset = ViewHandler().apply_filters(view, queryset)
+
+        if filter_object:
+            queryset = queryset.filter_by_fields_object(filter_object, filter_type)
+
+        sql, params = queryset.order_by().values("id").query.sql_with_params()
+        row_ids_table_name = f"row_ids_{uuid4().hex}"
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TEMPORARY TABLE {row_ids_table_name} ON COMMIT DROP "
+                f"AS {sql}",
+                params,
+            )
+            count = cursor.rowcount
+            cursor.execute(f"ANALYZE {row_ids_table_name}")
+
+        rows_queryset = model.objects_and_trash.filter(
+            id__in=RawSQL(f"SELECT id FROM {row_ids_table_name}", ())  # nosec
+        )
+        return rows_queryset, count
+
+    def update_rows_values(
+        self,
+        user: AbstractUser,
+        table: Table,
+        queryset: QuerySet,
+        values: Dict[str, Any],
+        model: Optional[Type[GeneratedTableModel]] = None,
+        lookup_cache: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Sets the same values for all the rows of the provided queryset. Contrary to
+        the `update_rows` method, the rows are never fetched. The values are written
+        using set-based `UPDATE` statements and the rows that depend on them are
+        updated by joining on the queryset. The realtime events of the rows are
+        therefore not sent, the `rows_updated_by_filter` signal is sent instead.
+
+        :param user: The user of whose behalf the change is made.
+        :param table: The table for which the rows must be updated.
+        :param queryset: The rows that must be updated. It must keep selecting the
+            same rows after the values have been set, like the queryset returned by
+            `get_row_ids_queryset_by_filter` or a queryset filtering on ids.
+        :param values: The values that must be set for all the rows with the field
+            id or the string 'field_{id}' as key.
+        :param model: If the correct model has already been generated it can be
+            provided so that it does not have to be generated for a second time.
+        :param lookup_cache: An optional dict that is shared by all the calls of
+            the same request, so that the select options, files and related rows
+            are only resolved once.
+        """
+
+        group = table.database.group
+        group.has_user(user, raise_error=True)
+
+        if model is None:
+            model = table.get_model()
+
+        values_by_name = {}
+        for field_id, field in model._field_objects.items():
+            if field_id in values:
+                values_by_name[field["name"]] = values[field_id]
+            elif field["name"] in values:
+                values_by_name[field["name"]] = values[field["name"]]
+        values = self.prepare_rows_in_bulk(
+            model._field_objects, [values_by_name], lookup_cache
+        )[0]
+        updated_field_ids = {
+            field_id
+            for field_id, field in model._field_objects.items()
+            if field["name"] in values
+        }
+
+        values, manytomany_values = self.extract_manytomany_values(values, model)
+        row_ids_queryset = queryset.values("id")
+
+        # The many to many relations need to be updated first because they need to
+        # exist when the rows are updated. Otherwise, the formula and lookup fields
+        # can't see the relations.
+        for field_name, value in manytomany_values.items():
+            if not value and not isinstance(value, list):
+                continue
+
+            through = getattr(model, field_name).through
+            row_column = None
+            value_column = None
+            for field in through._meta.get_fields():
+                if type(field) is not ForeignKey:
+                    continue
+
+                if field.remote_field.model == model:
+                    row_column = field.get_attname_column()[1]
+                else:
+                    value_column = field.get_attname_column()[1]
+
+            delete_qs = through.objects.filter(
+                **{f"{row_column}__in": row_ids_queryset}
+            )
+            delete_qs._raw_delete(delete_qs.db)
+            if value:
+                sql, params = row_ids_queryset.query.sql_with_params()
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        f"INSERT INTO {through._meta.db_table} "  # nosec
+                        f"({row_column}, {value_column}) "
+                        f"SELECT row_ids.id, value_ids.id "
+                        f"FROM ({sql}) row_ids "
+                        f"CROSS JOIN unnest(%s::int[]) AS value_ids(id)",
+                        [*params, [getattr(v, "id", v) for v in value]],
+                    )
+
+        # The values of the expression fields must be calculated after the new
+        # values have been written because the set-based expressions read the values
+        # that are stored in the row.
+        now = timezone.now()
+        values["updated_on"] = now
+        expression_values = {}
+        for field_name in model.fields_requiring_refresh_after_update():
+            model_field = model._meta.get_field(field_name)
+            if not isinstance(model_field, BaserowExpressionField):
+                values[field_name] = now
+            elif model_field.expression is None:
+                expression_values[field_name] = Value(None)
+            else:
+                expression_values[
+                    field_name
+                ] = FormulaHandler.baserow_expression_to_update_django_expression(
+                    model_field.expression, model
+                )
+
+        queryset.update(**values)
+        if len(expression_values) > 0:
+            queryset.update(**expression_values)
+
+        update_collector = CachingFieldUpdateCollector(
+            table, starting_row_id=row_ids_queryset, existing_model=model
+        )
+        for (
+            dependant_field,
+            dependant_field_type,
+            path_to_starting_table,
+        ) in FieldDependencyHandler.get_dependant_fields_with_type(
+            updated_field_ids, update_collector
+        ):
+            dependant_field_type.row_of_dependency_updated(
+                dependant_field,
+                queryset,
+                update_collector,
+                path_to_starting_table,
+            )
+        update_collector.apply_updates_and_get_updated_fields()
+
+        RowChangeLogHandler().log_row_changes_by_queryset(
+            table, RowChangeActions.UPDATED, queryset
+        )
+        SearchDataHandler().rows_changed(table)
+
+        from baserow.contrib.database.views.handler import ViewHandler
+
+        updated_fields = [o["field"] for o in model._field_objects.values()]
+        ViewHandler().field_value_updated(updated_fields)
+
+        rows_updated_by_filter.send(
+            self,
+            user=user,
+            table=table,
+            model=model,
+            updated_field_ids=updated_field_ids,
+        )
+
+    def delete_rows_by_queryset(
+        self,
+        user: AbstractUser,
+        table: Table,
+        queryset: QuerySet,
+        model: Optional[Type[GeneratedTableModel]] = None,
+    ) -> TrashedRows:
+        """
+        Trashes all the rows of the provided queryset. Contrary to the `delete_rows`
+        method, the rows are never fetched. They're trashed using a set-based
+        `UPDATE` statement and the ids of the trashed rows are stored in the trash
+        entry by the database. The realtime events of the rows are therefore not
+        sent, the `rows_deleted_by_filter` signal is sent instead.
+
+        :param user: The user of whose behalf the change is made.
+        :param table: The table for which the rows must be deleted.
+        :param queryset: The rows that must be deleted. It must keep selecting the
+            same rows after they have been trashed, like the queryset returned by
+            `get_row_ids_queryset_by_filter`.
+        :param model: If the correct model has already been generated, it can be
+            provided so that it does not have to be generated for a second time.
+        :return: The trashed rows entry.
+        """
+
+        group = table.database.group
+        group.has_user(user, raise_error=True)
+
+        if not model:
+            model = table.get_model()
+
+        trashed_rows = TrashedRows(table=table, row_ids=[])
+        # Like the `rows` attribute, this is used by the trash type to trash the rows
+        # without fetching them. The names of the rows are not stored.
+        trashed_rows.rows_queryset = queryset
+        trashed_rows.rows = []
+
+        TrashHandler.trash(
+            user, group, table.database, trashed_rows, parent_id=table.id
+        )
+
+        updated_field_ids = [field_id for field_id in model._field_objects.keys()]
+        update_collector = CachingFieldUpdateCollector(
+            table, starting_row_id=queryset.values("id"), existing_model=model
+        )
+        for (
+            dependant_field,
+            dependant_field_type,
+            path_to_starting_table,
+        ) in FieldDependencyHandler.get_dependant_fields_with_type(
+            updated_field_ids, update_collector
+        ):
+            dependant_field_type.row_of_dependency_deleted(
+                dependant_field, queryset, update_collector, path_to_starting_table
+            )
+        update_collector.apply_updates_and_get_updated_fields()
+
+        RowChangeLogHandler().log_row_changes_by_queryset(
+            table, RowChangeActions.DELETED, queryset
+        )
+
+        from baserow.contrib.database.views.handler import ViewHandler
+
+        updated_fields = [o["field"] for o in model._field_objects.values()]
+        ViewHandler().field_value_updated(updated_fields)
+
+        rows_deleted_by_filter.send(self, user=user, table=table, model=model)
+
+        return trashed_rows
+
     def move_row_by_id(
         self,
         user: AbstractUser,
@@ -1076,6 +1694,9 @@ class RowHandler:
             )
         update_collector.apply_updates_and_get_updated_fields()
 
+        RowChangeLogHandler().log_row_changes(table, RowChangeActions.UPDATED, [row.id])
+        SearchDataHandler().rows_changed(table)
+
         from baserow.contrib.database.views.handler import ViewHandler
 
         updated_fields = [o["field"] for o in model._field_objects.values()]
@@ -1165,6 +1786,8 @@ class RowHandler:
             )
         update_collector.apply_updates_and_get_updated_fields()
 
+        RowChangeLogHandler().log_row_changes(table, RowChangeActions.DELETED, [row_id])
+
         from baserow.contrib.database.views.handler import ViewHandler
 
         updated_fields = [o["field"] for o in model._field_objects.values()]
@@ -1186,6 +1809,7 @@ class RowHandler:
         table: Table,
         row_ids: List[int],
         model: Optional[Type[GeneratedTableModel]] = None,
+        send_realtime_update: bool = True,
     ) -> TrashedRows:
         """
         Trashes existing rows of the given table based on row_ids.
@@ -1196,6 +1820,9 @@ class RowHandler:
         :param model:
         :param model: If the correct model has already been generated, it can be
             provided so that it does not have to be generated for a second time.
+        :param send_realtime_update: Indicates whether the realtime events must be
+            sent. The rows are not serialized for them if `False`, which is for
+            example used by the rows batch jobs that send a single refresh event.
         :raises RowDoesNotExist: When the row with the provided id does not exist.
         """
 
@@ -1216,7 +1843,12 @@ class RowHandler:
             raise RowDoesNotExist(sorted(list(set(row_ids) - set(db_rows_ids))))
 
         before_return = before_rows_delete.send(
-            self, rows=rows, user=user, table=table, model=model
+            self,
+            rows=rows,
+            user=user,
+            table=table,
+            model=model,
+            send_realtime_update=send_realtime_update,
         )
 
         trashed_rows = TrashedRows()
@@ -1247,6 +1879,8 @@ class RowHandler:
             )
         update_collector.apply_updates_and_get_updated_fields()
 
+        RowChangeLogHandler().log_row_changes(table, RowChangeActions.DELETED, row_ids)
+
         from baserow.contrib.database.views.handler import ViewHandler
 
         updated_fields = [o["field"] for o in model._field_objects.values()]
@@ -1259,6 +1893,7 @@ class RowHandler:
             table=table,
             model=model,
             before_return=before_return,
+            send_realtime_update=send_realtime_update,
         )
 
         return trashed_rows
@@ -0,0 +1,168 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import models
+from django.utils import timezone
+
+from baserow.contrib.database.table.models import Table
+from baserow.core.mixins import CreatedAndUpdatedOnMixin
+
+User = get_user_model()
+
+
+class RowChangeActions(models.TextChoices):
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+    # Any row of the table could have changed, for example because the values of a
+    # field have been converted. The change doesn't have a row id.
+    TABLE_UPDATED = "table_updated"
+
+
+class RowChange(models.Model):
+    """
+    An append only log entry that is written every time a row is created, updated or
+    deleted. The entries are ordered by the id of the database transaction that made
+    the change, so that it can be determined which entries can't change anymore.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    table = models.ForeignKey(Table, on_delete=models.CASCADE)
+    row_id = models.PositiveIntegerField(null=True)
+    action = models.CharField(max_length=16, choices=RowChangeActions.choices)
+    timestamp = models.DateTimeField(
+        help_text="The start time of the transaction that changed the row."
+    )
+    transaction_id = models.BigIntegerField(
+        help_text="The id of the transaction that changed the row."
+    )
+
+    class Meta:
+        ordering = ("transaction_id", "id")
+        indexes = [
+            models.Index(fields=["table", "transaction_id", "id"]),
+            models.Index(fields=["timestamp"]),
+            models.Index(fields=["table", "row_id"]),
+        ]
+
+
+class RowsBatchJobTypes(models.TextChoices):
+    CREATE = "create"
+    UPDATE = "update"
+    DELETE = "delete"
+
+
+class RowsBatchJobStates(models.TextChoices):
+    PENDING = "pending"
+    PROCESSING = "processing"
+    FINISHED = "finished"
+    FAILED = "failed"
+
+
+class RowsBatchJobQuerySet(models.QuerySet):
+    def is_running(self):
+        """
+        Returns the jobs that are pending or processing. A job of which the progress
+        hasn't been updated for longer than the time limit of the task, is not
+        considered running anymore, because the worker has most likely stopped.
+        """
+
+        return self.filter(
+            state__in=[RowsBatchJobStates.PENDING, RowsBatchJobStates.PROCESSING],
+            updated_on__gt=self._get_stale_before(),
+        )
+
+    def is_stale(self):
+        """
+        Returns the pending or processing jobs of which the progress hasn't been
+        updated for longer than the time limit of the task, which means that they
+        won't be finished anymore.
+        """
+
+        return self.filter(
+            state__in=[RowsBatchJobStates.PENDING, RowsBatchJobStates.PROCESSING],
+            updated_on__lte=self._get_stale_before(),
+        )
+
+    def _get_stale_before(self):
+        return timezone.now() - timezone.timedelta(
+            seconds=settings.BASEROW_ROWS_BATCH_JOB_SOFT_TIME_LIMIT
+        )
+
+
+class RowsBatchJob(CreatedAndUpdatedOnMixin, models.Model):
+    """
+    A job that creates, updates or deletes more rows than can be done in a single
+    request. The items are processed in chunks by an asynchronous task, where every
+    chunk is committed in its own transaction.
+    """
+
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, help_text="The user that has created the job."
+    )
+    table = models.ForeignKey(
+        Table,
+        on_delete=models.CASCADE,
+        help_text="The table in which the rows must be changed.",
+    )
+    type = models.CharField(
+        max_length=16,
+        choices=RowsBatchJobTypes.choices,
+        help_text="Indicates whether the rows must be created, updated or deleted.",
+    )
+    user_field_names = models.BooleanField(
+        default=False,
+        help_text="Indicates whether the items contain the names of the fields "
+        "instead of the internal `field_{id}` names.",
+    )
+    total_count = models.PositiveIntegerField(
+        help_text="The total amount of items that must be processed."
+    )
+    processed_count = models.PositiveIntegerField(
+        default=0, help_text="The amount of items that have been processed."
+    )
+    progress_percentage = models.IntegerField(
+        default=0,
+        help_text="A percentage indicating how far along the job is. 100 means that "
+        "it's finished.",
+    )
+    state = models.CharField(
+        max_length=16,
+        choices=RowsBatchJobStates.choices,
+        default=RowsBatchJobStates.PENDING,
+        help_text="Indicates the state of the job.",
+    )
+    error = models.TextField(
+        blank=True, default="", help_text="An error message if something went wrong."
+    )
+    human_readable_error = models.TextField(
+        blank=True,
+        default="",
+        help_text="A human readable error message indicating what went wrong.",
+    )
+
+    objects = RowsBatchJobQuerySet.as_manager()
+
+
+class RowsBatchJobChunk(models.Model):
+    """
+    The items of one chunk of a rows batch job. The items are stored per chunk, so
+    that only the chunk that is being processed has to be loaded. A chunk is
+    deleted in the same transaction in which its rows are changed.
+    """
+
+    job = models.ForeignKey(
+        RowsBatchJob,
+        on_delete=models.CASCADE,
+        related_name="chunks",
+        help_text="The job that the chunk belongs to.",
+    )
+    offset = models.PositiveIntegerField(
+        help_text="The index of the first item of the chunk in all the items of the "
+        "job."
+    )
+    items = models.JSONField(
+        help_text="The row values or ids that must be processed.",
+    )
+
+    class Meta:
+        ordering = ("offset",)
@@ -0,0 +1,231 @@
+"""
+The rows of a table are ordered by their `order` value and then by their id. New rows
+are added last with a whole number order, so every whole number `n` is the upper
+bound of a bucket `(n - 1, n]` that contains the rows that have been inserted or
+moved before the row with order `n`.
+
+A row that is inserted before another row gets an order in the middle of the gap
+between that row and the row before it, so that no other rows have to be updated.
+Repeatedly inserting rows at the same position halves that gap every time until
+the precision of the `order` column runs out. Before that happens, the rows of the
+buckets that have become too dense are spread out evenly again over their bucket in
+the background by the `renormalize_row_orders` task.
+
+The renormalization changes the orders of existing rows, so it must not run at the
+same time as placing a row before another row, because the new order is calculated
+from the orders of the surrounding rows. Both take a transaction level advisory lock
+per table to prevent that. Keyset cursors contain the order of the last row of a
+page, so they contain the row order version of the table, which changes whenever the
+orders of existing rows change, and older cursors are rejected.
+"""
+
+import time
+
+from decimal import Decimal
+from typing import List, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+
+from baserow.contrib.database.table.change_sequence import bump_table_change_sequences
+from baserow.contrib.database.table.models import GeneratedTableModel
+
+# The smallest difference between two orders that the `order` column can store.
+ROW_ORDER_PRECISION = Decimal("0.00000000000000000001")
+
+# The first key of the advisory lock that serializes the changes to the row orders of
+# a table. The second key is the id of the table.
+ROW_ORDER_ADVISORY_LOCK_KEY = 41771
+
+
+def lock_table_row_orders(table_id: int):
+    """
+    Acquires the advisory lock of the row orders of the table. It's held until the
+    current transaction ends, so this must be called in a transaction.
+
+    :param table_id: The id of the table of which the row orders are going to be
+        changed.
+    """
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT pg_advisory_xact_lock(%s, %s)",
+            [ROW_ORDER_ADVISORY_LOCK_KEY, table_id],
+        )
+
+
+def get_row_order_version_cache_key(table_id: int) -> str:
+    return f"row_order_version__{table_id}"
+
+
+def get_table_row_order_version(table_id: int) -> int:
+    """
+    Returns the row order version of the table. It changes whenever the orders of
+    existing rows change without the rows being moved.
+
+    :param table_id: The id of the table.
+    :return: The current row order version.
+    """
+
+    cache_key = get_row_order_version_cache_key(table_id)
+    version = cache.get(cache_key)
+    if version is None:
+        # Start at the current time, so that the version doesn't get an older value
+        # again if the cache is cleared.
+        cache.add(cache_key, time.time_ns() // 1000, timeout=None)
+        version = cache.get(cache_key)
+    return version
+
+
+def bump_table_row_order_version(table_id: int):
+    """
+    Increases the row order version of the table right away and again when the
+    current transaction commits, so that a cursor created in between with the old
+    orders is also rejected.
+
+    :param table_id: The id of the table of which the row orders have changed.
+    """
+
+    def increment_version():
+        cache_key = get_row_order_version_cache_key(table_id)
+        try:
+            cache.incr(cache_key, 1)
+        except ValueError:
+            cache.add(cache_key, time.time_ns() // 1000, timeout=None)
+
+    increment_version()
+    transaction.on_commit(increment_version)
+
+
+def get_row_order_renormalization_cache_key(table_id: int) -> str:
+    return f"row_order_renormalization__{table_id}"
+
+
+def schedule_row_order_renormalization(table_id: int):
+    """
+    Starts the task that renormalizes the row orders of the table when the current
+    transaction commits. The task is only started if it hasn't already been scheduled
+    for the table, because every insert in a dense bucket would schedule it again.
+
+    :param table_id: The id of the table of which the row orders must be
+        renormalized.
+    """
+
+    from .tasks import renormalize_row_orders
+
+    cache_key = get_row_order_renormalization_cache_key(table_id)
+    if cache.add(
+        cache_key, True, timeout=settings.BASEROW_ROW_ORDER_RENORMALIZATION_LOCK_TIMEOUT
+    ):
+        transaction.on_commit(lambda: renormalize_row_orders.delay(table_id))
+
+
+def get_row_order_buckets_to_renormalize(
+    model: GeneratedTableModel,
+) -> List[Tuple[int, int]]:
+    """
+    Finds the buckets of which the gap between two rows, or between the lower bound
+    of the bucket and its first row, is smaller than
+    `BASEROW_ROW_ORDER_RENORMALIZATION_THRESHOLD`.
+
+    :param model: The generated model of the table.
+    :return: The upper bound and the number of rows of every bucket that must be
+        renormalized, ordered by upper bound.
+    """
+
+    table_name = connection.ops.quote_name(model._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            SELECT bucket, count(*) FROM (
+                SELECT
+                    ceil("order") AS bucket,
+                    "order" - greatest(
+                        lag("order") OVER (ORDER BY "order", "id"),
+                        ceil("order") - 1
+                    ) AS gap
+                FROM {table_name}
+            ) gaps
+            GROUP BY bucket
+            HAVING min(gap) < %s
+            ORDER BY bucket
+            """,
+            [settings.BASEROW_ROW_ORDER_RENORMALIZATION_THRESHOLD],
+        )
+        return [(int(bucket), count) for bucket, count in cursor.fetchall()]
+
+
+def renormalize_row_order_buckets(model: GeneratedTableModel, buckets: List[int]):
+    """
+    Spreads the rows of the provided buckets evenly over their bucket, while keeping
+    their current position. The last row of every bucket gets the whole number order
+    of its upper bound. The row orders lock of the table must be held.
+
+    :param model: The generated model of the table.
+    :param buckets: The upper bounds of the buckets that must be renormalized.
+    """
+
+    table_name = connection.ops.quote_name(model._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            UPDATE {table_name} AS t SET "order" = renormalized.new_order
+            FROM (
+                SELECT
+                    "id",
+                    ceil("order") - 1 + round(
+                        row_number() OVER (
+                            PARTITION BY ceil("order") ORDER BY "order", "id"
+                        )::numeric / count(*) OVER (PARTITION BY ceil("order")),
+                        20
+                    ) AS new_order
+                FROM {table_name}
+                WHERE ceil("order") = ANY(%s)
+            ) renormalized
+            WHERE t."id" = renormalized."id"
+            """,
+            [buckets],
+        )
+
+
+def renormalize_table_row_orders(model: GeneratedTableModel) -> int:
+    """
+    Renormalizes all the buckets of the table that have become too dense. Multiple
+    buckets are renormalized in the same transaction until it contains at least
+    `BASEROW_ROW_ORDER_RENORMALIZATION_CHUNK_SIZE` rows, so that the rows of a big
+    table are not all locked at once. Every transaction holds the row orders lock of
+    the table, so that no row is placed before another row using the orders from
+    before the renormalization. Rows that are added last don't need the lock, because
+    the renormalization never increases the highest order of the table. The row order
+    version is bumped so that the keyset cursors containing the old orders are
+    rejected.
+
+    :param model: The generated model of the table.
+    :return: The number of rows of which the order has been renormalized.
+    """
+
+    chunk_size = settings.BASEROW_ROW_ORDER_RENORMALIZATION_CHUNK_SIZE
+    renormalized_count = 0
+    chunk, chunk_count = [], 0
+
+    def renormalize_chunk():
+        with transaction.atomic():
+            lock_table_row_orders(model._table_id)
+            renormalize_row_order_buckets(model, chunk)
+            bump_table_change_sequences([model._table_id])
+            bump_table_row_order_version(model._table_id)
+
+    for bucket, count in get_row_order_buckets_to_renormalize(model):
+        chunk.append(bucket)
+        chunk_count += count
+        if chunk_count >= chunk_size:
+            renormalize_chunk()
+            renormalized_count += chunk_count
+            chunk, chunk_count = [], 0
+
+    if chunk:
+        renormalize_chunk()
+        renormalized_count += chunk_count
+
+    return renormalized_count
@@ -14,3 +14,11 @@ row_updated = Signal()
 rows_updated = Signal()
 row_deleted = Signal()
 rows_deleted = Signal()
+
+# Sent when the rows matching a filter are updated or deleted in bulk, without the
+# rows being fetched.
+rows_updated_by_filter = Signal()
+rows_deleted_by_filter = Signal()
+
+# Sent once for every chunk of rows that is processed by a rows batch job.
+rows_batch_job_chunk_processed = Signal()
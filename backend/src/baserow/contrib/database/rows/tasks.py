@@ -0,0 +1,93 @@
+from datetime import timedelta
+
+from django.conf import settings
+
+from baserow.config.celery import app
+
+
+@app.task(bind=True, queue="export")
+def compact_row_change_log(self):
+    """
+    Removes the expired and superseded changes from the row change log.
+    """
+
+    from baserow.contrib.database.rows.change_log import RowChangeLogHandler
+
+    RowChangeLogHandler().compact_row_changes()
+
+
+@app.task(
+    bind=True,
+    queue="export",
+    soft_time_limit=settings.BASEROW_ROWS_BATCH_JOB_SOFT_TIME_LIMIT,
+)
+def run_rows_batch_job(self, job_id: int):
+    """
+    Creates, updates or deletes the rows of a rows batch job. This task must run
+    after the job has been created.
+
+    :param job_id: The id of the job that must be run.
+    """
+
+    from baserow.contrib.database.rows.batch_jobs import RowsBatchJobHandler
+    from baserow.contrib.database.rows.models import RowsBatchJob
+
+    job = RowsBatchJob.objects.select_related("user", "table__database__group").get(
+        id=job_id
+    )
+    RowsBatchJobHandler().run_job(job)
+
+
+@app.task(bind=True, queue="export")
+def clean_up_stale_rows_batch_jobs(self):
+    """
+    Marks the rows batch jobs that have stopped making progress as failed.
+    """
+
+    from baserow.contrib.database.rows.batch_jobs import RowsBatchJobHandler
+
+    RowsBatchJobHandler().clean_up_stale_jobs()
+
+
+@app.task(bind=True, queue="export")
+def renormalize_row_orders(self, table_id: int):
+    """
+    Spreads the row orders of the dense buckets of the table evenly over their
+    bucket again, so that new rows can be inserted before the other rows without
+    having to update any other rows.
+
+    :param table_id: The id of the table of which the row orders must be
+        renormalized.
+    """
+
+    from django.core.cache import cache
+
+    from baserow.contrib.database.rows.order import (
+        get_row_order_renormalization_cache_key,
+        renormalize_table_row_orders,
+    )
+    from baserow.contrib.database.table.models import Table
+
+    # Rows that are inserted in a dense bucket while the task is running must be able
+    # to schedule it again.
+    cache.delete(get_row_order_renormalization_cache_key(table_id))
+
+    try:
+        table = Table.objects.get(id=table_id)
+    except Table.DoesNotExist:
+        return
+
+    renormalize_table_row_orders(table.get_model(field_ids=[]))
+
+
+# noinspection PyUnusedLocal
+@app.on_after_finalize.connect
+def setup_periodic_row_tasks(sender, **kwargs):
+    sender.add_periodic_task(
+        timedelta(minutes=settings.BASEROW_ROW_CHANGE_LOG_COMPACTION_INTERVAL_MINUTES),
+        compact_row_change_log.s(),
+    )
+    sender.add_periodic_task(
+        timedelta(minutes=settings.BASEROW_ROWS_BATCH_JOB_CLEANUP_INTERVAL_MINUTES),
+        clean_up_stale_rows_batch_jobs.s(),
+    )
@@ -5,7 +5,12 @@ from baserow.contrib.database.api.rows.serializers import (
 )
 from baserow.contrib.database.webhooks.registries import WebhookEventType
 from baserow.contrib.database.ws.rows.signals import before_row_update
-from .signals import row_created, row_updated, row_deleted
+from .signals import (
+    row_created,
+    row_updated,
+    row_deleted,
+    rows_batch_job_chunk_processed,
+)
 
 
 class RowEventType(WebhookEventType):
@@ -67,3 +72,25 @@ class RowDeletedEventType(WebhookEventType):
         payload = super().get_payload(event_id, webhook, **kwargs)
         payload["row_id"] = row.id
         return payload
+
+
+class RowsBatchJobChunkProcessedEventType(WebhookEventType):
+    """
+    Instead of an event per row, one event is sent for every chunk of rows that is
+    created, updated or deleted by a rows batch job.
+    """
+
+    type = "rows.batch_job_chunk_processed"
+    signal = rows_batch_job_chunk_processed
+
+    def get_payload(
+        self, event_id, webhook, job=None, row_ids=None, processed_count=0, **kwargs
+    ):
+        # The job is not provided when the user triggers a test call.
+        payload = super().get_payload(event_id, webhook, **kwargs)
+        payload["job_id"] = job.id if job else None
+        payload["job_type"] = job.type if job else None
+        payload["row_ids"] = row_ids or []
+        payload["processed_count"] = processed_count
+        payload["total_count"] = job.total_count if job else 0
+        return payload
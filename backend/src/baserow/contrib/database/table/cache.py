@@ -1,37 +1,80 @@
 """
-This file is responsible for caching Table model field attrs. These field attrs are
-stored in the generated models cache in a Redis backed Django cache (or in-memory cache
-for tests).
+This file is responsible for caching the schema of Table models. A compact descriptor
+of the fields of a table is stored in the generated models cache in a Redis backed
+Django cache (or in-memory cache for tests). The descriptor only contains plain values
+like the field types and the column values of the fields, from which the field
+instances and the model fields can be rebuilt without querying the database.
 
 Every table can have a model version stored in the
 `full_table_model_version_{table_id}_{BASEROW_VERSION}` cache key. This model version
-starts at 0 and is incremented every time:
-1. A change is made to the table or one of its fields.
-2. A process generates a new field_attrs for caching by querying the database.
+starts at 0 and is incremented every time a change is made to the table or one of its
+fields.
 
-We then store cache field_attrs in the cache key:
-    `full_table_model_{table_id}_{min_model_version}_{BASEROW_VERSION}`
+We then store the descriptor together with the model version it was made for in the
+cache key:
+    `full_table_model_{table_id}_{BASEROW_VERSION}`
 
 When we construct a model we:
 1. Get the latest model version
-2. Get that model versions field_attrs from the cache
+2. Get the descriptor from the cache if it is at least that model version
 
 
-By using different keys for different versions of the model we can
-be sure concurrent changes to the model aren't going to overwrite each others
-changes to the cached field_attrs.
+By storing the model version with the descriptor we can be sure concurrent changes to
+the model aren't going to result in an outdated descriptor being used.
+
+On top of the shared descriptor cache every process also keeps a bounded, least
+recently used, in-memory cache of the fully generated model classes. An entry in this
+cache remembers the model versions of the table and of every related table that was
+generated alongside it (via link row fields). The entry is only used if all those
+versions and the cache epoch still match what is found in the generated models cache,
+this means that any invalidation or a cache clear will make the process regenerate the
+model the next time it is needed.
+
+To avoid checking those versions on every request, the ids of invalidated tables are
+also published on a Redis channel once the transaction commits. Every process listens
+to that channel in a background thread and evicts the affected models. As long as the
+process is subscribed, an in-memory model that has been verified since the
+subscription started is used without any round trip to Redis.
 """
 
-from typing import Dict, Any, Optional
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime
+from typing import (
+    Dict,
+    Any,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    TYPE_CHECKING,
+)
 
 from django.conf import settings
 from django.core.cache import caches
 from django.core.exceptions import ImproperlyConfigured
+from django.db import DEFAULT_DB_ALIAS, models, transaction
+from django.db.models.base import ModelState
 
 from baserow.version import VERSION as BASEROW_VERSION
 
+if TYPE_CHECKING:
+    from baserow.contrib.database.fields.models import Field
+
+logger = logging.getLogger(__name__)
+
 generated_models_cache = caches[settings.GENERATED_MODEL_CACHE_NAME]
 
+# Must be increased every time the structure of the cached schema descriptor changes.
+MODEL_DESCRIPTOR_FORMAT_VERSION = 1
+
 
 def table_model_cache_version_key(table_id: int) -> str:
     return f"full_table_model_version_{table_id}_{BASEROW_VERSION}"
@@ -41,16 +84,29 @@ def table_model_cache_entry_key(table_id: int) -> str:
     return f"full_table_model_{table_id}_{BASEROW_VERSION}"
 
 
-def get_cached_model_field_attrs(
+def table_model_cache_epoch_key() -> str:
+    # Deliberately matches the `full_table_model_*` pattern so that clearing the
+    # generated model cache also resets the epoch.
+    return f"full_table_model_epoch_{BASEROW_VERSION}"
+
+
+local_model_cache: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+local_model_cache_lock = threading.Lock()
+# Keeps track of when tables have been evicted from the in memory model cache.
+local_model_cache_invalidations: Dict[str, Any] = {"seq": 0, "cleared": 0, "tables": {}}
+
+
+def get_cached_model_fields(
     table_id: int, min_model_version: int
-) -> Optional[Dict[str, Any]]:
+) -> Optional[List["Field"]]:
     """
     :param min_model_version: The model version to lookup, if an older or no version is
         found then None will be returned. Use get_current_cached_model_version to get
         this value.
-    :param table_id: The table to lookup any cached mode field attrs for.
-    :return: The latest cached field attrs for the table's model or None if nothing has
-        been cached yet or the attrs in the cache are older than the provided min
+    :param table_id: The table to lookup any cached model fields for.
+    :return: The specific field instances, including the trashed ones, of the latest
+        cached schema descriptor of the table's model or None if nothing has been
+        cached yet or the descriptor in the cache is older than the provided min
         version.
     """
 
@@ -58,7 +114,7 @@ def get_cached_model_field_attrs(
 
     cache_entry = generated_models_cache.get(cache_key)
     if cache_entry and cache_entry["version"] >= min_model_version:
-        return cache_entry["field_attrs"]
+        return _deserialize_model_descriptor(cache_entry.get("descriptor"))
     else:
         return None
 
@@ -66,33 +122,627 @@ def get_cached_model_field_attrs(
 def get_current_cached_model_version(table_id: int) -> int:
     """
     Returns the current cached model version for the table id. This can be then used
-    when getting the cached model attrs using the get_cached_model_field_attrs method.
+    when getting the cached model fields using the get_cached_model_fields method.
     """
 
     model_version_key = table_model_cache_version_key(table_id)
     return generated_models_cache.get_or_set(model_version_key, 0, timeout=None)
 
 
-def set_cached_model_field_attrs(
-    table_id: int, model_version: int, field_attrs: Dict[str, Any]
+def set_cached_model_fields(
+    table_id: int, model_version: int, fields: Iterable["Field"]
 ):
     """
-    Will increment the latest model version for table_id and store field_attrs in the
-    cache entry for that model version.
+    Stores a compact schema descriptor of the provided fields in the cache entry for
+    that model version.
 
-    :param table_id: The table to lookup any cached mode field attrs for.
+    :param table_id: The table to store the model fields for.
     :param model_version: The version of the model being set in the cache.
-    :param field_attrs: The field_attrs for table_id to cache.
+    :param fields: The specific field instances, including the trashed ones, that
+        the table's model is generated from.
     """
 
     cache_key = table_model_cache_entry_key(table_id)
     generated_models_cache.set(
         cache_key,
-        {"field_attrs": field_attrs, "version": model_version},
+        {"descriptor": _serialize_model_descriptor(fields), "version": model_version},
         timeout=None,
     )
 
 
+def _serialize_model_descriptor(fields: Iterable["Field"]) -> Dict[str, Any]:
+    """
+    Converts the field instances into a descriptor only containing JSON compatible
+    values. Next to the format version, it contains the column names of every used
+    field model class once and per field the field type and the values of those
+    columns. This is a lot smaller and quicker to load than pickled field and Django
+    model field instances.
+
+    :param fields: The specific field instances to describe.
+    :return: The schema descriptor that can be stored in the cache.
+    """
+
+    from baserow.contrib.database.fields.registries import field_type_registry
+
+    layouts = {}
+    described_fields = []
+    for field in fields:
+        field_type = field_type_registry.get_by_model(field)
+        if field_type.type not in layouts:
+            layouts[field_type.type] = _get_field_model_layout(field_type.model_class)
+        values = [getattr(field, attname) for attname in layouts[field_type.type]]
+        described_fields.append(
+            [
+                field_type.type,
+                [
+                    value.isoformat() if isinstance(value, datetime) else value
+                    for value in values
+                ],
+            ]
+        )
+
+    return {
+        "format": MODEL_DESCRIPTOR_FORMAT_VERSION,
+        "layouts": layouts,
+        "fields": described_fields,
+    }
+
+
+def _deserialize_model_descriptor(
+    descriptor: Optional[Dict[str, Any]]
+) -> Optional[List["Field"]]:
+    """
+    Rebuilds the specific field instances from a descriptor made by
+    _serialize_model_descriptor without doing any queries.
+
+    :param descriptor: The schema descriptor found in the cache.
+    :return: The specific field instances or None if the descriptor can't be used
+        anymore because its format or one of the field models has changed.
+    """
+
+    from baserow.contrib.database.fields.registries import field_type_registry
+
+    if (
+        not isinstance(descriptor, dict)
+        or descriptor.get("format") != MODEL_DESCRIPTOR_FORMAT_VERSION
+    ):
+        return None
+
+    layouts = descriptor["layouts"]
+    model_classes = {}
+    datetime_columns = {}
+    for field_type_name, layout in layouts.items():
+        try:
+            model_class = field_type_registry.get(field_type_name).model_class
+        except field_type_registry.does_not_exist_exception_class:
+            return None
+        if _get_field_model_layout(model_class) != layout:
+            return None
+        model_classes[field_type_name] = model_class
+        datetime_columns[field_type_name] = [
+            index
+            for index, field in enumerate(model_class._meta.concrete_fields)
+            if isinstance(field, models.DateTimeField)
+        ]
+
+    fields = []
+    for field_type_name, values in descriptor["fields"]:
+        values = list(values)
+        for index in datetime_columns[field_type_name]:
+            if values[index] is not None:
+                values[index] = datetime.fromisoformat(values[index])
+        fields.append(
+            _build_field_instance(
+                model_classes[field_type_name], layouts[field_type_name], values
+            )
+        )
+    return fields
+
+
+def _build_field_instance(
+    model_class: Type["Field"], layout: List[str], values: List[Any]
+) -> "Field":
+    """
+    Builds a field instance from the values of all its columns like
+    `Model.from_db` does, but without calling `Model.__init__`. The descriptor
+    always contains all the columns, so the instance doesn't need the deferred field
+    and signal handling of `__init__`, which makes up most of the time it takes to
+    rebuild a table with many fields. The instance is already specific, so its
+    `specific` and `specific_class` properties don't have to look up its content type.
+    """
+
+    instance = model_class.__new__(model_class)
+    instance.__dict__.update(zip(layout, values))
+    instance.__dict__["specific"] = instance
+    instance.__dict__["specific_class"] = model_class
+    instance._state = ModelState()
+    instance._state.adding = False
+    instance._state.db = DEFAULT_DB_ALIAS
+    return instance
+
+
+def _get_field_model_layout(model_class: Type["Field"]) -> List[str]:
+    return [field.attname for field in model_class._meta.concrete_fields]
+
+
+def get_current_cached_model_epoch() -> str:
+    """
+    Returns the current epoch of the generated model cache. A new epoch is started
+    every time the generated model cache is cleared, which makes sure that model
+    classes cached in memory by any process are never used after a clear.
+    """
+
+    return generated_models_cache.get_or_set(
+        table_model_cache_epoch_key(), lambda: uuid.uuid4().hex, timeout=None
+    )
+
+
+def table_model_cache_invalidation_channel() -> str:
+    return generated_models_cache.make_key(
+        f"full_table_model_invalidations_{BASEROW_VERSION}"
+    )
+
+
+class ModelCacheInvalidationListener:
+    """
+    Listens in a background thread of every process for the ids of changed tables
+    published on the invalidation channel in Redis and evicts the related model
+    classes from the in memory model cache. As long as the listener is subscribed,
+    the in memory cache can be used without checking the model versions in Redis.
+    Every time the listener (re)subscribes, the subscription generation is
+    increased. Cache entries are only trusted without a check if they were verified
+    during the current generation, because invalidations could have been missed
+    while not being subscribed.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.pid = None
+        self.generation = 0
+        self.listening = False
+
+    def get_listening_generation(self) -> Optional[int]:
+        """
+        Makes sure that the listener thread runs in the current process.
+
+        :return: The current subscription generation or None if the listener is not
+            subscribed to the invalidation channel at the moment.
+        """
+
+        if not model_cache_invalidation_pubsub_available():
+            return None
+
+        pid = os.getpid()
+        if self.pid != pid:
+            with self.lock:
+                # The thread of the parent process doesn't survive a fork, so a new
+                # one has to be started for every process.
+                if self.pid != pid:
+                    self.pid = pid
+                    self.listening = False
+                    threading.Thread(
+                        target=self.listen,
+                        name="model-cache-invalidation-listener",
+                        daemon=True,
+                    ).start()
+
+        return self.generation if self.listening else None
+
+    def listen(self):
+        channel = table_model_cache_invalidation_channel()
+        pid = os.getpid()
+        while self.pid == pid:
+            pubsub = None
+            try:
+                pubsub = generated_models_cache.client.get_client(write=False).pubsub()
+                pubsub.subscribe(channel)
+                last_ping = time.monotonic()
+                while self.pid == pid:
+                    message = pubsub.get_message(timeout=1.0)
+                    if message is None:
+                        # Makes sure that a broken connection is noticed even if
+                        # nothing is published for a while.
+                        if time.monotonic() - last_ping > 30:
+                            pubsub.ping()
+                            last_ping = time.monotonic()
+                    elif message["type"] == "subscribe":
+                        self.set_listening(True)
+                    elif message["type"] == "message":
+                        handle_model_cache_invalidation_message(message["data"])
+            except Exception:
+                logger.warning(
+                    "Lost the subscription to the model cache invalidation channel, "
+                    "falling back to checking the model versions.",
+                    exc_info=True,
+                )
+            finally:
+                self.set_listening(False)
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:  # nosec
+                        pass
+            time.sleep(1)
+
+    def set_listening(self, listening: bool):
+        with self.lock:
+            if listening and not self.listening:
+                self.generation += 1
+            self.listening = listening
+
+
+model_cache_invalidation_listener = ModelCacheInvalidationListener()
+
+
+def model_cache_invalidation_pubsub_available() -> bool:
+    """
+    Returns whether table invalidations can be published and listened to. This is
+    only possible if enabled and if the generated models cache is backed by Redis.
+    """
+
+    return settings.BASEROW_GENERATED_MODEL_CACHE_PUBSUB_ENABLED and hasattr(
+        getattr(generated_models_cache, "client", None), "get_client"
+    )
+
+
+def publish_model_cache_invalidation(table_ids: Optional[List[int]]):
+    """
+    Announces the changed tables to all the other processes once the current
+    transaction commits, so that they don't regenerate their models before the
+    changes are visible to them.
+
+    :param table_ids: The ids of the changed tables or None if the whole generated
+        models cache has been cleared.
+    """
+
+    if not model_cache_invalidation_pubsub_available():
+        return
+
+    if table_ids is None:
+        message = "*"
+    else:
+        message = ",".join(str(table_id) for table_id in table_ids)
+
+    def publish():
+        try:
+            generated_models_cache.client.get_client(write=True).publish(
+                table_model_cache_invalidation_channel(), message
+            )
+        except Exception:
+            logger.exception("Failed to publish the model cache invalidation.")
+
+    transaction.on_commit(publish)
+
+
+def handle_model_cache_invalidation_message(data: Union[bytes, str]):
+    """
+    Evicts the tables announced in a message published on the invalidation channel.
+
+    :param data: A comma separated list of table ids or `*` if everything must be
+        evicted.
+    """
+
+    if isinstance(data, bytes):
+        data = data.decode()
+
+    if data == "*":
+        evict_tables_from_local_model_cache(None)
+    else:
+        evict_tables_from_local_model_cache(
+            [int(table_id) for table_id in data.split(",") if table_id]
+        )
+
+
+def get_local_model_cache_checkpoint() -> Tuple[int, Optional[int]]:
+    """
+    Returns a number that increases every time something is evicted from the in
+    memory model cache and the current generation of the invalidation listener. It
+    must be fetched before the model versions are, so that set_local_cached_model
+    can detect invalidations that happen while generating a model.
+    """
+
+    generation = model_cache_invalidation_listener.get_listening_generation()
+    with local_model_cache_lock:
+        return local_model_cache_invalidations["seq"], generation
+
+
+def _invalidated_since(table_ids: Iterable[int], seq: int) -> bool:
+    return local_model_cache_invalidations["cleared"] > seq or any(
+        local_model_cache_invalidations["tables"].get(table_id, 0) > seq
+        for table_id in table_ids
+    )
+
+
+def get_local_cached_model(table_id: int) -> Optional[Type]:
+    """
+    Returns the fully generated model class of the table if it has been cached in the
+    memory of this process and if it is still up to date. If the invalidation
+    listener is subscribed and the entry has been verified since it subscribed, then
+    the entry is returned right away. Otherwise, the current model versions of the
+    table and all the related tables it was generated with are fetched from the
+    generated models cache in one go to check that.
+
+    :param table_id: The id of the table to look up the model for.
+    :return: The cached model class or None if there is no up to date model cached.
+    """
+
+    generation = model_cache_invalidation_listener.get_listening_generation()
+
+    with local_model_cache_lock:
+        cache_entry = local_model_cache.get(table_id)
+        if cache_entry is None:
+            return None
+        if generation is not None and cache_entry["generation"] == generation:
+            local_model_cache.move_to_end(table_id)
+            return cache_entry["model"]
+        seq = local_model_cache_invalidations["seq"]
+
+    model_versions = cache_entry["versions"]
+    version_keys = {
+        table_model_cache_version_key(related_table_id): version
+        for related_table_id, version in model_versions.items()
+    }
+    epoch_key = table_model_cache_epoch_key()
+    current_values = generated_models_cache.get_many([epoch_key, *version_keys])
+
+    up_to_date = current_values.get(epoch_key) == cache_entry["epoch"] and all(
+        current_values.get(key) == version for key, version in version_keys.items()
+    )
+
+    with local_model_cache_lock:
+        if not up_to_date:
+            if local_model_cache.get(table_id) is cache_entry:
+                del local_model_cache[table_id]
+            return None
+
+        if local_model_cache.get(table_id) is cache_entry:
+            local_model_cache.move_to_end(table_id)
+            # Any invalidation after the versions have been checked will be received
+            # by the listener, so the entry can be trusted from now on.
+            if generation is not None and not _invalidated_since(model_versions, seq):
+                cache_entry["generation"] = generation
+
+    return cache_entry["model"]
+
+
+def set_local_cached_model(
+    table_id: int,
+    model: Type,
+    model_versions: Dict[int, int],
+    epoch: str,
+    checkpoint: Tuple[int, Optional[int]],
+):
+    """
+    Stores the fully generated model class of the table in the memory of this process.
+    If the maximum amount of cached models is exceeded, then the least recently used
+    ones are evicted.
+
+    :param table_id: The id of the table the model has been generated for.
+    :param model: The generated model class.
+    :param model_versions: The model version of the table and every related table
+        that was used while generating the model keyed by table id.
+    :param epoch: The generated model cache epoch that was current before the model
+        was generated.
+    :param checkpoint: The checkpoint returned by get_local_model_cache_checkpoint
+        before the model was generated. If any of the tables has been invalidated
+        since, then the model is not stored because it could be outdated already.
+    """
+
+    max_size = settings.BASEROW_GENERATED_MODEL_LRU_CACHE_SIZE
+    if max_size <= 0:
+        return
+
+    invalidation_seq, generation = checkpoint
+
+    with local_model_cache_lock:
+        if _invalidated_since(model_versions, invalidation_seq):
+            return
+
+        local_model_cache[table_id] = {
+            "model": model,
+            "versions": model_versions,
+            "epoch": epoch,
+            # All invalidations since the model versions were fetched are received
+            # by the listener if it was already subscribed at that point.
+            "generation": generation,
+        }
+        local_model_cache.move_to_end(table_id)
+        while len(local_model_cache) > max_size:
+            local_model_cache.popitem(last=False)
+
+
+def evict_tables_from_local_model_cache(table_ids: Optional[List[int]]):
+    """
+    Removes the model classes of the provided tables, and the ones of all the tables
+    that were generated using one of them, from the memory of this process.
+
+    :param table_ids: The ids of the tables to evict or None to evict everything.
+    """
+
+    with local_model_cache_lock:
+        local_model_cache_invalidations["seq"] += 1
+        seq = local_model_cache_invalidations["seq"]
+
+        if table_ids is None:
+            local_model_cache_invalidations["cleared"] = seq
+            local_model_cache_invalidations["tables"].clear()
+            local_model_cache.clear()
+            return
+
+        for table_id in table_ids:
+            local_model_cache_invalidations["tables"][table_id] = seq
+
+        table_ids = set(table_ids)
+        for cached_table_id, cache_entry in list(local_model_cache.items()):
+            if not table_ids.isdisjoint(cache_entry["versions"]):
+                del local_model_cache[cached_table_id]
+
+
+def clear_local_model_cache():
+    """
+    Removes all the model classes cached in the memory of this process.
+    """
+
+    evict_tables_from_local_model_cache(None)
+
+
+def table_model_recently_used_key() -> str:
+    # Deliberately doesn't match the `full_table_model_*` pattern and doesn't contain
+    # the Baserow version, because the recently used tables are needed to warm up the
+    # cache after it has been cleared or after an upgrade.
+    return "table_model_recently_used"
+
+
+class TableModelAccessTracker:
+    """
+    Keeps track of which table models have been used recently. The accesses are
+    collected in memory and are merged into the generated models cache at most once
+    per flush interval, so that tracking doesn't add a round trip to every request.
+    """
+
+    FLUSH_INTERVAL_SECONDS = 60
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.accesses: Dict[int, float] = {}
+        self.flushed_at = 0.0
+
+    @contextmanager
+    def paused(self):
+        """
+        Doesn't record the models used in the current thread within this context.
+        """
+
+        self.local.paused = True
+        try:
+            yield
+        finally:
+            self.local.paused = False
+
+    def record(self, table_id: int):
+        """
+        Records that the model of the provided table has been used.
+
+        :param table_id: The id of the table whose model has been used.
+        """
+
+        if settings.BASEROW_GENERATED_MODEL_WARM_UP_SIZE <= 0 or getattr(
+            self.local, "paused", False
+        ):
+            return
+
+        now = time.time()
+        self.accesses[table_id] = now
+        if now - self.flushed_at > self.FLUSH_INTERVAL_SECONDS:
+            self.flush()
+
+    def flush(self):
+        """
+        Merges the accesses collected in memory with the ones in the generated models
+        cache. Only the most recent ones are kept.
+        """
+
+        with self.lock:
+            self.flushed_at = time.time()
+            accesses, self.accesses = self.accesses, {}
+
+        if not accesses:
+            return
+
+        key = table_model_recently_used_key()
+        recently_used = generated_models_cache.get(key) or {}
+        for table_id, accessed_at in accesses.items():
+            recently_used[table_id] = max(accessed_at, recently_used.get(table_id, 0))
+
+        limit = max(
+            settings.BASEROW_GENERATED_MODEL_WARM_UP_SIZE,
+            settings.BASEROW_GENERATED_MODEL_LRU_CACHE_SIZE,
+        )
+        generated_models_cache.set(
+            key,
+            dict(
+                sorted(recently_used.items(), key=lambda item: item[1], reverse=True)[
+                    :limit
+                ]
+            ),
+            timeout=None,
+        )
+
+    def get_recently_used_table_ids(self, limit: int) -> List[int]:
+        """
+        :param limit: The maximum amount of table ids to return.
+        :return: The ids of the tables whose models have been used most recently by
+            any process, the most recent first.
+        """
+
+        recently_used = generated_models_cache.get(table_model_recently_used_key())
+        return sorted(
+            (recently_used or {}).keys(),
+            key=lambda table_id: recently_used[table_id],
+            reverse=True,
+        )[:limit]
+
+
+table_model_access_tracker = TableModelAccessTracker()
+
+
+def warm_up_table_models(
+    limit: Optional[int] = None, max_seconds: Optional[float] = None
+) -> int:
+    """
+    Generates the models of the most recently used tables so that they are cached
+    in the memory of this process and in the generated models cache before the
+    first request needs them.
+
+    :param limit: The maximum amount of tables to warm up. Defaults to the
+        BASEROW_GENERATED_MODEL_WARM_UP_SIZE setting.
+    :param max_seconds: If provided, no new models are generated once the warm up
+        took longer than this.
+    :return: The amount of models that have been generated.
+    """
+
+    from baserow.contrib.database.table.models import Table
+
+    if limit is None:
+        limit = settings.BASEROW_GENERATED_MODEL_WARM_UP_SIZE
+
+    if limit <= 0:
+        return 0
+
+    started_at = time.monotonic()
+    table_ids = table_model_access_tracker.get_recently_used_table_ids(limit)
+    tables = Table.objects.filter(
+        id__in=table_ids, database__trashed=False, database__group__trashed=False
+    ).in_bulk()
+
+    warmed_up = 0
+    # Warming up must not make the tables look like they are still being used.
+    with table_model_access_tracker.paused():
+        for table_id in table_ids:
+            if max_seconds is not None and time.monotonic() - started_at > max_seconds:
+                break
+            if table_id in tables:
+                tables[table_id].get_model()
+                warmed_up += 1
+
+    return warmed_up
+
+
+def warm_up_table_models_on_startup(max_seconds: Optional[float] = None):
+    """
+    Warms up the models of the most recently used tables when a worker process
+    starts. Failing to do so must never prevent the process from starting.
+    """
+
+    try:
+        warmed_up = warm_up_table_models(max_seconds=max_seconds)
+        if warmed_up:
+            logger.info(f"Warmed up the models of {warmed_up} tables.")
+    except Exception:
+        logger.exception("Failed to warm up the table models.")
+
+
 def clear_generated_model_cache():
     print("Clearing Baserow's internal generated model cache...")
     if hasattr(generated_models_cache, "delete_pattern"):
@@ -104,6 +754,8 @@ def clear_generated_model_cache():
         raise ImproperlyConfigured(
             "Baserow must be run with a redis cache outside of " "tests."
         )
+    clear_local_model_cache()
+    publish_model_cache_invalidation(None)
     print("Done clearing cache.")
 
 
@@ -126,6 +778,9 @@ def invalidate_table_in_model_cache(
     model_version_key = table_model_cache_version_key(table_id)
     _incr_or_create_key_atomically_if_possible(model_version_key)
 
+    evict_tables_from_local_model_cache([table_id])
+    publish_model_cache_invalidation([table_id])
+
 
 def _incr_or_create_key_atomically_if_possible(key_to_incr: str) -> int:
     """
@@ -151,8 +806,8 @@ def _incr_or_create_key_atomically_if_possible(key_to_incr: str) -> int:
 
 def _invalidate_all_related_models(table_id: int):
     """
-    Given a table id looks up the latest cached field_attrs for it and loops over
-    all of the fields found in the field_attrs calling their
+    Given a table id looks up the latest cached fields for it and loops over
+    all of the non trashed fields calling their
     before_table_model_invalidated hook. Then in the link row field this hook will
     recursively invalidate the linked table.
 
@@ -167,15 +822,10 @@ def _invalidate_all_related_models(table_id: int):
 
     this_version_cache_key = table_model_cache_entry_key(table_id)
 
-    try:
-        field_objects = generated_models_cache.get(this_version_cache_key, {})[
-            "field_attrs"
-        ]["_field_objects"]
-    except KeyError:
-        field_objects = {}
-
-    for field_obj in field_objects.values():
-        field = field_obj.get("field", None)
-        if field is not None:
+    cache_entry = generated_models_cache.get(this_version_cache_key, {})
+    fields = _deserialize_model_descriptor(cache_entry.get("descriptor")) or []
+
+    for field in fields:
+        if not field.trashed:
             field_type = field_type_registry.get_by_model(field)
             field_type.before_table_model_invalidated(field)
@@ -0,0 +1,68 @@
+"""
+Every table has a change sequence number that increases whenever something changes
+that can affect the rows returned by the API. That is when rows are created,
+updated, deleted, moved or restored, when the values of the table change because of
+a change in a related table, and when the fields or the filters, sorts or field
+options of the views of the table change.
+
+The sequence numbers are stored in the default cache and can be used to cache
+derived values like row counts per table or to compare whether a client already has
+the latest version of a response.
+"""
+
+import time
+from typing import Iterable
+
+from django.core.cache import cache
+from django.db import transaction
+
+
+def get_table_change_sequence_cache_key(table_id: int) -> str:
+    return f"table_change_sequence__{table_id}"
+
+
+def _get_initial_change_sequence() -> int:
+    # The sequence starts at the current time in microseconds instead of 0, so that
+    # it doesn't start counting again from an older value if the cache is cleared.
+    return time.time_ns() // 1000
+
+
+def get_table_change_sequence(table_id: int) -> int:
+    """
+    Returns the current change sequence number of the provided table.
+
+    :param table_id: The id of the table.
+    :return: The current change sequence number.
+    """
+
+    cache_key = get_table_change_sequence_cache_key(table_id)
+    sequence = cache.get(cache_key)
+    if sequence is None:
+        cache.add(cache_key, _get_initial_change_sequence(), timeout=None)
+        sequence = cache.get(cache_key)
+    return sequence
+
+
+def bump_table_change_sequences(table_ids: Iterable[int]):
+    """
+    Increases the change sequence numbers of the provided tables. This is done right
+    away and again when the current transaction commits, because otherwise a request
+    in another transaction that runs in between could read the new sequence number
+    while it doesn't see the changes yet.
+
+    :param table_ids: The ids of the tables that have changed.
+    """
+
+    table_ids = set(table_ids)
+
+    def increment_sequences():
+        for table_id in table_ids:
+            cache_key = get_table_change_sequence_cache_key(table_id)
+            try:
+                cache.incr(cache_key, 1)
+            except ValueError:
+                # No cache key, we create one
+                cache.add(cache_key, _get_initial_change_sequence(), timeout=None)
+
+    increment_sequences()
+    transaction.on_commit(increment_sequences)
@@ -24,6 +24,7 @@ from baserow.contrib.database.fields.models import TextField
 from baserow.contrib.database.models import Database
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.view_types import GridViewType
+from baserow.core.db import bulk_insert
 from baserow.core.trash.handler import TrashHandler
 from baserow.contrib.database.db.schema import safe_django_schema_editor
 from .exceptions import (
@@ -257,7 +258,7 @@ class TableHandler:
             )
             for index, row in enumerate(data)
         ]
-        model.objects.bulk_create(bulk_data)
+        bulk_insert(model, bulk_data)
 
     def fill_example_table_data(self, user: AbstractUser, table: Table):
         """
@@ -12,6 +12,7 @@ from baserow.contrib.database.fields.exceptions import (
     FilterFieldNotFound,
 )
 from baserow.contrib.database.fields.field_filters import (
+    AnnotatedQ,
     FilterBuilder,
     FILTER_TYPE_AND,
     FILTER_TYPE_OR,
@@ -19,9 +20,14 @@ from baserow.contrib.database.fields.field_filters import (
 from baserow.contrib.database.fields.field_sortings import AnnotatedOrder
 from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.table.cache import (
-    get_cached_model_field_attrs,
-    set_cached_model_field_attrs,
+    get_cached_model_fields,
+    set_cached_model_fields,
     get_current_cached_model_version,
+    get_current_cached_model_epoch,
+    get_local_cached_model,
+    get_local_model_cache_checkpoint,
+    set_local_cached_model,
+    table_model_access_tracker,
 )
 from baserow.contrib.database.views.exceptions import ViewFilterTypeNotAllowedForField
 from baserow.contrib.database.views.registries import view_filter_type_registry
@@ -34,6 +40,14 @@ from baserow.core.utils import split_comma_separated_string
 
 deconstruct_filter_key_regex = re.compile(r"filter__field_([0-9]+)__([a-zA-Z0-9_]*)$")
 
+# The contains search mode returns the rows of which a field contains the search
+# query. The full-text search mode returns the rows that contain a word starting with
+# every word of the search query, using the search data of the table if full-text
+# search is enabled.
+SEARCH_MODE_CONTAINS = "contains"
+SEARCH_MODE_FULL_TEXT = "full-text"
+SEARCH_MODES = [SEARCH_MODE_CONTAINS, SEARCH_MODE_FULL_TEXT]
+
 
 class TableModelQuerySet(models.QuerySet):
     def enhance_by_fields(self):
@@ -53,12 +67,21 @@ class TableModelQuerySet(models.QuerySet):
             )
         return self
 
-    def search_all_fields(self, search, only_search_by_field_ids=None):
+    def search_all_fields(
+        self,
+        search,
+        only_search_by_field_ids=None,
+        search_mode=SEARCH_MODE_CONTAINS,
+    ):
         """
         Performs a very broad search across all supported fields with the given search
         query. If the primary key value matches then that result will be returned
         otherwise all field types other than link row and boolean fields are currently
-        searched.
+        searched. In the full-text search mode, when full-text search is enabled and
+        the search data of the table is up to date, the rows of which the search data
+        contains a word starting with every word of the search query are returned
+        instead. The rows that don't have search data yet are still searched using the
+        contains filters.
 
         :param search: The search query.
         :type search: str
@@ -66,13 +89,19 @@ class TableModelQuerySet(models.QuerySet):
             filtered by the search term. Other fields not in the iterable will be
             ignored and not be filtered.
         :type only_search_by_field_ids: Optional[Iterable[int]]
+        :param search_mode: Either `SEARCH_MODE_CONTAINS` or `SEARCH_MODE_FULL_TEXT`.
+        :type search_mode: str
         :return: The queryset containing the search queries.
         :rtype: QuerySet
         """
 
-        filter_builder = FilterBuilder(filter_type=FILTER_TYPE_OR).filter(
-            Q(id__contains=search)
+        from baserow.contrib.database.fields.trigram_indexes import (
+            TrigramIndexHandler,
         )
+        from baserow.contrib.database.table.search import SearchDataHandler
+
+        sub_filters = []
+        searched_fields = []
         for field_object in self.model._field_objects.values():
             if (
                 only_search_by_field_ids is not None
@@ -86,11 +115,51 @@ class TableModelQuerySet(models.QuerySet):
                 sub_filter = field_object["type"].contains_query(
                     field_name, search, model_field, field_object["field"]
                 )
-                filter_builder.filter(sub_filter)
             except Exception:  # nosec B112
                 continue
 
-        return filter_builder.apply_to_queryset(self)
+            # The field types that can't be searched return an empty filter, which
+            # doesn't add a condition.
+            if isinstance(sub_filter, AnnotatedQ) or len(sub_filter) > 0:
+                sub_filters.append(sub_filter)
+                searched_fields.append(field_object["field"])
+
+        # The id can only contain the search query if it only contains digits.
+        # Leaving out the id otherwise allows PostgreSQL to use the trigram indexes
+        # of the searched fields, because every condition must be indexed for that.
+        filter_builder = FilterBuilder(filter_type=FILTER_TYPE_OR)
+        if search.isdigit() or len(sub_filters) == 0:
+            filter_builder.filter(Q(id__contains=search))
+        for sub_filter in sub_filters:
+            filter_builder.filter(sub_filter)
+
+        # The search data contains the values of all the fields, so it can't be used
+        # if only some of the fields may be searched.
+        search_data_filters = None
+        if search_mode == SEARCH_MODE_FULL_TEXT and only_search_by_field_ids is None:
+            search_data_filters = SearchDataHandler().get_search_data_filters(
+                self.model, search
+            )
+
+        if search_data_filters is None:
+            TrigramIndexHandler().record_usage(searched_fields)
+            return filter_builder.apply_to_queryset(self)
+
+        # The rows that don't have search data yet are searched using the contains
+        # filters.
+        matches_search_data, without_search_data = search_data_filters
+        contains_filter = filter_builder.get_annotated_q()
+        return (
+            FilterBuilder(filter_type=FILTER_TYPE_OR)
+            .filter(matches_search_data)
+            .filter(
+                AnnotatedQ(
+                    annotation=contains_filter.annotation,
+                    q=without_search_data & contains_filter.q,
+                )
+            )
+            .apply_to_queryset(self)
+        )
 
     def _get_field_name(self, field: str) -> str:
         """
@@ -353,6 +422,16 @@ class Table(
     name = models.CharField(max_length=255)
     row_count = models.PositiveIntegerField(null=True)
     row_count_updated_at = models.DateTimeField(null=True)
+    search_data_column_added = models.BooleanField(
+        default=False,
+        help_text="Indicates whether the full-text search data column, its indexes "
+        "and its trigger have been added to the table.",
+    )
+    search_data_outdated_since = models.DateTimeField(
+        null=True,
+        help_text="Set when a field change has outdated the search data of all rows. "
+        "The search uses the contains search until the search data is rebuilt.",
+    )
 
     class Meta:
         ordering = ("order",)
@@ -417,6 +496,29 @@ class Table(
         if not fields:
             fields = []
 
+        # Only a regular model of the whole table can be identified by the model
+        # version of the table.
+        full_table_model = (
+            len(fields) == 0
+            and not filtered
+            and add_dependencies is True
+            and attribute_names is False
+        )
+
+        # A fully generated model class can only be shared if it's a regular model of
+        # the whole table that is not being generated as part of a related model.
+        use_local_cache = (
+            use_cache and full_table_model and not manytomany_models and not managed
+        )
+
+        if use_local_cache:
+            table_model_access_tracker.record(self.id)
+            model = get_local_cached_model(self.id)
+            if model is not None:
+                return model
+            local_cache_checkpoint = get_local_model_cache_checkpoint()
+            current_model_epoch = get_current_cached_model_epoch()
+
         if not manytomany_models:
             manytomany_models = {}
 
@@ -473,41 +575,47 @@ class Table(
             "__str__": __str__,
         }
 
-        use_cache = (
-            use_cache
-            and len(fields) == 0
-            and field_ids is None
-            and add_dependencies is True
-            and attribute_names is False
-        )
+        # The fields are selected from the cached fields of the whole table, unless
+        # an empty selection has been requested because then nothing has to be
+        # fetched at all.
+        fetch_fields = not (
+            isinstance(field_ids, list) and len(field_ids) == 0
+        ) and not (isinstance(field_names, list) and len(field_names) == 0)
 
-        if use_cache:
+        table_fields = None
+        current_model_version = None
+        if use_cache and fetch_fields:
             current_model_version = get_current_cached_model_version(self.id)
-            field_attrs = get_cached_model_field_attrs(
+            table_fields = get_cached_model_fields(
                 self.id, min_model_version=current_model_version
             )
-        else:
-            field_attrs = None
-            current_model_version = None
-
-        if field_attrs is None:
-            field_attrs = self._fetch_and_generate_field_attrs(
-                add_dependencies,
-                attribute_names,
-                field_ids,
-                field_names,
-                fields,
-                filtered,
-            )
 
-            if use_cache:
-                set_cached_model_field_attrs(
+            if table_fields is None:
+                table_fields = self._fetch_fields(None, None, [])
+                set_cached_model_fields(
                     table_id=self.id,
                     model_version=current_model_version,
-                    field_attrs=field_attrs,
+                    fields=table_fields,
                 )
 
+            model_fields = list(fields) + self._select_fields(
+                table_fields, field_ids, field_names
+            )
+        else:
+            model_fields = self._fetch_fields(field_ids, field_names, fields)
+
+        field_attrs = self._generate_field_attrs(
+            model_fields, add_dependencies, attribute_names, filtered, table_fields
+        )
+
         attrs.update(**field_attrs)
+        attrs["_table_model_version"] = (
+            current_model_version if full_table_model else None
+        )
+        # The version of the cached fields that the model has been generated from,
+        # also if it only contains some of them. It's None if the model contains
+        # fields that are not from the cache.
+        attrs["_table_fields_version"] = current_model_version if not fields else None
 
         # Create the model class.
         model = type(
@@ -535,26 +643,36 @@ class Table(
                 field_object["field"], model, field_object["name"], manytomany_models
             )
 
+        if use_local_cache:
+            # The model can only be reused as long as none of the related models
+            # generated alongside it have changed, so we remember all their versions.
+            model_versions = {
+                related_model._table_id: related_model._table_model_version
+                for related_model in manytomany_models.values()
+            }
+            model_versions[self.id] = current_model_version
+            if None not in model_versions.values():
+                set_local_cached_model(
+                    self.id,
+                    model,
+                    model_versions,
+                    current_model_epoch,
+                    local_cache_checkpoint,
+                )
+
         return model
 
-    def _fetch_and_generate_field_attrs(
-        self,
-        add_dependencies,
-        attribute_names,
-        field_ids,
-        field_names,
-        fields,
-        filtered,
-    ):
-        field_attrs = {
-            "_primary_field_id": -1,
-            # An object containing the table fields, field types and the chosen
-            # names with the table field id as key.
-            "_field_objects": {},
-            # An object containing the trashed table fields, field types and the
-            # chosen names with the table field id as key.
-            "_trashed_field_objects": {},
-        }
+    def _fetch_fields(self, field_ids, field_names, fields):
+        """
+        Fetches the specific fields, including the trashed ones, that must be added to
+        the model of this table.
+
+        :param field_ids: If provided only the fields with these ids are fetched.
+        :param field_names: If provided only the fields with these names are fetched.
+        :param fields: Extra fields that must be included before the fetched fields.
+        :return: A combined list of the provided and fetched fields.
+        """
+
         # Construct a query to fetch all the fields of that table. We need to
         # include any trashed fields so the created model still has them present
         # as the column is still actually there. If the model did not have the
@@ -584,7 +702,50 @@ class Table(
 
         # Create a combined list of fields that must be added and belong to the this
         # table.
-        fields = list(fields) + [field for field in fields_query]
+        return list(fields) + [field for field in fields_query]
+
+    def _select_fields(self, fields, field_ids, field_names):
+        """
+        Selects the fields with the provided ids and names from the already fetched
+        fields of this table, in the same way as _fetch_fields filters the query.
+        """
+
+        if isinstance(field_ids, list):
+            field_ids = {int(field_id) for field_id in field_ids}
+            fields = [field for field in fields if field.id in field_ids]
+
+        if isinstance(field_names, list):
+            field_names = set(field_names)
+            fields = [field for field in fields if field.name in field_names]
+
+        return list(fields)
+
+    def _generate_field_attrs(
+        self, fields, add_dependencies, attribute_names, filtered, table_fields=None
+    ):
+        """
+        Generates the model fields and the field objects for the provided fields.
+        This doesn't need to query the fields, so it can be used for fields that come
+        from the generated models cache. If all the fields of the table are provided
+        via `table_fields`, then the dependencies are looked up in there instead of
+        being fetched per field.
+        """
+
+        field_attrs = {
+            "_primary_field_id": -1,
+            # An object containing the table fields, field types and the chosen
+            # names with the table field id as key.
+            "_field_objects": {},
+            # An object containing the trashed table fields, field types and the
+            # chosen names with the table field id as key.
+            "_trashed_field_objects": {},
+        }
+        fields = list(fields)
+        dependency_ids = None
+        if table_fields is not None:
+            table_fields_by_id = {
+                field.id: field for field in table_fields if not field.trashed
+            }
 
         # If there are duplicate field names we have to store them in a list so we
         # know later which ones are duplicate.
@@ -601,9 +762,22 @@ class Table(
             field_name = field.db_column
 
             if filtered and add_dependencies:
-                direct_dependencies = (
-                    FieldDependencyHandler.get_same_table_dependencies(field)
-                )
+                if table_fields is None:
+                    direct_dependencies = (
+                        FieldDependencyHandler.get_same_table_dependencies(field)
+                    )
+                else:
+                    if dependency_ids is None:
+                        dependency_ids = (
+                            FieldDependencyHandler.get_same_table_dependency_ids(
+                                self.id
+                            )
+                        )
+                    direct_dependencies = [
+                        table_fields_by_id[dependency_id]
+                        for dependency_id in dependency_ids.get(field.id, [])
+                        if dependency_id in table_fields_by_id
+                    ]
                 for f in direct_dependencies:
                     if f.name not in already_included_field_names:
                         fields.append(f)
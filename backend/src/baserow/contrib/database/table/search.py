@@ -0,0 +1,430 @@
+"""
+Searching all fields ORs a contains filter for every field together, which always
+requires a sequential scan of the whole table. When full-text search is enabled, every
+table that is searched in the full-text search mode gets a `search_data` column in the
+background. It contains the words of the human readable values of all the fields of
+the row as a `tsvector` and has a GIN index, so that a search becomes a single index
+lookup. It can't be used for the default contains search mode, because a search query
+can also match the middle of a word.
+
+The `search_data` column isn't part of the generated models. A trigger resets it to
+`NULL` whenever a field column of the row is updated, no matter whether the row is
+changed by the `RowHandler` or because of a field dependency. It only fires for the
+field columns, so that changing the order of a row or trashing it doesn't reset the
+search data, which is why it's recreated whenever the fields of the table change. The
+search data of those rows is filled again by the `update_search_data` task, and until
+then the rows are searched using the contains filters, which is what the partial index
+on the rows without search data is for. When the fields of the table change, the
+search data of all the rows is outdated and the contains search is used for the whole
+table until the task has rebuilt it.
+
+Disabling full-text search doesn't drop the column, its indexes and its trigger from
+the tables that already have them. They're kept up to date, so that the search data
+can be used again when full-text search is enabled again.
+"""
+
+import re
+from typing import Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import BooleanField, CharField, Q
+from django.db.models.expressions import RawSQL
+from django.utils import timezone
+
+from baserow.contrib.database.db.schema import execute_concurrently_if_possible
+from baserow.contrib.database.table.models import GeneratedTableModel, Table
+
+SEARCH_DATA_COLUMN = "search_data"
+SEARCH_DATA_TRIGGER_FUNCTION = "database_table_search_data_outdated"
+
+# Words are truncated to this many characters in both the search data and the
+# search, because PostgreSQL doesn't allow very long words in a `tsvector`.
+MAX_WORD_LENGTH = 100
+
+# The update task is scheduled at most once per table within this many seconds,
+# unless the previously scheduled task has started.
+UPDATE_LOCK_TIMEOUT = 60 * 60
+
+
+def get_search_data_update_cache_key(table_id: int) -> str:
+    return f"search_data_update__{table_id}"
+
+
+def get_search_words(value: str) -> List[str]:
+    """
+    Splits the provided value into the lowercased words that are stored in the search
+    data or that are searched for.
+
+    :param value: The value to split.
+    :return: The unique words in the value.
+    """
+
+    return list(
+        dict.fromkeys(
+            word[:MAX_WORD_LENGTH] for word in re.findall(r"\w+", value.casefold())
+        )
+    )
+
+
+class SearchDataHandler:
+    def schedule_update(self, table_ids: Iterable[int]):
+        """
+        Starts the task that updates the search data of the provided tables when the
+        current transaction commits. The task is only started if it hasn't already
+        been scheduled for the table.
+
+        :param table_ids: The ids of the tables of which the search data must be
+            updated.
+        """
+
+        from .tasks import update_search_data
+
+        table_ids = list(table_ids)
+
+        def schedule():
+            for table_id in table_ids:
+                if cache.add(
+                    get_search_data_update_cache_key(table_id),
+                    True,
+                    timeout=UPDATE_LOCK_TIMEOUT,
+                ):
+                    update_search_data.delay(table_id)
+
+        transaction.on_commit(schedule)
+
+    def rows_changed(self, table: Table):
+        """
+        Must be called when rows of the table have been created or updated, so that
+        their search data is filled again in the background.
+
+        :param table: The table of which the rows have changed.
+        """
+
+        if settings.BASEROW_FULL_TEXT_SEARCH_ENABLED and table.search_data_column_added:
+            self.schedule_update([table.id])
+
+    def fields_changed(self, table_ids: Iterable[int]):
+        """
+        Must be called when fields of the provided tables have been created, updated,
+        deleted or restored. The trigger of those tables is recreated for the new
+        field columns and the search data of all their rows is marked as outdated and
+        rebuilt in the background.
+
+        :param table_ids: The ids of the tables of which the fields have changed.
+        """
+
+        tables = list(
+            Table.objects.filter(id__in=table_ids, search_data_column_added=True)
+        )
+        if len(tables) == 0:
+            return
+
+        for table in tables:
+            self.create_search_data_trigger(table)
+
+        outdated_table_ids = [table.id for table in tables]
+        Table.objects.filter(id__in=outdated_table_ids).update(
+            search_data_outdated_since=timezone.now()
+        )
+        if settings.BASEROW_FULL_TEXT_SEARCH_ENABLED:
+            self.schedule_update(outdated_table_ids)
+
+    def get_search_data_filters(
+        self, model: GeneratedTableModel, search: str
+    ) -> Optional[Tuple[Q, Q]]:
+        """
+        Returns the filters that search the table using its search data, if the
+        search data can be used for the provided search.
+
+        :param model: The generated model of the table that is searched.
+        :param search: The search query.
+        :return: A filter matching the rows of which the search data contains a word
+            starting with every word of the search, and a filter matching the rows
+            that don't have search data yet and must be searched using the contains
+            filters. None if the whole table must be searched using the contains
+            filters.
+        """
+
+        if not settings.BASEROW_FULL_TEXT_SEARCH_ENABLED:
+            return None
+
+        words = get_search_words(search)
+        if len(words) == 0:
+            return None
+
+        table = (
+            Table.objects.filter(id=model._table_id)
+            .only("id", "search_data_column_added", "search_data_outdated_since")
+            .first()
+        )
+        if table is None:
+            return None
+
+        if not table.search_data_column_added:
+            self.schedule_update([table.id])
+            return None
+
+        if table.search_data_outdated_since is not None:
+            # The fields might have changed while full-text search was disabled.
+            self.schedule_update([table.id])
+            return None
+
+        column = (
+            f"{connection.ops.quote_name(model._meta.db_table)}."
+            f"{connection.ops.quote_name(SEARCH_DATA_COLUMN)}"
+        )
+        if self._has_rows_without_search_data(model):
+            self.schedule_update([table.id])
+
+        # The words only contain word characters, so they can't escape the quotes.
+        query = " & ".join(f"'{word}':*" for word in words)
+        return (
+            Q(
+                RawSQL(  # nosec
+                    f"{column} @@ %s::tsquery", [query], output_field=BooleanField()
+                )
+            ),
+            Q(RawSQL(f"{column} IS NULL", [], output_field=BooleanField())),  # nosec
+        )
+
+    def _has_rows_without_search_data(self, model: GeneratedTableModel) -> bool:
+        table_name = connection.ops.quote_name(model._meta.db_table)
+        column = connection.ops.quote_name(SEARCH_DATA_COLUMN)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT EXISTS(SELECT 1 FROM {table_name} WHERE {column} IS NULL)"
+            )
+            return cursor.fetchone()[0]
+
+    def add_search_data_column(self, table: Table):
+        """
+        Adds the search data column, its index and the trigger that resets the
+        search data when the row changes to the table. All the rows start without
+        search data.
+
+        :param table: The table to which the search data column must be added.
+        """
+
+        table_name = connection.ops.quote_name(table.get_database_table_name())
+        column = connection.ops.quote_name(SEARCH_DATA_COLUMN)
+        index_name = connection.ops.quote_name(
+            f"{table.get_database_table_name()}_search_data"
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"ALTER TABLE {table_name} ADD COLUMN IF NOT EXISTS {column} tsvector"
+            )
+        execute_concurrently_if_possible(
+            f"CREATE INDEX {{concurrently}} IF NOT EXISTS {index_name} "
+            f"ON {table_name} USING gin ({column})"
+        )
+        self.create_search_data_trigger(table)
+
+        table.search_data_column_added = True
+        table.search_data_outdated_since = None
+        table.save(
+            update_fields=("search_data_column_added", "search_data_outdated_since")
+        )
+
+    def create_search_data_trigger(self, table: Table):
+        """
+        Creates or recreates the trigger that resets the search data of a row when
+        one of the columns of the fields of the table is updated. It must be
+        recreated when the fields of the table change, because the trigger only
+        knows the columns that existed when it was created and it's dropped together
+        with any of them.
+
+        :param table: The table of which the trigger must be created.
+        """
+
+        from baserow.contrib.database.fields.models import Field
+
+        table_name = table.get_database_table_name()
+        field_columns = [
+            f"field_{field_id}"
+            for field_id in Field.objects.filter(table_id=table.id).values_list(
+                "id", flat=True
+            )
+        ]
+
+        # The fields that are stored in a separate table don't have a column.
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT attname FROM pg_attribute
+                WHERE attrelid = %s::regclass AND attnum > 0 AND NOT attisdropped
+                    AND attname = ANY(%s)
+                ORDER BY attnum
+                """,
+                [connection.ops.quote_name(table_name), field_columns],
+            )
+            columns = [connection.ops.quote_name(row[0]) for row in cursor.fetchall()]
+
+            trigger_name = self._get_trigger_name(table)
+            table_name = connection.ops.quote_name(table_name)
+            cursor.execute(f"DROP TRIGGER IF EXISTS {trigger_name} ON {table_name}")
+            if len(columns) > 0:
+                cursor.execute(
+                    f"CREATE TRIGGER {trigger_name} "
+                    f"BEFORE UPDATE OF {', '.join(columns)} ON {table_name} "
+                    f"FOR EACH ROW EXECUTE PROCEDURE {SEARCH_DATA_TRIGGER_FUNCTION}()"
+                )
+
+    def drop_search_data_trigger(self, table: Table):
+        """
+        Drops the trigger that resets the search data of the table if it has one.
+        This must be called before the type of a field column changes, because
+        PostgreSQL doesn't allow altering the type of a column that is used by a
+        trigger. The trigger is recreated by `fields_changed`.
+
+        :param table: The table of which the trigger must be dropped.
+        """
+
+        if not table.search_data_column_added:
+            return
+
+        table_name = connection.ops.quote_name(table.get_database_table_name())
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DROP TRIGGER IF EXISTS {self._get_trigger_name(table)} "
+                f"ON {table_name}"
+            )
+
+    def _get_trigger_name(self, table: Table) -> str:
+        return connection.ops.quote_name(
+            f"{table.get_database_table_name()}_search_data_outdated"
+        )
+
+    def update_search_data(self, table: Table) -> int:
+        """
+        Adds the search data column to the table if it doesn't have it yet, rebuilds
+        the search data of all the rows if it's outdated and fills the search data of
+        the rows that don't have any.
+
+        :param table: The table of which the search data must be updated.
+        :return: The number of rows of which the search data has been updated.
+        """
+
+        if not settings.BASEROW_FULL_TEXT_SEARCH_ENABLED:
+            return 0
+
+        if not table.search_data_column_added:
+            self.add_search_data_column(table)
+
+        model = table.get_model()
+        updated_count = 0
+
+        outdated_since = table.search_data_outdated_since
+        if outdated_since is not None:
+            updated_count += self.update_rows_search_data(model)
+            # The fields might have changed again while the search data was being
+            # rebuilt, in which case it must be rebuilt again.
+            Table.objects.filter(
+                id=table.id, search_data_outdated_since=outdated_since
+            ).update(search_data_outdated_since=None)
+
+        updated_count += self.update_rows_search_data(model, only_missing=True)
+        self.add_missing_search_data_index(table)
+        return updated_count
+
+    def add_missing_search_data_index(self, table: Table):
+        """
+        Adds the partial index of the rows without search data, which allows the
+        search to find the rows that must be searched using the contains filters.
+        It's only added once the search data of all the rows has been filled, because
+        otherwise it would contain every row until the table is vacuumed.
+
+        :param table: The table to which the index must be added.
+        """
+
+        table_name = connection.ops.quote_name(table.get_database_table_name())
+        column = connection.ops.quote_name(SEARCH_DATA_COLUMN)
+        index_name = connection.ops.quote_name(
+            f"{table.get_database_table_name()}_search_data_null"
+        )
+        execute_concurrently_if_possible(
+            f"CREATE INDEX {{concurrently}} IF NOT EXISTS {index_name} "
+            f'ON {table_name} ("id") WHERE {column} IS NULL'
+        )
+
+    def update_rows_search_data(
+        self, model: GeneratedTableModel, only_missing: bool = False
+    ) -> int:
+        """
+        Computes the search data of the rows from the human readable values of all
+        the fields in chunks of `BASEROW_FULL_TEXT_SEARCH_CHUNK_SIZE` rows. The search
+        data of a row that changes while the chunk is being computed isn't updated,
+        because it has been reset by the trigger and is filled by the next update.
+
+        :param model: The generated model of the table.
+        :param only_missing: Whether only the rows without search data must be
+            updated.
+        :return: The number of rows of which the search data has been updated.
+        """
+
+        table_name = connection.ops.quote_name(model._meta.db_table)
+        column = connection.ops.quote_name(SEARCH_DATA_COLUMN)
+        field_objects = list(model._field_objects.values())
+
+        # The id of the transaction that wrote the row version and its location change
+        # whenever the row is updated, so they identify the version of the row of
+        # which the search data has been computed.
+        queryset = (
+            model.objects_and_trash.all()
+            .enhance_by_fields()
+            .annotate(
+                search_data_version=RawSQL(  # nosec
+                    f"{table_name}.xmin::text || {table_name}.ctid::text",
+                    [],
+                    output_field=CharField(),
+                )
+            )
+            .order_by("id")
+        )
+        if only_missing:
+            queryset = queryset.filter(
+                RawSQL(  # nosec
+                    f"{table_name}.{column} IS NULL", [], output_field=BooleanField()
+                )
+            )
+
+        chunk_size = settings.BASEROW_FULL_TEXT_SEARCH_CHUNK_SIZE
+        updated_count = 0
+        last_id = 0
+        while True:
+            rows = list(queryset.filter(id__gt=last_id)[:chunk_size])
+            if len(rows) == 0:
+                break
+            last_id = rows[-1].id
+
+            documents = []
+            for row in rows:
+                values = [str(row.id)] + [
+                    field_object["type"].get_human_readable_value(
+                        getattr(row, field_object["name"]), field_object
+                    )
+                    for field_object in field_objects
+                ]
+                documents.append(" ".join(get_search_words(" ".join(values))))
+
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"""
+                    UPDATE {table_name} AS t
+                    SET {column} = array_to_tsvector(string_to_array(v.document, ' '))
+                    FROM unnest(%s::integer[], %s::text[], %s::text[])
+                        AS v(id, version, document)
+                    WHERE t."id" = v.id AND t.xmin::text || t.ctid::text = v.version
+                    """,
+                    [
+                        [row.id for row in rows],
+                        [row.search_data_version for row in rows],
+                        documents,
+                    ],
+                )
+                updated_count += cursor.rowcount
+
+        return updated_count
@@ -15,6 +15,35 @@ def run_row_count_job():
     TableHandler.count_rows()
 
 
+@app.task(bind=True, queue="export")
+def update_search_data(self, table_id: int):
+    """
+    Adds the full-text search data column to the table if needed and updates the
+    search data of the rows that have changed or of all the rows if the fields of
+    the table have changed.
+
+    :param table_id: The id of the table of which the search data must be updated.
+    """
+
+    from django.core.cache import cache
+
+    from baserow.contrib.database.table.models import Table
+    from baserow.contrib.database.table.search import (
+        SearchDataHandler,
+        get_search_data_update_cache_key,
+    )
+
+    # Rows that change while the task is running must be able to schedule it again.
+    cache.delete(get_search_data_update_cache_key(table_id))
+
+    try:
+        table = Table.objects.get(id=table_id)
+    except Table.DoesNotExist:
+        return
+
+    SearchDataHandler().update_search_data(table)
+
+
 @app.on_after_finalize.connect
 def setup_periodic_tasks(sender, **kwargs):
     if settings.BASEROW_COUNT_ROWS_ENABLED:
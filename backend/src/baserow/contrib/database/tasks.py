@@ -1,3 +1,33 @@
-from baserow.contrib.database.table.tasks import setup_periodic_tasks
+from baserow.contrib.database.table.tasks import (
+    setup_periodic_tasks,
+    update_search_data,
+)
+from baserow.contrib.database.fields.tasks import (
+    manage_trigram_indexes,
+    setup_periodic_trigram_index_tasks,
+)
+from baserow.contrib.database.views.tasks import (
+    manage_view_indexes,
+    setup_periodic_view_index_tasks,
+)
+from baserow.contrib.database.rows.tasks import (
+    clean_up_stale_rows_batch_jobs,
+    compact_row_change_log,
+    renormalize_row_orders,
+    run_rows_batch_job,
+    setup_periodic_row_tasks,
+)
 
-__all__ = ["setup_periodic_tasks"]
+__all__ = [
+    "setup_periodic_tasks",
+    "clean_up_stale_rows_batch_jobs",
+    "compact_row_change_log",
+    "renormalize_row_orders",
+    "run_rows_batch_job",
+    "setup_periodic_row_tasks",
+    "manage_trigram_indexes",
+    "setup_periodic_trigram_index_tasks",
+    "update_search_data",
+    "manage_view_indexes",
+    "setup_periodic_view_index_tasks",
+]
@@ -10,8 +10,11 @@ from baserow.contrib.database.fields.dependencies.update_collector import (
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.models import Field
 from baserow.contrib.database.fields.registries import field_type_registry
+from baserow.contrib.database.rows.change_log import RowChangeLogHandler
+from baserow.contrib.database.rows.models import RowChangeActions
 from baserow.contrib.database.rows.signals import row_created, rows_created
 from baserow.contrib.database.table.models import Table, GeneratedTableModel
+from baserow.contrib.database.table.search import SearchDataHandler
 from baserow.contrib.database.table.signals import table_created
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.models import View
@@ -169,6 +172,10 @@ class FieldTrashableItemType(TrashableItemType):
 
         field.delete()
 
+        # Dropping the column has also dropped the search data trigger of the table.
+        if field.table.search_data_column_added:
+            SearchDataHandler().create_search_data_trigger(field.table)
+
         # After the field is deleted we are going to to call the after_delete method of
         # the field type because some instance cleanup might need to happen.
         field_type.after_delete(field, from_model, connection)
@@ -247,6 +254,9 @@ class RowTrashableItemType(TrashableItemType):
                 )
         update_collector.apply_updates_and_get_updated_fields()
 
+        RowChangeLogHandler().log_row_changes(
+            table, RowChangeActions.CREATED, [trashed_item.id]
+        )
         ViewHandler().field_value_updated(updated_fields)
 
         row_created.send(
@@ -367,6 +377,10 @@ class RowsTrashableItemType(TrashableItemType):
                 )
         update_collector.apply_updates_and_get_updated_fields()
 
+        RowChangeLogHandler().log_row_changes(
+            table, RowChangeActions.CREATED, [row.id for row in rows_to_restore]
+        )
+
         rows_created.send(
             self,
             rows=rows_to_restore,
@@ -378,9 +392,26 @@ class RowsTrashableItemType(TrashableItemType):
 
     def trash(self, item_to_trash, requesting_user):
         """
-        Sets trashed=True for all the rows
+        Sets trashed=True for all the rows. If the item has a `rows_queryset`
+        attribute, the ids of the rows are selected by the database, so that they
+        don't have to be provided.
         """
 
+        if hasattr(item_to_trash, "rows_queryset"):
+            item_to_trash.save()
+            sql, params = item_to_trash.rows_queryset.values(
+                "id"
+            ).query.sql_with_params()
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"UPDATE {TrashedRows._meta.db_table} SET row_ids = ("  # nosec
+                    f"SELECT coalesce(jsonb_agg(row_ids.id ORDER BY row_ids.id), "
+                    f"'[]') FROM ({sql}) row_ids) WHERE id = %s",
+                    [*params, item_to_trash.id],
+                )
+            item_to_trash.rows_queryset.update(trashed=True)
+            return
+
         table_model = self._get_table_model(item_to_trash.table_id)
         table_model.objects.filter(id__in=item_to_trash.row_ids).update(trashed=True)
         item_to_trash.save()
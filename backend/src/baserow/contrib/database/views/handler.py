@@ -30,9 +30,15 @@ from baserow.contrib.database.fields.field_filters import FilterBuilder
 from baserow.contrib.database.fields.field_sortings import AnnotatedOrder
 from baserow.contrib.database.fields.models import Field
 from baserow.contrib.database.fields.registries import field_type_registry
+from baserow.contrib.database.fields.trigram_indexes import TrigramIndexHandler
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.rows.signals import row_created
-from baserow.contrib.database.table.models import Table, GeneratedTableModel
+from baserow.contrib.database.table.change_sequence import bump_table_change_sequences
+from baserow.contrib.database.table.models import (
+    SEARCH_MODE_CONTAINS,
+    Table,
+    GeneratedTableModel,
+)
 from baserow.core.trash.handler import TrashHandler
 from baserow.core.utils import (
     extract_allowed,
@@ -59,6 +65,11 @@ from .exceptions import (
     NoAuthorizationToPubliclySharedView,
 )
 from .models import View, ViewDecoration, ViewFilter, ViewSort
+from .plan_cache import (
+    get_local_cached_view_plan,
+    get_view_plan_version,
+    set_local_cached_view_plan,
+)
 from .registries import (
     view_type_registry,
     view_filter_type_registry,
@@ -429,7 +440,8 @@ class ViewHandler:
         modification, deletion. This method is called for each directly or indirectly
         affected list of fields.
 
-        Calls the `.after_field_value_update(updated_fields)` of each view type.
+        Calls the `.after_field_value_update(updated_fields)` of each view type and
+        increases the change sequence numbers of the related tables.
 
         :param updated_fields: The field or list of fields that are affected.
         """
@@ -437,6 +449,8 @@ class ViewHandler:
         if not isinstance(updated_fields, list):
             updated_fields = [updated_fields]
 
+        bump_table_change_sequences(field.table_id for field in updated_fields)
+
         # Call each view types hook
         for view_type in view_type_registry.get_all():
             view_type.after_field_value_update(updated_fields)
@@ -446,7 +460,8 @@ class ViewHandler:
         Called for each field modification. This include indirect modification when
         fields depends from another (like formula fields or lookup fields).
 
-        Calls the `.after_field_update(updated_fields)` of each view type.
+        Calls the `.after_field_update(updated_fields)` of each view type and
+        increases the change sequence numbers of the related tables.
 
         :param updated_fields: The field or list of fields that are updated.
         """
@@ -454,6 +469,8 @@ class ViewHandler:
         if not isinstance(updated_fields, list):
             updated_fields = [updated_fields]
 
+        bump_table_change_sequences(field.table_id for field in updated_fields)
+
         # Call each view types hook
         for view_type in view_type_registry.get_all():
             view_type.after_field_update(updated_fields)
@@ -473,7 +490,28 @@ class ViewHandler:
         if not hasattr(model, "_field_objects"):
             raise ValueError("A queryset of the table model is required.")
 
+        # The version must be fetched before the filters, so that a change made while
+        # compiling them results in a new version.
+        plan_key = (
+            "filters",
+            view.id,
+            get_view_plan_version(view.id),
+            view.filter_type,
+            view.trashed,
+            model,
+        )
+        plan = get_local_cached_view_plan(plan_key)
+        if plan is not None:
+            filter_builder, trigram_index_fields = plan
+            # Compiling the filters records the usage of the fields for their trigram
+            # index, which must still happen when the compiled filters are reused.
+            if len(trigram_index_fields) > 0:
+                TrigramIndexHandler().record_usage(trigram_index_fields)
+            return filter_builder
+
         filter_builder = FilterBuilder(filter_type=view.filter_type)
+        trigram_index_fields = []
+        depends_on_current_time = False
         for view_filter in view.viewfilter_set.all():
             if view_filter.field_id not in model._field_objects:
                 raise ValueError(
@@ -489,6 +527,13 @@ class ViewHandler:
                     field_name, view_filter.value, model_field, field_object["field"]
                 )
             )
+            if view_filter_type.can_use_trigram_index:
+                trigram_index_fields.append(field_object["field"])
+            if view_filter_type.depends_on_current_time:
+                depends_on_current_time = True
+
+        if not depends_on_current_time:
+            set_local_cached_view_plan(plan_key, (filter_builder, trigram_index_fields))
 
         return filter_builder
 
@@ -742,6 +787,44 @@ class ViewHandler:
         if view.trashed:
             raise ViewSortDoesNotExist(f"The view {view.id} is trashed.")
 
+        annotations, order_by = self._get_sort_plan(view, model, restrict_to_field_ids)
+        for annotation in annotations:
+            queryset = queryset.annotate(**annotation)
+
+        return queryset.order_by(*order_by)
+
+    def _get_sort_plan(
+        self,
+        view: View,
+        model: GeneratedTableModel,
+        restrict_to_field_ids: Optional[Iterable[int]] = None,
+    ) -> Tuple[List[Dict[str, Any]], List[Any]]:
+        """
+        Compiles the view's sorts into the annotations and order expressions that
+        must be applied to a queryset of the provided model. The compiled sorts are
+        cached until the sorts of the view or the model change.
+
+        :param view: The view where to fetch the sorting from.
+        :param model: The generated model containing all fields.
+        :param restrict_to_field_ids: Only field ids in this iterable will have their
+            view sorts compiled.
+        :raises ValueError: When the table model does not contain one of the fields.
+        :return: The annotations and the order expressions in the order they must be
+            applied.
+        """
+
+        plan_key = (
+            "sorts",
+            view.id,
+            get_view_plan_version(view.id),
+            model,
+            None if restrict_to_field_ids is None else frozenset(restrict_to_field_ids),
+        )
+        plan = get_local_cached_view_plan(plan_key)
+        if plan is not None:
+            return plan
+
+        annotations = []
         order_by = []
 
         qs = view.viewsort_set
@@ -767,7 +850,7 @@ class ViewHandler:
                 order = order.order
 
             if annotation is not None:
-                queryset = queryset.annotate(**annotation)
+                annotations.append(annotation)
 
             # If the field type does not have a specific ordering expression we can
             # order the default way.
@@ -783,9 +866,10 @@ class ViewHandler:
 
         order_by.append("order")
         order_by.append("id")
-        queryset = queryset.order_by(*order_by)
 
-        return queryset
+        plan = (annotations, order_by)
+        set_local_cached_view_plan(plan_key, plan)
+        return plan
 
     def get_sort(self, user, view_sort_id, base_queryset=None):
         """
@@ -1167,6 +1251,7 @@ class ViewHandler:
         model=None,
         only_sort_by_field_ids=None,
         only_search_by_field_ids=None,
+        search_mode=SEARCH_MODE_CONTAINS,
     ):
         """
         Returns a queryset for the provided view which is appropriately sorted,
@@ -1187,6 +1272,8 @@ class ViewHandler:
              not present in the iterable will not be searched and filtered down by the
              search term.
         :type only_search_by_field_ids: Optional[Iterable[int]]
+        :param search_mode: The mode of the search, see `search_all_fields`.
+        :type search_mode: str
         :return: The appropriate queryset for the provided view.
         :rtype: QuerySet
         """
@@ -1202,7 +1289,9 @@ class ViewHandler:
         if view_type.can_sort:
             queryset = self.apply_sorting(view, queryset, only_sort_by_field_ids)
         if search is not None:
-            queryset = queryset.search_all_fields(search, only_search_by_field_ids)
+            queryset = queryset.search_all_fields(
+                search, only_search_by_field_ids, search_mode
+            )
         return queryset
 
     def _get_aggregation_lock_cache_key(self, view: View):
@@ -0,0 +1,172 @@
+"""
+The generated tables only have an index on the order and id of the rows, so sorting
+or filtering a view of a large table requires a sequential scan of the whole table.
+The view index advisor creates a B-tree index for the fields that are sorted on first
+by a view, or that are filtered on with an equality or range filter, in tables with at
+least `BASEROW_VIEW_INDEX_MIN_ROWS` rows. The index is dropped again once no view
+sorts or filters on the field anymore, or when the field or its table is trashed.
+
+The indexes are created and dropped without locking the table for writes by the
+`manage_view_indexes` task, or by the management command with the same name.
+"""
+
+from typing import Dict, Iterable, List, Set, Tuple
+
+from django.conf import settings
+from django.db import connection
+
+from baserow.contrib.database.fields.indexes import FieldIndexHandler
+from baserow.contrib.database.fields.models import Field
+from baserow.contrib.database.fields.registries import field_type_registry
+from baserow.contrib.database.table.models import Table
+
+from .models import ViewFieldIndex, ViewFieldIndexStates, ViewFilter, ViewSort
+from .registries import view_filter_type_registry
+
+
+class ViewIndexAdvisor(FieldIndexHandler):
+    index_model = ViewFieldIndex
+    created_state = ViewFieldIndexStates.CREATED
+    failed_state = ViewFieldIndexStates.FAILED
+
+    def get_used_field_ids(self) -> Set[int]:
+        """
+        Finds the fields that are sorted on first by a view, or that are filtered on
+        by a view filter that can use an index. Only the views, fields and tables
+        that aren't trashed are taken into account.
+
+        :return: The ids of the used fields.
+        """
+
+        not_trashed = {
+            "view__trashed": False,
+            "field__trashed": False,
+            "view__table__trashed": False,
+            "view__table__database__trashed": False,
+        }
+
+        # Only the first sort of a view can be served by an index on its field,
+        # because the other sorts only apply to rows with the same value.
+        first_sort_field_ids = {}
+        for view_id, field_id in (
+            ViewSort.objects.filter(**not_trashed)
+            .order_by("view_id", "id")
+            .values_list("view_id", "field_id")
+        ):
+            first_sort_field_ids.setdefault(view_id, field_id)
+
+        filter_types = [
+            filter_type.type
+            for filter_type in view_filter_type_registry.get_all()
+            if filter_type.can_use_index
+        ]
+        filter_field_ids = ViewFilter.objects.filter(
+            type__in=filter_types, **not_trashed
+        ).values_list("field_id", flat=True)
+
+        return set(first_sort_field_ids.values()) | set(filter_field_ids)
+
+    def get_estimated_row_counts(self, table_ids: Iterable[int]) -> Dict[int, int]:
+        """
+        Returns the number of rows that the PostgreSQL planner estimates the provided
+        tables to have, including the trashed rows.
+
+        :param table_ids: The ids of the tables.
+        :return: The estimated row count by table id. Tables that have never been
+            analyzed are left out.
+        """
+
+        table_names = {
+            f"{Table.USER_TABLE_DATABASE_NAME_PREFIX}{table_id}": table_id
+            for table_id in table_ids
+        }
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT relname, reltuples::bigint FROM pg_class "
+                "WHERE relkind = 'r' AND relname = ANY(%s)",
+                [list(table_names.keys())],
+            )
+            return {
+                table_names[table_name]: row_count
+                for table_name, row_count in cursor.fetchall()
+                if row_count >= 0
+            }
+
+    def get_advice(self) -> Tuple[List[Field], List[ViewFieldIndex]]:
+        """
+        Determines which indexes must be created and which must be dropped. An index
+        is advised for a used field of a type that supports it in a table with at
+        least `BASEROW_VIEW_INDEX_MIN_ROWS` rows. An existing index is only dropped
+        when the field isn't used anymore, so that it isn't recreated whenever the
+        row count of the table changes around the threshold.
+
+        :return: The fields for which an index must be created and the indexes that
+            must be dropped.
+        """
+
+        used_fields = [
+            field
+            for field in Field.objects.filter(
+                id__in=self.get_used_field_ids()
+            ).select_related("content_type")
+            if field_type_registry.get_by_model(
+                field.specific_class
+            ).can_have_view_index
+        ]
+        used_field_ids = {field.id for field in used_fields}
+
+        existing_indexes = list(ViewFieldIndex.objects.select_related("field"))
+        indexed_field_ids = {index.field_id for index in existing_indexes}
+        indexes_to_drop = [
+            index for index in existing_indexes if index.field_id not in used_field_ids
+        ]
+
+        row_counts = self.get_estimated_row_counts(
+            {field.table_id for field in used_fields}
+        )
+        fields_to_index = [
+            field
+            for field in used_fields
+            if field.id not in indexed_field_ids
+            and row_counts.get(field.table_id, 0)
+            >= settings.BASEROW_VIEW_INDEX_MIN_ROWS
+        ]
+
+        return fields_to_index, indexes_to_drop
+
+    def get_index_definition(self, column_name: str) -> str:
+        return f"({column_name})"
+
+    def create_field_index(self, field: Field) -> ViewFieldIndex:
+        """
+        Creates the B-tree index of the field. If the index can't be created, the
+        index is marked as failed so that it's not retried while the field is in use.
+
+        :param field: The field for which the index must be created.
+        :return: The created or failed index.
+        """
+
+        return self.create_index(ViewFieldIndex(field=field))
+
+    def manage_indexes(
+        self, dry_run: bool = False
+    ) -> Tuple[List[Field], List[ViewFieldIndex]]:
+        """
+        Drops the indexes that aren't used anymore and creates the advised indexes.
+
+        :param dry_run: If True, the advice is returned without changing any index.
+        :return: The fields for which an index has been created and the indexes that
+            have been dropped.
+        """
+
+        fields_to_index, indexes_to_drop = self.get_advice()
+        if dry_run:
+            return fields_to_index, indexes_to_drop
+
+        for index in indexes_to_drop:
+            self.drop_index(index)
+
+        for field in fields_to_index:
+            self.create_field_index(field)
+
+        return fields_to_index, indexes_to_drop
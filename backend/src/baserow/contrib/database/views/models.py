@@ -17,7 +17,11 @@ from baserow.contrib.database.fields.field_filters import (
     FILTER_TYPE_AND,
     FILTER_TYPE_OR,
 )
-from baserow.contrib.database.fields.models import Field, FileField
+from baserow.contrib.database.fields.models import (
+    Field,
+    FileField,
+    ManagedFieldIndex,
+)
 from baserow.contrib.database.views.registries import (
     view_type_registry,
     view_filter_type_registry,
@@ -613,3 +617,27 @@ class FormViewFieldOptions(models.Model):
             "order",
             "field_id",
         )
+
+
+class ViewFieldIndexStates(models.TextChoices):
+    CREATED = "created"
+    FAILED = "failed"
+
+
+class ViewFieldIndex(ManagedFieldIndex):
+    """
+    Keeps track of the B-tree index that the view index advisor has created for a
+    field that is sorted or filtered on by views of a large table. The index is
+    dropped again when no view sorts or filters on the field anymore.
+    """
+
+    index_name_suffix = "view"
+
+    field = models.OneToOneField(
+        Field, on_delete=models.CASCADE, related_name="view_index"
+    )
+    state = models.CharField(
+        max_length=16,
+        choices=ViewFieldIndexStates.choices,
+        default=ViewFieldIndexStates.CREATED,
+    )
@@ -0,0 +1,126 @@
+"""
+Applying the filters and sorts of a view requires fetching them from the database and
+compiling them into Q objects, annotations and order expressions using the view filter
+and field type registries. For busy views, like public views, this is repeated for
+every request even though the filters and sorts rarely change.
+
+Every process therefore keeps a bounded, least recently used, in-memory cache of the
+compiled filters and sorts. An entry is keyed by the view id, the plan version of the
+view and the generated table model it was compiled for. The plan version is stored in
+the default cache and is increased whenever a filter or sort of the view is created,
+updated or deleted. Changes to the fields of the table result in a new generated
+model, so they never match a previously compiled entry.
+
+Plans that depend on the current time are never cached. Side effects of compiling a
+filter, like recording the usage of a field for a trigram index, must be repeated by
+the caller when a cached plan is used.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+local_view_plan_cache: "OrderedDict[Hashable, Any]" = OrderedDict()
+local_view_plan_cache_lock = threading.Lock()
+
+
+def get_view_plan_version_cache_key(view_id: int) -> str:
+    return f"view_plan_version__{view_id}"
+
+
+def _get_initial_view_plan_version() -> int:
+    # The version starts at the current time in microseconds instead of 0, so that it
+    # doesn't start counting again from an older version if the cache is cleared.
+    return time.time_ns() // 1000
+
+
+def get_view_plan_version(view_id: int) -> int:
+    """
+    Returns the current plan version of the filters and sorts of the provided view.
+
+    :param view_id: The id of the view.
+    :return: The current plan version.
+    """
+
+    cache_key = get_view_plan_version_cache_key(view_id)
+    version = cache.get(cache_key)
+    if version is None:
+        cache.add(cache_key, _get_initial_view_plan_version(), timeout=None)
+        version = cache.get(cache_key)
+    return version
+
+
+def bump_view_plan_versions(view_ids: Iterable[int]):
+    """
+    Increases the plan versions of the provided views, so that their filters and sorts
+    are compiled again. This is done right away and again when the current transaction
+    commits, because otherwise a request in another transaction that runs in between
+    could compile and cache the old filters and sorts under the new version.
+
+    :param view_ids: The ids of the views of which the filters or sorts have changed.
+    """
+
+    view_ids = set(view_ids)
+
+    def increment_versions():
+        for view_id in view_ids:
+            cache_key = get_view_plan_version_cache_key(view_id)
+            try:
+                cache.incr(cache_key, 1)
+            except ValueError:
+                # No cache key, we create one
+                cache.add(cache_key, _get_initial_view_plan_version(), timeout=None)
+
+    increment_versions()
+    transaction.on_commit(increment_versions)
+
+
+def get_local_cached_view_plan(key: Hashable) -> Optional[Any]:
+    """
+    Returns the compiled plan that this process has cached under the provided key.
+
+    :param key: The key containing the view id, plan version and model.
+    :return: The compiled plan or None if it isn't cached.
+    """
+
+    with local_view_plan_cache_lock:
+        plan = local_view_plan_cache.get(key)
+        if plan is None:
+            return None
+
+        local_view_plan_cache.move_to_end(key)
+        return plan
+
+
+def set_local_cached_view_plan(key: Hashable, plan: Any):
+    """
+    Caches the compiled plan in this process, evicting the least recently used plans
+    if the cache holds more than `BASEROW_VIEW_PLAN_CACHE_SIZE` plans.
+
+    :param key: The key containing the view id, plan version and model.
+    :param plan: The compiled plan.
+    """
+
+    max_size = settings.BASEROW_VIEW_PLAN_CACHE_SIZE
+    if max_size <= 0:
+        return
+
+    with local_view_plan_cache_lock:
+        local_view_plan_cache[key] = plan
+        local_view_plan_cache.move_to_end(key)
+        while len(local_view_plan_cache) > max_size:
+            local_view_plan_cache.popitem(last=False)
+
+
+def clear_local_view_plan_cache():
+    """
+    Removes all the compiled plans that this process has cached.
+    """
+
+    with local_view_plan_cache_lock:
+        local_view_plan_cache.clear()
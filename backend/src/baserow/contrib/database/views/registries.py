@@ -595,6 +595,26 @@ class ViewFilterType(Instance):
     checked and returns True if compatible or False if not.
     """
 
+    depends_on_current_time: bool = False
+    """
+    Indicates whether the filter compares with the current date or time, so that
+    the filtered rows can change without any change to the table.
+    """
+
+    can_use_trigram_index: bool = False
+    """
+    Indicates whether the filter compiles to a contains condition that a trigram
+    index on the field can speed up. The usage of the field is recorded every time
+    the filter is applied, so that the index is created and kept.
+    """
+
+    can_use_index: bool = False
+    """
+    Indicates whether the filter compares the value of the field with an equality or
+    range condition, so that the view index advisor can speed it up with a B-tree
+    index on the field.
+    """
+
     def default_filter_on_exception(self):
         """The default Q to use when the filter value is of an incompatible type."""
 
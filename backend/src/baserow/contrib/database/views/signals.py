@@ -1,9 +1,12 @@
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import Signal, receiver
 
 from baserow.contrib.database.fields import signals as field_signals
 from baserow.contrib.database.fields.models import FileField
+from baserow.contrib.database.table.change_sequence import bump_table_change_sequences
 
-from .models import GalleryView
+from .models import GalleryView, ViewFilter, ViewSort
+from .plan_cache import bump_view_plan_versions
 
 
 view_created = Signal()
@@ -42,3 +45,33 @@ def field_deleted(sender, field, **kwargs):
         decorator_value_provider_type
     ) in decorator_value_provider_type_registry.get_all():
         decorator_value_provider_type.after_field_delete(field)
+
+
+@receiver(view_updated)
+@receiver(view_field_options_updated)
+def bump_table_change_sequence_when_view_changed(sender, view, **kwargs):
+    bump_table_change_sequences([view.table_id])
+
+
+@receiver(view_filter_created)
+@receiver(view_filter_updated)
+@receiver(view_filter_deleted)
+def bump_table_change_sequence_when_view_filter_changed(sender, view_filter, **kwargs):
+    bump_table_change_sequences([view_filter.view.table_id])
+
+
+@receiver(view_sort_created)
+@receiver(view_sort_updated)
+@receiver(view_sort_deleted)
+def bump_table_change_sequence_when_view_sort_changed(sender, view_sort, **kwargs):
+    bump_table_change_sequences([view_sort.view.table_id])
+
+
+@receiver(post_save, sender=ViewFilter)
+@receiver(post_delete, sender=ViewFilter)
+@receiver(post_save, sender=ViewSort)
+@receiver(post_delete, sender=ViewSort)
+def bump_view_plan_version_when_filter_or_sort_saved(sender, instance, **kwargs):
+    # Filters and sorts aren't always changed via the handler, for example when a
+    # view is duplicated or when a field type change removes incompatible ones.
+    bump_view_plan_versions([instance.view_id])
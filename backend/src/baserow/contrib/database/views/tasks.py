@@ -0,0 +1,39 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+
+from baserow.config.celery import app
+
+# The indexes are managed by one task at a time, a task that takes longer than this
+# many seconds doesn't prevent the next one from starting.
+MANAGE_VIEW_INDEXES_LOCK_TIMEOUT = 60 * 60
+
+
+@app.task(bind=True, queue="export")
+def manage_view_indexes(self):
+    """
+    Creates the indexes that the view index advisor advises for the fields that views
+    sort or filter on and drops the indexes that aren't used anymore.
+    """
+
+    from baserow.contrib.database.views.index_advisor import ViewIndexAdvisor
+
+    lock_key = "manage_view_indexes"
+    if not cache.add(lock_key, True, timeout=MANAGE_VIEW_INDEXES_LOCK_TIMEOUT):
+        return
+
+    try:
+        ViewIndexAdvisor().manage_indexes()
+    finally:
+        cache.delete(lock_key)
+
+
+# noinspection PyUnusedLocal
+@app.on_after_finalize.connect
+def setup_periodic_view_index_tasks(sender, **kwargs):
+    if settings.BASEROW_VIEW_INDEX_ADVISOR_ENABLED:
+        sender.add_periodic_task(
+            timedelta(minutes=settings.BASEROW_VIEW_INDEX_MANAGE_INTERVAL_MINUTES),
+            manage_view_indexes.s(),
+        )
@@ -1,13 +1,13 @@
-from datetime import datetime, timedelta
+from datetime import date, datetime, time, timedelta
 from decimal import Decimal
 from math import floor, ceil
+from typing import Optional, Tuple
 
 from dateutil import parser
 from dateutil.parser import ParserError
-from django.contrib.postgres.aggregates.general import ArrayAgg
-from django.db.models import Q, IntegerField, DateTimeField
-from django.db.models.functions import Cast, Length
-from pytz import timezone, all_timezones
+from django.db.models import Q, IntegerField, DateTimeField, Exists, OuterRef
+from django.db.models.functions import Length
+from pytz import timezone, all_timezones, AmbiguousTimeError, NonExistentTimeError
 
 from baserow.contrib.database.fields.field_filters import AnnotatedQ
 from baserow.contrib.database.fields.field_filters import (
@@ -33,6 +33,7 @@ from baserow.contrib.database.fields.field_types import (
     FormulaFieldType,
 )
 from baserow.contrib.database.fields.registries import field_type_registry
+from baserow.contrib.database.fields.trigram_indexes import TrigramIndexHandler
 from baserow.core.expressions import Timezone
 from .registries import ViewFilterType
 from baserow.contrib.database.formula import (
@@ -44,7 +45,113 @@ from baserow.contrib.database.formula import (
 )
 
 
+def get_start_of_day(day: date, timezone_string: str) -> datetime:
+    """
+    Returns the aware datetime of the first moment of the provided day in the provided
+    timezone.
+
+    :param day: The day of which the start must be returned.
+    :param timezone_string: The timezone in which the day starts.
+    :return: The start of the day.
+    """
+
+    timezone_object = timezone(timezone_string)
+    midnight = datetime.combine(day, time.min)
+    try:
+        return timezone_object.localize(midnight, is_dst=None)
+    except AmbiguousTimeError:
+        # The clock is set back at midnight, so the day starts at the first midnight.
+        return timezone_object.localize(midnight, is_dst=True)
+    except NonExistentTimeError:
+        # The clock is set forward at midnight, so the day starts at the moment the
+        # clock jumps.
+        return timezone_object.localize(midnight, is_dst=False)
+
+
+def get_date_range_filter(
+    field_name: str,
+    model_field,
+    start_date: Optional[date],
+    end_date: Optional[date],
+    timezone_string: str = "UTC",
+) -> Q:
+    """
+    Returns a filter matching the field values that fall within the half-open range
+    from the start date up to, but not including, the end date. If the field contains
+    a time, the dates are converted to the start of the day in the provided timezone,
+    so that the column is compared directly instead of converting the value of every
+    row to that timezone. This allows the database to use an index on the column.
+
+    :param field_name: The name of the field that must be filtered.
+    :param model_field: The model field of the field that must be filtered.
+    :param start_date: The first date that matches or None if there is no lower
+        bound.
+    :param end_date: The first date after the range or None if there is no upper
+        bound.
+    :param timezone_string: The timezone in which the dates of the field values must
+        be compared.
+    :return: The filter matching the dates within the range.
+    """
+
+    # The model field of a formula stores its value in the expression field.
+    model_field = getattr(model_field, "expression_field", model_field)
+    has_time = isinstance(model_field, DateTimeField)
+
+    def convert(day):
+        return get_start_of_day(day, timezone_string) if has_time else day
+
+    query_dict = {}
+    if start_date is not None:
+        query_dict[f"{field_name}__gte"] = convert(start_date)
+    if end_date is not None:
+        query_dict[f"{field_name}__lt"] = convert(end_date)
+    return Q(**query_dict)
+
+
+def get_next_day(day: date) -> Optional[date]:
+    """
+    Returns the day after the provided day or None if that's beyond the last date that
+    can be represented.
+    """
+
+    try:
+        return day + timedelta(days=1)
+    except OverflowError:
+        return None
+
+
+def get_period_range(day: date, query_for) -> Tuple[date, Optional[date]]:
+    """
+    Returns the half-open range of dates of the day, month or year containing the
+    provided day.
+
+    :param day: The day within the period.
+    :param query_for: The date parts that must match, like ["year", "month"] for the
+        month of the day.
+    :return: The first date of the period and the first date after the period, or
+        None if that's beyond the last date that can be represented.
+    """
+
+    if "day" in query_for:
+        return day, get_next_day(day)
+
+    if "month" in query_for:
+        start = day.replace(day=1)
+        end_year, end_month = divmod(start.month, 12)
+        end_year += start.year
+    else:
+        start = day.replace(month=1, day=1)
+        end_year, end_month = start.year + 1, 0
+
+    if end_year > date.max.year:
+        return start, None
+    return start, date(end_year, end_month + 1, 1)
+
+
 class NotViewFilterTypeMixin:
+    # A negated filter matches most of the rows, so an index doesn't help.
+    can_use_index = False
+
     def default_filter_on_exception(self):
         return Q()
 
@@ -61,6 +168,7 @@ class EqualViewFilterType(ViewFilterType):
     """
 
     type = "equal"
+    can_use_index = True
     compatible_field_types = [
         TextFieldType.type,
         LongTextFieldType.type,
@@ -142,6 +250,7 @@ class ContainsViewFilterType(ViewFilterType):
     """
 
     type = "contains"
+    can_use_trigram_index = True
     compatible_field_types = [
         TextFieldType.type,
         LongTextFieldType.type,
@@ -166,13 +275,20 @@ class ContainsViewFilterType(ViewFilterType):
         # Check if the model_field accepts the value.
         try:
             field_type = field_type_registry.get_by_model(field)
-            return field_type.contains_query(field_name, value, model_field, field)
+            q = field_type.contains_query(field_name, value, model_field, field)
         except Exception:
             return self.default_filter_on_exception()
 
+        if self.can_use_trigram_index:
+            TrigramIndexHandler().record_usage([field])
+
+        return q
+
 
 class ContainsNotViewFilterType(NotViewFilterTypeMixin, ContainsViewFilterType):
     type = "contains_not"
+    # A negated contains filter can't use a trigram index.
+    can_use_trigram_index = False
 
 
 class LengthIsLowerThanViewFilterType(ViewFilterType):
@@ -211,6 +327,7 @@ class HigherThanViewFilterType(ViewFilterType):
     """
 
     type = "higher_than"
+    can_use_index = True
     compatible_field_types = [
         NumberFieldType.type,
         RatingFieldType.type,
@@ -246,6 +363,7 @@ class LowerThanViewFilterType(ViewFilterType):
     """
 
     type = "lower_than"
+    can_use_index = True
     compatible_field_types = [
         NumberFieldType.type,
         RatingFieldType.type,
@@ -281,6 +399,7 @@ class DateEqualViewFilterType(ViewFilterType):
     """
 
     type = "date_equal"
+    can_use_index = True
     compatible_field_types = [
         DateFieldType.type,
         LastModifiedFieldType.type,
@@ -309,33 +428,20 @@ class DateEqualViewFilterType(ViewFilterType):
             return Q()
 
         # If the length of the string value is lower than 10 characters we know it is
-        # only a date so we can match only on year, month and day level. This way if a
-        # date is provided, but if it tries to compare with a models.DateTimeField it
-        # will still give back accurate results.
+        # only a date so we match all the values on that day. This way if a date is
+        # provided, but if it tries to compare with a models.DateTimeField it will
+        # still give back accurate results.
         # Since the LastModified and CreateOn fields are stored for a specific timezone
         # we need to make sure to take this timezone into account when comparing to
         # the "equals_date"
-        has_timezone = hasattr(field, "timezone")
         if len(value) <= 10:
-
-            def query_dict(query_field_name):
-                return {
-                    f"{query_field_name}__year": datetime.year,
-                    f"{query_field_name}__month": datetime.month,
-                    f"{query_field_name}__day": datetime.day,
-                }
-
-            if has_timezone:
-                timezone_string = field.get_timezone()
-                tmp_field_name = f"{field_name}_timezone_{timezone_string}"
-                return AnnotatedQ(
-                    annotation={
-                        f"{tmp_field_name}": Timezone(field_name, timezone_string)
-                    },
-                    q=query_dict(tmp_field_name),
-                )
-            else:
-                return Q(**query_dict(field_name))
+            day = datetime.date()
+            timezone_string = (
+                field.get_timezone() if hasattr(field, "timezone") else "UTC"
+            )
+            return get_date_range_filter(
+                field_name, model_field, day, get_next_day(day), timezone_string
+            )
         else:
             return Q(**{field_name: datetime})
 
@@ -349,7 +455,10 @@ class BaseDateFieldLookupFilterType(ViewFilterType):
     makes sure to only use the date part of the datetime in order to filter. This means
     that the time part of a DateTimeField gets completely ignored.
 
-    The 'query_field_lookup' needs to be set on the deriving classes to something like
+    Deriving classes that compare the whole date should implement `get_date_range`,
+    so that the column can be compared with a range without converting the value of
+    every row. Otherwise the 'query_field_lookup' needs to be set on the deriving
+    classes to something like
     '__lt'
     '__lte'
     '__gt'
@@ -387,7 +496,34 @@ class BaseDateFieldLookupFilterType(ViewFilterType):
         except ValueError as e:
             raise e
 
+    def get_date_range(
+        self, parsed_date: date
+    ) -> Optional[Tuple[Optional[date], Optional[date]]]:
+        """
+        Returns the half-open range of dates that match the parsed filter value, or
+        None if the filter can't be expressed as a range.
+
+        :param parsed_date: The date that the filter value has been parsed to.
+        :return: The first date that matches and the first date after the range. One
+            of them can be None if the range is unbounded.
+        """
+
+        return None
+
     def get_filter(self, field_name, value, model_field, field):
+        has_timezone = hasattr(field, "timezone")
+        try:
+            parsed_date = self.parse_date(value)
+        except (ParserError, ValueError):
+            return Q()
+
+        date_range = self.get_date_range(parsed_date)
+        if date_range is not None:
+            timezone_string = field.get_timezone() if has_timezone else "UTC"
+            return get_date_range_filter(
+                field_name, model_field, *date_range, timezone_string
+            )
+
         # in order to only compare the date part of a datetime field
         # we need to verify that we are in fact dealing with a datetime field
         # if so the django query lookup '__date' gets appended to the field_name
@@ -395,27 +531,18 @@ class BaseDateFieldLookupFilterType(ViewFilterType):
         query_date_lookup = self.query_date_lookup
         if isinstance(model_field, DateTimeField) and not query_date_lookup:
             query_date_lookup = "__date"
-        try:
-            parsed_date = self.parse_date(value)
-            has_timezone = hasattr(field, "timezone")
-            field_key = f"{field_name}{query_date_lookup}{self.query_field_lookup}"
-            if has_timezone:
-                timezone_string = field.get_timezone()
-                tmp_field_name = f"{field_name}_timezone_{timezone_string}"
-                field_key = (
-                    f"{tmp_field_name}{query_date_lookup}{self.query_field_lookup}"
-                )
+        field_key = f"{field_name}{query_date_lookup}{self.query_field_lookup}"
+        if has_timezone:
+            timezone_string = field.get_timezone()
+            tmp_field_name = f"{field_name}_timezone_{timezone_string}"
+            field_key = f"{tmp_field_name}{query_date_lookup}{self.query_field_lookup}"
 
-                return AnnotatedQ(
-                    annotation={
-                        f"{tmp_field_name}": Timezone(field_name, timezone_string)
-                    },
-                    q={field_key: parsed_date},
-                )
-            else:
-                return Q(**{field_key: parsed_date})
-        except (ParserError, ValueError):
-            return Q()
+            return AnnotatedQ(
+                annotation={f"{tmp_field_name}": Timezone(field_name, timezone_string)},
+                q={field_key: parsed_date},
+            )
+        else:
+            return Q(**{field_key: parsed_date})
 
 
 class DateBeforeViewFilterType(BaseDateFieldLookupFilterType):
@@ -426,7 +553,7 @@ class DateBeforeViewFilterType(BaseDateFieldLookupFilterType):
     """
 
     type = "date_before"
-    query_field_lookup = "__lt"
+    can_use_index = True
     compatible_field_types = [
         DateFieldType.type,
         LastModifiedFieldType.type,
@@ -436,6 +563,9 @@ class DateBeforeViewFilterType(BaseDateFieldLookupFilterType):
         ),
     ]
 
+    def get_date_range(self, parsed_date):
+        return None, parsed_date
+
 
 class DateAfterViewFilterType(BaseDateFieldLookupFilterType):
     """
@@ -445,7 +575,14 @@ class DateAfterViewFilterType(BaseDateFieldLookupFilterType):
     """
 
     type = "date_after"
-    query_field_lookup = "__gt"
+    can_use_index = True
+
+    def get_date_range(self, parsed_date):
+        next_day = get_next_day(parsed_date)
+        if next_day is None:
+            # Nothing can be after the last date that can be represented.
+            return parsed_date, parsed_date
+        return next_day, None
 
 
 class DateEqualsTodayViewFilterType(ViewFilterType):
@@ -454,6 +591,7 @@ class DateEqualsTodayViewFilterType(ViewFilterType):
     """
 
     type = "date_equals_today"
+    depends_on_current_time = True
     compatible_field_types = [
         DateFieldType.type,
         LastModifiedFieldType.type,
@@ -470,25 +608,12 @@ class DateEqualsTodayViewFilterType(ViewFilterType):
         field_has_timezone = hasattr(field, "timezone")
         now = datetime.utcnow().astimezone(timezone_object)
 
-        def make_query_dict(query_field_name):
-            query_dict = dict()
-            if "year" in self.query_for:
-                query_dict[f"{query_field_name}__year"] = now.year
-            if "month" in self.query_for:
-                query_dict[f"{query_field_name}__month"] = now.month
-            if "day" in self.query_for:
-                query_dict[f"{query_field_name}__day"] = now.day
-
-            return query_dict
-
-        if field_has_timezone:
-            tmp_field_name = f"{field_name}_timezone_{timezone_string}"
-            return AnnotatedQ(
-                annotation={f"{tmp_field_name}": Timezone(field_name, timezone_string)},
-                q=make_query_dict(tmp_field_name),
-            )
-        else:
-            return Q(**make_query_dict(field_name))
+        return get_date_range_filter(
+            field_name,
+            model_field,
+            *get_period_range(now.date(), self.query_for),
+            timezone_string if field_has_timezone else "UTC",
+        )
 
 
 class DateEqualsDaysAgoViewFilterType(ViewFilterType):
@@ -501,6 +626,7 @@ class DateEqualsDaysAgoViewFilterType(ViewFilterType):
     """
 
     type = "date_equals_days_ago"
+    depends_on_current_time = True
     compatible_field_types = [
         DateFieldType.type,
         LastModifiedFieldType.type,
@@ -536,25 +662,12 @@ class DateEqualsDaysAgoViewFilterType(ViewFilterType):
             # returns nothing because dates could not be before epoch
             return Q(pk__in=[])
 
-        def make_query_dict(query_field_name):
-            query_dict = dict()
-            if "year" in self.query_for:
-                query_dict[f"{query_field_name}__year"] = when.year
-            if "month" in self.query_for:
-                query_dict[f"{query_field_name}__month"] = when.month
-            if "day" in self.query_for:
-                query_dict[f"{query_field_name}__day"] = when.day
-
-            return query_dict
-
-        if field_has_timezone:
-            tmp_field_name = f"{field_name}_timezone_{timezone_string}"
-            return AnnotatedQ(
-                annotation={f"{tmp_field_name}": Timezone(field_name, timezone_string)},
-                q=make_query_dict(tmp_field_name),
-            )
-        else:
-            return Q(**make_query_dict(field_name))
+        return get_date_range_filter(
+            field_name,
+            model_field,
+            *get_period_range(when.date(), self.query_for),
+            timezone_string if field_has_timezone else "UTC",
+        )
 
 
 class DateEqualsCurrentMonthViewFilterType(DateEqualsTodayViewFilterType):
@@ -688,20 +801,26 @@ class ManyToManyHasBaseViewFilter(ViewFilterType):
         value = value.strip()
 
         try:
-            # We annotate the queryset with an aggregated Array containing all the ids
-            # of the related field. Then we filter on this annoted column by checking
-            # which of the items in the array overlap with a new Array containing the
-            # value of the filter. That way we can make sure that chaining more than
-            # one filter works correctly.
-            return AnnotatedQ(
-                annotation={
-                    f"{field_name}_array": ArrayAgg(Cast(field_name, IntegerField())),
-                },
-                q={f"{field_name}_array__overlap": [int(value)]},
-            )
+            value = int(value)
         except ValueError:
             return Q()
 
+        # We check whether a relation to the provided ID exists in the through table
+        # of the field using a correlated subquery. Contrary to joining the through
+        # table, this doesn't duplicate the rows, so that chaining, OR-ing and negating
+        # more than one filter works correctly without grouping the rows.
+        through_model = model_field.remote_field.through
+        return Q(
+            Exists(
+                through_model.objects.filter(
+                    **{
+                        model_field.m2m_field_name(): OuterRef("pk"),
+                        model_field.m2m_reverse_field_name(): value,
+                    }
+                )
+            )
+        )
+
 
 class LinkRowHasViewFilterType(ManyToManyHasBaseViewFilter):
     """
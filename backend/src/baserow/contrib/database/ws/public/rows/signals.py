@@ -5,7 +5,7 @@ from django.dispatch import receiver
 
 from baserow.contrib.database.api.constants import PUBLIC_PLACEHOLDER_ENTITY_ID
 from baserow.contrib.database.api.rows.serializers import (
-    get_row_serializer_class,
+    get_compiled_row_serializer,
     RowSerializer,
 )
 from baserow.contrib.database.rows import signals as row_signals
@@ -13,6 +13,9 @@ from baserow.contrib.database.table.models import GeneratedTableModel
 from baserow.contrib.database.views.handler import PublicViewRows, ViewHandler
 from baserow.contrib.database.views.models import View
 from baserow.contrib.database.views.registries import view_type_registry
+from baserow.contrib.database.ws.public.views.signals import (
+    _send_force_rows_refresh_if_view_public,
+)
 from baserow.contrib.database.ws.rows.signals import (
     before_row_update,
     before_rows_update,
@@ -22,9 +25,8 @@ from baserow.ws.registries import page_registry
 
 
 def _serialize_row(model, row, many=False):
-    return get_row_serializer_class(model, RowSerializer, is_response=True)(
-        row, many=many
-    ).data
+    serialize_row = get_compiled_row_serializer(model, RowSerializer)
+    return [serialize_row(r) for r in row] if many else serialize_row(row)
 
 
 def _send_row_created_event_to_views(
@@ -140,7 +142,12 @@ def public_row_created(sender, row, before, user, table, model, **kwargs):
 
 
 @receiver(row_signals.rows_created)
-def public_rows_created(sender, rows, before, user, table, model, **kwargs):
+def public_rows_created(
+    sender, rows, before, user, table, model, send_realtime_update=True, **kwargs
+):
+    if not send_realtime_update:
+        return
+
     row_checker = ViewHandler().get_public_views_row_checker(
         table, model, only_include_views_which_want_realtime_events=True
     )
@@ -167,7 +174,12 @@ def public_before_row_delete(sender, row, user, table, model, **kwargs):
 
 
 @receiver(row_signals.before_rows_delete)
-def public_before_rows_delete(sender, rows, user, table, model, **kwargs):
+def public_before_rows_delete(
+    sender, rows, user, table, model, send_realtime_update=True, **kwargs
+):
+    if not send_realtime_update:
+        return
+
     row_checker = ViewHandler().get_public_views_row_checker(
         table, model, only_include_views_which_want_realtime_events=True
     )
@@ -195,7 +207,12 @@ def public_row_deleted(
 
 
 @receiver(row_signals.rows_deleted)
-def public_rows_deleted(sender, rows, user, table, model, before_return, **kwargs):
+def public_rows_deleted(
+    sender, rows, user, table, model, before_return, send_realtime_update=True, **kwargs
+):
+    if not send_realtime_update:
+        return
+
     public_views = dict(before_return)[public_before_rows_delete][
         "deleted_rows_public_views"
     ]
@@ -228,8 +245,18 @@ def public_before_row_update(
 
 @receiver(row_signals.before_rows_update)
 def public_before_rows_update(
-    sender, rows, user, table, model, updated_field_ids, **kwargs
+    sender,
+    rows,
+    user,
+    table,
+    model,
+    updated_field_ids,
+    send_realtime_update=True,
+    **kwargs
 ):
+    if not send_realtime_update:
+        return
+
     row_checker = ViewHandler().get_public_views_row_checker(
         table,
         model,
@@ -313,8 +340,19 @@ def public_row_updated(
 
 @receiver(row_signals.rows_updated)
 def public_rows_updated(
-    sender, rows, user, table, model, before_return, updated_field_ids, **kwargs
+    sender,
+    rows,
+    user,
+    table,
+    model,
+    before_return,
+    updated_field_ids,
+    send_realtime_update=True,
+    **kwargs
 ):
+    if not send_realtime_update:
+        return
+
     before_return_dict = dict(before_return)[public_before_rows_update]
     serialized_old_rows = dict(before_return)[before_rows_update]
     serialized_updated_rows = _serialize_row(model, rows, many=True)
@@ -425,3 +463,23 @@ def public_rows_updated(
             )
 
     transaction.on_commit(_send_created_updated_deleted_row_signals_to_views)
+
+
+def _send_force_rows_refresh_to_public_views(table):
+    for view in View.objects.filter(table=table, public=True):
+        _send_force_rows_refresh_if_view_public(view)
+
+
+@receiver(row_signals.rows_batch_job_chunk_processed)
+def public_rows_batch_job_chunk_processed(sender, job, user, table, **kwargs):
+    _send_force_rows_refresh_to_public_views(table)
+
+
+@receiver(row_signals.rows_updated_by_filter)
+def public_rows_updated_by_filter(sender, user, table, model, **kwargs):
+    _send_force_rows_refresh_to_public_views(table)
+
+
+@receiver(row_signals.rows_deleted_by_filter)
+def public_rows_deleted_by_filter(sender, user, table, model, **kwargs):
+    _send_force_rows_refresh_to_public_views(table)
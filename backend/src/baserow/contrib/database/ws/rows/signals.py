@@ -4,7 +4,7 @@ from django.db import transaction
 from django.dispatch import receiver
 
 from baserow.contrib.database.api.rows.serializers import (
-    get_row_serializer_class,
+    get_compiled_row_serializer,
     RowSerializer,
 )
 from baserow.contrib.database.rows import signals as row_signals
@@ -13,6 +13,11 @@ from baserow.contrib.database.table.models import GeneratedTableModel
 from baserow.ws.registries import page_registry
 
 
+def _serialize_rows(model, rows):
+    serialize_row = get_compiled_row_serializer(model, RowSerializer)
+    return [serialize_row(row) for row in rows]
+
+
 @receiver(row_signals.row_created)
 def row_created(sender, row, before, user, table, model, **kwargs):
     table_page_type = page_registry.get("table")
@@ -20,9 +25,7 @@ def row_created(sender, row, before, user, table, model, **kwargs):
         lambda: table_page_type.broadcast(
             RealtimeRowMessages.row_created(
                 table_id=table.id,
-                serialized_row=get_row_serializer_class(
-                    model, RowSerializer, is_response=True
-                )(row).data,
+                serialized_row=get_compiled_row_serializer(model, RowSerializer)(row),
                 metadata=row_metadata_registry.generate_and_merge_metadata_for_row(
                     table, row.id
                 ),
@@ -35,15 +38,18 @@ def row_created(sender, row, before, user, table, model, **kwargs):
 
 
 @receiver(row_signals.rows_created)
-def rows_created(sender, rows, before, user, table, model, **kwargs):
+def rows_created(
+    sender, rows, before, user, table, model, send_realtime_update=True, **kwargs
+):
+    if not send_realtime_update:
+        return
+
     table_page_type = page_registry.get("table")
     transaction.on_commit(
         lambda: table_page_type.broadcast(
             RealtimeRowMessages.rows_created(
                 table_id=table.id,
-                serialized_rows=get_row_serializer_class(
-                    model, RowSerializer, is_response=True
-                )(rows, many=True).data,
+                serialized_rows=_serialize_rows(model, rows),
                 metadata=row_metadata_registry.generate_and_merge_metadata_for_rows(
                     table, [row.id for row in rows]
                 ),
@@ -60,14 +66,24 @@ def before_row_update(sender, row, user, table, model, updated_field_ids, **kwar
     # Generate a serialized version of the row before it is updated. The
     # `row_updated` receiver needs this serialized version because it can't serialize
     # the old row after it has been updated.
-    return get_row_serializer_class(model, RowSerializer, is_response=True)(row).data
+    return get_compiled_row_serializer(model, RowSerializer)(row)
 
 
 @receiver(row_signals.before_rows_update)
-def before_rows_update(sender, rows, user, table, model, updated_field_ids, **kwargs):
-    return get_row_serializer_class(model, RowSerializer, is_response=True)(
-        rows, many=True
-    ).data
+def before_rows_update(
+    sender,
+    rows,
+    user,
+    table,
+    model,
+    updated_field_ids,
+    send_realtime_update=True,
+    **kwargs
+):
+    if not send_realtime_update:
+        return
+
+    return _serialize_rows(model, rows)
 
 
 @receiver(row_signals.row_updated)
@@ -80,9 +96,7 @@ def row_updated(
             RealtimeRowMessages.row_updated(
                 table_id=table.id,
                 serialized_row_before_update=dict(before_return)[before_row_update],
-                serialized_row=get_row_serializer_class(
-                    model, RowSerializer, is_response=True
-                )(row).data,
+                serialized_row=get_compiled_row_serializer(model, RowSerializer)(row),
                 metadata=row_metadata_registry.generate_and_merge_metadata_for_row(
                     table, row.id
                 ),
@@ -95,17 +109,26 @@ def row_updated(
 
 @receiver(row_signals.rows_updated)
 def rows_updated(
-    sender, rows, user, table, model, before_return, updated_field_ids, **kwargs
+    sender,
+    rows,
+    user,
+    table,
+    model,
+    before_return,
+    updated_field_ids,
+    send_realtime_update=True,
+    **kwargs
 ):
+    if not send_realtime_update:
+        return
+
     table_page_type = page_registry.get("table")
     transaction.on_commit(
         lambda: table_page_type.broadcast(
             RealtimeRowMessages.rows_updated(
                 table_id=table.id,
                 serialized_rows_before_update=dict(before_return)[before_rows_update],
-                serialized_rows=get_row_serializer_class(
-                    model, RowSerializer, is_response=True
-                )(rows, many=True).data,
+                serialized_rows=_serialize_rows(model, rows),
                 metadata=row_metadata_registry.generate_and_merge_metadata_for_rows(
                     table, [row.id for row in rows]
                 ),
@@ -121,14 +144,17 @@ def before_row_delete(sender, row, user, table, model, **kwargs):
     # Generate a serialized version of the row before it is deleted. The
     # `row_deleted` receiver needs this serialized version because it can't serialize
     # the row after is has been deleted.
-    return get_row_serializer_class(model, RowSerializer, is_response=True)(row).data
+    return get_compiled_row_serializer(model, RowSerializer)(row)
 
 
 @receiver(row_signals.before_rows_delete)
-def before_rows_delete(sender, rows, user, table, model, **kwargs):
-    return get_row_serializer_class(model, RowSerializer, is_response=True)(
-        rows, many=True
-    ).data
+def before_rows_delete(
+    sender, rows, user, table, model, send_realtime_update=True, **kwargs
+):
+    if not send_realtime_update:
+        return
+
+    return _serialize_rows(model, rows)
 
 
 @receiver(row_signals.row_deleted)
@@ -146,7 +172,12 @@ def row_deleted(sender, row_id, row, user, table, model, before_return, **kwargs
 
 
 @receiver(row_signals.rows_deleted)
-def rows_deleted(sender, rows, user, table, model, before_return, **kwargs):
+def rows_deleted(
+    sender, rows, user, table, model, before_return, send_realtime_update=True, **kwargs
+):
+    if not send_realtime_update:
+        return
+
     table_page_type = page_registry.get("table")
     transaction.on_commit(
         lambda: table_page_type.broadcast(
@@ -160,6 +191,35 @@ def rows_deleted(sender, rows, user, table, model, before_return, **kwargs):
     )
 
 
+def _send_force_rows_refresh(table):
+    table_page_type = page_registry.get("table")
+    transaction.on_commit(
+        lambda: table_page_type.broadcast(
+            RealtimeRowMessages.force_rows_refresh(table_id=table.id),
+            None,
+            table_id=table.id,
+        )
+    )
+
+
+@receiver(row_signals.rows_batch_job_chunk_processed)
+def rows_batch_job_chunk_processed(sender, job, user, table, **kwargs):
+    # The rows of a batch job are changed without their realtime events because
+    # serializing every row would be expensive. Instead, a single event that makes
+    # the clients refresh the rows is sent per chunk.
+    _send_force_rows_refresh(table)
+
+
+@receiver(row_signals.rows_updated_by_filter)
+def rows_updated_by_filter(sender, user, table, model, **kwargs):
+    _send_force_rows_refresh(table)
+
+
+@receiver(row_signals.rows_deleted_by_filter)
+def rows_deleted_by_filter(sender, user, table, model, **kwargs):
+    _send_force_rows_refresh(table)
+
+
 class RealtimeRowMessages:
     """
     A collection of functions which construct the payloads for the realtime
@@ -254,3 +314,7 @@ class RealtimeRowMessages:
             "rows": serialized_rows,
             "metadata": metadata,
         }
+
+    @staticmethod
+    def force_rows_refresh(table_id: int) -> Dict[str, Any]:
+        return {"type": "force_rows_refresh", "table_id": table_id}
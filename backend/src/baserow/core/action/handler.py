@@ -10,6 +10,7 @@ from django.db import transaction
 from django.db.models import Q
 from django.utils import timezone
 
+from baserow.api.sessions import get_untrusted_client_session_id
 from baserow.core.action.models import Action
 from baserow.core.action.registries import action_type_registry, ActionScopeStr
 
@@ -136,6 +137,28 @@ class ActionHandler:
 
         return latest_undone_action
 
+    @classmethod
+    def clear_undo_stack(cls, user: AbstractUser, scope: ActionScopeStr):
+        """
+        Deletes all the actions of the user in the current session and the provided
+        scope. This must be called when a change is made that can't be undone,
+        because undoing an earlier action in the same scope would otherwise skip
+        past that change.
+
+        :param user: The user who performed the change that can't be undone.
+        :param scope: The scope in which the change occurred.
+        """
+
+        session = get_untrusted_client_session_id(user)
+        actions = Action.objects.filter(user=user, session=session, scope=scope)
+
+        for action_type in action_type_registry.get_all():
+            if action_type.has_custom_cleanup():
+                for action in actions.filter(type=action_type.type):
+                    action_type.clean_up_any_extra_action_data(action)
+
+        actions.delete()
+
     @classmethod
     def clean_up_old_actions(cls):
         """
@@ -1,8 +1,15 @@
+import asyncio
+import json
 from collections import defaultdict
-from typing import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from io import StringIO
+from itertools import islice
+from typing import Any, Iterable, Iterator, List, Sequence, Type, TypeVar
 
-from django.db import DEFAULT_DB_ALIAS
-from django.db.models import QuerySet, Model
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connection, connections
+from django.db.models import QuerySet, Model, prefetch_related_objects
 from django.db.transaction import Atomic, get_connection
 from django.contrib.contenttypes.models import ContentType
 
@@ -131,3 +138,255 @@ def specific_iterator(queryset: QuerySet) -> Iterable[Model]:
         ordered_specific_objects.append(specific_object)
 
     return ordered_specific_objects
+
+
+def chunked_queryset_iterator(
+    queryset: QuerySet, chunk_size: int = 2000
+) -> Iterable[List[Model]]:
+    """
+    Iterates over the given queryset in chunks using a server side cursor, so that
+    only one chunk of objects is in memory at the same time. Unlike
+    `queryset.iterator()`, the prefetch related lookups of the queryset are
+    respected by prefetching them for every chunk.
+
+    Can be used like:
+
+    for chunk in chunked_queryset_iterator(Table.objects.all(), 100):
+        print(len(chunk))  # 100
+
+    :param queryset: The queryset that must be iterated over.
+    :param chunk_size: The maximum amount of objects in a chunk.
+    """
+
+    prefetch_related_lookups = queryset._prefetch_related_lookups
+    iterator = queryset.prefetch_related(None).iterator(chunk_size=chunk_size)
+
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+
+        if not chunk:
+            break
+
+        if prefetch_related_lookups:
+            prefetch_related_objects(chunk, *prefetch_related_lookups)
+
+        yield chunk
+
+
+T = TypeVar("T")
+
+
+def iterate_outside_event_loop(iterable: Iterable[T]) -> Iterator[T]:
+    """
+    Iterates over the given iterable in a separate thread if the iteration is
+    started in a thread that runs an event loop. Django's ASGI handler consumes the
+    content of a streaming response inside the event loop, where no database queries
+    can be made, so content that queries the database while it's being streamed must
+    be wrapped with this function. The separate thread uses its own database
+    connection, which is closed when the iteration ends.
+
+    :param iterable: The iterable that must be iterated over.
+    :return: An iterator yielding the items of the iterable.
+    """
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        yield from iterable
+        return
+
+    end = object()
+    iterator = None
+
+    def close():
+        try:
+            if hasattr(iterator, "close"):
+                iterator.close()
+        finally:
+            connections.close_all()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        try:
+            iterator = executor.submit(iter, iterable).result()
+            while True:
+                item = executor.submit(next, iterator, end).result()
+                if item is end:
+                    break
+                yield item
+        finally:
+            executor.submit(close).result()
+
+
+# The characters that must be escaped in the text format of the PostgreSQL `COPY`
+# command.
+COPY_TEXT_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _to_copy_array_element(value: Any) -> str:
+    if value is None:
+        return "NULL"
+    if isinstance(value, (list, tuple)):
+        return _to_copy_array(value)
+    if isinstance(value, bool):
+        value = "t" if value else "f"
+    elif isinstance(value, (datetime, date)):
+        value = value.isoformat()
+    elif isinstance(value, dict):
+        value = json.dumps(value)
+    value = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{value}"'
+
+
+def _to_copy_array(value: Sequence[Any]) -> str:
+    return "{" + ",".join(_to_copy_array_element(item) for item in value) + "}"
+
+
+def _to_copy_text(value: Any) -> str:
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (datetime, date)):
+        value = value.isoformat()
+    elif isinstance(value, (list, tuple)):
+        # The prepared value of an `ArrayField`, which must be a PostgreSQL array
+        # literal.
+        value = _to_copy_array(value)
+    elif isinstance(value, dict):
+        value = json.dumps(value)
+    elif hasattr(value, "adapted") and hasattr(value, "dumps"):
+        # A psycopg2 `Json` adapter.
+        value = value.dumps(value.adapted)
+    return str(value).translate(COPY_TEXT_ESCAPES)
+
+
+def copy_bulk_create(
+    model: Type[Model],
+    objs: Sequence[Model],
+    assign_ids: bool = True,
+    chunk_size: int = 10000,
+) -> Sequence[Model]:
+    """
+    Inserts the provided unsaved model instances using the PostgreSQL
+    `COPY FROM STDIN` command, which is a lot faster than an `INSERT` statement
+    when many rows must be inserted at once. Like `bulk_create`, no signals are sent
+    and the `save` method is not called. The `pre_save` of the fields is called, so
+    that for example `auto_now_add` values are set. Values that are an expression
+    can't be sent using `COPY`, so those columns are left out for the objects
+    having such a value and they get their database default. The objects are
+    therefore copied in groups of objects having expressions for the same columns.
+
+    Because `COPY` can't return the ids of the inserted rows, the ids of the objects
+    without one are allocated from the sequence of the table up front.
+
+    :param model: The model of which instances must be inserted.
+    :param objs: The model instances that must be inserted.
+    :param assign_ids: Indicates whether the ids must be set on objects that don't
+        have one yet. If `False`, the database generates the ids of the objects
+        without one, but they're not set on the objects. Explicit ids are inserted
+        as they are.
+    :param chunk_size: The maximum amount of rows that are sent per `COPY` command.
+    :raises ValueError: When `assign_ids` is `False` and only some of the objects
+        have an id.
+    :return: The inserted objects.
+    """
+
+    if not objs:
+        return objs
+
+    meta = model._meta
+    quote_name = connection.ops.quote_name
+    objs_without_id = [obj for obj in objs if obj.pk is None]
+
+    if not assign_ids and 0 < len(objs_without_id) < len(objs):
+        raise ValueError(
+            "Either all or none of the objects must have an id if the ids are not "
+            "assigned."
+        )
+
+    with connection.cursor() as cursor:
+        if assign_ids and objs_without_id:
+            cursor.execute(
+                "SELECT nextval(pg_get_serial_sequence(%s, %s)) "
+                "FROM generate_series(1, %s)",
+                [quote_name(meta.db_table), meta.pk.column, len(objs_without_id)],
+            )
+            for obj, (pk,) in zip(objs_without_id, cursor.fetchall()):
+                obj.pk = pk
+
+        fields = [
+            field
+            for field in meta.concrete_fields
+            if field is not meta.pk or assign_ids or not objs_without_id
+        ]
+
+        # The lines of the objects grouped by the indexes of the fields of which the
+        # value is an expression, because those columns must be left out of the
+        # `COPY` command.
+        lines_per_expression_fields = defaultdict(list)
+        for obj in objs:
+            values = [field.pre_save(obj, add=True) for field in fields]
+            expression_fields = tuple(
+                index
+                for index, value in enumerate(values)
+                if hasattr(value, "resolve_expression")
+            )
+            lines_per_expression_fields[expression_fields].append(
+                "\t".join(
+                    _to_copy_text(field.get_db_prep_save(value, connection))
+                    for field, value in zip(fields, values)
+                    if not hasattr(value, "resolve_expression")
+                )
+            )
+
+        for expression_fields, lines in lines_per_expression_fields.items():
+            sql = "COPY {} ({}) FROM STDIN".format(
+                quote_name(meta.db_table),
+                ", ".join(
+                    quote_name(field.column)
+                    for index, field in enumerate(fields)
+                    if index not in expression_fields
+                ),
+            )
+            for start in range(0, len(lines), chunk_size):
+                buffer = StringIO()
+                for line in lines[start : start + chunk_size]:
+                    buffer.write(line)
+                    buffer.write("\n")
+                buffer.seek(0)
+                cursor.copy_expert(sql, buffer)
+
+    for obj in objs:
+        obj._state.adding = False
+        obj._state.db = connection.alias
+
+    return objs
+
+
+def bulk_insert_uses_copy(objs: Sequence[Model]) -> bool:
+    """
+    Indicates whether `bulk_insert` inserts the provided objects using `COPY`.
+    """
+
+    return len(objs) >= settings.BASEROW_BULK_INSERT_COPY_THRESHOLD
+
+
+def bulk_insert(
+    model: Type[Model], objs: Sequence[Model], assign_ids: bool = True
+) -> Sequence[Model]:
+    """
+    Inserts the provided unsaved model instances using `copy_bulk_create` if there
+    are at least `BASEROW_BULK_INSERT_COPY_THRESHOLD` of them and using the normal
+    `bulk_create` otherwise. Unlike the `COPY` path, `bulk_create` always sets the
+    ids of the objects.
+
+    :param model: The model of which instances must be inserted.
+    :param objs: The model instances that must be inserted.
+    :param assign_ids: Indicates whether the ids must be set on the objects.
+    :return: The inserted objects.
+    """
+
+    if bulk_insert_uses_copy(objs):
+        return copy_bulk_create(model, objs, assign_ids=assign_ids)
+    else:
+        return model.objects.bulk_create(objs)
@@ -1,5 +1,6 @@
 import contextlib
-from typing import TypeVar, Generic, Dict, List, ValuesView, Tuple, Type
+from weakref import WeakKeyDictionary
+from typing import TypeVar, Generic, Dict, List, Optional, ValuesView, Tuple, Type
 
 from django.core.exceptions import ImproperlyConfigured
 
@@ -328,7 +329,10 @@ P = TypeVar("P")
 class ModelRegistryMixin(Generic[P, T]):
     def get_by_model(self, model_instance: P) -> T:
         """
-        Returns a registered instance of the given model class.
+        Returns a registered instance of the given model class. The registered
+        instance is resolved once per model class and then cached until an instance
+        is registered or unregistered, because this method is called for every field
+        in several loops.
 
         :param model_instance: The value that must be or must be an instance of the
             model_class.
@@ -339,12 +343,52 @@ class ModelRegistryMixin(Generic[P, T]):
         :rtype: Instance
         """
 
+        is_class = isinstance(model_instance, type)
+        # The `__class__` is used instead of `type()` because that is also what
+        # `isinstance` respects.
+        model_class = model_instance if is_class else model_instance.__class__
+
+        cache = self._get_model_dispatch_cache()[is_class]
+        value = cache.get(model_class)
+
+        # The registry dict can also be changed directly, for example when a type is
+        # temporarily replaced in a test, so the cached value is only used if it is
+        # still registered.
+        if value is None or self.registry.get(value.type) is not value:
+            value = self._find_by_model_class(model_class, is_class)
+            if value is not None:
+                cache[model_class] = value
+
+        if value is not None:
+            return value
+
+        raise self.does_not_exist_exception_class(
+            f"The {self.name} model instance {model_instance} does not exist."
+        )
+
+    def _find_by_model_class(self, model_class: Type, is_class: bool) -> Optional[T]:
+        """
+        Finds the most specific registered instance of which the model class matches
+        the provided model class.
+
+        :param model_class: The model class or the class of the model instance.
+        :param is_class: Indicates whether the model class itself was provided to
+            `get_by_model` instead of an instance of it. Only the exact model class
+            matches in that case.
+        :return: The most specific registered instance or None if there is no match.
+        """
+
         most_specific_value = None
         for value in self.registry.values():
             value_model_class = value.model_class
-            if value_model_class == model_instance or isinstance(
-                model_instance, value_model_class
-            ):
+            if is_class:
+                matches = value_model_class == model_class or isinstance(
+                    model_class, value_model_class
+                )
+            else:
+                matches = issubclass(model_class, value_model_class)
+
+            if matches:
                 if most_specific_value is None:
                     most_specific_value = value
                 else:
@@ -358,12 +402,32 @@ class ModelRegistryMixin(Generic[P, T]):
                     if value_num_base_classes > most_specific_num_base_classes:
                         most_specific_value = value
 
-        if most_specific_value is not None:
-            return most_specific_value
+        return most_specific_value
 
-        raise self.does_not_exist_exception_class(
-            f"The {self.name} model instance {model_instance} does not exist."
-        )
+    def _get_model_dispatch_cache(
+        self,
+    ) -> Dict[bool, "WeakKeyDictionary[Type, T]"]:
+        """
+        Returns the cached registered instances per model class, separately for when
+        the class itself or an instance is provided. The model classes are weakly
+        referenced because generated table models are replaced when a table changes.
+        """
+
+        # The cache also belongs to the registry dict that it was built from because
+        # that dict can be replaced as a whole, for example when a test restores it.
+        registry, cache = getattr(self, "_model_dispatch_cache", (None, None))
+        if registry is not self.registry:
+            cache = {True: WeakKeyDictionary(), False: WeakKeyDictionary()}
+            self._model_dispatch_cache = (self.registry, cache)
+        return cache
+
+    def register(self, instance: T):
+        super().register(instance)
+        self._model_dispatch_cache = (None, None)
+
+    def unregister(self, value: T):
+        super().unregister(value)
+        self._model_dispatch_cache = (None, None)
 
 
 class CustomFieldsRegistryMixin:
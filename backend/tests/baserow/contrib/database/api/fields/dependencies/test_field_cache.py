@@ -2,6 +2,7 @@ import pytest
 
 from baserow.contrib.database.fields.field_cache import FieldCache
 from baserow.contrib.database.fields.models import Field
+from baserow.contrib.database.table.cache import clear_generated_model_cache
 
 
 @pytest.mark.django_db
@@ -159,6 +160,7 @@ def test_can_just_add_model_fields_to_cache(
 @pytest.mark.django_db
 def test_can_get_model_via_cache(api_client, data_fixture, django_assert_num_queries):
     field = data_fixture.create_text_field(name="field")
+    clear_generated_model_cache()
     # 1st query to get all fields in the table
     # 2nd query to lookup specific instance for the only field
     with django_assert_num_queries(2):
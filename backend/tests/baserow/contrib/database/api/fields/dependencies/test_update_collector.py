@@ -95,8 +95,9 @@ def test_can_only_trigger_update_for_rows_joined_to_a_starting_row_across_a_m2m(
     # Cache the models so we are only asserting about the update queries
     update_collector.cache_model(first_table.get_model())
     update_collector.cache_model(second_table.get_model())
-    # Only one field was updated so only one update statement is expected
-    with django_assert_num_queries(1):
+    # Only one field was updated so only one update statement is expected, together
+    # with one query logging the changed rows.
+    with django_assert_num_queries(2):
         updated_fields = update_collector.apply_updates_and_get_updated_fields()
 
     # No field in the starting table (second_table) was updated
@@ -172,8 +173,9 @@ def test_can_trigger_update_for_rows_joined_to_a_starting_row_across_a_m2m_and_b
     # Cache the models so we are only asserting about the update queries
     update_collector.cache_model(first_table.get_model())
     update_collector.cache_model(second_table.get_model())
-    # Two fields were updated with an update statement for each table
-    with django_assert_num_queries(2):
+    # Two fields were updated with an update statement for each table, both reached
+    # via a path from the starting row, so their changed rows are logged as well.
+    with django_assert_num_queries(4):
         updated_fields = update_collector.apply_updates_and_get_updated_fields()
 
     assert updated_fields == [second_table_primary_field]
@@ -263,8 +265,8 @@ def test_update_statements_at_the_same_path_node_are_grouped_into_one(
     update_collector.cache_model(first_table.get_model())
     update_collector.cache_model(second_table.get_model())
     # Three fields were updated but two are in the same path node (same table) and so
-    # only one update per table expected
-    with django_assert_num_queries(2):
+    # only one update and one query logging the changed rows per table expected
+    with django_assert_num_queries(4):
         updated_fields = update_collector.apply_updates_and_get_updated_fields()
 
     assert updated_fields == [second_table_primary_field]
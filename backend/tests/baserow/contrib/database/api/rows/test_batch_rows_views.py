@@ -538,12 +538,12 @@ def test_batch_create_rows_ordering_before_row(api_client, data_fixture):
             {
                 "id": 3,
                 f"field_{number_field.id}": "120",
-                "order": "1.99999999999999999998",
+                "order": "1.33333333333333333334",
             },
             {
                 "id": 4,
                 f"field_{number_field.id}": "240",
-                "order": "1.99999999999999999999",
+                "order": "1.66666666666666666667",
             },
         ]
     }
@@ -1811,6 +1811,126 @@ def test_batch_update_rows_num_of_queries(api_client, data_fixture):
     )
 
 
+# Upsert
+
+
+@pytest.mark.django_db
+@pytest.mark.api_rows
+def test_batch_upsert_rows(api_client, data_fixture):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    key_field = data_fixture.create_text_field(table=table, name="Key", primary=True)
+    number_field = data_fixture.create_number_field(table=table, name="Number")
+    model = table.get_model()
+    row_1 = model.objects.create(
+        **{f"field_{key_field.id}": "a", f"field_{number_field.id}": 1}
+    )
+    row_2 = model.objects.create(
+        **{f"field_{key_field.id}": "b", f"field_{number_field.id}": 2}
+    )
+    url = reverse("api:database:rows:batch", kwargs={"table_id": table.id})
+
+    response = api_client.put(
+        f"{url}?key_field_id={key_field.id}&user_field_names=true",
+        {
+            "items": [
+                {"Key": "c", "Number": 30},
+                {"Key": "b", "Number": 20},
+                {"Number": 40},
+            ]
+        },
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_200_OK
+    items = response.json()["items"]
+    assert [(item["Key"], item["Number"]) for item in items] == [
+        ("c", "30"),
+        ("b", "20"),
+        (None, "40"),
+    ]
+    assert items[1]["id"] == row_2.id
+    assert row_1.id not in [item["id"] for item in items]
+    assert model.objects.count() == 4
+    row_2.refresh_from_db()
+    assert getattr(row_2, f"field_{number_field.id}") == 20
+
+    response = api_client.put(
+        f"{url}?key_field_id={key_field.id}",
+        {
+            "items": [
+                {f"field_{key_field.id}": "d"},
+                {f"field_{key_field.id}": "d"},
+            ]
+        },
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_UPSERT_KEY_VALUES_NOT_UNIQUE"
+
+    model.objects.create(**{f"field_{key_field.id}": "a"})
+    response = api_client.put(
+        f"{url}?key_field_id={key_field.id}",
+        {"items": [{f"field_{key_field.id}": "a"}]},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_UPSERT_KEY_MATCHES_MULTIPLE_ROWS"
+
+    formula_field = data_fixture.create_formula_field(table=table, formula="'a'")
+    response = api_client.put(
+        f"{url}?key_field_id={formula_field.id}",
+        {"items": [{f"field_{key_field.id}": "a"}]},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_INCOMPATIBLE_UPSERT_KEY_FIELD"
+
+    response = api_client.put(
+        f"{url}?key_field_id=9999",
+        {"items": [{f"field_{key_field.id}": "a"}]},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_404_NOT_FOUND
+    assert response.json()["error"] == "ERROR_FIELD_DOES_NOT_EXIST"
+
+    response = api_client.put(
+        url,
+        {"items": [{f"field_{key_field.id}": "a"}]},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_QUERY_PARAMETER_VALIDATION"
+
+
+@pytest.mark.django_db
+@pytest.mark.api_rows
+def test_batch_upsert_rows_token_permissions(api_client, data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    key_field = data_fixture.create_text_field(table=table, primary=True)
+    token = TokenHandler().create_token(user, table.database.group, "Good")
+    url = reverse("api:database:rows:batch", kwargs={"table_id": table.id})
+
+    for create, update in [(True, False), (False, True)]:
+        TokenHandler().update_token_permissions(
+            user, token, create=create, read=True, update=update, delete=True
+        )
+        response = api_client.put(
+            f"{url}?key_field_id={key_field.id}",
+            {"items": [{f"field_{key_field.id}": "a"}]},
+            format="json",
+            HTTP_AUTHORIZATION=f"Token {token.key}",
+        )
+        assert response.status_code == HTTP_401_UNAUTHORIZED
+        assert response.json()["error"] == "ERROR_NO_PERMISSION_TO_TABLE"
+
+
 # Delete
 
 
@@ -2132,3 +2252,179 @@ def test_batch_delete_rows_num_of_queries(api_client, data_fixture):
     assert len(delete_one_row_ctx.captured_queries) == len(
         delete_multiple_rows_ctx.captured_queries
     )
+
+
+# Update and delete by filter
+
+
+@pytest.mark.django_db
+@pytest.mark.api_rows
+def test_update_rows_by_filter(api_client, data_fixture):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    other_table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="Name")
+    number_field = data_fixture.create_number_field(table=table, name="Number")
+    grid_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=grid_view, field=number_field, type="higher_than", value="1"
+    )
+    model = table.get_model()
+    row_1, row_2, row_3 = [
+        model.objects.create(**{f"field_{number_field.id}": value})
+        for value in [1, 2, 3]
+    ]
+    url = reverse("api:database:rows:update-by-filter", kwargs={"table_id": table.id})
+
+    response = api_client.patch(
+        url,
+        {"values": {"Name": "Test"}},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_REQUEST_BODY_VALIDATION"
+    assert response.json()["detail"]["non_field_errors"][0]["error"] == (
+        "Either the `view_id` or the `filters` must be provided."
+    )
+
+    response = api_client.patch(
+        url,
+        {"filters": {"field_1": ["1"]}, "values": {}},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["detail"]["filters"][0]["code"] == "invalid"
+
+    response = api_client.patch(
+        url,
+        {"view_id": grid_view.id},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["detail"]["values"][0]["code"] == "invalid"
+
+    response = api_client.patch(
+        url,
+        {
+            "view_id": data_fixture.create_grid_view(table=other_table).id,
+            "values": {},
+        },
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_VIEW_NOT_IN_TABLE"
+
+    response = api_client.patch(
+        url,
+        {"view_id": 0, "values": {}},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_404_NOT_FOUND
+    assert response.json()["error"] == "ERROR_VIEW_DOES_NOT_EXIST"
+
+    response = api_client.patch(
+        url,
+        {
+            "filters": {f"filter__field_{number_field.id}__boolean": ["1"]},
+            "values": {},
+        },
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_VIEW_FILTER_TYPE_UNSUPPORTED_FIELD"
+
+    response = api_client.patch(
+        f"{url}?user_field_names",
+        {
+            "view_id": grid_view.id,
+            "filters": {f"filter__field_{number_field.id}__lower_than": ["3"]},
+            "values": {"Name": "Test"},
+        },
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_200_OK
+    assert response.json() == {"count": 1}
+    assert list(
+        model.objects.order_by("id").values_list(f"field_{text_field.id}", flat=True)
+    ) == [None, "Test", None]
+
+    response = api_client.patch(
+        url,
+        {
+            "filters": {f"filter__field_{number_field.id}__equal": ["1", "3"]},
+            "filter_type": "OR",
+            "values": {f"field_{text_field.id}": "Other"},
+        },
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_200_OK
+    assert response.json() == {"count": 2}
+    assert list(
+        model.objects.order_by("id").values_list(f"field_{text_field.id}", flat=True)
+    ) == ["Other", "Test", "Other"]
+
+
+@pytest.mark.django_db
+@pytest.mark.api_rows
+def test_delete_rows_by_filter(api_client, data_fixture):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=grid_view, field=number_field, type="higher_than", value="1"
+    )
+    model = table.get_model()
+    row_1, row_2, row_3 = [
+        model.objects.create(**{f"field_{number_field.id}": value})
+        for value in [1, 2, 3]
+    ]
+    url = reverse("api:database:rows:delete-by-filter", kwargs={"table_id": table.id})
+
+    token = TokenHandler().create_token(user, table.database.group, "Token")
+    TokenHandler().update_token_permissions(user, token, True, True, True, False)
+    response = api_client.post(
+        url,
+        {"view_id": grid_view.id},
+        format="json",
+        HTTP_AUTHORIZATION=f"Token {token.key}",
+    )
+    assert response.status_code == HTTP_401_UNAUTHORIZED
+    assert response.json()["error"] == "ERROR_NO_PERMISSION_TO_TABLE"
+
+    response = api_client.post(
+        url,
+        {"filters": {}},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_REQUEST_BODY_VALIDATION"
+
+    response = api_client.post(
+        url,
+        {"filters": {"filter__field_0__equal": ["1"]}},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_FILTER_FIELD_NOT_FOUND"
+
+    response = api_client.post(
+        url,
+        {"view_id": grid_view.id},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_200_OK
+    assert response.json() == {"count": 2}
+    assert list(model.objects.values_list("id", flat=True)) == [row_1.id]
+    assert model.objects_and_trash.filter(trashed=True).count() == 2
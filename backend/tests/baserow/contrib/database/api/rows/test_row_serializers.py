@@ -4,6 +4,7 @@ import pytest
 from rest_framework import serializers
 
 from baserow.contrib.database.api.rows.serializers import (
+    get_compiled_row_serializer,
     get_row_serializer_class,
     get_example_row_serializer_class,
     remap_serialized_row_to_user_field_names,
@@ -363,3 +364,127 @@ def test_remap_serialized_row_to_user_field_names(data_fixture):
         "Link": [{"id": 1, "value": "Lookup 1"}],
         "Test 1": "Test value",
     }
+
+
+@pytest.mark.django_db
+def test_get_row_serializer_class_is_memoized_per_model_version(
+    data_fixture, monkeypatch
+):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table, name="Text")
+    number_field = data_fixture.create_number_field(table=table, name="Number")
+    model = table.get_model()
+
+    serializer_class = get_row_serializer_class(
+        model, RowSerializer, is_response=True, user_field_names=True
+    )
+    assert serializer_class is get_row_serializer_class(
+        model, RowSerializer, is_response=True, user_field_names=True
+    )
+    assert serializer_class is not get_row_serializer_class(
+        model, RowSerializer, is_response=True
+    )
+    assert serializer_class is not get_row_serializer_class(
+        model, RowSerializer, user_field_names=True
+    )
+
+    subset_serializer_class = get_row_serializer_class(
+        model, RowSerializer, field_ids=[text_field.id]
+    )
+    assert subset_serializer_class is get_row_serializer_class(
+        model, RowSerializer, field_ids={text_field.id}
+    )
+    assert list(subset_serializer_class().fields) == [
+        "id",
+        "order",
+        f"field_{text_field.id}",
+    ]
+
+    field_kwargs = {f"field_{number_field.id}": {"required": True}}
+    required_serializer_class = get_row_serializer_class(
+        model, field_kwargs=field_kwargs
+    )
+    assert required_serializer_class is get_row_serializer_class(
+        model, field_kwargs={f"field_{number_field.id}": {"required": True}}
+    )
+    assert required_serializer_class is not get_row_serializer_class(
+        model, field_kwargs={f"field_{number_field.id}": {"required": False}}
+    )
+    assert not required_serializer_class(data={}).is_valid()
+
+    # Models generated for the same version of the table share the serializers,
+    # also if they only contain some of the fields.
+    projected_serializer_class = get_row_serializer_class(
+        table.get_model(field_ids=[text_field.id]), RowSerializer
+    )
+    assert projected_serializer_class is get_row_serializer_class(
+        table.get_model(field_ids=[text_field.id]), RowSerializer
+    )
+    assert projected_serializer_class is not get_row_serializer_class(
+        model, RowSerializer
+    )
+    assert list(projected_serializer_class().fields) == [
+        "id",
+        "order",
+        f"field_{text_field.id}",
+    ]
+
+    # A model that isn't generated from the cached fields doesn't use the cache.
+    uncached_model = table.get_model(use_cache=False)
+    assert get_row_serializer_class(
+        uncached_model, RowSerializer
+    ) is not get_row_serializer_class(uncached_model, RowSerializer)
+
+    # A model generated after a schema change doesn't use the serializer of the old
+    # model.
+    data_fixture.create_boolean_field(table=table, name="Boolean")
+    new_model = table.get_model()
+    assert new_model is not model
+    new_serializer_class = get_row_serializer_class(
+        new_model, RowSerializer, is_response=True, user_field_names=True
+    )
+    assert new_serializer_class is not serializer_class
+    assert "Boolean" in new_serializer_class().fields
+
+    monkeypatch.setattr(
+        "baserow.contrib.database.api.rows.serializers."
+        "ROW_SERIALIZER_CLASS_CACHE_SIZE",
+        1,
+    )
+    get_row_serializer_class(new_model, RowSerializer)
+    assert new_serializer_class is not get_row_serializer_class(
+        new_model, RowSerializer, is_response=True, user_field_names=True
+    )
+
+
+@pytest.mark.django_db
+def test_compiled_row_serializer_output_is_identical(data_fixture):
+    table, user, row, _ = setup_interesting_test_table(data_fixture)
+    model = table.get_model()
+    field_ids = [
+        field_object["field"].id
+        for field_object in list(model._field_objects.values())[::2]
+    ]
+
+    for kwargs in [
+        {},
+        {"user_field_names": True},
+        {"field_ids": field_ids},
+        {"field_ids": field_ids, "user_field_names": True},
+    ]:
+        serializer_class = get_row_serializer_class(
+            model, RowSerializer, is_response=True, **kwargs
+        )
+        serialize_row = get_compiled_row_serializer(model, RowSerializer, **kwargs)
+        assert serialize_row is get_compiled_row_serializer(
+            model, RowSerializer, **kwargs
+        )
+
+        rows = list(model.objects.all().enhance_by_fields())
+        expected = json.dumps(serializer_class(rows, many=True).data)
+        assert json.dumps([serialize_row(r) for r in rows]) == expected
+
+        # Without prefetching the related objects.
+        rows = list(model.objects.all())
+        expected = json.dumps(serializer_class(rows, many=True).data)
+        assert json.dumps([serialize_row(r) for r in rows]) == expected
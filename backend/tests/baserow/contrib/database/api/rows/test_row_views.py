@@ -1,18 +1,27 @@
+import json
 from decimal import Decimal
 
 import pytest
+from asgiref.sync import async_to_sync
+from asgiref.testing import ApplicationCommunicator
 from django.shortcuts import reverse
 from rest_framework.status import (
     HTTP_200_OK,
+    HTTP_304_NOT_MODIFIED,
     HTTP_400_BAD_REQUEST,
     HTTP_401_UNAUTHORIZED,
     HTTP_404_NOT_FOUND,
 )
 
+from baserow.config.asgi import application
+from baserow.contrib.database.api.rows.views import StreamRowsView
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.registries import field_type_registry
+from baserow.contrib.database.rows.change_log import RowChangeLogHandler
 from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.rows.order import bump_table_row_order_version
 from baserow.contrib.database.table.cache import invalidate_table_in_model_cache
+from baserow.contrib.database.table.change_sequence import bump_table_change_sequences
 from baserow.contrib.database.tokens.handler import TokenHandler
 from baserow.test_utils.helpers import setup_interesting_test_table
 
@@ -206,6 +215,24 @@ def test_list_rows(api_client, data_fixture):
     assert len(response_json["results"]) == 1
     assert response_json["results"][0]["id"] == row_4.id
 
+    response = api_client.get(
+        f"{url}?search=200&search_mode=full-text",
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_200_OK
+    assert response_json["count"] == 1
+    assert response_json["results"][0]["id"] == row_4.id
+
+    response = api_client.get(
+        f"{url}?search=200&search_mode=unknown",
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_QUERY_PARAMETER_VALIDATION"
+
     url = reverse("api:database:rows:list", kwargs={"table_id": table.id})
     response = api_client.get(
         f"{url}?order_by=field_999999",
@@ -534,7 +561,7 @@ def test_create_row(api_client, data_fixture):
     assert response_json_row_5[f"field_{number_field.id}"] == "480"
     assert not response_json_row_5[f"field_{boolean_field.id}"]
     assert response_json_row_5[f"field_{text_field_2.id}"] == ""
-    assert response_json_row_5["order"] == "2.99999999999999999999"
+    assert response_json_row_5["order"] == "2.50000000000000000000"
 
     token.refresh_from_db()
     assert token.handled_calls == 2
@@ -1131,12 +1158,12 @@ def test_move_row(api_client, data_fixture):
     response_json_row_1 = response.json()
     assert response.status_code == HTTP_200_OK
     assert response_json_row_1["id"] == row_1.id
-    assert response_json_row_1["order"] == "2.99999999999999999999"
+    assert response_json_row_1["order"] == "2.50000000000000000000"
 
     row_1.refresh_from_db()
     row_2.refresh_from_db()
     row_3.refresh_from_db()
-    assert row_1.order == Decimal("2.99999999999999999999")
+    assert row_1.order == Decimal("2.50000000000000000000")
     assert row_2.order == Decimal("2.00000000000000000000")
     assert row_3.order == Decimal("3.00000000000000000000")
 
@@ -1360,6 +1387,9 @@ def test_list_rows_with_attribute_names(api_client, data_fixture):
             f"field_{field_3.id}": True,
         }
     )
+    # The row is not created via the handler, so the cached counts are not
+    # invalidated automatically.
+    bump_table_change_sequences([table.id])
 
     url = reverse("api:database:rows:list", kwargs={"table_id": table.id})
     response = api_client.get(
@@ -1522,6 +1552,7 @@ def test_list_rows_returns_https_next_url(api_client, data_fixture, settings):
                 f"field_{field_1.id}": f"name {i}",
             }
         )
+    bump_table_change_sequences([table.id])
 
     url = reverse("api:database:rows:list", kwargs={"table_id": table.id})
     response = api_client.get(
@@ -1552,6 +1583,343 @@ def test_list_rows_returns_https_next_url(api_client, data_fixture, settings):
     )
 
 
+@pytest.mark.django_db
+def test_list_rows_with_cursor_pagination(api_client, data_fixture):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(name="Name", table=table, primary=True)
+    number_field = data_fixture.create_number_field(
+        name="Number", table=table, number_decimal_places=1
+    )
+
+    model = table.get_model()
+    values = [
+        ("b", 1),
+        (None, 2),
+        ("a", None),
+        ("b", None),
+        ("a", 1),
+        (None, None),
+        ("c", 3),
+        ("b", 1),
+        ("a", 2),
+    ]
+    for index, (text, number) in enumerate(values):
+        model.objects.create(
+            order=Decimal(len(values) - index // 2),
+            **{f"field_{text_field.id}": text, f"field_{number_field.id}": number},
+        )
+
+    url = reverse("api:database:rows:list", kwargs={"table_id": table.id})
+    for order_by in [
+        None,
+        f"field_{number_field.id}",
+        f"-field_{number_field.id}",
+        f"field_{text_field.id},-field_{number_field.id}",
+        f"-field_{text_field.id},field_{number_field.id}",
+    ]:
+        query = f"order_by={order_by}&" if order_by else ""
+        response = api_client.get(
+            f"{url}?{query}size=100", HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+        )
+        assert response.status_code == HTTP_200_OK
+        expected_ids = [row["id"] for row in response.json()["results"]]
+        assert len(expected_ids) == len(values)
+
+        ids = []
+        next_url = f"{url}?{query}size=2&cursor="
+        while next_url:
+            response = api_client.get(next_url, HTTP_AUTHORIZATION=f"JWT {jwt_token}")
+            assert response.status_code == HTTP_200_OK
+            response_json = response.json()
+            assert "count" not in response_json
+            assert len(response_json["results"]) <= 2
+            ids += [row["id"] for row in response_json["results"]]
+            next_url = response_json["next"]
+
+        assert ids == expected_ids, order_by
+
+    response = api_client.get(
+        f"{url}?cursor=invalid", HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_INVALID_CURSOR"
+
+    response = api_client.get(
+        f"{url}?size=2&cursor=", HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    response = api_client.get(
+        f"{response.json()['next']}&order_by=field_{text_field.id}",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_INVALID_CURSOR"
+
+    response = api_client.get(
+        f"{url}?size=2&cursor=", HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    next_url = response.json()["next"]
+    bump_table_row_order_version(table.id)
+    response = api_client.get(next_url, HTTP_AUTHORIZATION=f"JWT {jwt_token}")
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_CURSOR_EXPIRED"
+
+
+@pytest.mark.django_db
+def test_list_rows_etag(api_client, data_fixture):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    date_field = data_fixture.create_date_field(table=table, primary=True)
+    url = reverse("api:database:rows:list", kwargs={"table_id": table.id})
+
+    response = api_client.get(url, HTTP_AUTHORIZATION=f"JWT {jwt_token}")
+    assert response.status_code == HTTP_200_OK
+    etag = response["ETag"]
+
+    response = api_client.get(
+        url, HTTP_AUTHORIZATION=f"JWT {jwt_token}", HTTP_IF_NONE_MATCH=etag
+    )
+    assert response.status_code == HTTP_304_NOT_MODIFIED
+    assert response["ETag"] == etag
+    assert response.content == b""
+
+    response = api_client.get(
+        url, HTTP_AUTHORIZATION=f"JWT {jwt_token}", HTTP_IF_NONE_MATCH=f"W/{etag}"
+    )
+    assert response.status_code == HTTP_304_NOT_MODIFIED
+
+    RowHandler().create_row(user, table, {})
+    response = api_client.get(
+        url, HTTP_AUTHORIZATION=f"JWT {jwt_token}", HTTP_IF_NONE_MATCH=etag
+    )
+    assert response.status_code == HTTP_200_OK
+    assert len(response.json()["results"]) == 1
+    assert response["ETag"] != etag
+    etag = response["ETag"]
+
+    FieldHandler().create_field(user, table, "text", name="Text")
+    response = api_client.get(
+        url, HTTP_AUTHORIZATION=f"JWT {jwt_token}", HTTP_IF_NONE_MATCH=etag
+    )
+    assert response.status_code == HTTP_200_OK
+    assert response["ETag"] != etag
+    etag = response["ETag"]
+
+    # The response can change without a change to the table if filtered on today.
+    response = api_client.get(
+        f"{url}?filter__field_{date_field.id}__date_equals_today=UTC",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+        HTTP_IF_NONE_MATCH=etag,
+    )
+    assert response.status_code == HTTP_200_OK
+    assert "ETag" not in response
+
+    user_2, jwt_token_2 = data_fixture.create_user_and_token()
+    response = api_client.get(
+        url, HTTP_AUTHORIZATION=f"JWT {jwt_token_2}", HTTP_IF_NONE_MATCH=etag
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_USER_NOT_IN_GROUP"
+
+
+@pytest.mark.django_db
+def test_stream_rows(api_client, data_fixture, monkeypatch):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    table_2 = data_fixture.create_database_table(database=table.database)
+    text_field = data_fixture.create_text_field(name="Name", table=table, primary=True)
+    number_field = data_fixture.create_number_field(name="Number", table=table)
+    primary_field_2 = data_fixture.create_text_field(
+        name="Name", table=table_2, primary=True
+    )
+    link_field = FieldHandler().create_field(
+        user, table, "link_row", name="Link", link_row_table=table_2
+    )
+
+    related_rows = [
+        table_2.get_model().objects.create(**{f"field_{primary_field_2.id}": n})
+        for n in ["x", "y"]
+    ]
+    model = table.get_model()
+    for index in range(7):
+        row = model.objects.create(
+            **{
+                f"field_{text_field.id}": f"name {index % 3}",
+                f"field_{number_field.id}": index,
+            }
+        )
+        getattr(row, f"field_{link_field.id}").set(
+            [related_row.id for related_row in related_rows[: index % 3]]
+        )
+
+    # Stream in small chunks to make sure that the related rows are prefetched for
+    # every chunk.
+    monkeypatch.setattr(StreamRowsView, "chunk_size", 2)
+
+    list_url = reverse("api:database:rows:list", kwargs={"table_id": table.id})
+    stream_url = reverse("api:database:rows:stream", kwargs={"table_id": table.id})
+    for query in [
+        "",
+        f"?order_by=-field_{number_field.id}",
+        f"?search=name 1&include=field_{number_field.id},field_{link_field.id}",
+        f"?filter__field_{number_field.id}__higher_than=2&user_field_names=true",
+    ]:
+        response = api_client.get(
+            f"{list_url}{query}", HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+        )
+        expected_rows = response.json()["results"]
+
+        response = api_client.get(
+            f"{stream_url}{query}", HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+        )
+        assert response.status_code == HTTP_200_OK
+        assert response["Content-Type"] == "application/x-ndjson"
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        assert [json.loads(line) for line in lines] == expected_rows
+
+    response = api_client.get(
+        f"{stream_url}?order_by=field_9999", HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_ORDER_BY_FIELD_NOT_FOUND"
+
+    table_3 = data_fixture.create_database_table()
+    response = api_client.get(
+        reverse("api:database:rows:stream", kwargs={"table_id": table_3.id}),
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_USER_NOT_IN_GROUP"
+
+
+@pytest.mark.django_db(transaction=True)
+def test_stream_rows_through_asgi_application(data_fixture, monkeypatch):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(name="Name", table=table, primary=True)
+    model = table.get_model()
+    for index in range(5):
+        model.objects.create(**{f"field_{text_field.id}": f"name {index}"})
+
+    monkeypatch.setattr(StreamRowsView, "chunk_size", 2)
+
+    # The ASGI handler consumes the streaming response inside the event loop, where
+    # no database queries can be made.
+    async def get_response():
+        communicator = ApplicationCommunicator(
+            application,
+            {
+                "type": "http",
+                "method": "GET",
+                "path": reverse(
+                    "api:database:rows:stream", kwargs={"table_id": table.id}
+                ),
+                "query_string": b"",
+                "headers": [
+                    (b"host", b"localhost"),
+                    (b"authorization", f"JWT {jwt_token}".encode()),
+                ],
+            },
+        )
+        await communicator.send_input({"type": "http.request"})
+        response_start = await communicator.receive_output(10)
+        body = b""
+        while True:
+            message = await communicator.receive_output(10)
+            body += message.get("body", b"")
+            if not message.get("more_body", False):
+                return response_start["status"], body
+
+    status, body = async_to_sync(get_response)()
+
+    assert status == HTTP_200_OK
+    assert [
+        json.loads(line)[f"field_{text_field.id}"]
+        for line in body.decode().splitlines()
+    ] == [f"name {index}" for index in range(5)]
+
+
+@pytest.mark.django_db
+def test_list_row_changes(api_client, data_fixture, monkeypatch):
+    # The changes made by the transaction of the test itself are never visible,
+    # because the transaction is still running.
+    monkeypatch.setattr(
+        RowChangeLogHandler, "get_visible_transaction_id_limit", lambda self: 2 ** 62
+    )
+
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(name="Name", table=table, primary=True)
+
+    handler = RowHandler()
+    row_1, row_2 = handler.create_rows(
+        user,
+        table,
+        [{f"field_{text_field.id}": "a"}, {f"field_{text_field.id}": "b"}],
+    )
+    handler.update_row(user, table, row_1, {f"field_{text_field.id}": "c"})
+    handler.delete_row(user, table, row_2)
+    RowChangeLogHandler().log_table_change(table)
+
+    url = reverse("api:database:rows:changes", kwargs={"table_id": table.id})
+    response = api_client.get(
+        f"{url}?size=3&user_field_names=true", HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    assert response.status_code == HTTP_200_OK
+    response_json = response.json()
+    assert response_json["has_more"] is True
+    assert [
+        (change["row_id"], change["action"], change["row"])
+        for change in response_json["results"]
+    ] == [
+        (
+            row_1.id,
+            "created",
+            {"id": row_1.id, "order": "1.00000000000000000000", "Name": "c"},
+        ),
+        (row_2.id, "created", None),
+        (
+            row_1.id,
+            "updated",
+            {"id": row_1.id, "order": "1.00000000000000000000", "Name": "c"},
+        ),
+    ]
+
+    response = api_client.get(
+        f"{url}?cursor={response_json['next_cursor']}",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_200_OK
+    response_json = response.json()
+    assert response_json["has_more"] is False
+    assert [
+        (change["row_id"], change["action"], change["row"])
+        for change in response_json["results"]
+    ] == [(row_2.id, "deleted", None), (None, "table_updated", None)]
+
+    response = api_client.get(
+        f"{url}?cursor=invalid", HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_ROW_CHANGE_CURSOR_INVALID"
+
+    response = api_client.get(
+        f"{url}?since=2000-01-01T00:00:00Z", HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_ROW_CHANGE_CURSOR_EXPIRED"
+
+    response = api_client.get(
+        reverse(
+            "api:database:rows:changes",
+            kwargs={"table_id": data_fixture.create_database_table().id},
+        ),
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_USER_NOT_IN_GROUP"
+
+
 @pytest.mark.django_db
 def test_list_row_names(api_client, data_fixture):
     user, jwt_token = data_fixture.create_user_and_token(
@@ -0,0 +1,184 @@
+from unittest.mock import patch
+
+import pytest
+from django.shortcuts import reverse
+from rest_framework.status import (
+    HTTP_200_OK,
+    HTTP_400_BAD_REQUEST,
+    HTTP_401_UNAUTHORIZED,
+    HTTP_404_NOT_FOUND,
+)
+
+from baserow.contrib.database.rows.models import RowsBatchJob
+from baserow.contrib.database.tokens.handler import TokenHandler
+
+
+@pytest.mark.django_db
+@pytest.mark.api_rows
+@patch("baserow.contrib.database.rows.batch_jobs.run_rows_batch_job")
+def test_create_rows_batch_job(
+    mock_run_rows_batch_job,
+    api_client,
+    data_fixture,
+    django_capture_on_commit_callbacks,
+):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    other_table = data_fixture.create_database_table()
+    url = reverse("api:database:rows:batch-job", kwargs={"table_id": table.id})
+
+    response = api_client.post(
+        reverse("api:database:rows:batch-job", kwargs={"table_id": 0}),
+        {"type": "create", "items": [{}]},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_404_NOT_FOUND
+    assert response.json()["error"] == "ERROR_TABLE_DOES_NOT_EXIST"
+
+    response = api_client.post(
+        reverse("api:database:rows:batch-job", kwargs={"table_id": other_table.id}),
+        {"type": "create", "items": [{}]},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_USER_NOT_IN_GROUP"
+
+    response = api_client.post(
+        url,
+        {"type": "move", "items": []},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_REQUEST_BODY_VALIDATION"
+    assert response.json()["detail"]["type"][0]["code"] == "invalid_choice"
+    assert response.json()["detail"]["items"][0]["code"] == "min_length"
+
+    response = api_client.post(
+        url,
+        {"type": "delete", "items": [1, {}]},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["detail"]["items"][0]["error"] == (
+        "The items must be row ids when deleting rows."
+    )
+
+    response = api_client.post(
+        url,
+        {"type": "update", "items": [1]},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["detail"]["items"][0]["error"] == (
+        "The items must be objects containing the row values."
+    )
+
+    with django_capture_on_commit_callbacks(execute=True):
+        response = api_client.post(
+            f"{url}?user_field_names",
+            {"type": "create", "items": [{"Name": "a"}, {"Name": "b"}]},
+            format="json",
+            HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+        )
+    assert response.status_code == HTTP_200_OK
+    response_json = response.json()
+    job = RowsBatchJob.objects.get(id=response_json["id"])
+    assert job.user_field_names
+    assert [chunk.items for chunk in job.chunks.all()] == [
+        [{"Name": "a"}, {"Name": "b"}]
+    ]
+    assert response_json == {
+        "id": job.id,
+        "table_id": table.id,
+        "type": "create",
+        "state": "pending",
+        "progress_percentage": 0,
+        "processed_count": 0,
+        "total_count": 2,
+        "human_readable_error": "",
+        "created_on": response_json["created_on"],
+    }
+    mock_run_rows_batch_job.delay.assert_called_once_with(job.id)
+
+    response = api_client.post(
+        url,
+        {"type": "delete", "items": [1]},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_ROWS_BATCH_JOB_ALREADY_RUNNING"
+
+
+@pytest.mark.django_db
+@pytest.mark.api_rows
+@patch("baserow.contrib.database.rows.batch_jobs.run_rows_batch_job")
+def test_create_rows_batch_job_token_permissions(
+    mock_run_rows_batch_job, api_client, data_fixture
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    token = TokenHandler().create_token(user, table.database.group, "Token")
+    TokenHandler().update_token_permissions(user, token, True, True, True, False)
+    url = reverse("api:database:rows:batch-job", kwargs={"table_id": table.id})
+
+    response = api_client.post(
+        url,
+        {"type": "delete", "items": [1]},
+        format="json",
+        HTTP_AUTHORIZATION=f"Token {token.key}",
+    )
+    assert response.status_code == HTTP_401_UNAUTHORIZED
+    assert response.json()["error"] == "ERROR_NO_PERMISSION_TO_TABLE"
+
+    response = api_client.post(
+        url,
+        {"type": "update", "items": [{"id": 1}]},
+        format="json",
+        HTTP_AUTHORIZATION=f"Token {token.key}",
+    )
+    assert response.status_code == HTTP_200_OK
+
+
+@pytest.mark.django_db
+@pytest.mark.api_rows
+def test_get_rows_batch_job(api_client, data_fixture):
+    user, jwt_token = data_fixture.create_user_and_token()
+    other_user, other_jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    job = RowsBatchJob.objects.create(
+        user=user,
+        table=table,
+        type="delete",
+        total_count=4,
+        processed_count=2,
+        progress_percentage=50,
+        state="failed",
+        error="Internal error",
+        human_readable_error="One of the rows does not exist.",
+    )
+    url = reverse("api:database:rows:batch-job-item", kwargs={"job_id": job.id})
+
+    response = api_client.get(url, HTTP_AUTHORIZATION=f"JWT {other_jwt_token}")
+    assert response.status_code == HTTP_404_NOT_FOUND
+    assert response.json()["error"] == "ERROR_ROWS_BATCH_JOB_DOES_NOT_EXIST"
+
+    response = api_client.get(url, HTTP_AUTHORIZATION=f"JWT {jwt_token}")
+    assert response.status_code == HTTP_200_OK
+    response_json = response.json()
+    assert response_json == {
+        "id": job.id,
+        "table_id": table.id,
+        "type": "delete",
+        "state": "failed",
+        "progress_percentage": 50,
+        "processed_count": 2,
+        "total_count": 4,
+        "human_readable_error": "One of the rows does not exist.",
+        "created_on": response_json["created_on"],
+    }
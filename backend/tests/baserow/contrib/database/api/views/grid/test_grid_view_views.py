@@ -1,5 +1,6 @@
 from decimal import Decimal
 from typing import List, Dict, Any
+from unittest.mock import patch
 
 import pytest
 from django.shortcuts import reverse
@@ -8,6 +9,7 @@ from rest_framework import serializers
 from rest_framework.fields import Field
 from rest_framework.status import (
     HTTP_200_OK,
+    HTTP_304_NOT_MODIFIED,
     HTTP_400_BAD_REQUEST,
     HTTP_401_UNAUTHORIZED,
     HTTP_404_NOT_FOUND,
@@ -19,6 +21,8 @@ from baserow.contrib.database.rows.registries import (
     RowMetadataType,
     row_metadata_registry,
 )
+from baserow.contrib.database.table.change_sequence import bump_table_change_sequences
+from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.models import GridView
 from baserow.contrib.database.views.registries import view_aggregation_type_registry
 from baserow.contrib.database.fields.handler import FieldHandler
@@ -176,13 +180,15 @@ def test_list_rows(api_client, data_fixture):
         url, data={"count": ""}, **{"HTTP_AUTHORIZATION": f"JWT {token}"}
     )
     response_json = response.json()
-    assert response_json["count"] == 4
-    assert len(response_json.keys()) == 1
+    assert response_json == {"count": 4, "count_is_exact": True}
 
     row_1.delete()
     row_2.delete()
     row_3.delete()
     row_4.delete()
+    # The rows are not deleted via the handler, so the cached counts are not
+    # invalidated automatically.
+    bump_table_change_sequences([table.id])
 
     url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
     response = api_client.get(url, **{"HTTP_AUTHORIZATION": f"JWT {token}"})
@@ -285,6 +291,175 @@ def test_list_rows_include_row_metadata(api_client, data_fixture):
         }
 
 
+@pytest.mark.django_db
+def test_list_rows_approximate_count(api_client, data_fixture, settings):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="Name")
+    grid = data_fixture.create_grid_view(table=table)
+    model = table.get_model()
+    for value in ["a", "b", "c"]:
+        RowHandler().create_row(
+            user, table, {f"field_{text_field.id}": value}, model=model
+        )
+
+    settings.BASEROW_ROW_COUNT_ESTIMATE_THRESHOLD = 0
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+
+    with patch(
+        "baserow.contrib.database.rows.count.get_estimated_row_count",
+        return_value=1000,
+    ):
+        response = api_client.get(
+            url, {"count": "", "approximate": ""}, HTTP_AUTHORIZATION=f"JWT {token}"
+        )
+        assert response.status_code == HTTP_200_OK
+        assert response.json() == {"count": 1000, "count_is_exact": False}
+
+        response = api_client.get(url, {"count": ""}, HTTP_AUTHORIZATION=f"JWT {token}")
+        assert response.json() == {"count": 3, "count_is_exact": True}
+
+        response = api_client.get(
+            url,
+            {"count": "", "approximate": "", "search": "b"},
+            HTTP_AUTHORIZATION=f"JWT {token}",
+        )
+        assert response.json() == {"count": 1, "count_is_exact": True}
+
+        data_fixture.create_view_filter(
+            view=grid, field=text_field, type="equal", value="c"
+        )
+        response = api_client.get(
+            url, {"count": "", "approximate": ""}, HTTP_AUTHORIZATION=f"JWT {token}"
+        )
+        assert response.json() == {"count": 1, "count_is_exact": True}
+
+
+@pytest.mark.django_db
+def test_list_rows_and_aggregations_etag(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table, name="Number")
+    grid = data_fixture.create_grid_view(table=table)
+    RowHandler().create_row(user, table, {f"field_{number_field.id}": 1})
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+    aggregation_url = reverse(
+        "api:database:views:grid:field-aggregation",
+        kwargs={"view_id": grid.id, "field_id": number_field.id},
+    )
+
+    response = api_client.get(url, HTTP_AUTHORIZATION=f"JWT {token}")
+    assert response.status_code == HTTP_200_OK
+    etag = response["ETag"]
+    response = api_client.get(
+        f"{aggregation_url}?type=sum", HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    assert response.json() == {"value": 1}
+    aggregation_etag = response["ETag"]
+
+    response = api_client.get(
+        url, HTTP_AUTHORIZATION=f"JWT {token}", HTTP_IF_NONE_MATCH=etag
+    )
+    assert response.status_code == HTTP_304_NOT_MODIFIED
+    response = api_client.get(
+        f"{aggregation_url}?type=sum",
+        HTTP_AUTHORIZATION=f"JWT {token}",
+        HTTP_IF_NONE_MATCH=aggregation_etag,
+    )
+    assert response.status_code == HTTP_304_NOT_MODIFIED
+
+    ViewHandler().create_filter(user, grid, number_field, "higher_than", "1")
+    response = api_client.get(
+        url, HTTP_AUTHORIZATION=f"JWT {token}", HTTP_IF_NONE_MATCH=etag
+    )
+    assert response.status_code == HTTP_200_OK
+    assert response.json()["count"] == 0
+    assert response["ETag"] != etag
+    response = api_client.get(
+        f"{aggregation_url}?type=sum",
+        HTTP_AUTHORIZATION=f"JWT {token}",
+        HTTP_IF_NONE_MATCH=aggregation_etag,
+    )
+    assert response.status_code == HTTP_200_OK
+    assert response.json() == {"value": None}
+
+    # The row metadata can change without a change to the table.
+    response = api_client.get(
+        url, {"include": "row_metadata"}, HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    assert response.status_code == HTTP_200_OK
+    assert "ETag" not in response
+
+
+@pytest.mark.django_db
+def test_list_rows_with_cursor_pagination(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="Name")
+    single_select_field = data_fixture.create_single_select_field(table=table)
+    option_a = data_fixture.create_select_option(field=single_select_field, value="A")
+    option_b = data_fixture.create_select_option(field=single_select_field, value="B")
+    multiple_select_field = data_fixture.create_multiple_select_field(table=table)
+    option_c = data_fixture.create_select_option(field=multiple_select_field, value="C")
+    option_d = data_fixture.create_select_option(field=multiple_select_field, value="D")
+    grid = data_fixture.create_grid_view(table=table)
+
+    model = table.get_model()
+    for index in range(12):
+        row = model.objects.create(
+            **{
+                f"field_{text_field.id}": None if index % 5 == 0 else f"{index % 3}",
+                f"field_{single_select_field.id}": [option_a, option_b, None][
+                    index % 3
+                ],
+            }
+        )
+        getattr(row, f"field_{multiple_select_field.id}").set(
+            [[option_c.id], [option_d.id], [option_c.id, option_d.id], []][index % 4]
+        )
+    data_fixture.create_view_filter(
+        view=grid, field=text_field, type="not_equal", value="2"
+    )
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+    for sorts in [
+        [],
+        [(single_select_field, "DESC")],
+        [(multiple_select_field, "ASC"), (text_field, "DESC")],
+        [(text_field, "ASC"), (multiple_select_field, "DESC")],
+    ]:
+        grid.viewsort_set.all().delete()
+        for field, order in sorts:
+            data_fixture.create_view_sort(view=grid, field=field, order=order)
+
+        response = api_client.get(
+            f"{url}?size=100", **{"HTTP_AUTHORIZATION": f"JWT {token}"}
+        )
+        assert response.status_code == HTTP_200_OK
+        response_json = response.json()
+        expected_ids = [row["id"] for row in response_json["results"]]
+        assert len(expected_ids) == response_json["count"]
+
+        ids = []
+        next_url = f"{url}?size=3&cursor="
+        while next_url:
+            response = api_client.get(
+                next_url, **{"HTTP_AUTHORIZATION": f"JWT {token}"}
+            )
+            assert response.status_code == HTTP_200_OK
+            response_json = response.json()
+            ids += [row["id"] for row in response_json["results"]]
+            next_url = response_json["next"]
+
+        assert ids == expected_ids
+
+    response = api_client.get(
+        f"{url}?cursor=W10=", **{"HTTP_AUTHORIZATION": f"JWT {token}"}
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_INVALID_CURSOR"
+
+
 @pytest.mark.django_db
 def test_list_filtered_rows(api_client, data_fixture):
     user, token = data_fixture.create_user_and_token(
@@ -6,13 +6,19 @@ from rest_framework.status import (
     HTTP_204_NO_CONTENT,
     HTTP_400_BAD_REQUEST,
     HTTP_401_UNAUTHORIZED,
+    HTTP_403_FORBIDDEN,
     HTTP_404_NOT_FOUND,
 )
 
 from django.shortcuts import reverse
 from django.contrib.contenttypes.models import ContentType
 
-from baserow.contrib.database.views.models import View, GridView
+from baserow.contrib.database.views.models import (
+    View,
+    GridView,
+    ViewFieldIndex,
+    ViewFieldIndexStates,
+)
 from baserow.contrib.database.views.registries import (
     view_type_registry,
 )
@@ -408,3 +414,28 @@ def test_rotate_slug(api_client, data_fixture):
     assert response.status_code == HTTP_200_OK
     assert response_json["slug"] != old_slug
     assert len(response_json["slug"]) == 43
+
+
+@pytest.mark.django_db
+def test_list_view_field_indexes(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    staff_user, staff_token = data_fixture.create_user_and_token(is_staff=True)
+    table = data_fixture.create_database_table()
+    number_field = data_fixture.create_number_field(table=table)
+    index = ViewFieldIndex.objects.create(
+        field=number_field, state=ViewFieldIndexStates.FAILED, error="Failed"
+    )
+    url = reverse("api:database:views:indexes")
+
+    response = api_client.get(url, HTTP_AUTHORIZATION=f"JWT {token}")
+    assert response.status_code == HTTP_403_FORBIDDEN
+
+    response = api_client.get(url, HTTP_AUTHORIZATION=f"JWT {staff_token}")
+    assert response.status_code == HTTP_200_OK
+    response_json = response.json()
+    assert len(response_json) == 1
+    assert response_json[0]["id"] == index.id
+    assert response_json[0]["field_id"] == number_field.id
+    assert response_json[0]["table_id"] == table.id
+    assert response_json[0]["state"] == "failed"
+    assert response_json[0]["error"] == "Failed"
@@ -0,0 +1,193 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.utils import timezone
+
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.fields.models import (
+    FieldTrigramIndex,
+    FieldTrigramIndexStates,
+)
+from baserow.contrib.database.fields.trigram_indexes import (
+    TrigramIndexHandler,
+    get_trigram_index_usage_cache_key,
+)
+from baserow.contrib.database.views.handler import ViewHandler
+
+
+def clear_usage_cache(*fields):
+    cache.delete_many([get_trigram_index_usage_cache_key(f.id) for f in fields])
+
+
+@pytest.mark.django_db
+def test_record_usage(data_fixture, settings):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table)
+    number_field = data_fixture.create_number_field(table=table)
+    handler = TrigramIndexHandler()
+
+    handler.record_usage([text_field, number_field])
+    assert FieldTrigramIndex.objects.count() == 0
+
+    settings.BASEROW_TRIGRAM_INDEXES_ENABLED = True
+    handler.record_usage([text_field, number_field])
+    index = FieldTrigramIndex.objects.get()
+    assert index.field_id == text_field.id
+    assert index.state == FieldTrigramIndexStates.PENDING
+    last_used_on = index.last_used_on
+
+    # The usage is only recorded once per interval.
+    handler.record_usage([text_field])
+    index.refresh_from_db()
+    assert index.last_used_on == last_used_on
+
+    clear_usage_cache(text_field)
+    handler.record_usage([text_field])
+    index.refresh_from_db()
+    assert index.last_used_on > last_used_on
+    assert FieldTrigramIndex.objects.count() == 1
+
+    clear_usage_cache(text_field)
+
+
+@pytest.mark.django_db
+def test_contains_filter_and_search_record_usage(data_fixture, settings):
+    settings.BASEROW_TRIGRAM_INDEXES_ENABLED = True
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table)
+    long_text_field = data_fixture.create_long_text_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    model = table.get_model()
+    model.objects.create(
+        **{
+            f"field_{text_field.id}": "Baserow",
+            f"field_{long_text_field.id}": "Database",
+        }
+    )
+    view_handler = ViewHandler()
+
+    view_filter = data_fixture.create_view_filter(
+        view=grid_view, field=text_field, type="contains_not", value="base"
+    )
+    assert view_handler.apply_filters(grid_view, model.objects.all()).count() == 0
+    assert FieldTrigramIndex.objects.count() == 0
+
+    view_filter.type = "contains"
+    view_filter.save()
+    assert view_handler.apply_filters(grid_view, model.objects.all()).count() == 1
+    assert list(FieldTrigramIndex.objects.values_list("field_id", flat=True)) == [
+        text_field.id
+    ]
+
+    assert model.objects.all().search_all_fields("DATA").count() == 1
+    assert set(FieldTrigramIndex.objects.values_list("field_id", flat=True)) == {
+        text_field.id,
+        long_text_field.id,
+    }
+
+    clear_usage_cache(text_field, long_text_field)
+
+
+@pytest.mark.django_db
+def test_search_all_fields_by_id(data_fixture):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table)
+    model = table.get_model()
+    row = model.objects.create(**{f"field_{text_field.id}": "Text"})
+    model.objects.create(**{f"field_{text_field.id}": "Other"})
+
+    assert list(model.objects.all().search_all_fields(str(row.id))) == [row]
+    assert list(model.objects.all().search_all_fields("ext")) == [row]
+
+
+@pytest.mark.django_db
+def test_manage_indexes(data_fixture, settings):
+    settings.BASEROW_TRIGRAM_INDEXES_ENABLED = True
+    settings.BASEROW_TRIGRAM_INDEX_MIN_ROWS = 0
+    table = data_fixture.create_database_table()
+    unused_field = data_fixture.create_text_field(table=table)
+    trashed_field = data_fixture.create_text_field(table=table, trashed=True)
+    used_field = data_fixture.create_text_field(table=table)
+    FieldTrigramIndex.objects.create(
+        field=unused_field,
+        state=FieldTrigramIndexStates.CREATED,
+        last_used_on=timezone.now() - timedelta(days=8),
+    )
+    FieldTrigramIndex.objects.create(field=trashed_field, last_used_on=timezone.now())
+    used_index = FieldTrigramIndex.objects.create(
+        field=used_field, last_used_on=timezone.now()
+    )
+    handler = TrigramIndexHandler()
+
+    with patch.object(
+        TrigramIndexHandler, "is_extension_available", return_value=False
+    ), patch.object(TrigramIndexHandler, "create_index") as mock_create_index:
+        handler.manage_indexes()
+    mock_create_index.assert_not_called()
+    assert list(FieldTrigramIndex.objects.all()) == [used_index]
+
+    settings.BASEROW_TRIGRAM_INDEX_MIN_ROWS = 1
+    with patch.object(
+        TrigramIndexHandler, "is_extension_available", return_value=True
+    ), patch.object(TrigramIndexHandler, "create_index") as mock_create_index:
+        handler.manage_indexes()
+    mock_create_index.assert_not_called()
+
+    settings.BASEROW_TRIGRAM_INDEX_MIN_ROWS = 0
+    with patch.object(
+        TrigramIndexHandler, "is_extension_available", return_value=True
+    ), patch.object(TrigramIndexHandler, "create_index") as mock_create_index:
+        handler.manage_indexes()
+    mock_create_index.assert_called_once_with(used_index)
+
+
+@pytest.mark.django_db
+def test_create_and_drop_index(data_fixture):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table)
+    index = FieldTrigramIndex.objects.create(
+        field=text_field, last_used_on=timezone.now()
+    )
+    handler = TrigramIndexHandler()
+
+    def index_exists():
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM pg_indexes WHERE indexname = %s", [index.index_name]
+            )
+            return cursor.fetchone() is not None
+
+    handler.create_index(index)
+    index.refresh_from_db()
+    if handler.is_extension_available():
+        assert index.state == FieldTrigramIndexStates.CREATED
+        assert index_exists()
+    else:
+        assert index.state == FieldTrigramIndexStates.FAILED
+        assert "gin_trgm_ops" in index.error
+        assert not index_exists()
+
+    handler.drop_index(index)
+    assert not index_exists()
+    assert FieldTrigramIndex.objects.count() == 0
+
+
+@pytest.mark.django_db
+def test_changing_field_type_drops_index(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    FieldTrigramIndex.objects.create(
+        field=text_field,
+        state=FieldTrigramIndexStates.CREATED,
+        last_used_on=timezone.now(),
+    )
+
+    FieldHandler().update_field(user, text_field, name="Renamed")
+    assert FieldTrigramIndex.objects.count() == 1
+
+    FieldHandler().update_field(user, text_field, new_type_name="number")
+    assert FieldTrigramIndex.objects.count() == 0
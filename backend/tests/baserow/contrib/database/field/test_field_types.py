@@ -14,7 +14,7 @@ from baserow.contrib.database.fields.models import (
     EmailField,
     PhoneNumberField,
 )
-from baserow.contrib.database.fields.registries import field_type_registry
+from baserow.contrib.database.fields.registries import FieldType, field_type_registry
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.test_utils.helpers import setup_interesting_test_table
 
@@ -643,3 +643,31 @@ def test_import_export_lookup_field(data_fixture, api_client):
     assert lookup_field_imported.target_field_name == lookup.target_field_name
 
     assert id_mapping["database_fields"][lookup.id] == lookup_field_imported.id
+
+
+@pytest.mark.django_db
+def test_relation_backed_field_types_prepare_values_in_bulk(data_fixture):
+    table, user, row, blank_row = setup_interesting_test_table(data_fixture)
+    model = table.get_model()
+
+    relation_backed_field_types = set()
+    for field_object in model._field_objects.values():
+        field_type = field_object["type"]
+        model_field = model._meta.get_field(field_object["name"])
+        if field_type.read_only:
+            continue
+        if model_field.is_relation or field_type.type == "file":
+            relation_backed_field_types.add(field_type.type)
+
+    assert relation_backed_field_types == {
+        "file",
+        "link_row",
+        "multiple_select",
+        "single_select",
+    }
+    for field_type_name in relation_backed_field_types:
+        field_type = field_type_registry.get(field_type_name)
+        assert (
+            type(field_type).prepare_value_for_db_in_bulk
+            is not FieldType.prepare_value_for_db_in_bulk
+        ), f"{field_type_name} must resolve its references in bulk."
@@ -7,10 +7,12 @@ from rest_framework.status import HTTP_200_OK, HTTP_204_NO_CONTENT, HTTP_400_BAD
 from django.shortcuts import reverse
 from django.db import connections
 from django.apps.registry import apps
+from django.core.exceptions import ValidationError
 
 from baserow.core.handler import CoreHandler
 from baserow.contrib.database.fields.models import Field, TextField, LinkRowField
 from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.fields.registries import field_type_registry
 from baserow.contrib.database.fields.exceptions import (
     LinkRowTableNotInSameDatabase,
     LinkRowTableNotProvided,
@@ -669,6 +671,36 @@ def test_link_row_field_type_api_row_views(api_client, data_fixture):
         format="json",
         HTTP_AUTHORIZATION=f"JWT {token}",
     )
+    response_json = response.json()
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response_json["error"] == "ERROR_REQUEST_BODY_VALIDATION"
+    assert "999" in response_json["detail"]
+    assert example_table.get_model().objects.count() == 0
+
+    response = api_client.post(
+        reverse("api:database:rows:batch", kwargs={"table_id": example_table.id}),
+        {
+            "items": [
+                {f"field_{link_row_field.id}": [customers_row_1.id]},
+                {f"field_{link_row_field.id}": [999]},
+            ]
+        },
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    response_json = response.json()
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response_json["error"] == "ERROR_REQUEST_BODY_VALIDATION"
+    assert example_table.get_model().objects.count() == 0
+
+    response = api_client.post(
+        reverse("api:database:rows:list", kwargs={"table_id": example_table.id}),
+        {
+            f"field_{link_row_field.id}": [customers_row_1.id, customers_row_2.id],
+        },
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
 
     response_json = response.json()
     row_id = response_json["id"]
@@ -988,3 +1020,69 @@ def test_change_link_row_related_table_when_field_with_related_name_exists(
     )
     assert names == ["Table", "Table - Link"]
     assert LinkRowField.objects.count() == 2
+
+
+@pytest.mark.django_db
+def test_link_row_field_type_prepare_value_for_db_in_bulk(
+    data_fixture, django_assert_num_queries
+):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(database=database)
+    customers_table = data_fixture.create_database_table(database=database)
+    data_fixture.create_text_field(table=customers_table, primary=True)
+    link_row_field = FieldHandler().create_field(
+        user=user,
+        table=table,
+        type_name="link_row",
+        name="Customers",
+        link_row_table=customers_table,
+    )
+    customers_model = customers_table.get_model()
+    customer_1 = customers_model.objects.create()
+    customer_2 = customers_model.objects.create()
+    trashed_customer = customers_model.objects.create(trashed=True)
+    field_type = field_type_registry.get("link_row")
+    lookup_cache = {}
+
+    with pytest.raises(ValidationError):
+        field_type.prepare_value_for_db_in_bulk(
+            link_row_field,
+            {0: [customer_1.id, 999999, customer_2.id], 1: []},
+            lookup_cache,
+        )
+
+    values = field_type.prepare_value_for_db_in_bulk(
+        link_row_field,
+        {
+            0: [customer_1.id, customer_2.id],
+            1: [],
+            2: [trashed_customer.id, customer_1.id],
+            3: None,
+        },
+        lookup_cache,
+    )
+    assert values == {
+        0: [customer_1.id, customer_2.id],
+        1: [],
+        2: [trashed_customer.id, customer_1.id],
+        3: None,
+    }
+
+    # The existence of the already resolved rows is not checked again.
+    with django_assert_num_queries(0):
+        values = field_type.prepare_value_for_db_in_bulk(
+            link_row_field, {0: [customer_2.id, customer_1.id]}, lookup_cache
+        )
+    assert values == {0: [customer_2.id, customer_1.id]}
+
+    with pytest.raises(ValidationError):
+        RowHandler().create_rows(
+            user,
+            table,
+            [
+                {f"field_{link_row_field.id}": [customer_2.id]},
+                {f"field_{link_row_field.id}": [999999]},
+            ],
+        )
+    assert table.get_model().objects.count() == 0
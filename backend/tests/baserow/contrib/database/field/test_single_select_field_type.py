@@ -10,6 +10,9 @@ from django.core.exceptions import ValidationError
 from faker import Faker
 
 from baserow.core.handler import CoreHandler
+from baserow.contrib.database.fields.exceptions import (
+    AllProvidedMultipleSelectValuesMustBeSelectOption,
+)
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.models import (
     SelectOption,
@@ -799,3 +802,36 @@ def test_get_set_export_serialized_value_single_select_field(data_fixture):
     assert getattr(imported_row_3, f"field_{imported_field.id}_id") != option_b.id
     assert getattr(imported_row_3, f"field_{imported_field.id}").value == "B"
     assert getattr(imported_row_3, f"field_{imported_field.id}").color == "red"
+
+
+@pytest.mark.django_db
+def test_single_select_field_type_prepare_value_for_db_in_bulk(
+    data_fixture, django_assert_num_queries
+):
+    field = data_fixture.create_single_select_field()
+    option_1 = data_fixture.create_select_option(field=field, value="A")
+    option_2 = data_fixture.create_select_option(field=field, value="B")
+    other_option = data_fixture.create_select_option()
+    field_type = SingleSelectFieldType()
+    lookup_cache = {}
+
+    # All the options of the batch are fetched using a single query.
+    with django_assert_num_queries(1):
+        values = field_type.prepare_value_for_db_in_bulk(
+            field,
+            {0: option_1.id, 1: None, 2: option_2.id, 3: option_1.id},
+            lookup_cache,
+        )
+    assert values == {0: option_1, 1: None, 2: option_2, 3: option_1}
+
+    # The options that are already in the lookup cache are not fetched again.
+    with django_assert_num_queries(0):
+        values = field_type.prepare_value_for_db_in_bulk(
+            field, {0: option_2.id, 1: option_1.id}, lookup_cache
+        )
+    assert values == {0: option_2, 1: option_1}
+
+    with pytest.raises(AllProvidedMultipleSelectValuesMustBeSelectOption):
+        field_type.prepare_value_for_db_in_bulk(
+            field, {0: option_1.id, 1: other_option.id}, lookup_cache
+        )
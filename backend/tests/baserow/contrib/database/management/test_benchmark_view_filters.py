@@ -0,0 +1,21 @@
+import pytest
+from io import StringIO
+
+from django.core.management import call_command
+
+
+@pytest.mark.django_db
+def test_benchmark_view_filters(data_fixture):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=grid_view, field=text_field, type="equal", value="a"
+    )
+
+    output = StringIO()
+    call_command("benchmark_view_filters", grid_view.id, "--repeat", "2", stdout=output)
+
+    assert "Execution Time" in output.getvalue()
+    assert "count: min" in output.getvalue()
+    assert "first page: min" in output.getvalue()
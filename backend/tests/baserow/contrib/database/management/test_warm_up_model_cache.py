@@ -0,0 +1,24 @@
+import pytest
+from io import StringIO
+
+from django.core.management import call_command
+
+from baserow.contrib.database.table.cache import (
+    clear_local_model_cache,
+    local_model_cache,
+    table_model_access_tracker,
+)
+
+
+@pytest.mark.django_db
+def test_warm_up_model_cache(data_fixture):
+    table = data_fixture.create_database_table()
+    table.get_model()
+    table_model_access_tracker.flush()
+    clear_local_model_cache()
+
+    output = StringIO()
+    call_command("warm_up_model_cache", stdout=output)
+
+    assert output.getvalue() == "Warmed up the models of 1 tables.\n"
+    assert table.id in local_model_cache
@@ -0,0 +1,218 @@
+import pytest
+from django.utils import timezone
+
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.rows.change_log import RowChangeLogHandler
+from baserow.contrib.database.rows.exceptions import (
+    RowChangeCursorExpired,
+    RowChangeCursorInvalid,
+)
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.rows.models import RowChange
+from baserow.contrib.database.rows.tasks import compact_row_change_log
+from baserow.core.trash.handler import TrashHandler
+
+
+@pytest.fixture
+def all_transactions_visible(monkeypatch):
+    # The changes made by the transaction of the test itself are never visible,
+    # because the transaction is still running.
+    monkeypatch.setattr(
+        RowChangeLogHandler, "get_visible_transaction_id_limit", lambda self: 2 ** 62
+    )
+
+
+def get_changes(table):
+    return [
+        (change.row_id, change.action)
+        for change in RowChange.objects.filter(table=table)
+    ]
+
+
+@pytest.mark.django_db
+def test_row_changes_are_logged(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    other_table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    data_fixture.create_text_field(table=other_table, primary=True)
+    handler = RowHandler()
+
+    row_1 = handler.create_row(user, table, {f"field_{text_field.id}": "a"})
+    row_2, row_3 = handler.create_rows(user, table, [{}, {}])
+    handler.update_row(user, table, row_1, {f"field_{text_field.id}": "b"})
+    handler.update_rows(user, table, [{"id": row_2.id}, {"id": row_3.id}])
+    handler.move_row(user, table, row_1, before_row=row_2)
+    handler.delete_row(user, table, row_1)
+    trashed_rows = handler.delete_rows(user, table, [row_2.id, row_3.id])
+    handler.create_row(user, other_table, {})
+
+    assert get_changes(table) == [
+        (row_1.id, "created"),
+        (row_2.id, "created"),
+        (row_3.id, "created"),
+        (row_1.id, "updated"),
+        (row_2.id, "updated"),
+        (row_3.id, "updated"),
+        (row_1.id, "updated"),
+        (row_1.id, "deleted"),
+        (row_2.id, "deleted"),
+        (row_3.id, "deleted"),
+    ]
+
+    RowChange.objects.all().delete()
+    TrashHandler.restore_item(user, "row", row_1.id, parent_trash_item_id=table.id)
+    TrashHandler.restore_item(
+        user, "rows", trashed_rows.id, parent_trash_item_id=table.id
+    )
+    assert get_changes(table) == [
+        (row_1.id, "created"),
+        (row_2.id, "created"),
+        (row_3.id, "created"),
+    ]
+
+
+@pytest.mark.django_db
+def test_recalculated_and_converted_rows_are_logged(data_fixture):
+    user = data_fixture.create_user()
+    table_a, table_b, link_field = data_fixture.create_two_linked_tables(user=user)
+    primary_a = table_a.field_set.get(primary=True).specific
+    field_handler = FieldHandler()
+    field_handler.create_field(
+        user,
+        table_b,
+        "formula",
+        name="lookup",
+        formula=f"join(lookup('{link_field.link_row_related_field.name}', "
+        f"'{primary_a.name}'), ',')",
+    )
+    row_handler = RowHandler()
+    linked_row, unlinked_row = row_handler.create_rows(user, table_b, [{}, {}])
+    row = row_handler.create_row(
+        user, table_a, {f"field_{link_field.id}": [linked_row.id]}
+    )
+    RowChange.objects.all().delete()
+
+    # Only the rows in the other table that look up the updated row are logged.
+    row_handler.update_row(user, table_a, row, {f"field_{primary_a.id}": "a"})
+    assert get_changes(table_a) == [(row.id, "updated")]
+    assert get_changes(table_b) == [(linked_row.id, "updated")]
+
+    # Converting a field can change every row of the table.
+    RowChange.objects.all().delete()
+    field_handler.update_field(user, primary_a, new_type_name="long_text")
+    assert (None, "table_updated") in get_changes(table_a)
+    assert (None, "table_updated") in get_changes(table_b)
+
+    # Changing a field without converting its values doesn't change any row.
+    RowChange.objects.all().delete()
+    text_field = data_fixture.create_text_field(table=table_b)
+    field_handler.update_field(user, text_field, name="renamed")
+    assert get_changes(table_b) == []
+
+
+@pytest.mark.django_db
+def test_get_row_changes_only_returns_finished_transactions(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    RowHandler().create_row(user, table, {})
+
+    changes, next_cursor, has_more = RowChangeLogHandler().get_row_changes(table)
+    assert changes == []
+    assert not has_more
+
+    changes, _, _ = RowChangeLogHandler().get_row_changes(table, cursor=next_cursor)
+    assert changes == []
+
+
+@pytest.mark.django_db
+def test_get_row_changes(data_fixture, all_transactions_visible):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    handler = RowHandler()
+    change_log_handler = RowChangeLogHandler()
+
+    row_1, row_2, row_3 = handler.create_rows(user, table, [{}, {}, {}])
+
+    changes, next_cursor, has_more = change_log_handler.get_row_changes(table, limit=2)
+    assert [change.row_id for change in changes] == [row_1.id, row_2.id]
+    assert has_more
+
+    changes, next_cursor, has_more = change_log_handler.get_row_changes(
+        table, cursor=next_cursor, limit=2
+    )
+    assert [change.row_id for change in changes] == [row_3.id]
+    assert not has_more
+
+    changes, next_cursor, has_more = change_log_handler.get_row_changes(
+        table, cursor=next_cursor, limit=2
+    )
+    assert changes == []
+    assert not has_more
+
+    handler.delete_row(user, table, row_2)
+    changes, _, _ = change_log_handler.get_row_changes(
+        table, since=timezone.now() - timezone.timedelta(hours=1)
+    )
+    assert [(change.row_id, change.action) for change in changes] == [
+        (row_1.id, "created"),
+        (row_2.id, "created"),
+        (row_3.id, "created"),
+        (row_2.id, "deleted"),
+    ]
+    changes, _, _ = change_log_handler.get_row_changes(
+        table, since=timezone.now() + timezone.timedelta(hours=1)
+    )
+    assert changes == []
+
+
+@pytest.mark.django_db
+def test_get_row_changes_invalid_or_expired(data_fixture, settings):
+    table = data_fixture.create_database_table()
+    change_log_handler = RowChangeLogHandler()
+
+    with pytest.raises(RowChangeCursorInvalid):
+        change_log_handler.get_row_changes(table, cursor="invalid")
+
+    with pytest.raises(RowChangeCursorInvalid):
+        change_log_handler.get_row_changes(
+            table, cursor=change_log_handler.encode_cursor(1, 1, "invalid")
+        )
+
+    settings.BASEROW_ROW_CHANGE_LOG_RETENTION_DAYS = 7
+    expired = timezone.now() - timezone.timedelta(days=8)
+    with pytest.raises(RowChangeCursorExpired):
+        change_log_handler.get_row_changes(
+            table, cursor=change_log_handler.encode_cursor(1, 1, expired)
+        )
+
+    with pytest.raises(RowChangeCursorExpired):
+        change_log_handler.get_row_changes(table, since=expired)
+
+
+@pytest.mark.django_db
+def test_compact_row_changes(data_fixture, settings, all_transactions_visible):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    handler = RowHandler()
+
+    row_1, row_2, row_3 = handler.create_rows(user, table, [{}, {}, {}])
+    handler.update_rows(user, table, [{"id": row_1.id}, {"id": row_2.id}])
+    handler.delete_row(user, table, row_1)
+
+    settings.BASEROW_ROW_CHANGE_LOG_RETENTION_DAYS = 7
+    RowChange.objects.filter(row_id=row_3.id).update(
+        timestamp=timezone.now() - timezone.timedelta(days=8)
+    )
+
+    compact_row_change_log.delay()
+
+    assert get_changes(table) == [(row_2.id, "updated"), (row_1.id, "deleted")]
+
+    # A change of the whole table supersedes all the older changes of the table.
+    RowChangeLogHandler().log_table_change(table)
+    handler.update_rows(user, table, [{"id": row_2.id}])
+    RowChangeLogHandler().log_table_change(table)
+    compact_row_change_log.delay()
+
+    assert get_changes(table) == [(None, "table_updated")]
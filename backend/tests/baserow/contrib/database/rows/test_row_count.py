@@ -0,0 +1,72 @@
+import pytest
+from django.db import connection
+
+from baserow.contrib.database.rows.count import (
+    count_rows,
+    get_cached_row_count,
+    get_estimated_row_count,
+    is_unfiltered_queryset,
+)
+from baserow.contrib.database.rows.handler import RowHandler
+
+
+@pytest.mark.django_db
+def test_get_cached_row_count(data_fixture, django_assert_num_queries):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    model = table.get_model()
+
+    handler = RowHandler()
+    row_1 = handler.create_row(
+        user, table, {f"field_{text_field.id}": "a"}, model=model
+    )
+    handler.create_row(user, table, {f"field_{text_field.id}": "b"}, model=model)
+
+    queryset = model.objects.all()
+    filtered_queryset = model.objects.filter(**{f"field_{text_field.id}": "a"})
+
+    with django_assert_num_queries(2):
+        assert get_cached_row_count(queryset) == 2
+        assert get_cached_row_count(filtered_queryset) == 1
+
+    with django_assert_num_queries(0):
+        assert get_cached_row_count(queryset) == 2
+        assert get_cached_row_count(queryset.order_by("-id")) == 2
+        assert get_cached_row_count(filtered_queryset) == 1
+
+    handler.create_row(user, table, {f"field_{text_field.id}": "a"}, model=model)
+    assert get_cached_row_count(queryset) == 3
+    assert get_cached_row_count(filtered_queryset) == 2
+
+    handler.delete_row(user, table, row_1, model=model)
+    assert get_cached_row_count(queryset) == 2
+    assert get_cached_row_count(filtered_queryset) == 1
+
+
+@pytest.mark.django_db
+def test_count_rows_approximate(data_fixture, settings):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    model = table.get_model()
+    model.objects.bulk_create(
+        [model(**{f"field_{text_field.id}": str(i)}) for i in range(10)]
+    )
+
+    queryset = model.objects.all()
+    filtered_queryset = model.objects.filter(**{f"field_{text_field.id}": "1"})
+    assert is_unfiltered_queryset(queryset)
+    assert is_unfiltered_queryset(queryset.order_by("-id"))
+    assert not is_unfiltered_queryset(filtered_queryset)
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"ANALYZE {model._meta.db_table}")
+    assert get_estimated_row_count(queryset) == 10
+
+    settings.BASEROW_ROW_COUNT_ESTIMATE_THRESHOLD = 100
+    assert count_rows(queryset, approximate=True) == (10, True)
+
+    settings.BASEROW_ROW_COUNT_ESTIMATE_THRESHOLD = 5
+    assert count_rows(queryset) == (10, True)
+    assert count_rows(queryset, approximate=True) == (10, False)
+    assert count_rows(filtered_queryset, approximate=True) == (1, True)
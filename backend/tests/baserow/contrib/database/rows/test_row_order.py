@@ -0,0 +1,108 @@
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.rows.order import (
+    get_row_order_buckets_to_renormalize,
+    get_row_order_renormalization_cache_key,
+    get_table_row_order_version,
+    renormalize_table_row_orders,
+)
+from baserow.contrib.database.rows.tasks import renormalize_row_orders
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.rows.tasks.renormalize_row_orders")
+def test_insert_row_before_dense_bucket_schedules_renormalization(
+    mock_renormalize_row_orders, data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    model = table.get_model()
+    row_1 = model.objects.create(order=Decimal("1.00000000000000000000"))
+    row_2 = model.objects.create(order=Decimal("1.99999999999999999999"))
+    row_3 = model.objects.create(order=Decimal("2.00000000000000000000"))
+    handler = RowHandler()
+
+    # There is plenty of room before the first row, so no other rows are updated.
+    with django_capture_on_commit_callbacks(execute=True):
+        row_4 = handler.create_row(user, table, before_row=row_1, model=model)
+    assert row_4.order == Decimal("0.50000000000000000000")
+    mock_renormalize_row_orders.delay.assert_not_called()
+
+    # There is no room left between the second and the third row, so the order of
+    # the second row must be decreased and the renormalization is scheduled.
+    with django_capture_on_commit_callbacks(execute=True):
+        row_5 = handler.create_row(user, table, before_row=row_3, model=model)
+    row_2.refresh_from_db()
+    assert row_2.order == Decimal("1.99999999999999999998")
+    assert row_5.order == Decimal("1.99999999999999999999")
+    mock_renormalize_row_orders.delay.assert_called_once_with(table.id)
+
+    # The renormalization isn't scheduled again while it's pending.
+    with django_capture_on_commit_callbacks(execute=True):
+        handler.create_row(user, table, before_row=row_3, model=model)
+    mock_renormalize_row_orders.delay.assert_called_once()
+
+    cache.delete(get_row_order_renormalization_cache_key(table.id))
+
+
+@pytest.mark.django_db
+def test_renormalize_table_row_orders(data_fixture, settings):
+    settings.BASEROW_ROW_ORDER_RENORMALIZATION_CHUNK_SIZE = 2
+    table = data_fixture.create_database_table()
+    model = table.get_model()
+    row_1 = model.objects.create(order=Decimal("0.50000000000000000000"))
+    row_2 = model.objects.create(order=Decimal("1.00000000000000000000"))
+    row_3 = model.objects.create(order=Decimal("1.99999999999999999998"))
+    row_4 = model.objects.create(order=Decimal("1.99999999999999999999"))
+    row_5 = model.objects.create(order=Decimal("2.00000000000000000000"))
+    row_6 = model.objects.create(order=Decimal("3.00000000000000000000"))
+    row_7 = model.objects.create(order=Decimal("3.00000000000000000001"))
+    row_8 = model.objects.create(order=Decimal("4.00000000000000000000"))
+
+    assert get_row_order_buckets_to_renormalize(model) == [(2, 3), (4, 2)]
+
+    cache_key = get_row_order_renormalization_cache_key(table.id)
+    cache.set(cache_key, True)
+    row_order_version = get_table_row_order_version(table.id)
+    renormalize_row_orders(table.id)
+    assert cache.get(cache_key) is None
+    assert get_table_row_order_version(table.id) > row_order_version
+
+    assert get_row_order_buckets_to_renormalize(model) == []
+    assert [
+        (row.id, row.order) for row in model.objects.all().order_by("order", "id")
+    ] == [
+        (row_1.id, Decimal("0.50000000000000000000")),
+        (row_2.id, Decimal("1.00000000000000000000")),
+        (row_3.id, Decimal("1.33333333333333333333")),
+        (row_4.id, Decimal("1.66666666666666666667")),
+        (row_5.id, Decimal("2.00000000000000000000")),
+        (row_6.id, Decimal("3.00000000000000000000")),
+        (row_7.id, Decimal("3.50000000000000000000")),
+        (row_8.id, Decimal("4.00000000000000000000")),
+    ]
+
+    assert renormalize_table_row_orders(model) == 0
+
+
+@pytest.mark.django_db
+def test_insert_row_before_uses_current_order_of_before_row(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    model = table.get_model()
+    model.objects.create(order=Decimal("1.00000000000000000000"))
+    row_2 = model.objects.create(order=Decimal("1.99999999999999999999"))
+    model.objects.create(order=Decimal("2.00000000000000000000"))
+
+    # The order of the row is changed by a renormalization after it was fetched.
+    renormalize_table_row_orders(model)
+    assert row_2.order == Decimal("1.99999999999999999999")
+
+    row_4 = RowHandler().create_row(user, table, before_row=row_2, model=model)
+    assert row_2.order == Decimal("1.50000000000000000000")
+    assert row_4.order == Decimal("1.25000000000000000000")
@@ -18,11 +18,15 @@ from baserow.contrib.database.rows.actions import (
     CreateRowsActionType,
     DeleteRowActionType,
     DeleteRowsActionType,
+    DeleteRowsByFilterActionType,
     MoveRowActionType,
     UpdateRowActionType,
     UpdateRowsActionType,
+    UpdateRowsByFilterActionType,
+    UpsertRowsActionType,
 )
 from baserow.contrib.database.rows.handler import RowHandler
+from baserow.core.models import TrashEntry
 
 
 @pytest.mark.django_db
@@ -1147,3 +1151,229 @@ def test_can_undo_redo_update_rows_interesting_field_types(data_fixture):
         )
     ) == [multi_select_option_2.id]
     assert getattr(row_table_1, f"field_{formula_field.id}") == "New value"
+
+
+@pytest.mark.django_db
+def test_can_undo_redo_upsert_rows(data_fixture):
+    session_id = "session-id"
+    user = data_fixture.create_user(session_id=session_id)
+    table = data_fixture.create_database_table(name="Test", user=user)
+    key_field = data_fixture.create_text_field(table=table, name="Key", primary=True)
+    name_field = data_fixture.create_text_field(table=table, name="Name")
+    key = f"field_{key_field.id}"
+    name = f"field_{name_field.id}"
+
+    row_handler = RowHandler()
+    model = table.get_model()
+    existing_row = row_handler.create_row(
+        user, table, {key: "a", name: "Original value"}, model=model
+    )
+
+    rows = action_type_registry.get_by_type(UpsertRowsActionType).do(
+        user,
+        table,
+        [{key: "a", name: "New value"}, {key: "b", name: "Created"}],
+        key_field.id,
+    )
+    created_row = rows[1]
+    assert rows[0].id == existing_row.id
+
+    ActionHandler.undo(
+        user, [TableActionScopeType.value(table_id=table.id)], session_id
+    )
+
+    existing_row.refresh_from_db()
+    assert getattr(existing_row, name) == "Original value"
+    assert not model.objects.filter(id=created_row.id).exists()
+
+    action_redone = ActionHandler.redo(
+        user, [TableActionScopeType.value(table_id=table.id)], session_id
+    )
+
+    assert action_redone is not None
+    assert action_redone.type == UpsertRowsActionType.type
+    assert action_redone.error is None
+
+    existing_row.refresh_from_db()
+    assert getattr(existing_row, name) == "New value"
+    assert getattr(model.objects.get(id=created_row.id), name) == "Created"
+
+
+@pytest.mark.django_db
+def test_can_undo_redo_update_rows_by_filter(data_fixture, settings):
+    session_id = "session-id"
+    user = data_fixture.create_user(session_id=session_id)
+    table = data_fixture.create_database_table(name="Test", user=user)
+    name_field = data_fixture.create_text_field(table=table, name="Name")
+    number_field = data_fixture.create_number_field(table=table, name="Number")
+    name = f"field_{name_field.id}"
+    number = f"field_{number_field.id}"
+
+    model = table.get_model()
+    rows = RowHandler().create_rows(
+        user,
+        table,
+        [
+            {name: "a", number: 1},
+            {name: "b", number: 2},
+            {name: "c", number: 3},
+            {name: "d", number: 4},
+        ],
+        model=model,
+    )
+    view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=view, field=number_field, type="higher_than", value="1"
+    )
+
+    count = action_type_registry.get_by_type(UpdateRowsByFilterActionType).do(
+        user, table, {name: "New value"}, view=view
+    )
+    assert count == 3
+
+    def get_names():
+        return list(model.objects.order_by("id").values_list(name, flat=True))
+
+    assert get_names() == ["a", "New value", "New value", "New value"]
+
+    ActionHandler.undo(
+        user, [TableActionScopeType.value(table_id=table.id)], session_id
+    )
+
+    assert get_names() == ["a", "b", "c", "d"]
+
+    action_redone = ActionHandler.redo(
+        user, [TableActionScopeType.value(table_id=table.id)], session_id
+    )
+
+    assert action_redone is not None
+    assert action_redone.type == UpdateRowsByFilterActionType.type
+    assert action_redone.error is None
+    assert get_names() == ["a", "New value", "New value", "New value"]
+
+    # Above the limit, the original values are not stored and the undo stack of the
+    # table is cleared, so the earlier update can't be undone anymore either.
+    settings.BASEROW_ROWS_BY_FILTER_UNDO_LIMIT = 2
+    count = action_type_registry.get_by_type(UpdateRowsByFilterActionType).do(
+        user, table, {name: "Other value"}, view=view
+    )
+    assert count == 3
+    assert get_names() == ["a", "Other value", "Other value", "Other value"]
+
+    action_undone = ActionHandler.undo(
+        user, [TableActionScopeType.value(table_id=table.id)], session_id
+    )
+    assert action_undone is None
+    assert get_names() == ["a", "Other value", "Other value", "Other value"]
+
+
+@pytest.mark.django_db
+def test_can_undo_update_rows_by_filter_with_link_row_field(data_fixture):
+    session_id = "session-id"
+    user = data_fixture.create_user(session_id=session_id)
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(name="Test", database=database)
+    related_table = data_fixture.create_database_table(
+        name="Related", database=database
+    )
+    number_field = data_fixture.create_number_field(table=table, name="Number")
+    link_field = FieldHandler().create_field(
+        user, table, "link_row", name="Link", link_row_table=related_table
+    )
+    number = f"field_{number_field.id}"
+    link = f"field_{link_field.id}"
+
+    related_model = related_table.get_model()
+    related_1 = related_model.objects.create()
+    related_2 = related_model.objects.create()
+
+    model = table.get_model()
+    RowHandler().create_rows(
+        user,
+        table,
+        [
+            {number: 1, link: [related_1.id, related_2.id]},
+            {number: 2, link: []},
+            {number: 3, link: [related_2.id]},
+        ],
+        model=model,
+    )
+
+    def get_values():
+        return [
+            (getattr(row, number), [r.id for r in getattr(row, link).all()])
+            for row in model.objects.order_by("id")
+        ]
+
+    original_values = get_values()
+
+    count = action_type_registry.get_by_type(UpdateRowsByFilterActionType).do(
+        user, table, {number: 10, link: [related_1.id]}
+    )
+    assert count == 3
+    assert [value for value, _ in get_values()] == [10, 10, 10]
+
+    ActionHandler.undo(
+        user, [TableActionScopeType.value(table_id=table.id)], session_id
+    )
+
+    assert get_values() == original_values
+
+
+@pytest.mark.django_db
+def test_can_undo_redo_delete_rows_by_filter(data_fixture, settings):
+    session_id = "session-id"
+    user = data_fixture.create_user(session_id=session_id)
+    table = data_fixture.create_database_table(name="Test", user=user)
+    name_field = data_fixture.create_text_field(table=table, name="Name")
+    name = f"field_{name_field.id}"
+
+    model = table.get_model()
+    rows = RowHandler().create_rows(
+        user,
+        table,
+        [{name: "a"}, {name: "b"}, {name: "b"}, {name: "b"}],
+        model=model,
+    )
+
+    count = action_type_registry.get_by_type(DeleteRowsByFilterActionType).do(
+        user, table, filter_object={f"filter__{name}__equal": ["b"]}
+    )
+    assert count == 3
+    assert list(model.objects.values_list("id", flat=True)) == [rows[0].id]
+    # All the rows end up in a single trash entry.
+    assert TrashEntry.objects.filter(trash_item_type="rows").count() == 1
+
+    ActionHandler.undo(
+        user, [TableActionScopeType.value(table_id=table.id)], session_id
+    )
+
+    assert model.objects.count() == 4
+
+    action_redone = ActionHandler.redo(
+        user, [TableActionScopeType.value(table_id=table.id)], session_id
+    )
+
+    assert action_redone is not None
+    assert action_redone.type == DeleteRowsByFilterActionType.type
+    assert action_redone.error is None
+    assert list(model.objects.values_list("id", flat=True)) == [rows[0].id]
+
+    ActionHandler.undo(
+        user, [TableActionScopeType.value(table_id=table.id)], session_id
+    )
+
+    assert model.objects.count() == 4
+
+    # Above the limit, the action is not registered and the undo stack of the table
+    # is cleared, but the rows can still be restored from the trash.
+    settings.BASEROW_ROWS_BY_FILTER_UNDO_LIMIT = 2
+    action_type_registry.get_by_type(DeleteRowsByFilterActionType).do(
+        user, table, filter_object={f"filter__{name}__equal": ["b"]}
+    )
+    assert model.objects.count() == 1
+    action_undone = ActionHandler.undo(
+        user, [TableActionScopeType.value(table_id=table.id)], session_id
+    )
+    assert action_undone is None
+    assert model.objects.count() == 1
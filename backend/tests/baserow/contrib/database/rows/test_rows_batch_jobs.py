@@ -0,0 +1,308 @@
+from unittest.mock import patch
+
+import pytest
+from celery.exceptions import SoftTimeLimitExceeded
+from django.utils import timezone
+from freezegun import freeze_time
+
+from baserow.contrib.database.rows.batch_jobs import RowsBatchJobHandler
+from baserow.contrib.database.rows.exceptions import (
+    RowsBatchJobAlreadyRunning,
+    RowsBatchJobDoesNotExist,
+)
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.rows.models import RowsBatchJob
+from baserow.contrib.database.rows.webhook_event_types import (
+    RowsBatchJobChunkProcessedEventType,
+)
+from baserow.core.exceptions import UserNotInGroup
+
+
+def _create_job(items, **kwargs):
+    job = RowsBatchJob.objects.create(total_count=len(items), **kwargs)
+    RowsBatchJobHandler().create_chunks(job, items)
+    return job
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.rows.batch_jobs.run_rows_batch_job")
+def test_create_and_start_rows_batch_job(
+    mock_run_rows_batch_job, data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    other_table = data_fixture.create_database_table()
+    handler = RowsBatchJobHandler()
+
+    with pytest.raises(UserNotInGroup):
+        handler.create_and_start_job(user, other_table, "create", [{}])
+
+    with django_capture_on_commit_callbacks(execute=True):
+        job = handler.create_and_start_job(
+            user, table, "create", [{}, {}], user_field_names=True
+        )
+    mock_run_rows_batch_job.delay.assert_called_once_with(job.id)
+
+    job.refresh_from_db()
+    assert job.user_id == user.id
+    assert job.table_id == table.id
+    assert job.type == "create"
+    assert job.user_field_names
+    assert [chunk.items for chunk in job.chunks.all()] == [[{}, {}]]
+    assert job.total_count == 2
+    assert job.processed_count == 0
+    assert job.state == "pending"
+
+    with pytest.raises(RowsBatchJobAlreadyRunning):
+        handler.create_and_start_job(user, table, "create", [{}])
+
+    # A job that hasn't made any progress for longer than the time limit isn't
+    # considered running anymore.
+    with freeze_time(timezone.now() + timezone.timedelta(days=1)):
+        handler.create_and_start_job(user, table, "create", [{}])
+
+    assert handler.get_job(user, job.id).id == job.id
+    with pytest.raises(RowsBatchJobDoesNotExist):
+        handler.get_job(data_fixture.create_user(), job.id)
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.rows.signals.rows_batch_job_chunk_processed.send")
+@patch("baserow.contrib.database.rows.signals.rows_created.send")
+def test_run_rows_batch_job(
+    rows_created_mock, chunk_processed_mock, data_fixture, settings
+):
+    settings.BASEROW_ROWS_BATCH_JOB_CHUNK_SIZE = 2
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="Name")
+    model = table.get_model()
+
+    job = _create_job(
+        user=user,
+        table=table,
+        type="create",
+        user_field_names=True,
+        items=[{"Name": "a"}, {"Name": "b"}, {"Name": "c"}],
+    )
+    RowsBatchJobHandler().run_job(job)
+
+    job.refresh_from_db()
+    assert job.state == "finished"
+    assert job.processed_count == 3
+    assert job.progress_percentage == 100
+    assert not job.chunks.exists()
+    rows = list(model.objects.all().order_by("id"))
+    assert [getattr(row, f"field_{text_field.id}") for row in rows] == ["a", "b", "c"]
+
+    # The signals are sent once per chunk, without the realtime events of the rows.
+    assert rows_created_mock.call_count == 2
+    assert rows_created_mock.call_args[1]["send_realtime_update"] is False
+    assert chunk_processed_mock.call_count == 2
+    assert chunk_processed_mock.call_args_list[0][1]["row_ids"] == [
+        rows[0].id,
+        rows[1].id,
+    ]
+    assert chunk_processed_mock.call_args_list[0][1]["processed_count"] == 2
+    assert chunk_processed_mock.call_args_list[1][1]["row_ids"] == [rows[2].id]
+    assert chunk_processed_mock.call_args_list[1][1]["processed_count"] == 3
+
+    job = _create_job(
+        user=user,
+        table=table,
+        type="update",
+        items=[
+            {"id": rows[0].id, f"field_{text_field.id}": "d"},
+            {"id": rows[2].id, f"field_{text_field.id}": "e"},
+        ],
+    )
+    RowsBatchJobHandler().run_job(job)
+
+    rows = list(model.objects.all().order_by("id"))
+    assert [getattr(row, f"field_{text_field.id}") for row in rows] == ["d", "b", "e"]
+
+    job = _create_job(
+        user=user,
+        table=table,
+        type="delete",
+        items=[rows[0].id, rows[1].id],
+    )
+    RowsBatchJobHandler().run_job(job)
+
+    assert list(model.objects.values_list("id", flat=True)) == [rows[2].id]
+
+
+@pytest.mark.django_db
+def test_run_rows_batch_job_failed_chunk(data_fixture, settings):
+    settings.BASEROW_ROWS_BATCH_JOB_CHUNK_SIZE = 2
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    model = table.get_model()
+
+    job = _create_job(
+        user=user,
+        table=table,
+        type="create",
+        items=[
+            {f"field_{number_field.id}": 1},
+            {f"field_{number_field.id}": 2},
+            {f"field_{number_field.id}": 3},
+            {f"field_{number_field.id}": "invalid"},
+        ],
+    )
+    with pytest.raises(Exception):
+        RowsBatchJobHandler().run_job(job)
+
+    job.refresh_from_db()
+    assert job.state == "failed"
+    assert job.processed_count == 2
+    assert job.progress_percentage == 50
+    assert job.human_readable_error == "The item at index 3 is invalid."
+    assert f"field_{number_field.id}" in job.error
+    assert not job.chunks.exists()
+
+    # The chunk before the invalid one stays committed.
+    assert sorted(model.objects.values_list(f"field_{number_field.id}", flat=True)) == [
+        1,
+        2,
+    ]
+
+    row = RowHandler().create_row(user, table, {})
+    job = _create_job(
+        user=user,
+        table=table,
+        type="delete",
+        items=[row.id, 0],
+    )
+    with pytest.raises(Exception):
+        RowsBatchJobHandler().run_job(job)
+
+    job.refresh_from_db()
+    assert job.state == "failed"
+    assert job.human_readable_error == "One of the rows does not exist."
+    assert model.objects.filter(id=row.id).exists()
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.rows.batch_jobs.run_rows_batch_job")
+def test_run_rows_batch_job_continues_after_soft_time_limit(
+    mock_run_rows_batch_job, data_fixture, settings, django_capture_on_commit_callbacks
+):
+    settings.BASEROW_ROWS_BATCH_JOB_CHUNK_SIZE = 1
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="Name")
+    model = table.get_model()
+    handler = RowsBatchJobHandler()
+    original_process_chunk = handler.process_chunk
+
+    def process_chunk_until_time_limit(job, chunk, offset, lookup_cache=None):
+        if offset > 0:
+            raise SoftTimeLimitExceeded()
+        return original_process_chunk(job, chunk, offset, lookup_cache)
+
+    job = _create_job(
+        user=user,
+        table=table,
+        type="create",
+        user_field_names=True,
+        items=[{"Name": "a"}, {"Name": "b"}, {"Name": "c"}],
+    )
+    with patch.object(
+        handler, "process_chunk", side_effect=process_chunk_until_time_limit
+    ), django_capture_on_commit_callbacks(execute=True):
+        handler.run_job(job)
+
+    # The task is started again and continues with the remaining chunks.
+    mock_run_rows_batch_job.delay.assert_called_once_with(job.id)
+    job.refresh_from_db()
+    assert job.state == "processing"
+    assert job.processed_count == 1
+    assert job.chunks.count() == 2
+
+    handler.run_job(job)
+
+    job.refresh_from_db()
+    assert job.state == "finished"
+    assert job.processed_count == 3
+    assert [
+        getattr(row, f"field_{text_field.id}") for row in model.objects.order_by("id")
+    ] == ["a", "b", "c"]
+
+    # When not a single chunk can be processed within the time limit, the job fails.
+    job = _create_job(user=user, table=table, type="create", items=[{}, {}])
+    with patch.object(
+        handler, "process_chunk", side_effect=SoftTimeLimitExceeded()
+    ), pytest.raises(SoftTimeLimitExceeded):
+        handler.run_job(job)
+
+    job.refresh_from_db()
+    assert job.state == "failed"
+    assert job.human_readable_error == "The job took too long and was timed out."
+    assert not job.chunks.exists()
+
+
+@pytest.mark.django_db
+def test_clean_up_stale_rows_batch_jobs(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    handler = RowsBatchJobHandler()
+
+    with freeze_time(timezone.now() - timezone.timedelta(days=1)):
+        stale_job = _create_job(user=user, table=table, type="create", items=[{}])
+        stale_job.state = "processing"
+        stale_job.save()
+        finished_job = _create_job(user=user, table=table, type="create", items=[])
+        finished_job.state = "finished"
+        finished_job.save()
+    running_job = _create_job(user=user, table=table, type="create", items=[{}])
+
+    assert handler.clean_up_stale_jobs() == 1
+
+    stale_job.refresh_from_db()
+    assert stale_job.state == "failed"
+    assert stale_job.human_readable_error == "The job was interrupted."
+    assert not stale_job.chunks.exists()
+    finished_job.refresh_from_db()
+    assert finished_job.state == "finished"
+    running_job.refresh_from_db()
+    assert running_job.state == "pending"
+    assert running_job.chunks.exists()
+
+    # A task that starts after its job has been marked as failed doesn't run it.
+    handler.run_job(stale_job)
+    stale_job.refresh_from_db()
+    assert stale_job.state == "failed"
+    assert table.get_model().objects.count() == 0
+
+
+@pytest.mark.django_db
+def test_rows_batch_job_chunk_processed_event_type_payload(data_fixture):
+    table = data_fixture.create_database_table()
+    webhook = data_fixture.create_table_webhook(table=table)
+    job = RowsBatchJob.objects.create(
+        user=data_fixture.create_user(),
+        table=table,
+        type="delete",
+        total_count=4,
+    )
+
+    payload = RowsBatchJobChunkProcessedEventType().get_payload(
+        event_id="1",
+        webhook=webhook,
+        job=job,
+        row_ids=[1, 2],
+        processed_count=2,
+        table=table,
+    )
+    assert payload == {
+        "table_id": table.id,
+        "event_id": "1",
+        "event_type": "rows.batch_job_chunk_processed",
+        "job_id": job.id,
+        "job_type": "delete",
+        "row_ids": [1, 2],
+        "processed_count": 2,
+        "total_count": 4,
+    }
@@ -6,10 +6,20 @@ from pytz import UTC
 
 import pytest
 from django.core.exceptions import ValidationError
-from django.db import models
-
-from baserow.contrib.database.rows.exceptions import RowDoesNotExist
-from baserow.contrib.database.rows.handler import RowHandler
+from django.db import connection, models, transaction
+
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.rows.exceptions import (
+    IncompatibleUpsertKeyField,
+    RowDoesNotExist,
+    UpsertKeyMatchesMultipleRows,
+    UpsertKeyValuesNotUnique,
+)
+from baserow.contrib.database.rows.handler import (
+    UPSERT_ADVISORY_LOCK_KEY,
+    RowHandler,
+)
+from baserow.contrib.database.views.exceptions import ViewNotInTable
 from baserow.core.exceptions import UserNotInGroup
 from baserow.core.trash.handler import TrashHandler
 from baserow.contrib.database.api.utils import (
@@ -171,7 +181,7 @@ def test_create_row(send_mock, data_fixture):
     row_2.refresh_from_db()
     assert row_1.order == Decimal("1.00000000000000000000")
     assert row_2.order == Decimal("2.00000000000000000000")
-    assert row_3.order == Decimal("1.99999999999999999999")
+    assert row_3.order == Decimal("1.50000000000000000000")
     assert send_mock.call_args[1]["before"].id == row_2.id
 
     row_4 = handler.create_row(user=user, table=table, before_row=row_2)
@@ -180,8 +190,8 @@ def test_create_row(send_mock, data_fixture):
     row_3.refresh_from_db()
     assert row_1.order == Decimal("1.00000000000000000000")
     assert row_2.order == Decimal("2.00000000000000000000")
-    assert row_3.order == Decimal("1.99999999999999999998")
-    assert row_4.order == Decimal("1.99999999999999999999")
+    assert row_3.order == Decimal("1.50000000000000000000")
+    assert row_4.order == Decimal("1.75000000000000000000")
 
     row_5 = handler.create_row(user=user, table=table, before_row=row_3)
     row_1.refresh_from_db()
@@ -190,9 +200,9 @@ def test_create_row(send_mock, data_fixture):
     row_4.refresh_from_db()
     assert row_1.order == Decimal("1.00000000000000000000")
     assert row_2.order == Decimal("2.00000000000000000000")
-    assert row_3.order == Decimal("1.99999999999999999998")
-    assert row_4.order == Decimal("1.99999999999999999999")
-    assert row_5.order == Decimal("1.99999999999999999997")
+    assert row_3.order == Decimal("1.50000000000000000000")
+    assert row_4.order == Decimal("1.75000000000000000000")
+    assert row_5.order == Decimal("1.25000000000000000000")
 
     row_6 = handler.create_row(user=user, table=table, before_row=row_2)
     row_1.refresh_from_db()
@@ -202,10 +212,10 @@ def test_create_row(send_mock, data_fixture):
     row_5.refresh_from_db()
     assert row_1.order == Decimal("1.00000000000000000000")
     assert row_2.order == Decimal("2.00000000000000000000")
-    assert row_3.order == Decimal("1.99999999999999999997")
-    assert row_4.order == Decimal("1.99999999999999999998")
-    assert row_5.order == Decimal("1.99999999999999999996")
-    assert row_6.order == Decimal("1.99999999999999999999")
+    assert row_3.order == Decimal("1.50000000000000000000")
+    assert row_4.order == Decimal("1.75000000000000000000")
+    assert row_5.order == Decimal("1.25000000000000000000")
+    assert row_6.order == Decimal("1.87500000000000000000")
 
     row_7 = handler.create_row(user, table=table, before_row=row_1)
     row_1.refresh_from_db()
@@ -216,11 +226,11 @@ def test_create_row(send_mock, data_fixture):
     row_6.refresh_from_db()
     assert row_1.order == Decimal("1.00000000000000000000")
     assert row_2.order == Decimal("2.00000000000000000000")
-    assert row_3.order == Decimal("1.99999999999999999997")
-    assert row_4.order == Decimal("1.99999999999999999998")
-    assert row_5.order == Decimal("1.99999999999999999996")
-    assert row_6.order == Decimal("1.99999999999999999999")
-    assert row_7.order == Decimal("0.99999999999999999999")
+    assert row_3.order == Decimal("1.50000000000000000000")
+    assert row_4.order == Decimal("1.75000000000000000000")
+    assert row_5.order == Decimal("1.25000000000000000000")
+    assert row_6.order == Decimal("1.87500000000000000000")
+    assert row_7.order == Decimal("0.50000000000000000000")
 
     with pytest.raises(ValidationError):
         handler.create_row(user=user, table=table, values={price_field.id: -10.22})
@@ -365,6 +375,63 @@ def test_create_rows_created_on_and_last_modified(data_fixture):
         assert row.updated_on == datetime(2020, 1, 1, 12, 0, tzinfo=UTC)
 
 
+@pytest.mark.django_db
+@patch("baserow.contrib.database.rows.signals.rows_created.send")
+def test_create_rows_using_copy(send_mock, data_fixture, settings):
+    settings.BASEROW_BULK_INSERT_COPY_THRESHOLD = 2
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(database=database)
+    link_table = data_fixture.create_database_table(database=database)
+    text_field = data_fixture.create_text_field(table=table)
+    link_field = FieldHandler().create_field(
+        user, table, "link_row", name="Link", link_row_table=link_table
+    )
+    formula_field = FieldHandler().create_field(
+        user,
+        table,
+        "formula",
+        name="Formula",
+        formula=f"concat(field('{text_field.name}'), '!')",
+    )
+    link_row_1, link_row_2 = RowHandler().create_rows(user, link_table, [{}, {}])
+    send_mock.reset_mock()
+
+    rows = RowHandler().create_rows(
+        user,
+        table,
+        [
+            {
+                f"field_{text_field.id}": "a",
+                f"field_{link_field.id}": [link_row_1.id, link_row_2.id],
+            },
+            {f"field_{text_field.id}": "b\tc"},
+            {f"field_{link_field.id}": [link_row_2.id]},
+        ],
+    )
+
+    assert len(rows) == 3
+    send_mock.assert_called_once()
+    assert [row.id for row in send_mock.call_args[1]["rows"]] == [
+        row.id for row in rows
+    ]
+
+    row_1, row_2, row_3 = table.get_model().objects.all().order_by("id")
+    assert [row_1.id, row_2.id, row_3.id] == [row.id for row in rows]
+    assert getattr(row_1, f"field_{text_field.id}") == "a"
+    assert getattr(row_2, f"field_{text_field.id}") == "b\tc"
+    assert getattr(row_3, f"field_{text_field.id}") is None
+    assert getattr(row_1, f"field_{formula_field.id}") == "a!"
+    assert getattr(row_2, f"field_{formula_field.id}") == "b\tc!"
+    assert [r.id for r in getattr(row_1, f"field_{link_field.id}").all()] == [
+        link_row_1.id,
+        link_row_2.id,
+    ]
+    assert [r.id for r in getattr(row_3, f"field_{link_field.id}").all()] == [
+        link_row_2.id
+    ]
+
+
 @pytest.mark.django_db
 def test_update_rows_created_on_and_last_modified(data_fixture):
     user = data_fixture.create_user()
@@ -430,7 +497,7 @@ def test_move_row(before_send_mock, send_mock, data_fixture):
     row_1.refresh_from_db()
     row_2.refresh_from_db()
     row_3.refresh_from_db()
-    assert row_1.order == Decimal("2.99999999999999999999")
+    assert row_1.order == Decimal("2.50000000000000000000")
     assert row_2.order == Decimal("2.00000000000000000000")
     assert row_3.order == Decimal("3.00000000000000000000")
 
@@ -615,3 +682,299 @@ def test_has_row(data_fixture):
 
     assert handler.has_row(user=user, table=table, row_id=row.id, raise_error=False)
     assert handler.has_row(user=user, table=table, row_id=row.id, raise_error=True)
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.rows.signals.rows_updated.send")
+@patch("baserow.contrib.database.rows.signals.rows_created.send")
+def test_upsert_rows(send_rows_created_mock, send_rows_updated_mock, data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    key_field = data_fixture.create_number_field(table=table, primary=True)
+    text_field = data_fixture.create_text_field(table=table)
+    model = table.get_model()
+    key = f"field_{key_field.id}"
+    text = f"field_{text_field.id}"
+    row_1 = model.objects.create(**{key: 1, text: "a"})
+    row_2 = model.objects.create(**{key: 2, text: "b"})
+
+    handler = RowHandler()
+    assert handler.match_rows_by_key(
+        model, key_field.id, [{key: Decimal("2")}, {key: 3}, {key: None}, {}]
+    ) == [row_2.id, None, None, None]
+
+    rows = handler.upsert_rows(
+        user,
+        table,
+        [{key: 3, text: "c"}, {key: 1, text: "d"}, {text: "e"}],
+        key_field.id,
+        model=model,
+    )
+    assert [(getattr(row, key), getattr(row, text)) for row in rows] == [
+        (3, "c"),
+        (1, "d"),
+        (None, "e"),
+    ]
+    assert rows[1].id == row_1.id
+    assert model.objects.count() == 4
+    send_rows_created_mock.assert_called_once()
+    assert send_rows_created_mock.call_args[1]["rows"] == [rows[0], rows[2]]
+    send_rows_updated_mock.assert_called_once()
+    assert send_rows_updated_mock.call_args[1]["rows"] == [rows[1]]
+
+    with pytest.raises(UpsertKeyValuesNotUnique):
+        handler.upsert_rows(user, table, [{key: 4}, {key: 4}], key_field.id)
+
+    model.objects.create(**{key: 2})
+    with pytest.raises(UpsertKeyMatchesMultipleRows):
+        handler.upsert_rows(user, table, [{key: 2}], key_field.id)
+
+    formula_field = data_fixture.create_formula_field(table=table, formula="1")
+    with pytest.raises(IncompatibleUpsertKeyField):
+        handler.upsert_rows(user, table, [{key: 2}], formula_field.id)
+
+    with pytest.raises(UserNotInGroup):
+        handler.upsert_rows(data_fixture.create_user(), table, [{key: 5}], key_field.id)
+
+
+@pytest.mark.django_db
+def test_match_rows_by_key_locks_the_key_field(data_fixture):
+    table = data_fixture.create_database_table()
+    key_field = data_fixture.create_number_field(table=table, primary=True)
+    model = table.get_model()
+
+    def get_key_field_locks():
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT count(*) FROM pg_locks
+                WHERE locktype = 'advisory' AND classid = %s AND objid = %s
+                    AND pid = pg_backend_pid()
+                """,
+                [UPSERT_ADVISORY_LOCK_KEY, key_field.id],
+            )
+            return cursor.fetchone()[0]
+
+    # The lock is held until the transaction that creates the new rows ends, so
+    # that a concurrent upsert with the same key waits for it and matches its row.
+    with transaction.atomic():
+        assert get_key_field_locks() == 0
+        RowHandler().match_rows_by_key(
+            model, key_field.id, [{f"field_{key_field.id}": 1}]
+        )
+        assert get_key_field_locks() == 1
+
+
+@pytest.mark.django_db
+def test_get_row_ids_queryset_by_filter(data_fixture):
+    table = data_fixture.create_database_table()
+    number_field = data_fixture.create_number_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=grid_view, field=number_field, type="higher_than", value="1"
+    )
+    model = table.get_model()
+    row_1, row_2, row_3, row_4 = [
+        model.objects.create(**{f"field_{number_field.id}": value})
+        for value in [1, 2, 3, 4]
+    ]
+
+    handler = RowHandler()
+
+    def get_row_ids(*args, **kwargs):
+        queryset, count = handler.get_row_ids_queryset_by_filter(*args, **kwargs)
+        row_ids = list(queryset.order_by("id").values_list("id", flat=True))
+        assert count == len(row_ids)
+        return row_ids
+
+    filter_object = {f"filter__field_{number_field.id}__lower_than": ["4"]}
+    assert get_row_ids(table) == [row_1.id, row_2.id, row_3.id, row_4.id]
+    assert get_row_ids(table, view=grid_view) == [row_2.id, row_3.id, row_4.id]
+    assert get_row_ids(table, filter_object=filter_object) == [
+        row_1.id,
+        row_2.id,
+        row_3.id,
+    ]
+    assert get_row_ids(
+        table, model=model, view=grid_view, filter_object=filter_object
+    ) == [row_2.id, row_3.id]
+    assert (
+        get_row_ids(
+            table,
+            filter_object={f"filter__field_{number_field.id}__equal": ["1", "4"]},
+            filter_type="OR",
+        )
+        == [row_1.id, row_4.id]
+    )
+
+    # The queryset keeps selecting the same rows after they don't match anymore.
+    queryset, count = handler.get_row_ids_queryset_by_filter(table, view=grid_view)
+    model.objects.update(**{f"field_{number_field.id}": 0})
+    assert count == 3
+    assert list(queryset.order_by("id").values_list("id", flat=True)) == [
+        row_2.id,
+        row_3.id,
+        row_4.id,
+    ]
+
+    with pytest.raises(ViewNotInTable):
+        handler.get_row_ids_queryset_by_filter(
+            table, view=data_fixture.create_grid_view()
+        )
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.rows.signals.rows_updated_by_filter.send")
+@patch("baserow.contrib.database.rows.signals.rows_updated.send")
+def test_update_rows_values(rows_updated_mock, send_mock, data_fixture):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(database=database)
+    other_table = data_fixture.create_database_table(database=database)
+    text_field = data_fixture.create_text_field(table=table, name="Text")
+    multiple_select_field = data_fixture.create_multiple_select_field(table=table)
+    option_a = data_fixture.create_select_option(field=multiple_select_field)
+    option_b = data_fixture.create_select_option(field=multiple_select_field)
+    last_modified_field = data_fixture.create_last_modified_field(table=table)
+    formula_field = FieldHandler().create_field(
+        user, table, "formula", name="Formula", formula="concat(field('Text'), '!')"
+    )
+    link_field = FieldHandler().create_field(
+        user, other_table, "link_row", name="Link", link_row_table=table
+    )
+    lookup_field = FieldHandler().create_field(
+        user,
+        other_table,
+        "lookup",
+        name="Lookup",
+        through_field_id=link_field.id,
+        target_field_id=text_field.id,
+    )
+
+    handler = RowHandler()
+    with freeze_time("2020-01-01 12:00"):
+        row_1, row_2, row_3 = handler.create_rows(
+            user,
+            table,
+            [
+                {f"field_{text_field.id}": "a"},
+                {f"field_{multiple_select_field.id}": [option_a.id]},
+                {f"field_{text_field.id}": "c"},
+            ],
+        )
+    other_row = handler.create_row(
+        user, other_table, {f"field_{link_field.id}": [row_1.id, row_2.id]}
+    )
+
+    model = table.get_model()
+    with freeze_time("2020-01-02 12:00"):
+        handler.update_rows_values(
+            user,
+            table,
+            model.objects.filter(id__in=[row_1.id, row_2.id]),
+            {
+                f"field_{text_field.id}": "new",
+                f"field_{multiple_select_field.id}": [option_b.id],
+            },
+        )
+
+    # The rows are not fetched to send their realtime events.
+    rows_updated_mock.assert_not_called()
+    send_mock.assert_called_once()
+    assert send_mock.call_args[1]["updated_field_ids"] == {
+        text_field.id,
+        multiple_select_field.id,
+    }
+
+    for row in model.objects.filter(id__in=[row_1.id, row_2.id]):
+        assert getattr(row, f"field_{text_field.id}") == "new"
+        assert getattr(row, f"field_{formula_field.id}") == "new!"
+        assert [
+            option.id
+            for option in getattr(row, f"field_{multiple_select_field.id}").all()
+        ] == [option_b.id]
+        assert row.updated_on == datetime(2020, 1, 2, 12, 0, tzinfo=UTC)
+        assert getattr(row, f"field_{last_modified_field.id}") == datetime(
+            2020, 1, 2, 12, 0, tzinfo=UTC
+        )
+
+    row_3 = model.objects.get(id=row_3.id)
+    assert getattr(row_3, f"field_{text_field.id}") == "c"
+    assert getattr(row_3, f"field_{formula_field.id}") == "c!"
+    assert row_3.updated_on == datetime(2020, 1, 1, 12, 0, tzinfo=UTC)
+
+    other_row = other_table.get_model().objects.get(id=other_row.id)
+    assert [
+        value["value"] for value in getattr(other_row, f"field_{lookup_field.id}")
+    ] == [
+        "new",
+        "new",
+    ]
+
+    with pytest.raises(UserNotInGroup):
+        handler.update_rows_values(
+            data_fixture.create_user(),
+            table,
+            model.objects.filter(id=row_1.id),
+            {f"field_{text_field.id}": "x"},
+        )
+
+
+@pytest.mark.django_db
+@patch("baserow.contrib.database.rows.signals.rows_deleted_by_filter.send")
+def test_delete_rows_by_queryset(send_mock, data_fixture):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(database=database)
+    other_table = data_fixture.create_database_table(database=database)
+    text_field = data_fixture.create_text_field(table=table, name="Text")
+    link_field = FieldHandler().create_field(
+        user, other_table, "link_row", name="Link", link_row_table=table
+    )
+    lookup_field = FieldHandler().create_field(
+        user,
+        other_table,
+        "lookup",
+        name="Lookup",
+        through_field_id=link_field.id,
+        target_field_id=text_field.id,
+    )
+
+    def get_lookup_values():
+        other_model = other_table.get_model()
+        row = other_model.objects.get(id=other_row.id)
+        return [value["value"] for value in getattr(row, f"field_{lookup_field.id}")]
+
+    handler = RowHandler()
+    row_1, row_2, row_3 = handler.create_rows(
+        user, table, [{f"field_{text_field.id}": value} for value in "abc"]
+    )
+    other_row = handler.create_row(
+        user, other_table, {f"field_{link_field.id}": [row_1.id, row_2.id]}
+    )
+
+    model = table.get_model()
+    queryset, count = handler.get_row_ids_queryset_by_filter(
+        table, filter_object={f"filter__field_{text_field.id}__contains": ["a"]}
+    )
+    trashed_rows = handler.delete_rows_by_queryset(user, table, queryset)
+
+    send_mock.assert_called_once()
+    assert list(model.objects.order_by("id").values_list("id", flat=True)) == [
+        row_2.id,
+        row_3.id,
+    ]
+    trashed_rows.refresh_from_db()
+    assert trashed_rows.row_ids == [row_1.id]
+    assert get_lookup_values() == ["b"]
+
+    TrashHandler.restore_item(
+        user, "rows", trashed_rows.id, parent_trash_item_id=table.id
+    )
+    assert model.objects.count() == 3
+    assert get_lookup_values() == ["a", "b"]
+
+    with pytest.raises(UserNotInGroup):
+        handler.delete_rows_by_queryset(
+            data_fixture.create_user(), table, model.objects.all()
+        )
@@ -1,19 +1,37 @@
+import json
+import pickle
+from unittest.mock import MagicMock, patch
+
 import pytest
 
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.fields.models import Field
 from baserow.contrib.database.table.cache import (
     invalidate_table_in_model_cache,
     table_model_cache_version_key,
     generated_models_cache,
     clear_generated_model_cache,
     get_current_cached_model_version,
-    get_cached_model_field_attrs,
+    get_cached_model_fields,
+    clear_local_model_cache,
+    local_model_cache,
+    evict_tables_from_local_model_cache,
+    get_local_model_cache_checkpoint,
+    handle_model_cache_invalidation_message,
+    model_cache_invalidation_listener,
+    publish_model_cache_invalidation,
+    set_local_cached_model,
+    table_model_cache_invalidation_channel,
+    table_model_access_tracker,
+    table_model_recently_used_key,
+    warm_up_table_models,
+    table_model_cache_entry_key,
+    MODEL_DESCRIPTOR_FORMAT_VERSION,
 )
 
 
-def get_latest_attrs(table_id):
-    return get_cached_model_field_attrs(
-        table_id, get_current_cached_model_version(table_id)
-    )
+def get_latest_fields(table_id):
+    return get_cached_model_fields(table_id, get_current_cached_model_version(table_id))
 
 
 @pytest.mark.django_db
@@ -24,15 +42,15 @@ def test_changing_link_row_field_invalidates_both_tables(data_fixture):
     table_b.get_model()
     unrelated_table.get_model()
 
-    assert get_latest_attrs(table_a.id) is not None
-    assert get_latest_attrs(table_b.id) is not None
-    assert get_latest_attrs(unrelated_table.id) is not None
+    assert get_latest_fields(table_a.id) is not None
+    assert get_latest_fields(table_b.id) is not None
+    assert get_latest_fields(unrelated_table.id) is not None
 
     link_field.save()
 
-    assert get_latest_attrs(table_a.id) is None
-    assert get_latest_attrs(table_b.id) is None
-    assert get_latest_attrs(unrelated_table.id) is not None
+    assert get_latest_fields(table_a.id) is None
+    assert get_latest_fields(table_b.id) is None
+    assert get_latest_fields(unrelated_table.id) is not None
 
 
 @pytest.mark.django_db
@@ -75,11 +93,11 @@ def test_deleting_field_removes_tables_generated_model_cache_entry(data_fixture)
     field = data_fixture.create_text_field()
     field.table.get_model()
 
-    assert get_latest_attrs(field.table_id) is not None
+    assert get_latest_fields(field.table_id) is not None
 
     field.delete()
 
-    assert get_latest_attrs(field.table_id) is None
+    assert get_latest_fields(field.table_id) is None
 
 
 @pytest.mark.django_db
@@ -87,11 +105,11 @@ def test_deleting_table_removes_generated_model_cache_entry(data_fixture):
     table = data_fixture.create_database_table()
     table.get_model()
 
-    assert get_latest_attrs(table.id) is not None
+    assert get_latest_fields(table.id) is not None
 
     table.delete()
 
-    assert get_latest_attrs(table.id) is None
+    assert get_latest_fields(table.id) is None
 
 
 @pytest.mark.django_db
@@ -99,11 +117,11 @@ def test_deleting_tables_database_removes_generated_model_cache_entry(data_fixtu
     table = data_fixture.create_database_table()
     table.get_model()
 
-    assert get_latest_attrs(table.id) is not None
+    assert get_latest_fields(table.id) is not None
 
     table.database.delete()
 
-    assert get_latest_attrs(table.id) is None
+    assert get_latest_fields(table.id) is None
 
 
 @pytest.mark.django_db
@@ -111,24 +129,432 @@ def test_deleting_tables_group_removes_generated_model_cache_entry(data_fixture)
     table = data_fixture.create_database_table()
     table.get_model()
 
-    assert get_latest_attrs(table.id) is not None
+    assert get_latest_fields(table.id) is not None
 
     table.database.group.delete()
 
-    assert get_latest_attrs(table.id) is None
+    assert get_latest_fields(table.id) is None
 
 
 @pytest.mark.django_db
-def test_getting_newer_version_of_stored_attrs_returns_none(data_fixture):
+def test_getting_newer_version_of_stored_fields_returns_none(data_fixture):
     table = data_fixture.create_database_table()
     table.get_model()
 
     current_version = get_current_cached_model_version(table.id)
 
-    # If we are asking for the current version or an older one we will get the field
-    # attrs back.
-    assert get_cached_model_field_attrs(table.id, current_version) is not None
-    assert get_cached_model_field_attrs(table.id, current_version - 1) is not None
+    # If we are asking for the current version or an older one we will get the
+    # fields back.
+    assert get_cached_model_fields(table.id, current_version) is not None
+    assert get_cached_model_fields(table.id, current_version - 1) is not None
 
     # If we are getting a newer version which doesn't exist, we'll get back None
-    assert get_cached_model_field_attrs(table.id, current_version + 1) is None
+    assert get_cached_model_fields(table.id, current_version + 1) is None
+
+
+@pytest.mark.django_db
+def test_get_model_reuses_the_model_class_cached_in_memory(data_fixture):
+    table = data_fixture.create_database_table()
+    data_fixture.create_text_field(table=table)
+
+    model = table.get_model()
+
+    assert table.get_model() is model
+    assert table.get_model(use_cache=False) is not model
+    assert table.get_model(field_ids=[]) is not model
+    assert table.get_model(attribute_names=True) is not model
+
+
+@pytest.mark.django_db
+def test_changing_a_field_regenerates_the_in_memory_model(data_fixture):
+    table = data_fixture.create_database_table()
+    data_fixture.create_text_field(table=table)
+
+    model = table.get_model()
+    field = data_fixture.create_text_field(table=table)
+
+    new_model = table.get_model()
+    assert new_model is not model
+    assert field.id in new_model._field_objects
+    assert table.get_model() is new_model
+
+
+@pytest.mark.django_db
+def test_changing_a_related_table_regenerates_the_in_memory_model(data_fixture):
+    table_a, table_b, link_field = data_fixture.create_two_linked_tables()
+
+    model_a = table_a.get_model()
+    assert table_a.get_model() is model_a
+
+    # Bumping only the version of the related table must still invalidate the
+    # in memory model of table a because it contains a model of table b.
+    generated_models_cache.incr(table_model_cache_version_key(table_b.id))
+
+    assert table_a.get_model() is not model_a
+
+
+@pytest.mark.django_db
+def test_clearing_the_cache_regenerates_the_in_memory_model(data_fixture):
+    table = data_fixture.create_database_table()
+    model = table.get_model()
+
+    generated_models_cache.clear()
+
+    assert table.get_model() is not model
+
+
+@pytest.mark.django_db
+def test_in_memory_model_cache_evicts_least_recently_used(data_fixture, settings):
+    settings.BASEROW_GENERATED_MODEL_LRU_CACHE_SIZE = 2
+    clear_local_model_cache()
+    table_1 = data_fixture.create_database_table()
+    table_2 = data_fixture.create_database_table()
+    table_3 = data_fixture.create_database_table()
+
+    model_1 = table_1.get_model()
+    model_2 = table_2.get_model()
+    assert table_1.get_model() is model_1
+
+    table_3.get_model()
+
+    assert list(local_model_cache.keys()) == [table_1.id, table_3.id]
+    assert table_1.get_model() is model_1
+    assert table_2.get_model() is not model_2
+
+
+@pytest.mark.django_db
+def test_in_memory_model_cache_can_be_disabled(data_fixture, settings):
+    settings.BASEROW_GENERATED_MODEL_LRU_CACHE_SIZE = 0
+    table = data_fixture.create_database_table()
+
+    assert table.get_model() is not table.get_model()
+
+
+@pytest.mark.django_db
+def test_cached_model_descriptor_only_contains_plain_values(data_fixture):
+    table = data_fixture.create_database_table()
+    data_fixture.create_text_field(table=table, primary=True)
+    data_fixture.create_number_field(table=table, number_decimal_places=2)
+    data_fixture.create_boolean_field(table=table)
+    data_fixture.create_formula_field(table=table, formula="1")
+    table.get_model()
+
+    cache_entry = generated_models_cache.get(table_model_cache_entry_key(table.id))
+    descriptor = cache_entry["descriptor"]
+
+    assert descriptor["format"] == MODEL_DESCRIPTOR_FORMAT_VERSION
+    assert len(descriptor["fields"]) == 4
+    # Nothing but JSON compatible values must be stored, so no model instances.
+    assert json.loads(json.dumps(descriptor)) == descriptor
+    assert len(pickle.dumps(cache_entry)) < len(
+        pickle.dumps(table.get_model(use_cache=False)._field_objects)
+    )
+
+
+@pytest.mark.django_db
+def test_cached_model_fields_match_the_fetched_fields(data_fixture):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    number_field = data_fixture.create_number_field(
+        table=table, number_decimal_places=2
+    )
+    formula_field = data_fixture.create_formula_field(
+        table=table, formula=f"field('{text_field.name}')"
+    )
+    trashed_field = data_fixture.create_text_field(table=table, trashed=True)
+    table.get_model()
+
+    fields = {field.id: field for field in get_latest_fields(table.id)}
+
+    assert set(fields.keys()) == {
+        text_field.id,
+        number_field.id,
+        formula_field.id,
+        trashed_field.id,
+    }
+    for field in [text_field, number_field, formula_field, trashed_field]:
+        cached_field = fields[field.id]
+        assert type(cached_field) is type(field)
+        assert not cached_field._state.adding
+        for model_field in type(field)._meta.concrete_fields:
+            assert getattr(cached_field, model_field.attname) == getattr(
+                Field.objects_and_trash.get(id=field.id).specific, model_field.attname
+            )
+
+
+@pytest.mark.django_db
+def test_get_model_from_cached_descriptor_does_not_query_fields(
+    data_fixture, django_assert_num_queries
+):
+    table = data_fixture.create_database_table()
+    data_fixture.create_text_field(table=table, primary=True)
+    data_fixture.create_number_field(table=table)
+    table.get_model()
+    clear_local_model_cache()
+
+    with django_assert_num_queries(0):
+        model = table.get_model()
+
+    assert len(model._field_objects) == 2
+
+
+@pytest.mark.django_db
+def test_outdated_cached_model_descriptor_is_ignored(data_fixture):
+    table = data_fixture.create_database_table()
+    data_fixture.create_text_field(table=table, primary=True)
+    table.get_model()
+    cache_key = table_model_cache_entry_key(table.id)
+    cache_entry = generated_models_cache.get(cache_key)
+
+    old_format = {**cache_entry["descriptor"], "format": -1}
+    generated_models_cache.set(cache_key, {**cache_entry, "descriptor": old_format})
+    assert get_latest_fields(table.id) is None
+
+    changed_layout = {
+        **cache_entry["descriptor"],
+        "layouts": {"text": ["id", "unknown_column"]},
+    }
+    generated_models_cache.set(cache_key, {**cache_entry, "descriptor": changed_layout})
+    assert get_latest_fields(table.id) is None
+
+    # Entries made by previous versions don't have a descriptor at all.
+    generated_models_cache.set(
+        cache_key, {"field_attrs": {}, "version": cache_entry["version"]}
+    )
+    assert get_latest_fields(table.id) is None
+
+    clear_local_model_cache()
+    model = table.get_model()
+    assert len(model._field_objects) == 1
+    assert get_latest_fields(table.id) is not None
+
+
+@pytest.mark.django_db
+def test_projected_models_are_generated_from_cached_fields(
+    data_fixture, django_assert_num_queries
+):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table, name="text", primary=True)
+    number_field = data_fixture.create_number_field(table=table, name="number")
+    table.get_model()
+
+    with django_assert_num_queries(0):
+        model = table.get_model(field_ids=[number_field.id], add_dependencies=False)
+    assert list(model._field_objects.keys()) == [number_field.id]
+
+    with django_assert_num_queries(0):
+        model = table.get_model(field_names=["text"], add_dependencies=False)
+    assert list(model._field_objects.keys()) == [text_field.id]
+
+    with django_assert_num_queries(0):
+        model = table.get_model(attribute_names=True)
+    assert list(model._field_objects.keys()) == [text_field.id, number_field.id]
+    assert hasattr(model, "text")
+    assert hasattr(model, "number")
+
+
+@pytest.mark.django_db
+def test_projected_models_from_cached_fields_include_dependencies(
+    data_fixture, django_assert_num_queries
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="text", primary=True)
+    data_fixture.create_number_field(table=table, name="number")
+    trashed_field = data_fixture.create_text_field(table=table, name="trashed")
+    formula_field = FieldHandler().create_field(
+        user,
+        table,
+        "formula",
+        name="formula",
+        formula="concat(field('text'), field('trashed'))",
+    )
+    trashed_field.trashed = True
+    trashed_field.save()
+    table.get_model()
+
+    # Only the dependencies of all the fields must be fetched in a single query.
+    with django_assert_num_queries(1):
+        model = table.get_model(field_ids=[formula_field.id])
+
+    uncached_model = table.get_model(field_ids=[formula_field.id], use_cache=False)
+    assert list(model._field_objects.keys()) == [formula_field.id, text_field.id]
+    assert list(model._field_objects.keys()) == list(
+        uncached_model._field_objects.keys()
+    )
+
+
+@pytest.mark.django_db
+def test_in_memory_model_is_used_without_checking_versions_while_listening(
+    data_fixture,
+):
+    table = data_fixture.create_database_table()
+    clear_local_model_cache()
+
+    with patch.object(
+        model_cache_invalidation_listener, "get_listening_generation", return_value=1
+    ):
+        model = table.get_model()
+        with patch.object(generated_models_cache, "get_many") as get_many:
+            assert table.get_model() is model
+        get_many.assert_not_called()
+
+    # The listener has been resubscribed, so the versions must be checked once.
+    with patch.object(
+        model_cache_invalidation_listener, "get_listening_generation", return_value=2
+    ):
+        with patch.object(
+            generated_models_cache, "get_many", wraps=generated_models_cache.get_many
+        ) as get_many:
+            assert table.get_model() is model
+            assert table.get_model() is model
+        assert get_many.call_count == 1
+
+
+@pytest.mark.django_db
+def test_invalidation_messages_evict_the_in_memory_models(data_fixture):
+    table_a, table_b, link_field = data_fixture.create_two_linked_tables()
+    unrelated_table = data_fixture.create_database_table()
+    clear_local_model_cache()
+    table_a.get_model()
+    unrelated_table.get_model()
+
+    handle_model_cache_invalidation_message(str(table_b.id).encode())
+
+    assert table_a.id not in local_model_cache
+    assert unrelated_table.id in local_model_cache
+
+    handle_model_cache_invalidation_message(b"*")
+
+    assert len(local_model_cache) == 0
+
+
+@pytest.mark.django_db
+def test_model_invalidated_while_being_generated_is_not_cached_in_memory(
+    data_fixture,
+):
+    table = data_fixture.create_database_table()
+    clear_local_model_cache()
+    model = table.get_model(use_cache=False)
+
+    checkpoint = get_local_model_cache_checkpoint()
+    evict_tables_from_local_model_cache([table.id])
+    set_local_cached_model(table.id, model, {table.id: 1}, "epoch", checkpoint)
+
+    assert table.id not in local_model_cache
+
+    checkpoint = get_local_model_cache_checkpoint()
+    set_local_cached_model(table.id, model, {table.id: 1}, "epoch", checkpoint)
+
+    assert table.id in local_model_cache
+
+
+@pytest.mark.django_db
+def test_invalidations_are_published_after_commit(
+    data_fixture, settings, django_capture_on_commit_callbacks
+):
+    settings.BASEROW_GENERATED_MODEL_CACHE_PUBSUB_ENABLED = True
+    client = MagicMock()
+    table = data_fixture.create_database_table()
+
+    with patch.object(generated_models_cache, "client", create=True) as cache_client:
+        cache_client.get_client.return_value = client
+        with django_capture_on_commit_callbacks(execute=True):
+            invalidate_table_in_model_cache(table.id)
+            publish_model_cache_invalidation(None)
+            client.publish.assert_not_called()
+
+    assert [c.args for c in client.publish.call_args_list] == [
+        (table_model_cache_invalidation_channel(), str(table.id)),
+        (table_model_cache_invalidation_channel(), "*"),
+    ]
+
+
+@pytest.mark.django_db
+def test_recently_used_table_models_are_tracked(data_fixture, settings):
+    table_a = data_fixture.create_database_table()
+    table_b = data_fixture.create_database_table()
+    table_c = data_fixture.create_database_table()
+    table_model_access_tracker.flush()
+    generated_models_cache.delete(table_model_recently_used_key())
+
+    table_a.get_model()
+    table_b.get_model()
+    # Models with a subset of the fields are not tracked.
+    table_c.get_model(field_ids=[])
+
+    # Nothing is stored until the accesses are flushed.
+    assert table_model_access_tracker.get_recently_used_table_ids(10) == []
+
+    table_model_access_tracker.flush()
+    assert table_model_access_tracker.get_recently_used_table_ids(10) == [
+        table_b.id,
+        table_a.id,
+    ]
+    assert table_model_access_tracker.get_recently_used_table_ids(1) == [table_b.id]
+
+    # The recently used tables must survive clearing the generated model cache.
+    assert not table_model_recently_used_key().startswith("full_table_model_")
+
+    table_a.get_model()
+    table_model_access_tracker.flush()
+    assert table_model_access_tracker.get_recently_used_table_ids(10) == [
+        table_a.id,
+        table_b.id,
+    ]
+
+    settings.BASEROW_GENERATED_MODEL_WARM_UP_SIZE = 0
+    table_b.get_model()
+    table_model_access_tracker.flush()
+    assert table_model_access_tracker.get_recently_used_table_ids(10) == [
+        table_a.id,
+        table_b.id,
+    ]
+
+
+@pytest.mark.django_db
+def test_warm_up_table_models(data_fixture, settings):
+    table_a = data_fixture.create_database_table()
+    table_b = data_fixture.create_database_table()
+    trashed_table = data_fixture.create_database_table()
+    table_model_access_tracker.flush()
+    generated_models_cache.delete(table_model_recently_used_key())
+    table_a.get_model()
+    trashed_table.get_model()
+    table_b.get_model()
+    table_model_access_tracker.flush()
+    trashed_table.database.trashed = True
+    trashed_table.database.save()
+    clear_local_model_cache()
+
+    assert warm_up_table_models(limit=1) == 1
+    assert list(local_model_cache.keys()) == [table_b.id]
+
+    clear_local_model_cache()
+    settings.BASEROW_GENERATED_MODEL_WARM_UP_SIZE = 5
+    assert warm_up_table_models() == 2
+    assert set(local_model_cache.keys()) == {table_a.id, table_b.id}
+
+    # Warming up doesn't count as using the tables.
+    table_model_access_tracker.flush()
+    assert table_model_access_tracker.accesses == {}
+
+    clear_local_model_cache()
+    assert warm_up_table_models(max_seconds=0) == 0
+    assert len(local_model_cache) == 0
+
+    settings.BASEROW_GENERATED_MODEL_WARM_UP_SIZE = 0
+    assert warm_up_table_models() == 0
+
+
+@patch("baserow.contrib.database.table.cache.warm_up_table_models")
+def test_gunicorn_post_worker_init_warms_up_table_models(mock_warm_up):
+    from baserow.config.gunicorn import post_worker_init
+
+    worker = MagicMock(timeout=30)
+    post_worker_init(worker)
+    mock_warm_up.assert_called_once_with(max_seconds=15)
+
+    # A failing warm up must not prevent the worker from starting.
+    mock_warm_up.side_effect = Exception("Redis is not reachable")
+    post_worker_init(worker)
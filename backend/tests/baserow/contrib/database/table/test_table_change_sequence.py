@@ -0,0 +1,64 @@
+import pytest
+from django.core.cache import cache
+
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.table.change_sequence import (
+    bump_table_change_sequences,
+    get_table_change_sequence,
+    get_table_change_sequence_cache_key,
+)
+from baserow.contrib.database.views.handler import ViewHandler
+
+
+@pytest.mark.django_db
+def test_table_change_sequence_increases(data_fixture):
+    table = data_fixture.create_database_table()
+    table_2 = data_fixture.create_database_table()
+
+    sequence = get_table_change_sequence(table.id)
+    sequence_2 = get_table_change_sequence(table_2.id)
+    assert get_table_change_sequence(table.id) == sequence
+
+    bump_table_change_sequences([table.id])
+    assert get_table_change_sequence(table.id) > sequence
+    assert get_table_change_sequence(table_2.id) == sequence_2
+
+    # The sequence doesn't start over when the cache is cleared.
+    sequence = get_table_change_sequence(table.id)
+    cache.delete(get_table_change_sequence_cache_key(table.id))
+    assert get_table_change_sequence(table.id) > sequence
+
+
+@pytest.mark.django_db
+def test_table_change_sequence_increases_on_changes(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    grid = data_fixture.create_grid_view(table=table)
+
+    def assert_increases(func):
+        sequence = get_table_change_sequence(table.id)
+        func()
+        assert get_table_change_sequence(table.id) > sequence
+
+    row = RowHandler().create_row(user, table, {})
+    assert_increases(lambda: RowHandler().create_row(user, table, {}))
+    assert_increases(
+        lambda: RowHandler().update_row_by_id(
+            user, table, row.id, {f"field_{text_field.id}": "a"}
+        )
+    )
+    assert_increases(lambda: RowHandler().delete_row_by_id(user, table, row.id))
+    assert_increases(
+        lambda: FieldHandler().update_field(user, text_field, name="Renamed")
+    )
+    assert_increases(
+        lambda: ViewHandler().create_filter(user, grid, text_field, "equal", "a")
+    )
+    assert_increases(lambda: ViewHandler().create_sort(user, grid, text_field, "asc"))
+    assert_increases(
+        lambda: ViewHandler().update_field_options(
+            view=grid, field_options={text_field.id: {"hidden": True}}, user=user
+        )
+    )
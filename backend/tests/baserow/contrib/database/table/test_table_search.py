@@ -0,0 +1,211 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.fields.registries import field_type_registry
+from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.table.models import SEARCH_MODE_FULL_TEXT
+from baserow.contrib.database.table.search import (
+    SearchDataHandler,
+    get_search_data_update_cache_key,
+    get_search_words,
+)
+from baserow.contrib.database.table.tasks import update_search_data
+from baserow.core.trash.handler import TrashHandler
+
+
+def get_search_data(table):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'SELECT "id", "search_data"::text FROM '
+            f'{table.get_database_table_name()} ORDER BY "id"'
+        )
+        return cursor.fetchall()
+
+
+def full_text_search(model, search):
+    return list(
+        model.objects.all().search_all_fields(search, search_mode=SEARCH_MODE_FULL_TEXT)
+    )
+
+
+def test_get_search_words():
+    assert get_search_words("Hello, hello WORLD! hello_world 1.5") == [
+        "hello",
+        "world",
+        "hello_world",
+        "1",
+        "5",
+    ]
+    assert get_search_words(" -- ") == []
+    assert get_search_words("a" * 150) == ["a" * 100]
+
+
+@pytest.mark.django_db
+def test_search_data_is_not_used_when_disabled(data_fixture):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table)
+    model = table.get_model()
+    row = model.objects.create(**{f"field_{text_field.id}": "Baserow"})
+
+    with patch(
+        "baserow.contrib.database.table.tasks.update_search_data"
+    ) as mock_update_search_data:
+        assert full_text_search(model, "row") == [row]
+    mock_update_search_data.delay.assert_not_called()
+
+    table.refresh_from_db()
+    assert not table.search_data_column_added
+
+
+@pytest.mark.django_db
+def test_search_data(data_fixture, settings, django_capture_on_commit_callbacks):
+    settings.BASEROW_FULL_TEXT_SEARCH_ENABLED = True
+    settings.BASEROW_FULL_TEXT_SEARCH_CHUNK_SIZE = 1
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    number_field = data_fixture.create_number_field(table=table)
+    model = table.get_model()
+    row_1 = model.objects.create(
+        **{f"field_{text_field.id}": "Baserow database", f"field_{number_field.id}": 5}
+    )
+    row_2 = model.objects.create(
+        **{f"field_{text_field.id}": "Open-source", f"field_{number_field.id}": 20}
+    )
+
+    # The first search adds the search data column in the background and searches
+    # the table using the contains filters in the meantime.
+    with django_capture_on_commit_callbacks(execute=True):
+        assert full_text_search(model, "row") == [row_1]
+    table.refresh_from_db()
+    assert table.search_data_column_added
+    assert table.search_data_outdated_since is None
+    assert get_search_data(table) == [
+        (row_1.id, f"'{row_1.id}' '5' 'baserow' 'database'"),
+        (row_2.id, f"'{row_2.id}' '20' 'open' 'source'"),
+    ]
+
+    # The contains search mode still checks whether a field contains the query,
+    # while in the full-text search mode every word of the search must be the start
+    # of a word of the row.
+    assert list(model.objects.all().search_all_fields("row")) == [row_1]
+    assert list(model.objects.all().search_all_fields("sou op")) == []
+    assert full_text_search(model, "row") == []
+    assert full_text_search(model, "BASE") == [row_1]
+    assert full_text_search(model, "sou op") == [row_2]
+    assert full_text_search(model, "2") == [row_2]
+    assert full_text_search(model, "open database") == []
+
+    # A search without words and a search in only some of the fields still use
+    # the contains filters.
+    assert full_text_search(model, "-") == [row_2]
+    assert list(
+        model.objects.all().search_all_fields(
+            "row", [text_field.id, number_field.id], SEARCH_MODE_FULL_TEXT
+        )
+    ) == [row_1]
+
+    # The trigger resets the search data of a changed row and the row is searched
+    # using the contains filters until its search data is updated.
+    with patch(
+        "baserow.contrib.database.table.tasks.update_search_data"
+    ) as mock_update_search_data, django_capture_on_commit_callbacks(execute=True):
+        RowHandler().update_row_by_id(
+            user, table, row_2.id, {f"field_{text_field.id}": "Open row"}
+        )
+    mock_update_search_data.delay.assert_called_once_with(table.id)
+    assert get_search_data(table)[1] == (row_2.id, None)
+    assert full_text_search(model, "row") == [row_2]
+    assert full_text_search(model, "sou") == []
+
+    # Renormalizing the row orders or trashing a row doesn't reset the search data.
+    model.objects.filter(id=row_1.id).update(order=10)
+    model.objects_and_trash.filter(id=row_1.id).update(trashed=True)
+    model.objects_and_trash.filter(id=row_1.id).update(trashed=False)
+    assert get_search_data(table)[0][1] is not None
+
+    update_search_data(table.id)
+    assert get_search_data(table)[1] == (row_2.id, f"'{row_2.id}' '20' 'open' 'row'")
+    assert full_text_search(model, "row") == [row_2]
+
+    # When the fields change, the search data of all rows is rebuilt.
+    with django_capture_on_commit_callbacks(execute=True):
+        with patch("baserow.contrib.database.table.tasks.update_search_data"):
+            FieldHandler().update_field(user, number_field, new_type_name="text")
+        table.refresh_from_db()
+        assert table.search_data_outdated_since is not None
+        model = table.get_model()
+        assert [row.id for row in full_text_search(model, "row")] == [
+            row_2.id,
+            row_1.id,
+        ]
+    update_search_data(table.id)
+    table.refresh_from_db()
+    assert table.search_data_outdated_since is None
+    assert [row.id for row in full_text_search(model, "row")] == [row_2.id]
+
+    # The trigger has been recreated for the converted column.
+    model.objects.filter(id=row_1.id).update(**{f"field_{number_field.id}": "row"})
+    assert get_search_data(table)[0] == (row_1.id, None)
+
+    cache.delete(get_search_data_update_cache_key(table.id))
+
+
+@pytest.mark.django_db
+def test_search_data_trigger_is_recreated_when_a_field_is_deleted(
+    data_fixture, settings
+):
+    settings.BASEROW_FULL_TEXT_SEARCH_ENABLED = True
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    other_field = data_fixture.create_text_field(table=table)
+    model = table.get_model()
+    row = model.objects.create(**{f"field_{text_field.id}": "Baserow"})
+    handler = SearchDataHandler()
+    handler.add_search_data_column(table)
+    handler.update_rows_search_data(model)
+
+    with patch("baserow.contrib.database.table.tasks.update_search_data"):
+        FieldHandler().delete_field(user, other_field)
+    TrashHandler.permanently_delete(other_field)
+    table.refresh_from_db()
+    update_search_data(table.id)
+    assert get_search_data(table) == [(row.id, f"'{row.id}' 'baserow'")]
+
+    model = table.get_model()
+    model.objects.filter(id=row.id).update(**{f"field_{text_field.id}": "Changed"})
+    assert get_search_data(table) == [(row.id, None)]
+
+
+@pytest.mark.django_db
+def test_update_search_data_only_updates_unchanged_rows(data_fixture, settings):
+    settings.BASEROW_FULL_TEXT_SEARCH_ENABLED = True
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table)
+    model = table.get_model()
+    row = model.objects.create(**{f"field_{text_field.id}": "Baserow"})
+    handler = SearchDataHandler()
+    handler.add_search_data_column(table)
+
+    text_field_type = field_type_registry.get_by_model(text_field)
+    original_get_human_readable_value = text_field_type.get_human_readable_value
+
+    def get_human_readable_value_while_row_changes(value, field_object):
+        model.objects.filter(id=row.id).update(**{f"field_{text_field.id}": "Changed"})
+        return original_get_human_readable_value(value, field_object)
+
+    with patch.object(
+        text_field_type,
+        "get_human_readable_value",
+        side_effect=get_human_readable_value_while_row_changes,
+    ):
+        assert handler.update_rows_search_data(model, only_missing=True) == 0
+    assert get_search_data(table) == [(row.id, None)]
+
+    assert handler.update_rows_search_data(model, only_missing=True) == 1
+    assert get_search_data(table) == [(row.id, f"'{row.id}' 'changed'")]
@@ -1,3 +1,4 @@
+from django.db import connection
 from django.db.models import Q
 from freezegun import freeze_time
 
@@ -15,7 +16,12 @@ from baserow.contrib.database.views.registries import (
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.rows.handler import RowHandler
-from baserow.contrib.database.views.view_filters import BaseDateFieldLookupFilterType
+from baserow.contrib.database.views.index_advisor import ViewIndexAdvisor
+from baserow.contrib.database.views.view_filters import (
+    BaseDateFieldLookupFilterType,
+    get_period_range,
+    get_start_of_day,
+)
 
 
 @pytest.mark.django_db
@@ -3497,6 +3503,116 @@ def test_multiple_select_has_not_filter_type(data_fixture):
     assert row_3.id in ids
 
 
+@pytest.mark.django_db
+def test_many_to_many_has_filters_use_exists_subqueries(data_fixture):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table = data_fixture.create_database_table(database=database)
+    related_table = data_fixture.create_database_table(database=database)
+    grid_view = data_fixture.create_grid_view(table=table)
+
+    field_handler = FieldHandler()
+    link_row_field = field_handler.create_field(
+        user=user,
+        table=table,
+        type_name="link_row",
+        name="Link",
+        link_row_table=related_table,
+    )
+    multiple_select_field = field_handler.create_field(
+        user=user,
+        table=table,
+        type_name="multiple_select",
+        name="Multi Select",
+        select_options=[
+            {"value": "Option 1", "color": "blue"},
+            {"value": "Option 2", "color": "red"},
+        ],
+    )
+    option_1, option_2 = multiple_select_field.select_options.all()
+
+    related_model = related_table.get_model()
+    related_row_1 = related_model.objects.create()
+    related_row_2 = related_model.objects.create()
+
+    row_handler = RowHandler()
+    model = table.get_model()
+    row_1 = row_handler.create_row(
+        user=user,
+        table=table,
+        model=model,
+        values={
+            f"field_{link_row_field.id}": [related_row_1.id, related_row_2.id],
+            f"field_{multiple_select_field.id}": [option_1.id],
+        },
+    )
+    row_2 = row_handler.create_row(
+        user=user,
+        table=table,
+        model=model,
+        values={
+            f"field_{link_row_field.id}": [related_row_2.id],
+            f"field_{multiple_select_field.id}": [option_1.id, option_2.id],
+        },
+    )
+    row_3 = row_handler.create_row(user=user, table=table, model=model, values={})
+
+    # The through tables have an index starting with the related row or option.
+    for field in [link_row_field, multiple_select_field]:
+        through_table = model._meta.get_field(
+            field.db_column
+        ).remote_field.through._meta.db_table
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM pg_indexes WHERE indexname = %s",
+                [f"{through_table}_reverse"],
+            )
+            assert cursor.fetchone() is not None
+
+    handler = ViewHandler()
+    data_fixture.create_view_filter(
+        view=grid_view,
+        field=link_row_field,
+        type="link_row_has",
+        value=f"{related_row_1.id}",
+    )
+    data_fixture.create_view_filter(
+        view=grid_view,
+        field=link_row_field,
+        type="link_row_has",
+        value=f"{related_row_2.id}",
+    )
+    data_fixture.create_view_filter(
+        view=grid_view,
+        field=multiple_select_field,
+        type="multiple_select_has",
+        value=f"{option_1.id}",
+    )
+    queryset = handler.apply_filters(grid_view, model.objects.all())
+    sql = str(queryset.query)
+    assert "EXISTS" in sql
+    assert "GROUP BY" not in sql
+    assert [r.id for r in queryset] == [row_1.id]
+
+    has_not_filter = data_fixture.create_view_filter(
+        view=grid_view,
+        field=multiple_select_field,
+        type="multiple_select_has_not",
+        value=f"{option_2.id}",
+    )
+    assert [r.id for r in handler.apply_filters(grid_view, model.objects.all())] == [
+        row_1.id
+    ]
+
+    handler.update_view(user=user, view=grid_view, filter_type="OR")
+    ids = [r.id for r in handler.apply_filters(grid_view, model.objects.all())]
+    assert ids == [row_1.id, row_2.id, row_3.id]
+
+    has_not_filter.delete()
+    ids = [r.id for r in handler.apply_filters(grid_view, model.objects.all())]
+    assert ids == [row_1.id, row_2.id]
+
+
 @pytest.mark.django_db
 def test_length_is_lower_than_filter_type(data_fixture):
     user = data_fixture.create_user()
@@ -3598,6 +3714,101 @@ def test_length_is_lower_than_filter_type(data_fixture):
     assert row_1.id in ids
 
 
+@pytest.mark.django_db
+def test_date_filters_compare_the_column_with_a_utc_range(data_fixture):
+    table = data_fixture.create_database_table()
+    date_field = data_fixture.create_date_field(table=table, date_include_time=True)
+    created_on_field = data_fixture.create_created_on_field(
+        table=table, date_include_time=True, timezone="Europe/Amsterdam"
+    )
+    grid_view = data_fixture.create_grid_view(table=table)
+    model = table.get_model()
+    handler = ViewHandler()
+
+    for filter_type, value in [
+        ("date_equal", "2021-06-01"),
+        ("date_before", "2021-06-01"),
+        ("date_after", "2021-06-01"),
+        ("date_equals_today", "Europe/Amsterdam"),
+        ("date_equals_month", "Europe/Amsterdam"),
+        ("date_equals_year", "Europe/Amsterdam"),
+        ("date_equals_days_ago", "Europe/Amsterdam?1"),
+    ]:
+        for field in [date_field, created_on_field]:
+            view_filter = data_fixture.create_view_filter(
+                view=grid_view, field=field, type=filter_type, value=value
+            )
+            queryset = handler.apply_filters(grid_view, model.objects.all())
+            sql = str(queryset.query).upper()
+            assert "AT TIME ZONE" not in sql
+            assert "EXTRACT" not in sql
+            view_filter.delete()
+
+    data_fixture.create_view_filter(
+        view=grid_view, field=created_on_field, type="date_equal", value="2021-06-01"
+    )
+    queryset = handler.apply_filters(grid_view, model.objects.all())
+    params = queryset.query.sql_with_params()[1]
+    assert params == (
+        datetime(2021, 5, 31, 22, 0, tzinfo=timezone("UTC")),
+        datetime(2021, 6, 1, 22, 0, tzinfo=timezone("UTC")),
+    )
+
+
+def test_get_start_of_day():
+    assert get_start_of_day(date(2021, 6, 1), "UTC") == datetime(
+        2021, 6, 1, tzinfo=timezone("UTC")
+    )
+    assert get_start_of_day(date(2021, 6, 1), "Europe/Amsterdam") == datetime(
+        2021, 5, 31, 22, tzinfo=timezone("UTC")
+    )
+    # The clock is set forward from midnight to 1 AM, so the day starts at 1 AM.
+    assert get_start_of_day(date(2019, 9, 8), "America/Santiago") == datetime(
+        2019, 9, 8, 4, tzinfo=timezone("UTC")
+    )
+
+
+def test_get_period_range():
+    assert get_period_range(date(2021, 12, 31), ["year", "month", "day"]) == (
+        date(2021, 12, 31),
+        date(2022, 1, 1),
+    )
+    assert get_period_range(date(2021, 12, 15), ["year", "month"]) == (
+        date(2021, 12, 1),
+        date(2022, 1, 1),
+    )
+    assert get_period_range(date(2021, 2, 15), ["year", "month"]) == (
+        date(2021, 2, 1),
+        date(2021, 3, 1),
+    )
+    assert get_period_range(date(2021, 2, 15), ["year"]) == (
+        date(2021, 1, 1),
+        date(2022, 1, 1),
+    )
+    assert get_period_range(date(9999, 12, 31), ["year"]) == (date(9999, 1, 1), None)
+
+
+@pytest.mark.django_db
+def test_date_equal_filter_can_use_the_field_index(data_fixture):
+    table = data_fixture.create_database_table()
+    date_field = data_fixture.create_date_field(table=table, date_include_time=True)
+    grid_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=grid_view, field=date_field, type="date_equal", value="2021-06-01"
+    )
+    index = ViewIndexAdvisor().create_field_index(date_field)
+    model = table.get_model()
+
+    queryset = ViewHandler().apply_filters(grid_view, model.objects.all())
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute("SET LOCAL enable_seqscan = off")
+        cursor.execute(f"EXPLAIN {sql}", params)
+        plan = "\n".join(row[0] for row in cursor.fetchall())
+    assert index.index_name in plan
+    assert "Index Cond" in plan
+
+
 @pytest.mark.django_db
 def test_date_equals_day_of_month_filter_type(data_fixture):
     user = data_fixture.create_user()
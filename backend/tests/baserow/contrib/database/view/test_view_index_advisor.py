@@ -0,0 +1,154 @@
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.db.utils import DatabaseError
+
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.views.index_advisor import ViewIndexAdvisor
+from baserow.contrib.database.views.models import (
+    ViewFieldIndex,
+    ViewFieldIndexStates,
+)
+
+
+def index_exists(index_name):
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_indexes WHERE indexname = %s", [index_name])
+        return cursor.fetchone() is not None
+
+
+@pytest.mark.django_db
+def test_get_advice(data_fixture, settings):
+    settings.BASEROW_VIEW_INDEX_MIN_ROWS = 0
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table)
+    number_field = data_fixture.create_number_field(table=table)
+    second_sort_field = data_fixture.create_number_field(table=table)
+    boolean_field = data_fixture.create_boolean_field(table=table)
+    date_field = data_fixture.create_date_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    trashed_view = data_fixture.create_grid_view(table=table, trashed=True)
+    advisor = ViewIndexAdvisor()
+
+    # Text fields, the second sort of a view, negated filters and trashed views
+    # don't get an index.
+    data_fixture.create_view_sort(view=grid_view, field=text_field)
+    data_fixture.create_view_sort(view=grid_view, field=second_sort_field)
+    data_fixture.create_view_filter(
+        view=grid_view, field=text_field, type="equal", value="a"
+    )
+    data_fixture.create_view_filter(
+        view=grid_view, field=boolean_field, type="not_equal", value="1"
+    )
+    data_fixture.create_view_sort(view=trashed_view, field=date_field)
+    assert advisor.get_advice() == ([], [])
+
+    data_fixture.create_view_filter(
+        view=grid_view, field=number_field, type="higher_than", value="1"
+    )
+    grid_view_2 = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_sort(view=grid_view_2, field=date_field)
+    fields_to_index, indexes_to_drop = advisor.get_advice()
+    assert {field.id for field in fields_to_index} == {number_field.id, date_field.id}
+    assert indexes_to_drop == []
+
+    # The estimated number of rows of a table that has never been analyzed is 0.
+    settings.BASEROW_VIEW_INDEX_MIN_ROWS = 1
+    assert advisor.get_advice() == ([], [])
+
+
+@pytest.mark.django_db
+def test_manage_indexes(data_fixture, settings):
+    settings.BASEROW_VIEW_INDEX_MIN_ROWS = 0
+    table = data_fixture.create_database_table()
+    number_field = data_fixture.create_number_field(table=table)
+    date_field = data_fixture.create_date_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    view_sort = data_fixture.create_view_sort(view=grid_view, field=number_field)
+    data_fixture.create_view_filter(
+        view=grid_view, field=date_field, type="date_before", value="2022-01-01"
+    )
+    advisor = ViewIndexAdvisor()
+
+    created, dropped = advisor.manage_indexes(dry_run=True)
+    assert {field.id for field in created} == {number_field.id, date_field.id}
+    assert ViewFieldIndex.objects.count() == 0
+
+    advisor.manage_indexes()
+    number_index = ViewFieldIndex.objects.get(field=number_field)
+    date_index = ViewFieldIndex.objects.get(field=date_field)
+    assert number_index.state == ViewFieldIndexStates.CREATED
+    assert index_exists(number_index.index_name)
+    assert index_exists(date_index.index_name)
+
+    # The existing indexes aren't created again, even if the table is too small.
+    settings.BASEROW_VIEW_INDEX_MIN_ROWS = 1
+    assert advisor.manage_indexes() == ([], [])
+
+    view_sort.delete()
+    date_field.trashed = True
+    date_field.save()
+    created, dropped = advisor.manage_indexes()
+    assert created == []
+    assert {index.field_id for index in dropped} == {number_field.id, date_field.id}
+    assert ViewFieldIndex.objects.count() == 0
+    assert not index_exists(number_index.index_name)
+    assert not index_exists(date_index.index_name)
+
+
+@pytest.mark.django_db
+def test_create_index_failed(data_fixture):
+    table = data_fixture.create_database_table()
+    number_field = data_fixture.create_number_field(table=table)
+    advisor = ViewIndexAdvisor()
+
+    with patch(
+        "baserow.contrib.database.fields.indexes.execute_concurrently_if_possible",
+        side_effect=[None, DatabaseError("Failed"), None],
+    ):
+        index = advisor.create_field_index(number_field)
+    index.refresh_from_db()
+    assert index.state == ViewFieldIndexStates.FAILED
+    assert index.error == "Failed"
+    assert not index_exists(index.index_name)
+
+
+@pytest.mark.django_db
+def test_changing_field_type_drops_index(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table)
+    index = ViewIndexAdvisor().create_field_index(number_field)
+    assert index_exists(index.index_name)
+
+    FieldHandler().update_field(user, number_field, name="Renamed")
+    assert ViewFieldIndex.objects.count() == 1
+
+    FieldHandler().update_field(user, number_field, new_type_name="long_text")
+    assert ViewFieldIndex.objects.count() == 0
+    assert not index_exists(index.index_name)
+
+
+@pytest.mark.django_db
+def test_manage_view_indexes_command(data_fixture, settings):
+    settings.BASEROW_VIEW_INDEX_MIN_ROWS = 0
+    table = data_fixture.create_database_table()
+    number_field = data_fixture.create_number_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_sort(view=grid_view, field=number_field)
+
+    output = StringIO()
+    call_command("manage_view_indexes", "--dry-run", stdout=output)
+    assert (
+        f"Would create the index of field {number_field.id} in table {table.id}."
+        in output.getvalue()
+    )
+    assert ViewFieldIndex.objects.count() == 0
+
+    output = StringIO()
+    call_command("manage_view_indexes", stdout=output)
+    assert "Created 1 and dropped 0 indexes." in output.getvalue()
+    assert ViewFieldIndex.objects.filter(field=number_field).exists()
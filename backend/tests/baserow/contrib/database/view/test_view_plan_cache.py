@@ -0,0 +1,172 @@
+import pytest
+from django.core.cache import cache
+
+from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.fields.models import FieldTrigramIndex
+from baserow.contrib.database.fields.trigram_indexes import (
+    get_trigram_index_usage_cache_key,
+)
+from baserow.contrib.database.views.handler import ViewHandler
+from baserow.contrib.database.views.plan_cache import (
+    clear_local_view_plan_cache,
+    get_view_plan_version,
+)
+
+
+@pytest.mark.django_db
+def test_compiled_filters_are_cached(data_fixture, django_assert_num_queries):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    model = table.get_model()
+    row_1 = model.objects.create(**{f"field_{text_field.id}": "a"})
+    row_2 = model.objects.create(**{f"field_{text_field.id}": "b"})
+    view_filter = data_fixture.create_view_filter(
+        view=grid_view, field=text_field, type="equal", value="a"
+    )
+    view_handler = ViewHandler()
+
+    with django_assert_num_queries(1):
+        queryset = view_handler.apply_filters(grid_view, model.objects.all())
+    assert list(queryset) == [row_1]
+
+    # The filters are compiled once and reused until they change.
+    with django_assert_num_queries(0):
+        queryset = view_handler.apply_filters(grid_view, model.objects.all())
+    assert list(queryset) == [row_1]
+
+    version = get_view_plan_version(grid_view.id)
+    view_filter.value = "b"
+    view_filter.save()
+    assert get_view_plan_version(grid_view.id) > version
+    assert list(view_handler.apply_filters(grid_view, model.objects.all())) == [row_2]
+
+    grid_view.filter_type = "OR"
+    data_fixture.create_view_filter(
+        view=grid_view, field=text_field, type="equal", value="a"
+    )
+    assert list(view_handler.apply_filters(grid_view, model.objects.all())) == [
+        row_1,
+        row_2,
+    ]
+
+    view_filter.delete()
+    assert list(view_handler.apply_filters(grid_view, model.objects.all())) == [row_1]
+
+    clear_local_view_plan_cache()
+
+
+@pytest.mark.django_db
+def test_compiled_filters_depending_on_current_time_are_not_cached(
+    data_fixture, django_assert_num_queries
+):
+    table = data_fixture.create_database_table()
+    date_field = data_fixture.create_date_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    model = table.get_model()
+    data_fixture.create_view_filter(
+        view=grid_view, field=date_field, type="date_equals_today", value="UTC"
+    )
+    view_handler = ViewHandler()
+
+    view_handler.apply_filters(grid_view, model.objects.all())
+    with django_assert_num_queries(1):
+        view_handler.apply_filters(grid_view, model.objects.all())
+
+
+@pytest.mark.django_db
+def test_cached_compiled_filters_record_trigram_index_usage(data_fixture, settings):
+    settings.BASEROW_TRIGRAM_INDEXES_ENABLED = True
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table)
+    number_field = data_fixture.create_number_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    model = table.get_model()
+    data_fixture.create_view_filter(
+        view=grid_view, field=text_field, type="contains", value="a"
+    )
+    data_fixture.create_view_filter(
+        view=grid_view, field=number_field, type="equal", value="1"
+    )
+    view_handler = ViewHandler()
+    usage_cache_key = get_trigram_index_usage_cache_key(text_field.id)
+
+    view_handler.apply_filters(grid_view, model.objects.all())
+    assert list(FieldTrigramIndex.objects.values_list("field_id", flat=True)) == [
+        text_field.id
+    ]
+
+    FieldTrigramIndex.objects.all().delete()
+    cache.delete(usage_cache_key)
+    view_handler.apply_filters(grid_view, model.objects.all())
+    assert list(FieldTrigramIndex.objects.values_list("field_id", flat=True)) == [
+        text_field.id
+    ]
+
+    cache.delete(usage_cache_key)
+    clear_local_view_plan_cache()
+
+
+@pytest.mark.django_db
+def test_compiled_sorts_are_cached(data_fixture, django_assert_num_queries):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    number_field = data_fixture.create_number_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    model = table.get_model()
+    row_1 = model.objects.create(
+        **{f"field_{text_field.id}": "b", f"field_{number_field.id}": 1}
+    )
+    row_2 = model.objects.create(
+        **{f"field_{text_field.id}": "a", f"field_{number_field.id}": 2}
+    )
+    view_sort = data_fixture.create_view_sort(
+        view=grid_view, field=text_field, order="ASC"
+    )
+    view_handler = ViewHandler()
+
+    with django_assert_num_queries(1):
+        queryset = view_handler.apply_sorting(grid_view, model.objects.all())
+    assert list(queryset) == [row_2, row_1]
+
+    with django_assert_num_queries(0):
+        queryset = view_handler.apply_sorting(grid_view, model.objects.all())
+    assert list(queryset) == [row_2, row_1]
+
+    # Restricting the sorts to other fields is compiled separately.
+    queryset = view_handler.apply_sorting(
+        grid_view, model.objects.all(), [number_field.id]
+    )
+    assert list(queryset) == [row_1, row_2]
+
+    view_sort.order = "DESC"
+    view_sort.save()
+    queryset = view_handler.apply_sorting(grid_view, model.objects.all())
+    assert list(queryset) == [row_1, row_2]
+
+    # Changing a field results in a new model, for which the sorts are compiled
+    # again.
+    FieldHandler().update_field(user, text_field, new_type_name="number")
+    model = table.get_model()
+    with django_assert_num_queries(1):
+        view_handler.apply_sorting(grid_view, model.objects.all())
+
+    clear_local_view_plan_cache()
+
+
+@pytest.mark.django_db
+def test_view_plan_cache_can_be_disabled(
+    data_fixture, settings, django_assert_num_queries
+):
+    settings.BASEROW_VIEW_PLAN_CACHE_SIZE = 0
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    model = table.get_model()
+    data_fixture.create_view_filter(view=grid_view, field=text_field)
+    view_handler = ViewHandler()
+
+    view_handler.apply_filters(grid_view, model.objects.all())
+    with django_assert_num_queries(1):
+        view_handler.apply_filters(grid_view, model.objects.all())
@@ -7,7 +7,9 @@ from unittest.mock import patch
 from rest_framework import serializers
 from rest_framework.fields import Field
 
+from baserow.contrib.database.rows.batch_jobs import RowsBatchJobHandler
 from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.rows.models import RowsBatchJob
 from baserow.contrib.database.rows.registries import (
     RowMetadataType,
     row_metadata_registry,
@@ -179,3 +181,22 @@ def test_row_deleted(mock_broadcast_to_channel_group, data_fixture):
     assert args[0][1]["table_id"] == table.id
     assert args[0][1]["row"]["id"] == row_id
     assert args[0][1]["row"][f"field_{field.id}"] == "Value"
+
+
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.ws.registries.broadcast_to_channel_group")
+def test_rows_batch_job_chunk_processed(mock_broadcast_to_channel_group, data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(table=table, name="Name")
+    job = RowsBatchJob.objects.create(
+        user=user, table=table, type="create", user_field_names=True, total_count=2
+    )
+    RowsBatchJobHandler().create_chunks(job, [{"Name": "a"}, {"Name": "b"}])
+    RowsBatchJobHandler().run_job(job)
+
+    # Instead of the serialized rows, only an event to refresh the rows is sent.
+    mock_broadcast_to_channel_group.delay.assert_called_once()
+    args = mock_broadcast_to_channel_group.delay.call_args
+    assert args[0][0] == f"table-{table.id}"
+    assert args[0][1] == {"type": "force_rows_refresh", "table_id": table.id}
@@ -7,9 +7,16 @@ from django.db.models.functions import Concat
 from django.test.utils import override_settings
 from django.contrib.contenttypes.models import ContentType
 
-from baserow.core.db import LockedAtomicTransaction, specific_iterator
-from baserow.core.models import Settings
-
+from baserow.core.db import (
+    LockedAtomicTransaction,
+    bulk_insert,
+    chunked_queryset_iterator,
+    copy_bulk_create,
+    specific_iterator,
+)
+from baserow.core.models import Settings, TrashEntry
+
+from baserow.contrib.database.trash.models import TrashedRows
 from baserow.contrib.database.views.models import View
 from baserow.contrib.database.fields.models import Field, TextField, LongTextField
 from baserow.contrib.database.fields.handler import FieldHandler
@@ -197,3 +204,222 @@ def test_specific_iterator_with_prefetch_related(
         all_2 = specific_objects[1].viewfilter_set.all()
         assert all_2[0].id == filter_2.id
         assert all_2[1].id == filter_3.id
+
+
+@pytest.mark.django_db
+def test_chunked_queryset_iterator(data_fixture, django_assert_num_queries):
+    grid_view = data_fixture.create_grid_view()
+    grid_view_2 = data_fixture.create_grid_view(table=grid_view.table)
+    grid_view_3 = data_fixture.create_grid_view(table=grid_view.table)
+    filter_1 = data_fixture.create_view_filter(view=grid_view)
+    filter_2 = data_fixture.create_view_filter(view=grid_view_3)
+
+    queryset = (
+        View.objects.filter(table=grid_view.table)
+        .order_by("id")
+        .prefetch_related("viewfilter_set")
+    )
+
+    # One query to select the views and one query per chunk to prefetch the filters.
+    with django_assert_num_queries(3):
+        chunks = list(chunked_queryset_iterator(queryset, 2))
+        assert [[view.id for view in chunk] for chunk in chunks] == [
+            [grid_view.id, grid_view_2.id],
+            [grid_view_3.id],
+        ]
+        assert list(chunks[0][0].viewfilter_set.all()) == [filter_1]
+        assert list(chunks[0][1].viewfilter_set.all()) == []
+        assert list(chunks[1][0].viewfilter_set.all()) == [filter_2]
+
+    assert list(chunked_queryset_iterator(View.objects.none())) == []
+
+
+@pytest.mark.django_db
+def test_copy_bulk_create(data_fixture):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table)
+    number_field = data_fixture.create_number_field(table=table)
+    boolean_field = data_fixture.create_boolean_field(table=table)
+    date_field = data_fixture.create_date_field(table=table, date_include_time=True)
+    model = table.get_model()
+
+    rows = copy_bulk_create(
+        model,
+        [
+            model(
+                **{
+                    f"field_{text_field.id}": "Tab\tnew\nline back\\slash",
+                    f"field_{number_field.id}": 10,
+                    f"field_{boolean_field.id}": True,
+                    f"field_{date_field.id}": "2021-01-02T12:00:00+00:00",
+                }
+            ),
+            model(**{f"field_{text_field.id}": ""}),
+            model(),
+        ],
+        chunk_size=2,
+    )
+
+    assert all(row.id is not None for row in rows)
+    row_1, row_2, row_3 = model.objects.all().order_by("id")
+    assert [row_1.id, row_2.id, row_3.id] == [row.id for row in rows]
+    assert getattr(row_1, f"field_{text_field.id}") == "Tab\tnew\nline back\\slash"
+    assert getattr(row_1, f"field_{number_field.id}") == 10
+    assert getattr(row_1, f"field_{boolean_field.id}") is True
+    assert getattr(row_1, f"field_{date_field.id}").isoformat() == (
+        "2021-01-02T12:00:00+00:00"
+    )
+    assert row_1.created_on is not None
+    assert getattr(row_2, f"field_{text_field.id}") == ""
+    assert getattr(row_3, f"field_{text_field.id}") is None
+    assert getattr(row_3, f"field_{boolean_field.id}") is False
+
+    # The sequence must still be usable after the ids have been allocated.
+    row_4 = model.objects.create()
+    assert row_4.id > row_3.id
+
+    assert copy_bulk_create(model, []) == []
+
+
+@pytest.mark.django_db
+def test_copy_bulk_create_json_and_without_ids(data_fixture):
+    table = data_fixture.create_database_table()
+    link_table = data_fixture.create_database_table(database=table.database)
+    link_field = data_fixture.create_link_row_field(
+        table=table, link_row_table=link_table
+    )
+    model = table.get_model()
+    link_model = link_table.get_model()
+    row = model.objects.create()
+    link_row_1 = link_model.objects.create()
+    link_row_2 = link_model.objects.create()
+    link_row_3 = link_model.objects.create()
+
+    model_field = model._meta.get_field(f"field_{link_field.id}")
+    through = model_field.remote_field.through
+    relations = copy_bulk_create(
+        through,
+        [
+            through(
+                **{
+                    f"{model_field.m2m_field_name()}_id": row.id,
+                    f"{model_field.m2m_reverse_field_name()}_id": link_row.id,
+                }
+            )
+            for link_row in [link_row_1, link_row_2]
+        ],
+        assign_ids=False,
+    )
+    assert [relation.id for relation in relations] == [None, None]
+    assert (
+        list(
+            through.objects.order_by("id").values_list(
+                f"{model_field.m2m_field_name()}_id",
+                f"{model_field.m2m_reverse_field_name()}_id",
+            )
+        )
+        == [(row.id, link_row_1.id), (row.id, link_row_2.id)]
+    )
+
+    trashed_rows = copy_bulk_create(
+        TrashedRows, [TrashedRows(table=table, row_ids=[1, 2, {"a": "b\tc"}])]
+    )[0]
+    trashed_rows.refresh_from_db()
+    assert trashed_rows.row_ids == [1, 2, {"a": "b\tc"}]
+
+    relation = through(
+        id=1000,
+        **{
+            f"{model_field.m2m_field_name()}_id": row.id,
+            f"{model_field.m2m_reverse_field_name()}_id": link_row_3.id,
+        },
+    )
+    copy_bulk_create(through, [relation], assign_ids=False)
+    assert through.objects.filter(id=1000).exists()
+
+    with pytest.raises(ValueError):
+        copy_bulk_create(
+            through,
+            [
+                through(id=1001, **{f"{model_field.m2m_field_name()}_id": row.id}),
+                through(**{f"{model_field.m2m_field_name()}_id": row.id}),
+            ],
+            assign_ids=False,
+        )
+
+
+@pytest.mark.django_db
+def test_copy_bulk_create_arrays_and_expressions(data_fixture):
+    group = data_fixture.create_group()
+    names = ["a", 'b "c"', "d\\e", "f,g", "{h}", "tab\tnew\nline", None, ""]
+    entry = copy_bulk_create(
+        TrashEntry,
+        [
+            TrashEntry(
+                group=group,
+                trash_item_type="row",
+                trash_item_id=1,
+                name="Row",
+                names=names,
+            )
+        ],
+    )[0]
+    entry.refresh_from_db()
+    assert entry.names == names
+
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table)
+    number_field = data_fixture.create_number_field(table=table)
+    model = table.get_model()
+
+    # The columns having an expression are only left out for the objects having
+    # an expression value for them.
+    rows = copy_bulk_create(
+        model,
+        [
+            model(
+                **{
+                    f"field_{text_field.id}": "Text",
+                    f"field_{number_field.id}": 1,
+                }
+            ),
+            model(
+                **{
+                    f"field_{text_field.id}": Concat(Value("a"), Value("b")),
+                    f"field_{number_field.id}": 2,
+                }
+            ),
+            model(
+                **{
+                    f"field_{text_field.id}": "Other",
+                    f"field_{number_field.id}": 3,
+                }
+            ),
+        ],
+    )
+    assert list(
+        model.objects.order_by("id").values_list(
+            "id", f"field_{text_field.id}", f"field_{number_field.id}"
+        )
+    ) == [
+        (rows[0].id, "Text", 1),
+        (rows[1].id, None, 2),
+        (rows[2].id, "Other", 3),
+    ]
+
+
+@pytest.mark.django_db
+def test_bulk_insert(data_fixture, settings, django_assert_num_queries):
+    table = data_fixture.create_database_table()
+    model = table.get_model()
+
+    settings.BASEROW_BULK_INSERT_COPY_THRESHOLD = 3
+    with django_assert_num_queries(1):
+        rows = bulk_insert(model, [model(), model()])
+    assert all(row.id is not None for row in rows)
+
+    # One query to allocate the ids and one `COPY` query.
+    with django_assert_num_queries(2):
+        rows = bulk_insert(model, [model(), model(), model()])
+    assert all(row.id is not None for row in rows)
+    assert model.objects.count() == 5
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 
 from django.core.exceptions import ImproperlyConfigured
@@ -147,6 +149,33 @@ def test_registry_get_by_model_returns_the_most_specific_value():
     assert registry.get_by_model(SubClassOfBaseFakeModel()) == subtype_of_base_app
 
 
+def test_registry_get_by_model_cache_is_invalidated():
+    base_app = BaseFakeModelApplication()
+    subtype_of_base_app = SubClassOfBaseFakeModelApplication()
+    registry = TemporaryRegistry()
+    registry.register(base_app)
+
+    assert registry.get_by_model(SubClassOfBaseFakeModel()) == base_app
+    with pytest.raises(InstanceTypeDoesNotExist):
+        registry.get_by_model(SubClassOfBaseFakeModel)
+
+    registry.register(subtype_of_base_app)
+    assert registry.get_by_model(SubClassOfBaseFakeModel()) == subtype_of_base_app
+    assert registry.get_by_model(SubClassOfBaseFakeModel) == subtype_of_base_app
+
+    registry.unregister(subtype_of_base_app)
+    assert registry.get_by_model(SubClassOfBaseFakeModel()) == base_app
+
+    replacement_app = BaseFakeModelApplication()
+    with patch.dict(registry.registry, {"temporary_1": replacement_app}):
+        assert registry.get_by_model(SubClassOfBaseFakeModel()) is replacement_app
+    assert registry.get_by_model(SubClassOfBaseFakeModel()) is base_app
+
+    registry.registry = {}
+    with pytest.raises(InstanceTypeDoesNotExist):
+        registry.get_by_model(SubClassOfBaseFakeModel())
+
+
 def test_api_exceptions_api_mixins():
     class FakeInstance(MapAPIExceptionsInstanceMixin, Instance):
         type = "fake_instance"
@@ -0,0 +1,55 @@
+import timeit
+
+import pytest
+
+from baserow.contrib.database.fields.registries import field_type_registry
+from baserow.contrib.database.views.registries import view_type_registry
+from baserow.core.trash.registries import trash_item_type_registry
+
+
+@pytest.mark.django_db
+@pytest.mark.disabled_in_ci
+# You must add --run-disabled-in-ci -s to pytest to run this test, you can do this in
+# intellij by editing the run config for this test and adding --run-disabled-in-ci -s
+# to additional args.
+def test_get_by_model_performance(data_fixture):
+    table = data_fixture.create_database_table()
+    fields = [
+        data_fixture.create_text_field(table=table, primary=True),
+        data_fixture.create_number_field(table=table),
+        data_fixture.create_boolean_field(table=table),
+        data_fixture.create_date_field(table=table),
+        data_fixture.create_single_select_field(table=table),
+        data_fixture.create_formula_field(table=table, formula="1"),
+    ]
+    views = [
+        data_fixture.create_grid_view(table=table),
+        data_fixture.create_gallery_view(table=table),
+        data_fixture.create_form_view(table=table),
+    ]
+    row = table.get_model().objects.create()
+    registries_and_instances = [
+        (field_type_registry, fields),
+        (view_type_registry, views),
+        (trash_item_type_registry, [table, fields[0], views[0], row]),
+    ]
+
+    runs = 10000
+    for registry, instances in registries_and_instances:
+        linear_time = timeit.timeit(
+            lambda: [
+                registry._find_by_model_class(instance.__class__, False)
+                for instance in instances
+            ],
+            number=runs,
+        )
+        cached_time = timeit.timeit(
+            lambda: [registry.get_by_model(instance) for instance in instances],
+            number=runs,
+        )
+        print(
+            f"\n{registry.name}: {len(registry.registry)} types, "
+            f"{linear_time / runs / len(instances) * 1000000:.2f}µs linear, "
+            f"{cached_time / runs / len(instances) * 1000000:.2f}µs cached"
+        )
+        assert cached_time < linear_time
@@ -0,0 +1,73 @@
+import timeit
+
+import pytest
+
+from baserow.contrib.database.api.rows.serializers import (
+    RowSerializer,
+    get_compiled_row_serializer,
+    get_row_serializer_class,
+)
+from baserow.contrib.database.rows.handler import RowHandler
+
+
+@pytest.mark.django_db
+@pytest.mark.disabled_in_ci
+# You must add --run-disabled-in-ci -s to pytest to run this test, you can do this in
+# intellij by editing the run config for this test and adding --run-disabled-in-ci -s
+# to additional args.
+def test_compiled_row_serializer_performance(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    data_fixture.create_text_field(table=table, primary=True)
+    single_select_fields = []
+    for i in range(20):
+        data_fixture.create_text_field(table=table, name=f"text {i}")
+        data_fixture.create_number_field(
+            table=table, name=f"number {i}", number_decimal_places=2
+        )
+        data_fixture.create_boolean_field(table=table, name=f"boolean {i}")
+        single_select_field = data_fixture.create_single_select_field(
+            table=table, name=f"single select {i}"
+        )
+        data_fixture.create_select_option(field=single_select_field, value="option")
+        single_select_fields.append(single_select_field)
+
+    model = table.get_model()
+    rows_values = []
+    for i in range(200):
+        values = {}
+        for field_object in model._field_objects.values():
+            name = field_object["name"]
+            field_type = field_object["type"].type
+            if field_type == "text":
+                values[name] = f"value {i}"
+            elif field_type == "number":
+                values[name] = i
+            elif field_type == "boolean":
+                values[name] = i % 2 == 0
+            elif field_type == "single_select":
+                values[name] = field_object["field"].select_options.first().id
+        rows_values.append(values)
+    RowHandler().create_rows(user, table, rows_values, model=model)
+
+    rows = list(model.objects.all().enhance_by_fields())
+    serializer_class = get_row_serializer_class(model, RowSerializer, is_response=True)
+    serialize_row = get_compiled_row_serializer(model, RowSerializer)
+    assert [serialize_row(row) for row in rows] == serializer_class(
+        rows, many=True
+    ).data
+
+    runs = 20
+    serializer_time = timeit.timeit(
+        lambda: serializer_class(rows, many=True).data, number=runs
+    )
+    compiled_time = timeit.timeit(
+        lambda: [serialize_row(row) for row in rows], number=runs
+    )
+
+    print(
+        f"\nSerializing {len(rows)} rows with {len(model._field_objects)} fields:"
+        f"\nSerializer: {serializer_time / runs * 1000:.2f}ms"
+        f"\nCompiled serializer: {compiled_time / runs * 1000:.2f}ms"
+    )
+    assert compiled_time < serializer_time
@@ -0,0 +1,124 @@
+import pickle
+import timeit
+from unittest.mock import patch
+
+import pytest
+
+from baserow.contrib.database.table.cache import (
+    _serialize_model_descriptor,
+    _deserialize_model_descriptor,
+    clear_local_model_cache,
+)
+from baserow.contrib.database.table.models import Table
+
+
+@pytest.mark.django_db
+@pytest.mark.disabled_in_ci
+# You must add --run-disabled-in-ci -s to pytest to run this test, you can do this in
+# intellij by editing the run config for this test and adding --run-disabled-in-ci -s
+# to additional args.
+def test_size_and_speed_of_cached_model_descriptor_with_many_fields(data_fixture):
+    table = data_fixture.create_database_table()
+    data_fixture.create_text_field(table=table, primary=True)
+    for i in range(40):
+        data_fixture.create_text_field(table=table, name=f"text {i}")
+        data_fixture.create_number_field(table=table, name=f"number {i}")
+        data_fixture.create_boolean_field(table=table, name=f"boolean {i}")
+
+    fields = table._fetch_fields(None, None, [])
+    assert len(fields) > 100
+
+    # The old cache entry pickled the generated field attrs, including the field
+    # instances and the Django model fields.
+    field_attrs = table._generate_field_attrs(fields, True, False, False)
+    pickled_field_attrs = pickle.dumps(
+        {"field_attrs": field_attrs, "version": 1}, pickle.HIGHEST_PROTOCOL
+    )
+    pickled_descriptor = pickle.dumps(
+        {"descriptor": _serialize_model_descriptor(fields), "version": 1},
+        pickle.HIGHEST_PROTOCOL,
+    )
+
+    runs = 100
+    field_attrs_time = timeit.timeit(
+        lambda: pickle.loads(pickled_field_attrs), number=runs
+    )
+    descriptor_time = timeit.timeit(
+        lambda: _deserialize_model_descriptor(
+            pickle.loads(pickled_descriptor)["descriptor"]
+        ),
+        number=runs,
+    )
+    cached_fields = _deserialize_model_descriptor(
+        pickle.loads(pickled_descriptor)["descriptor"]
+    )
+    generate_time = timeit.timeit(
+        lambda: table._generate_field_attrs(cached_fields, True, False, False),
+        number=runs,
+    )
+
+    print(
+        f"\nPickled field attrs: {len(pickled_field_attrs)} bytes, "
+        f"{field_attrs_time / runs * 1000:.2f}ms to load"
+        f"\nDescriptor: {len(pickled_descriptor)} bytes, "
+        f"{descriptor_time / runs * 1000:.2f}ms to load, "
+        f"{generate_time / runs * 1000:.2f}ms to generate the field attrs"
+    )
+    assert len(pickled_descriptor) < len(pickled_field_attrs)
+    assert descriptor_time < field_attrs_time
+    assert descriptor_time + generate_time < field_attrs_time
+
+
+@pytest.mark.django_db
+@pytest.mark.disabled_in_ci
+# You must add --run-disabled-in-ci -s to pytest to run this test, you can do this in
+# intellij by editing the run config for this test and adding --run-disabled-in-ci -s
+# to additional args.
+def test_speed_of_get_model_from_cached_descriptor_with_many_fields(data_fixture):
+    table = data_fixture.create_database_table()
+    data_fixture.create_text_field(table=table, primary=True)
+    for i in range(40):
+        data_fixture.create_text_field(table=table, name=f"text {i}")
+        data_fixture.create_number_field(table=table, name=f"number {i}")
+        data_fixture.create_boolean_field(table=table, name=f"boolean {i}")
+
+    fields = table._fetch_fields(None, None, [])
+    pickled_field_attrs = pickle.dumps(
+        {
+            "field_attrs": table._generate_field_attrs(fields, True, False, False),
+            "version": 1,
+        },
+        pickle.HIGHEST_PROTOCOL,
+    )
+
+    # Fills the descriptor cache, so that every following call is a cache hit.
+    table.get_model()
+
+    def get_model_without_local_cache():
+        clear_local_model_cache()
+        table.get_model()
+
+    runs = 50
+    descriptor_time = timeit.timeit(get_model_without_local_cache, number=runs)
+
+    # The old cache hit unpickled the field attrs instead of regenerating them from
+    # the cached fields, everything else of generating the model was the same.
+    with patch(
+        "baserow.contrib.database.table.models.get_cached_model_fields",
+        return_value=[],
+    ), patch.object(
+        Table,
+        "_generate_field_attrs",
+        side_effect=lambda *args, **kwargs: pickle.loads(pickled_field_attrs)[
+            "field_attrs"
+        ],
+    ):
+        field_attrs_time = timeit.timeit(get_model_without_local_cache, number=runs)
+
+    clear_local_model_cache()
+    print(
+        f"\nget_model with pickled field attrs: "
+        f"{field_attrs_time / runs * 1000:.2f}ms"
+        f"\nget_model with descriptor: {descriptor_time / runs * 1000:.2f}ms"
+    )
+    assert descriptor_time < field_attrs_time
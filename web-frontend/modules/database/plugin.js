@@ -62,6 +62,7 @@ import {
   RowCreatedWebhookEventType,
   RowUpdatedWebhookEventType,
   RowDeletedWebhookEventType,
+  RowsBatchJobChunkProcessedWebhookEventType,
 } from '@baserow/modules/database/webhookEventTypes'
 import {
   ImageFilePreview,
@@ -307,6 +308,10 @@ export default (context) => {
     'webhookEvent',
     new RowDeletedWebhookEventType(context)
   )
+  app.$registry.register(
+    'webhookEvent',
+    new RowsBatchJobChunkProcessedWebhookEventType(context)
+  )
 
   // Text functions
   app.$registry.register('formula_function', new BaserowUpper(context))
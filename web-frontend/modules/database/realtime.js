@@ -303,6 +303,14 @@ export const registerRealtimeEvents = (realtime) => {
     }
   })
 
+  realtime.registerEvent('force_rows_refresh', ({ store, app }, data) => {
+    if (store.getters['table/getSelectedId'] === data.table_id) {
+      app.$bus.$emit('table-refresh', {
+        tableId: data.table_id,
+      })
+    }
+  })
+
   realtime.registerEvent('force_view_rows_refresh', ({ store, app }, data) => {
     const view = store.getters['view/get'](data.view_id)
     if (view !== undefined) {
@@ -85,3 +85,24 @@ export class RowDeletedWebhookEventType extends WebhookEventType {
     return payload
   }
 }
+
+export class RowsBatchJobChunkProcessedWebhookEventType extends WebhookEventType {
+  getType() {
+    return 'rows.batch_job_chunk_processed'
+  }
+
+  getName() {
+    const { i18n } = this.app
+    return i18n.t('webhook.eventType.rowsBatchJobChunkProcessed')
+  }
+
+  getExamplePayload(table, rowExample) {
+    const payload = super.getExamplePayload(table, rowExample)
+    payload.job_id = 1
+    payload.job_type = 'create'
+    payload.row_ids = [rowExample.id]
+    payload.processed_count = 1
+    payload.total_count = 1
+    return payload
+  }
+}